@@ -3,14 +3,58 @@ PyNDS: a Python package for performing non-dominated sorting.
 """
 
 __all__ = [
+    "stats",
     "relation",
     "presort",
+    "workspace",
+    "fronts",
+    "crowding",
+    "jit",
     "naive",
+    "fast",
+    "bitset",
+    "biobj",
+    "bos",
+    "ens",
+    "jensen",
+    "incremental",
+    "archive",
+    "batch",
+    "external",
+    "stream",
+    "problems",
+    "dispatch",
+    "ndsort",
+    "argndsort",
+    "iter_fronts",
 ]
 
 __version__ = '1.0.0'
 
 # import submodules
+from pynds import stats
 from pynds import relation
 from pynds import presort
+from pynds import workspace
+from pynds import fronts
+from pynds import crowding
+from pynds import jit
 from pynds import naive
+from pynds import fast
+from pynds import bitset
+from pynds import biobj
+from pynds import bos
+from pynds import ens
+from pynds import jensen
+from pynds import incremental
+from pynds import archive
+from pynds import batch
+from pynds import external
+from pynds import stream
+from pynds import problems
+from pynds import dispatch
+
+# import top-level functions
+from pynds.dispatch import ndsort
+from pynds.dispatch import argndsort
+from pynds.dispatch import iter_fronts
@@ -0,0 +1,414 @@
+import numpy
+from typing import Optional
+from pynds.presort import argpresort
+from pynds.relation import relation_options
+
+# maximum number of individuals stored in a leaf before it is split
+NDTREE_LEAF_SIZE = 20
+
+# number of presorted individuals filtered per block by ``nondominated_mask``
+FILTER_BLKSIZE = 256
+
+def nondominated_mask(x: numpy.ndarray, blksize: int = FILTER_BLKSIZE, sense: Optional[numpy.ndarray] = None, cv: Optional[numpy.ndarray] = None) -> numpy.ndarray:
+    """
+    Find the first front of a matrix without sorting later fronts.
+
+    Individuals are visited in presorted order, so no individual is
+    dominated by a later one. Each block of individuals is compared against
+    the first front found so far and against itself.
+
+    Computational complexity: O(MNF + MNB + MNlogN)
+        O(MNlogN) for presorting
+        O(MNF) for comparing against the first front
+        O(MNB) for comparing within blocks
+
+    Size definitions:
+        B = block size.
+        F = number of individuals in the first front.
+        M = number of objectives.
+        N = number of individuals.
+
+    Parameters
+    ----------
+    x : numpy.ndarray
+        A matrix of shape ``(N,M)`` containing objective values for individuals.
+    blksize : int
+        Number of individuals to filter per block.
+    sense : numpy.ndarray, None
+        A vector of shape ``(M,)`` containing ``1`` for minimized and ``-1``
+        for maximized objectives. If ``None``, minimize all objectives.
+    cv : numpy.ndarray, None
+        A vector of shape ``(N,)`` containing constraint violations. If given,
+        use Deb's constraint-domination.
+
+    Returns
+    -------
+    out : numpy.ndarray
+        A boolean vector of shape ``(N,)`` which is ``True`` for individuals
+        in the first front.
+    """
+    # get the number of individuals
+    nindiv = x.shape[0]
+
+    # get options
+    maximize, eps = relation_options(x.shape[1], sense)
+
+    # presort individuals
+    ix = argpresort(x, sense, cv)
+
+    # first front found so far
+    out = numpy.zeros(nindiv, dtype = bool)
+    nd = x[:0]
+    ndcv = None if cv is None else cv[:0]
+
+    for start in range(0, nindiv, blksize):
+        # compare block against first front and itself
+        # dominators of an individual in the block precede it, and dominators
+        # which are themselves dominated imply a dominator in the first front
+        b = ix[start:start+blksize]
+        xb = x[b]
+        y = numpy.concatenate((nd, xb))
+        le = numpy.ones((len(b),len(y)), dtype = bool)
+        lt = numpy.zeros((len(b),len(y)), dtype = bool)
+        for j in range(x.shape[1]):
+            xj = xb[:,j,None]
+            yj = y[None,:,j]
+            # maximized objectives compare with operands swapped
+            if maximize is not None and maximize[j]:
+                xj, yj = yj, xj
+            le &= yj <= xj
+            lt |= yj < xj
+        dom = le & lt
+
+        # constraint-domination: infeasible pairs are decided by violation
+        if cv is not None:
+            cb = cv[b]
+            cx = numpy.maximum(cb, 0)[:,None]
+            cy = numpy.maximum(numpy.concatenate((ndcv, cb)), 0)[None,:]
+            dom = numpy.where((cx > 0) | (cy > 0), cy < cx, dom)
+        keep = ~numpy.any(dom, axis = 1)
+
+        # add non-dominated individuals to first front
+        out[b[keep]] = True
+        nd = numpy.concatenate((nd, xb[keep]))
+        if cv is not None:
+            ndcv = numpy.concatenate((ndcv, cb[keep]))
+
+    return out
+
+class NDTreeNode:
+    """
+    Node of an ND-Tree. Stores the ideal and nadir points bounding every
+    individual below it. Leaves store individuals; internal nodes store
+    children.
+    """
+    def __init__(self, points: numpy.ndarray) -> None:
+        """
+        Constructor for NDTreeNode. Creates a leaf.
+
+        Parameters
+        ----------
+        points : numpy.ndarray
+            A matrix of shape ``(n,nobj)`` containing individuals, with ``n >= 1``.
+        """
+        self.points = points
+        self.children = None
+        self.size = len(points)
+        self.ideal = points.min(axis = 0)
+        self.nadir = points.max(axis = 0)
+
+    def is_leaf(self) -> bool:
+        """
+        Whether the node is a leaf.
+        """
+        return self.children is None
+
+    def update_bounds(self) -> None:
+        """
+        Recalculate size and bounds from stored individuals or children.
+        """
+        if self.is_leaf():
+            self.size = len(self.points)
+            self.ideal = self.points.min(axis = 0)
+            self.nadir = self.points.max(axis = 0)
+        else:
+            self.size = sum(c.size for c in self.children)
+            self.ideal = numpy.min([c.ideal for c in self.children], axis = 0)
+            self.nadir = numpy.max([c.nadir for c in self.children], axis = 0)
+
+class ParetoArchive:
+    """
+    Archive of mutually non-dominated individuals backed by an ND-Tree
+    (Jaszkiewicz and Lust, 2018).
+
+    The ideal and nadir bounds of each node allow whole subtrees to be
+    skipped, accepted, or evicted without visiting their individuals, so
+    dominance queries and updates are sublinear in the archive size in
+    practice.
+
+    Ties follow ``pynds.relation.dominance_relationship``: identical
+    individuals do not dominate each other, so duplicates of archived
+    individuals are accepted.
+
+    Maximized objectives are stored with their sign flipped, so the tree
+    only handles minimization. Under constraint-domination, archived
+    individuals are either all feasible or all share the least constraint
+    violation seen so far; a less violating individual replaces the whole
+    archive. Epsilon-dominance is not supported, because it is not
+    transitive.
+
+    Space complexity: O(MN)
+        O(MN) for storing archived individuals and node bounds
+
+    Size definitions:
+        M = number of objectives.
+        N = number of archived individuals.
+    """
+
+    def __init__(self, nobj: int, leaf_size: int = NDTREE_LEAF_SIZE, sense: Optional[numpy.ndarray] = None) -> None:
+        """
+        Constructor for ParetoArchive.
+
+        Parameters
+        ----------
+        nobj : int
+            Number of objectives.
+        leaf_size : int
+            Maximum number of individuals stored in a leaf before it is split.
+        sense : numpy.ndarray, None
+            A vector of shape ``(nobj,)`` containing ``1`` for minimized and
+            ``-1`` for maximized objectives. If ``None``, minimize all objectives.
+        """
+        if nobj < 1:
+            raise ValueError("``nobj`` must be a positive integer: received ``{0}``".format(nobj))
+        if leaf_size < 1:
+            raise ValueError("``leaf_size`` must be a positive integer: received ``{0}``".format(leaf_size))
+        maximize, eps = relation_options(nobj, sense)
+        self.nobj = nobj
+        self.leaf_size = leaf_size
+        self.nchild = nobj + 1
+        self.root = None
+        # sign applied to stored individuals, or ``None`` if all are minimized
+        self.sense = None if maximize is None else numpy.where(maximize, -1.0, 1.0)
+        # clipped constraint violation shared by archived individuals
+        self.violation = 0.0
+
+    def __len__(self) -> int:
+        """
+        Number of archived individuals.
+        """
+        return 0 if self.root is None else self.root.size
+
+    @property
+    def points(self) -> numpy.ndarray:
+        """
+        A matrix of shape ``(N,nobj)`` containing archived individuals, in
+        arbitrary order.
+        """
+        leaves = []
+        stack = [] if self.root is None else [self.root]
+        while len(stack) > 0:
+            node = stack.pop()
+            if node.is_leaf():
+                leaves.append(node.points)
+            else:
+                stack.extend(node.children)
+        if len(leaves) == 0:
+            return numpy.empty((0,self.nobj), dtype = float)
+        out = numpy.concatenate(leaves)
+        if self.sense is not None:
+            out *= self.sense
+        return out
+
+    def _check(self, p: numpy.ndarray) -> numpy.ndarray:
+        """
+        Convert an individual to a float vector of shape ``(nobj,)``, with
+        maximized objectives negated.
+        """
+        p = numpy.asarray(p, dtype = float)
+        if p.shape != (self.nobj,):
+            raise ValueError("Individual ``p`` is not the correct shape: expected ``{0}`` but received ``{1}``".format((self.nobj,),p.shape))
+        if self.sense is not None:
+            p = p * self.sense
+        return p
+
+    def _dominated(self, node: NDTreeNode, p: numpy.ndarray) -> bool:
+        """
+        Whether any individual below ``node`` dominates ``p``.
+        """
+        # no individual can be weakly better than p in every objective
+        if numpy.any(node.ideal > p):
+            return False
+        # nadir point dominates p, so every individual dominates p
+        if numpy.all(node.nadir <= p) and numpy.any(node.nadir < p):
+            return True
+        if node.is_leaf():
+            q = node.points
+            return bool(numpy.any(numpy.all(q <= p, axis = 1) & numpy.any(q < p, axis = 1)))
+        return any(self._dominated(c, p) for c in node.children)
+
+    def _evict(self, node: NDTreeNode, p: numpy.ndarray) -> None:
+        """
+        Remove individuals below ``node`` which are dominated by ``p``.
+        Empty children are removed; the caller removes ``node`` if empty.
+        """
+        # p cannot be weakly better than any individual in every objective
+        if numpy.any(p > node.nadir):
+            return
+        # p dominates the ideal point, so p dominates every individual
+        if numpy.all(p <= node.ideal) and numpy.any(p < node.ideal):
+            node.size = 0
+            return
+        if node.is_leaf():
+            q = node.points
+            mask = numpy.all(p <= q, axis = 1) & numpy.any(p < q, axis = 1)
+            if numpy.any(mask):
+                node.points = q[~mask]
+                node.size = len(node.points)
+                if node.size > 0:
+                    node.update_bounds()
+            return
+        size = node.size
+        for c in node.children:
+            self._evict(c, p)
+        node.children = [c for c in node.children if c.size > 0]
+        if len(node.children) == 0:
+            node.size = 0
+        elif len(node.children) == 1:
+            # collapse internal node with a single child
+            child = node.children[0]
+            node.points = child.points
+            node.children = child.children
+            node.update_bounds()
+        elif sum(c.size for c in node.children) < size:
+            node.update_bounds()
+
+    def _split(self, node: NDTreeNode) -> None:
+        """
+        Split a full leaf into children along its widest objective.
+        """
+        points = node.points
+        dim = numpy.argmax(node.nadir - node.ideal)
+        ix = numpy.argsort(points[:,dim], kind = "stable")
+        node.children = [NDTreeNode(points[c]) for c in numpy.array_split(ix, min(self.nchild, len(ix)))]
+        node.points = None
+
+    def _add(self, p: numpy.ndarray) -> None:
+        """
+        Add a non-dominated individual to the leaf with the closest midpoint.
+        """
+        if self.root is None:
+            self.root = NDTreeNode(p[None,:])
+            return
+        node = self.root
+        while True:
+            node.size += 1
+            numpy.minimum(node.ideal, p, out = node.ideal)
+            numpy.maximum(node.nadir, p, out = node.nadir)
+            if node.is_leaf():
+                break
+            mid = numpy.array([c.ideal + c.nadir for c in node.children]) / 2.0
+            node = node.children[numpy.argmin(numpy.sum((mid - p)**2, axis = 1))]
+        node.points = numpy.concatenate((node.points, p[None,:]))
+        if len(node.points) > self.leaf_size:
+            self._split(node)
+
+    def is_dominated(self, p: numpy.ndarray, cv: Optional[float] = None) -> bool:
+        """
+        Whether an individual is dominated by any archived individual.
+
+        Parameters
+        ----------
+        p : numpy.ndarray
+            A vector of shape ``(nobj,)`` containing objective values.
+        cv : float, None
+            Constraint violation of ``p``. If ``None``, ``p`` is feasible.
+
+        Returns
+        -------
+        out : bool
+            ``True`` if ``p`` is dominated by an archived individual.
+        """
+        p = self._check(p)
+        if self.root is None:
+            return False
+        # infeasible pairs are decided by violation
+        c = 0.0 if cv is None else max(float(cv), 0.0)
+        if c != self.violation or c > 0:
+            return c > self.violation
+        return self._dominated(self.root, p)
+
+    def insert(self, p: numpy.ndarray, cv: Optional[float] = None) -> bool:
+        """
+        Insert an individual unless it is dominated, evicting archived
+        individuals which it dominates.
+
+        Parameters
+        ----------
+        p : numpy.ndarray
+            A vector of shape ``(nobj,)`` containing objective values.
+        cv : float, None
+            Constraint violation of ``p``. If ``None``, ``p`` is feasible.
+
+        Returns
+        -------
+        out : bool
+            ``True`` if ``p`` was inserted.
+        """
+        p = self._check(p)
+        c = 0.0 if cv is None else max(float(cv), 0.0)
+        if self.root is not None:
+            # a more violating individual is dominated by every archived
+            # individual, and a less violating one dominates all of them
+            if c > self.violation:
+                return False
+            if c < self.violation:
+                self.root = None
+            # infeasible individuals with equal violation are non-dominated
+            elif c == 0:
+                if self._dominated(self.root, p):
+                    return False
+                self._evict(self.root, p)
+                if self.root.size == 0:
+                    self.root = None
+        self.violation = c
+        self._add(p.copy())
+        return True
+
+    def update(self, x: numpy.ndarray, cv: Optional[numpy.ndarray] = None) -> numpy.ndarray:
+        """
+        Insert a batch of individuals.
+
+        Individuals dominated within the batch are discarded by
+        ``nondominated_mask`` before any archive queries are made.
+
+        Parameters
+        ----------
+        x : numpy.ndarray
+            A matrix of shape ``(n,nobj)`` containing objective values.
+        cv : numpy.ndarray, None
+            A vector of shape ``(n,)`` containing constraint violations. If
+            ``None``, all individuals are feasible.
+
+        Returns
+        -------
+        out : numpy.ndarray
+            A boolean vector of shape ``(n,)`` which is ``True`` for
+            individuals which are archived after the update.
+        """
+        x = numpy.asarray(x, dtype = float)
+        if x.ndim != 2 or x.shape[1] != self.nobj:
+            raise ValueError("Input matrix ``x`` must have shape ``(n,{0})``: received ``{1}``".format(self.nobj, x.shape))
+        if cv is not None:
+            cv = numpy.asarray(cv, dtype = float)
+            if cv.shape != (x.shape[0],):
+                raise ValueError("Constraint violations ``cv`` are not the correct shape: expected ``{0}`` but received ``{1}``".format((x.shape[0],),cv.shape))
+
+        # get first front of the batch
+        mask = nondominated_mask(x, sense = self.sense, cv = cv)
+
+        # insert first front; members cannot evict each other
+        out = numpy.zeros(x.shape[0], dtype = bool)
+        for i in numpy.flatnonzero(mask):
+            out[i] = self.insert(x[i], None if cv is None else cv[i])
+        return out
@@ -0,0 +1,314 @@
+import numpy
+from typing import Optional
+from pynds.presort import UNASSIGNED
+from pynds.relation import relation_options
+from pynds.stats import count_relations
+from pynds.stats import phase_start
+from pynds.stats import phase_stop
+
+def dominance_relationship_batch(x: numpy.ndarray, dom: numpy.ndarray, sense: Optional[numpy.ndarray] = None, cv: Optional[numpy.ndarray] = None) -> None:
+    """
+    Calculate the dominance relationships between all rows in each of a
+    stack of matrices using broadcast array operations.
+
+    Parameters
+    ----------
+    x : numpy.ndarray
+        An array of shape ``(nbatch,nindiv,nobj)`` containing objective function values.
+        Input array.
+    dom : numpy.ndarray
+        An array of shape ``(nbatch,nindiv,nindiv)`` to store dominance relationships.
+        Output array.
+        If x[b,i] dominates x[b,j],           then dom[b,i,j] == -1.
+        If x[b,i] is non-dominated by x[b,j], then dom[b,i,j] == 0.
+        If x[b,i] is dominated by x[b,j],     then dom[b,i,j] == 1.
+    sense : numpy.ndarray, None
+        A vector of shape ``(nobj,)`` containing ``1`` for minimized and
+        ``-1`` for maximized objectives. If ``None``, minimize all objectives.
+    cv : numpy.ndarray, None
+        An array of shape ``(nbatch,nindiv)`` containing constraint violations.
+        If given, use Deb's constraint-domination.
+    """
+    # get options
+    maximize, eps = relation_options(x.shape[2], sense)
+
+    # get expected and observed shapes
+    eshape = (x.shape[0],x.shape[1],x.shape[1])
+    dshape = dom.shape
+
+    # test output size
+    if eshape != dshape:
+        raise ValueError("Output array ``dom`` is not the correct shape: expected ``{0}`` but received ``{1}``".format(eshape,dshape))
+
+    # "dominates" relationships, accumulated one objective at a time on
+    # (nbatch,nindiv,nindiv) arrays; "dominated-by" is the transpose
+    tstart = phase_start()
+    x_le_y = numpy.ones(eshape, dtype = bool)
+    x_lt_y = numpy.zeros(eshape, dtype = bool)
+    tmp = numpy.empty(eshape, dtype = bool)
+    for j in range(x.shape[2]):
+        xj = x[:,:,None,j]
+        yj = x[:,None,:,j]
+        # maximized objectives compare with operands swapped
+        if maximize is not None and maximize[j]:
+            xj, yj = yj, xj
+        x_le_y &= numpy.less_equal(xj, yj, out = tmp)
+        x_lt_y |= numpy.less(xj, yj, out = tmp)
+    x_dom_y = numpy.logical_and(x_le_y, x_lt_y, out = x_le_y)
+
+    # store -1, 0, 1
+    dom[:,:,:] = x_dom_y.transpose(0,2,1)
+    dom -= x_dom_y
+
+    # constraint-domination: infeasible pairs are decided by violation
+    if cv is not None:
+        cx = numpy.maximum(cv, 0)[:,:,None]
+        cy = numpy.maximum(cv, 0)[:,None,:]
+        infeasible = (cx > 0) | (cy > 0)
+        dom[infeasible] = numpy.sign(cx - cy)[infeasible]
+
+    count_relations(x.shape[0] * x.shape[1] * x.shape[1])
+    phase_stop("matrix", tstart)
+
+def batch_fronts(dom: numpy.ndarray, front: numpy.ndarray, cnt: numpy.ndarray) -> None:
+    """
+    Assign fronts in each of a stack of populations using Deb's fast
+    non-dominated sorting algorithm, advancing all populations together.
+
+    Parameters
+    ----------
+    dom : numpy.ndarray
+        An array of shape ``(nbatch,nindiv,nindiv)`` containing dominance
+        relationships, as calculated by ``dominance_relationship_batch``.
+    front : numpy.ndarray
+        An array of shape ``(nbatch,nindiv)`` to store front assignments.
+        Output array.
+    cnt : numpy.ndarray
+        An array of shape ``(nbatch,nindiv)``
+        Workspace holding the number of individuals dominating each individual.
+    """
+    # calculate domination counts
+    tstart = phase_start()
+    numpy.sum(dom > 0, axis = 2, out = cnt)
+
+    # "dominates" relationships as floats for batched matrix-vector products
+    domf = (dom < 0).astype(numpy.float32)
+
+    # mark all individuals as unassigned
+    front[:,:] = UNASSIGNED
+
+    # first front of each population: individuals which are dominated by no one
+    cur = cnt == 0
+
+    # current front counter
+    nfront = 0
+
+    # while any population has a non-empty current front
+    while numpy.any(cur):
+        # make front assignments and mark current front members as visited
+        front[cur] = nfront
+        cnt[cur] = -1
+
+        # decrement domination counts of individuals dominated by current front members
+        dec = numpy.matmul(cur[:,None,:].astype(domf.dtype), domf)[:,0,:]
+        cnt -= dec.astype(cnt.dtype)
+
+        # next front: individuals whose domination count just reached zero
+        cur = cnt == 0
+
+        # increment front count
+        nfront += 1
+
+    phase_stop("peel", tstart)
+
+def segment_frontsort(x: numpy.ndarray, front: numpy.ndarray, segment: numpy.ndarray) -> numpy.ndarray:
+    """
+    In-place sort of a matrix and its front assignments, first by segment,
+    then by front, then by the first column, then by subsequent columns if
+    identical values exist.
+
+    Parameters
+    ----------
+    x : numpy.ndarray
+        A matrix of shape ``(n,m)`` containing objective values.
+        This matrix is modified in-place.
+    front : numpy.ndarray
+        A vector of shape ``(n,)`` containing front assignments.
+        This vector is modified in-place.
+    segment : numpy.ndarray
+        A non-decreasing vector of shape ``(n,)`` containing segment labels.
+
+    Returns
+    -------
+    out : numpy.ndarray
+        A vector of shape ``(n,)`` containing the sorting indices which were applied.
+    """
+    # get keys for sorting (must be in reverse order)
+    keys = tuple(x[:,j] for j in range(x.shape[1]))[::-1] + (front, segment)
+
+    # indirect sort indices for reordering
+    tstart = phase_start()
+    out = numpy.lexsort(keys)
+    phase_stop("lexsort", tstart)
+
+    # reorder objective matrix and front matrix
+    x[:,:] = x[out,:]
+    front[:] = front[out]
+
+    return out
+
+def ndsort_batch(x: numpy.ndarray, front: numpy.ndarray, perm: numpy.ndarray, dom: numpy.ndarray, cnt: numpy.ndarray, sense: Optional[numpy.ndarray] = None, cv: Optional[numpy.ndarray] = None) -> None:
+    """
+    In-place non-dominated sorting of a stack of independent populations of
+    equal size using Deb's fast non-dominated sorting algorithm, with
+    dominance comparisons and front peeling vectorized across populations.
+    Objective sense and constraint-domination are supported; epsilon-dominance
+    is not.
+
+    Computational complexity: O(BMN^2 + BFN^2 + BMNlogN)
+        O(BMN^2) for calculating dominance relationships
+        O(BFN^2) for decrementing domination counts front by front
+        O(BMNlogN) for final quicksorting based on dominance and objectives
+
+    Space complexity: O(5BN^2)
+        O(BN^2) for storing dominance relationships
+        O(BN^2) for storing "dominates" relationships as floats
+        O(3BN^2) booleans for temporaries
+
+    Size definitions:
+        B = number of populations.
+        F = maximum number of fronts in a population.
+        M = number of objectives.
+        N = number of individuals per population.
+
+    Parameters
+    ----------
+    x : numpy.ndarray
+        An array of shape ``(B,N,M)`` containing objective values for individuals.
+        Each population ``x[b]`` is sorted in-place.
+    front : numpy.ndarray
+        An array of shape ``(B,N)`` containing front assignments.
+    perm : numpy.ndarray
+        An array of shape ``(B,N)`` containing the sorting permutations.
+        Output array. The sorted population ``x[b]`` is the input population
+        ``x[b]`` indexed by ``perm[b]``.
+    dom : numpy.ndarray
+        An array of shape ``(B,N,N)``
+        Workspace holding dominance relationships.
+    cnt : numpy.ndarray
+        An array of shape ``(B,N)``
+        Workspace holding the number of individuals dominating each individual.
+    sense : numpy.ndarray, None
+        A vector of shape ``(M,)`` containing ``1`` for minimized and ``-1``
+        for maximized objectives. If ``None``, minimize all objectives.
+    cv : numpy.ndarray, None
+        An array of shape ``(B,N)`` containing constraint violations; an
+        individual is feasible if its violation is ``<= 0``. If given, use
+        Deb's constraint-domination.
+        This array is reordered in-place along with ``x``.
+    """
+    # get the number of populations, individuals, and objectives
+    nbatch, nindiv, nobj = x.shape
+
+    # test constraint violations
+    if cv is not None and cv.shape != (nbatch,nindiv):
+        raise ValueError("Constraint violations ``cv`` are not the correct shape: expected ``{0}`` but received ``{1}``".format((nbatch,nindiv),cv.shape))
+
+    # assign fronts in all populations
+    dominance_relationship_batch(x, dom, sense, cv)
+    batch_fronts(dom, front, cnt)
+
+    # quicksort all populations at once, using the population as the first key
+    xf = x.reshape(nbatch * nindiv, nobj)
+    ff = front.reshape(nbatch * nindiv)
+    segment = numpy.repeat(numpy.arange(nbatch), nindiv)
+    ix = segment_frontsort(xf, ff, segment)
+
+    # write back in case reshaping copied, and store per-population permutations
+    x[:,:,:] = xf.reshape(x.shape)
+    front[:,:] = ff.reshape(front.shape)
+    perm[:,:] = ix.reshape(nbatch, nindiv) - (numpy.arange(nbatch) * nindiv)[:,None]
+
+    # reorder constraint violations along with each population
+    if cv is not None:
+        cv[:,:] = numpy.take_along_axis(cv, perm, axis = 1)
+
+def ndsort_ragged(x: numpy.ndarray, offsets: numpy.ndarray, front: numpy.ndarray, perm: numpy.ndarray, sense: Optional[numpy.ndarray] = None, cv: Optional[numpy.ndarray] = None) -> None:
+    """
+    In-place non-dominated sorting of independent populations of different
+    sizes, stored contiguously in one matrix.
+
+    Populations are padded to the size of the largest population and sorted
+    together as by ``ndsort_batch``. Padding is masked out of all dominance
+    relationships.
+
+    Parameters
+    ----------
+    x : numpy.ndarray
+        A matrix of shape ``(N,M)`` containing objective values for individuals.
+        Population ``b`` is stored in rows ``offsets[b]:offsets[b+1]`` and is
+        sorted in-place.
+    offsets : numpy.ndarray
+        A non-decreasing vector of shape ``(B+1,)`` containing population
+        boundaries, with ``offsets[0] == 0`` and ``offsets[B] == N``.
+    front : numpy.ndarray
+        A vector of shape ``(N,)`` containing front assignments.
+    perm : numpy.ndarray
+        A vector of shape ``(N,)`` containing the sorting permutation.
+        Output vector. The sorted matrix is the input matrix indexed by
+        ``perm``; each population is permuted within its own rows.
+    sense : numpy.ndarray, None
+        A vector of shape ``(M,)`` containing ``1`` for minimized and ``-1``
+        for maximized objectives. If ``None``, minimize all objectives.
+    cv : numpy.ndarray, None
+        A vector of shape ``(N,)`` containing constraint violations; an
+        individual is feasible if its violation is ``<= 0``. If given, use
+        Deb's constraint-domination.
+        This vector is reordered in-place along with ``x``.
+    """
+    # get the number of individuals and objectives
+    nindiv = x.shape[0]
+    nobj = x.shape[1]
+
+    # test constraint violations
+    if cv is not None and cv.shape != (nindiv,):
+        raise ValueError("Constraint violations ``cv`` are not the correct shape: expected ``{0}`` but received ``{1}``".format((nindiv,),cv.shape))
+
+    # test offsets
+    offsets = numpy.asarray(offsets)
+    if offsets.ndim != 1 or len(offsets) < 1 or offsets[0] != 0 or offsets[-1] != nindiv or numpy.any(numpy.diff(offsets) < 0):
+        raise ValueError("``offsets`` must be non-decreasing from ``0`` to ``{0}``: received ``{1}``".format(nindiv, offsets))
+
+    # get population sizes
+    sizes = numpy.diff(offsets)
+    nbatch = len(sizes)
+    nmax = sizes.max() if nbatch > 0 else 0
+
+    # pad populations; valid entries are in row-major order
+    valid = numpy.arange(nmax)[None,:] < sizes[:,None]
+    xb = numpy.zeros((nbatch,nmax,nobj), dtype = x.dtype)
+    xb[valid] = x
+    cb = None
+    if cv is not None:
+        cb = numpy.zeros((nbatch,nmax), dtype = cv.dtype)
+        cb[valid] = cv
+
+    # calculate dominance relationships and mask out padding
+    dom = numpy.empty((nbatch,nmax,nmax), dtype = int)
+    dominance_relationship_batch(xb, dom, sense, cb)
+    dom *= valid[:,:,None]
+    dom *= valid[:,None,:]
+
+    # assign fronts in all populations
+    fb = numpy.empty((nbatch,nmax), dtype = int)
+    cnt = numpy.empty((nbatch,nmax), dtype = int)
+    batch_fronts(dom, fb, cnt)
+    front[:] = fb[valid]
+
+    # quicksort all populations at once, using the population as the first key
+    segment = numpy.repeat(numpy.arange(nbatch), sizes)
+    perm[:] = segment_frontsort(x, front, segment)
+
+    # reorder constraint violations along with x
+    if cv is not None:
+        cv[:] = cv[perm]
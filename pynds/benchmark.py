@@ -0,0 +1,379 @@
+"""
+Benchmark non-dominated sorting engines on generated problems.
+
+Run from the command line with ``python -m pynds.benchmark``; see
+``python -m pynds.benchmark --help`` for options. Results are written as JSON
+or CSV and can be compared against a baseline from an earlier release to find
+performance regressions.
+"""
+
+import argparse
+import csv
+import json
+import platform
+import sys
+import time
+import numpy
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Sequence
+from pynds import __version__
+from pynds.dispatch import ENGINES
+from pynds.dispatch import available_memory
+from pynds.dispatch import engine_memory
+from pynds.jit import JIT_AVAILABLE
+from pynds.problems import PROBLEMS
+from pynds.workspace import Workspace
+
+# numbers of individuals to benchmark
+BENCHMARK_SIZES = (100, 1000, 10000, 100000)
+
+# numbers of objectives to benchmark
+BENCHMARK_NOBJS = (2, 3, 5)
+
+# number of timed runs for each engine, problem and size
+BENCHMARK_REPEAT = 5
+
+# time budget in seconds for the timed runs of each engine, problem and size;
+# larger sizes are skipped once an engine is expected to exceed it
+BENCHMARK_BUDGET = 10.0
+
+# number of individuals for the untimed warm-up run
+BENCHMARK_NWARMUP = 32
+
+# record fields, in the order written to CSV files
+BENCHMARK_FIELDS = ("engine", "problem", "nobj", "nindiv", "dtype", "status", "nrun", "min", "median", "mean", "max", "nfront")
+
+def time_engine(engine: str, x: numpy.ndarray, front: Optional[numpy.ndarray] = None, repeat: int = BENCHMARK_REPEAT, budget: float = BENCHMARK_BUDGET, workspace: Optional[Workspace] = None) -> numpy.ndarray:
+    """
+    Time repeated runs of an engine sorting a matrix in-place.
+
+    Every run sorts a fresh copy of ``x``; copying is not timed. Workspaces
+    are reused between runs, so that timings exclude allocation. An untimed
+    warm-up run on the first ``BENCHMARK_NWARMUP`` rows compiles JIT kernels.
+
+    Parameters
+    ----------
+    engine : str
+        Name of the engine: a key of ``pynds.dispatch.ENGINES``.
+    x : numpy.ndarray
+        A matrix of shape ``(nindiv,nobj)`` containing objective values.
+    front : numpy.ndarray, None
+        A vector of shape ``(nindiv,)`` to store the front assignments of
+        the sorted matrix from the last run. If ``None``, allocate it.
+    repeat : int
+        Maximum number of timed runs.
+    budget : float
+        Time budget in seconds. After the first run, only as many runs as
+        fit in the budget are made.
+    workspace : Workspace, None
+        Workspace pool. If ``None``, use a new pool.
+
+    Returns
+    -------
+    out : numpy.ndarray
+        A vector of shape ``(nrun,)`` containing run times in seconds, where
+        ``1 <= nrun <= repeat``.
+    """
+    if repeat < 1:
+        raise ValueError("``repeat`` must be a positive integer: received ``{0}``".format(repeat))
+    if workspace is None:
+        workspace = Workspace()
+    run = ENGINES[engine]
+
+    # warm-up run
+    xw = x[:BENCHMARK_NWARMUP].copy()
+    run(xw, numpy.empty(len(xw), dtype = int), workspace = workspace)
+
+    # timed runs
+    if front is None:
+        front = numpy.empty(len(x), dtype = int)
+    out = []
+    while len(out) < repeat:
+        xc = x.copy()
+        start = time.perf_counter()
+        run(xc, front, workspace = workspace)
+        out.append(time.perf_counter() - start)
+        if sum(out) + out[0] > budget:
+            break
+
+    return numpy.array(out)
+
+def expected_time(times: Sequence[float], sizes: Sequence[int], nindiv: int) -> float:
+    """
+    Extrapolate the run time of an engine to a larger number of individuals
+    from run times at smaller numbers of individuals, assuming run time grows
+    as a power of the number of individuals, and at least linearly.
+
+    Parameters
+    ----------
+    times : Sequence
+        Run times in seconds, in order of increasing size.
+    sizes : Sequence
+        Numbers of individuals for each run time.
+    nindiv : int
+        Number of individuals to extrapolate to.
+
+    Returns
+    -------
+    out : float
+        Expected run time in seconds, or ``0.0`` if there are no run times.
+    """
+    if len(times) == 0:
+        return 0.0
+    # fit growth exponent from the last two sizes
+    power = 1.0
+    if len(times) > 1 and times[-2] > 0.0 and times[-1] > 0.0:
+        power = max(power, numpy.log(times[-1] / times[-2]) / numpy.log(sizes[-1] / sizes[-2]))
+    return times[-1] * (nindiv / sizes[-1])**power
+
+def benchmark(engines: Optional[Sequence[str]] = None, problems: Optional[Sequence[str]] = None, sizes: Sequence[int] = BENCHMARK_SIZES, nobjs: Sequence[int] = BENCHMARK_NOBJS, repeat: int = BENCHMARK_REPEAT, budget: float = BENCHMARK_BUDGET, memory: Optional[int] = None, seed: Optional[int] = 0, verbose: bool = False) -> List[Dict]:
+    """
+    Benchmark engines on generated problems for increasing numbers of
+    individuals.
+
+    For each problem and number of objectives, every engine sorts the same
+    matrices. An engine is skipped for a size if it does not support the
+    number of objectives (``"nobj"``), if its workspaces do not fit in memory
+    (``"memory"``), or if its run time extrapolated from smaller sizes
+    exceeds the time budget (``"budget"``).
+
+    Parameters
+    ----------
+    engines : Sequence, None
+        Names of engines. If ``None``, use every key of ``pynds.dispatch.ENGINES``.
+    problems : Sequence, None
+        Names of problems. If ``None``, use every key of ``pynds.problems.PROBLEMS``.
+    sizes : Sequence
+        Numbers of individuals, in increasing order.
+    nobjs : Sequence
+        Numbers of objectives.
+    repeat : int
+        Maximum number of timed runs per engine, problem and size.
+    budget : float
+        Time budget in seconds per engine, problem and size.
+    memory : int, None
+        Memory budget in bytes for workspaces.
+        If ``None``, use the available physical memory, if it can be determined.
+    seed : int, None
+        Seed for generating problems.
+    verbose : bool
+        Whether to print each record as it is made.
+
+    Returns
+    -------
+    out : list
+        Records holding the fields in ``BENCHMARK_FIELDS``. Timings are in
+        seconds; timings and ``nfront`` are ``None`` for skipped records.
+    """
+    if engines is None:
+        engines = tuple(ENGINES)
+    if problems is None:
+        problems = tuple(PROBLEMS)
+    for engine in engines:
+        if engine not in ENGINES:
+            raise ValueError("Unknown engine ``{0}``: must be one of ``{1}``".format(engine, tuple(ENGINES)))
+    for problem in problems:
+        if problem not in PROBLEMS:
+            raise ValueError("Unknown problem ``{0}``: must be one of ``{1}``".format(problem, tuple(PROBLEMS)))
+    if memory is None:
+        memory = available_memory()
+
+    rng = numpy.random.default_rng(seed)
+    workspace = Workspace()
+    out = []
+    for problem in problems:
+        for nobj in nobjs:
+            # run times of the largest sizes so far, for each engine
+            history = {engine: ([],[]) for engine in engines}
+            for nindiv in sizes:
+                x = PROBLEMS[problem](nindiv, nobj, rng)
+                for engine in engines:
+                    record = {
+                        "engine": engine, "problem": problem, "nobj": nobj, "nindiv": nindiv, "dtype": x.dtype.name,
+                        "status": "ok", "nrun": 0, "min": None, "median": None, "mean": None, "max": None, "nfront": None,
+                    }
+                    times, tsizes = history[engine]
+                    if engine == "biobj" and nobj != 2:
+                        record["status"] = "nobj"
+                    elif memory is not None and engine_memory(engine, nindiv, nobj) > memory:
+                        record["status"] = "memory"
+                    elif expected_time(times, tsizes, nindiv) > budget:
+                        record["status"] = "budget"
+                    else:
+                        front = numpy.empty(nindiv, dtype = int)
+                        t = time_engine(engine, x, front, repeat, budget, workspace)
+                        times.append(float(t.min()))
+                        tsizes.append(nindiv)
+                        record.update({
+                            "nrun": len(t), "min": float(t.min()), "median": float(numpy.median(t)),
+                            "mean": float(t.mean()), "max": float(t.max()), "nfront": int(front.max()) + 1 if nindiv > 0 else 0,
+                        })
+                    if verbose:
+                        print(format_record(record), flush = True)
+                    out.append(record)
+                # free workspaces before the next, larger size
+                workspace.clear()
+
+    return out
+
+def format_record(record: Dict) -> str:
+    """
+    Format a benchmark record as one line of text.
+
+    Parameters
+    ----------
+    record : dict
+        Benchmark record.
+
+    Returns
+    -------
+    out : str
+        Formatted record.
+    """
+    head = "{0:<8s} {1:<13s} {2:>2d} {3:>7d}".format(record["engine"], record["problem"], record["nobj"], record["nindiv"])
+    if record["status"] != "ok":
+        return "{0} skipped ({1})".format(head, record["status"])
+    return "{0} {1:>10.6f} s (median of {2}, {3} fronts)".format(head, record["median"], record["nrun"], record["nfront"])
+
+def write_results(records: List[Dict], path: str) -> None:
+    """
+    Write benchmark records to a file. Files ending in ``.csv`` hold one row
+    per record; other files hold JSON with the records under ``"results"``
+    and the package, NumPy and Python versions, platform and JIT
+    availability.
+
+    Parameters
+    ----------
+    records : list
+        Benchmark records, as from ``benchmark``.
+    path : str
+        Output file path.
+    """
+    if path.endswith(".csv"):
+        with open(path, "w", newline = "") as f:
+            writer = csv.DictWriter(f, fieldnames = BENCHMARK_FIELDS)
+            writer.writeheader()
+            writer.writerows(records)
+        return
+    data = {
+        "pynds": __version__,
+        "numpy": numpy.__version__,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "jit": JIT_AVAILABLE,
+        "results": records,
+    }
+    with open(path, "w") as f:
+        json.dump(data, f, indent = 1)
+
+def read_results(path: str) -> List[Dict]:
+    """
+    Read benchmark records written by ``write_results``.
+
+    Parameters
+    ----------
+    path : str
+        Input file path.
+
+    Returns
+    -------
+    out : list
+        Benchmark records.
+    """
+    if not path.endswith(".csv"):
+        with open(path, "r") as f:
+            return json.load(f)["results"]
+    out = []
+    with open(path, "r", newline = "") as f:
+        for row in csv.DictReader(f):
+            # convert fields from strings; empty fields are None
+            for key in ("nobj", "nindiv", "nrun", "nfront"):
+                row[key] = int(row[key]) if row[key] != "" else None
+            for key in ("min", "median", "mean", "max"):
+                row[key] = float(row[key]) if row[key] != "" else None
+            out.append(row)
+    return out
+
+def compare_results(baseline: List[Dict], current: List[Dict], tolerance: float = 0.2) -> List[Dict]:
+    """
+    Find performance regressions: records whose median run time exceeds
+    the median run time of the matching baseline record by more than a
+    relative tolerance. Records match if they have the same engine, problem,
+    number of objectives and number of individuals.
+
+    Parameters
+    ----------
+    baseline : list
+        Benchmark records from an earlier run.
+    current : list
+        Benchmark records from the current run.
+    tolerance : float
+        Relative tolerance: ``0.2`` allows run times to grow by 20%.
+
+    Returns
+    -------
+    out : list
+        Regressions holding ``engine``, ``problem``, ``nobj``, ``nindiv``,
+        ``baseline`` and ``current`` median run times, and their ``ratio``.
+    """
+    keys = ("engine", "problem", "nobj", "nindiv")
+    medians = {tuple(r[k] for k in keys): r["median"] for r in baseline if r["median"] is not None}
+    out = []
+    for r in current:
+        old = medians.get(tuple(r[k] for k in keys))
+        if old is None or r["median"] is None or old <= 0.0:
+            continue
+        if r["median"] > old * (1.0 + tolerance):
+            regression = {k: r[k] for k in keys}
+            regression.update({"baseline": old, "current": r["median"], "ratio": r["median"] / old})
+            out.append(regression)
+    return out
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """
+    Command line interface: benchmark engines, write results and compare
+    them against a baseline.
+
+    Parameters
+    ----------
+    argv : Sequence, None
+        Command line arguments. If ``None``, use ``sys.argv[1:]``.
+
+    Returns
+    -------
+    out : int
+        Exit status: ``1`` if regressions were found, otherwise ``0``.
+    """
+    parser = argparse.ArgumentParser(prog = "python -m pynds.benchmark", description = "Benchmark non-dominated sorting engines.")
+    parser.add_argument("--engines", nargs = "+", default = None, choices = tuple(ENGINES), help = "engines to benchmark (default: all)")
+    parser.add_argument("--problems", nargs = "+", default = None, choices = tuple(PROBLEMS), help = "problems to benchmark (default: all)")
+    parser.add_argument("--sizes", nargs = "+", type = int, default = BENCHMARK_SIZES, help = "numbers of individuals")
+    parser.add_argument("--nobj", nargs = "+", type = int, default = BENCHMARK_NOBJS, help = "numbers of objectives")
+    parser.add_argument("--repeat", type = int, default = BENCHMARK_REPEAT, help = "maximum number of timed runs")
+    parser.add_argument("--budget", type = float, default = BENCHMARK_BUDGET, help = "time budget in seconds per engine, problem and size")
+    parser.add_argument("--seed", type = int, default = 0, help = "seed for generating problems")
+    parser.add_argument("--output", default = None, help = "output file: .csv for CSV, otherwise JSON")
+    parser.add_argument("--baseline", default = None, help = "results from an earlier run to compare against")
+    parser.add_argument("--tolerance", type = float, default = 0.2, help = "relative run time increase counted as a regression")
+    args = parser.parse_args(argv)
+
+    records = benchmark(
+        engines = args.engines, problems = args.problems, sizes = sorted(args.sizes), nobjs = args.nobj,
+        repeat = args.repeat, budget = args.budget, seed = args.seed, verbose = True,
+    )
+    if args.output is not None:
+        write_results(records, args.output)
+
+    if args.baseline is None:
+        return 0
+    regressions = compare_results(read_results(args.baseline), records, args.tolerance)
+    for r in regressions:
+        print("regression: {0} {1} nobj={2} nindiv={3}: {4:.6f} s -> {5:.6f} s ({6:.2f}x)".format(
+            r["engine"], r["problem"], r["nobj"], r["nindiv"], r["baseline"], r["current"], r["ratio"],
+        ))
+    return 1 if len(regressions) > 0 else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
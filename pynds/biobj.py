@@ -0,0 +1,183 @@
+import numpy
+from bisect import bisect_left
+from typing import Optional
+from pynds.relation import relation_options
+from pynds.presort import UNASSIGNED
+from pynds.presort import dense_rank
+from pynds.presort import argfrontsort
+from pynds.presort import assign_infeasible
+from pynds.presort import argfrontsort_presorted
+from pynds.presort import permute_matrix
+from pynds.jit import jit_supported
+from pynds.jit import assign_biobj_kernel
+from pynds.stats import phase_start
+from pynds.stats import phase_stop
+
+def ndsort_biobj_sweep(key: list) -> list:
+    """
+    Assign fronts to presorted individuals by sweeping over their keys and
+    searching for the first front whose tail key is not less than the
+    individual key.
+
+    Parameters
+    ----------
+    key : list
+        A list of length ``N`` containing integer keys of presorted individuals.
+    
+    Returns
+    -------
+    out : list
+        A list of length ``N`` containing front assignments.
+    """
+    # bind to locals; this loop is the bottleneck for large N
+    tails = []
+    append = tails.append
+    search = bisect_left
+    nfront = 0
+    out = [0] * len(key)
+    for i,k in enumerate(key):
+        f = search(tails, k)                # first front not dominating individual
+        if f == nfront:                     # if dominated by all fronts, create a new front
+            append(k)
+            nfront += 1
+        else:                               # otherwise individual is new front tail
+            tails[f] = k
+        out[i] = f
+    return out
+
+def ndsort_biobj(x: numpy.ndarray, front: numpy.ndarray, perm: numpy.ndarray, sense: Optional[numpy.ndarray] = None, cv: Optional[numpy.ndarray] = None, kfront: Optional[int] = None) -> None:
+    """
+    In-place non-dominated sorting specialized for two objectives.
+
+    After presorting, individuals are swept in order while keeping the last
+    member added to each front (the front's tail). An individual is dominated
+    by a front if and only if it is dominated by that front's tail, and tails
+    are ordered by the second objective, so the first front which does not
+    dominate an individual is found using binary search over the tails.
+
+    Presorting uses unstable sorts of each objective and of a combined
+    integer key, rather than a lexicographic sort, and the sweep uses a
+    compiled kernel if numba is installed (``pip install pynds[jit]``).
+
+    Computational complexity: O(NlogN)
+        O(NlogN) for presorting by dense ranks of each objective
+        O(NlogN) for sweeping with binary search over front tails
+        O(NlogN) for final sorting based on dominance and objectives
+
+    Space complexity: O(N)
+        O(N) for storing front tails
+
+    Size definitions:
+        N = number of individuals.
+
+    Parameters
+    ----------
+    x : numpy.ndarray
+        A matrix of shape ``(N,2)`` containing objective values for individuals.
+    front : numpy.ndarray
+        A vector of shape ``(N,)`` containing front assignments.
+    perm : numpy.ndarray
+        A vector of shape ``(N,)`` containing the sorting permutation.
+        Output vector. The sorted matrix is the input matrix indexed by ``perm``.
+    sense : numpy.ndarray, None
+        A vector of shape ``(2,)`` containing ``1`` for minimized and ``-1``
+        for maximized objectives; maximized objectives are ranked in
+        descending order. If ``None``, minimize both objectives.
+        Rows are still ordered by ascending objective values within fronts.
+    cv : numpy.ndarray, None
+        A vector of shape ``(N,)`` containing constraint violations; an
+        individual is feasible if its violation is ``<= 0``. If given, use
+        Deb's constraint-domination: feasible individuals are swept, and
+        infeasible individuals follow in order of increasing violation.
+        This vector is reordered in-place along with ``x``.
+    kfront : int, None
+        Number of fronts to assign. Individuals in later fronts are left
+        unassigned with front ``pynds.presort.UNASSIGNED`` and placed last in
+        their original order. The sweep is not shortened, as each of its
+        searches is already logarithmic. If ``None``, assign every front.
+    """
+    # assign fronts and calculate the sorting permutation
+    argndsort_biobj(x, front, perm, sense, cv, kfront)
+
+    # reorder objective matrix and front matrix
+    permute_matrix(x, front, perm)
+
+    # reorder constraint violations along with rows
+    if cv is not None:
+        cv[:] = cv[perm]
+
+def argndsort_biobj(x: numpy.ndarray, front: numpy.ndarray, perm: numpy.ndarray, sense: Optional[numpy.ndarray] = None, cv: Optional[numpy.ndarray] = None, kfront: Optional[int] = None) -> None:
+    """
+    Non-dominated sorting specialized for two objectives, returning the
+    sorting permutation instead of reordering ``x``.
+
+    Parameters are as for ``ndsort_biobj``. On output, ``front`` contains
+    front assignments in the order of the rows of ``x``, and ``x[perm]`` is
+    the sorted matrix. ``cv`` is not modified.
+    """
+    # get the number of objectives
+    nobj = x.shape[1]
+
+    # test number of objectives
+    if nobj != 2:
+        raise ValueError("Input matrix ``x`` must have 2 objectives: received ``{0}``".format(nobj))
+
+    # get maximized objectives
+    maximize, _ = relation_options(nobj, sense)
+    descending = (False, False) if maximize is None else tuple(maximize)
+
+    # constraint-domination: only feasible individuals are swept
+    rows = None if cv is None else numpy.flatnonzero(cv <= 0)
+    f0 = x[:,0] if rows is None else x[rows,0]
+    f1 = x[:,1] if rows is None else x[rows,1]
+    nindiv = len(f0)
+
+    # dense ranks of each objective, best first; tied values share a rank
+    tstart = phase_start()
+    rank0 = dense_rank(f0, descending[0])
+    rank1 = dense_rank(f1, descending[1])
+
+    # presort individuals by first objective, then second objective,
+    # as the order of a single integer key; identical rows share a key
+    ix = numpy.argsort(rank0 * nindiv + rank1)
+    phase_stop("presort", tstart)
+
+    # assign fronts by sweeping
+    tstart = phase_start()
+
+    # a tail dominates an individual if the tail has a lesser second objective,
+    # or an equal second objective and a lesser first objective
+    # encode (second objective, first objective) as a single integer key
+    key = rank1[ix] * nindiv + rank0[ix]
+
+    # tails are nondecreasing in key, so search for first tail with key >= individual key
+    if jit_supported(x):
+        sfront = numpy.empty(nindiv, dtype = numpy.int64)
+        nfront = assign_biobj_kernel(key, sfront, numpy.empty(nindiv, dtype = numpy.int64))
+        sfront = sfront.astype(numpy.min_scalar_type(max(nfront - 1, 0)))
+    else:
+        sfront = ndsort_biobj_sweep(key.tolist())
+        nfront = max(sfront, default = -1) + 1
+        sfront = numpy.array(sfront, dtype = numpy.min_scalar_type(max(nfront - 1, 0)))
+
+    # make front assignments in the order of the rows of x
+    if rows is None:
+        front[ix] = sfront
+    else:
+        front[rows[ix]] = sfront
+        assign_infeasible(front, cv, nfront)
+    phase_stop("peel", tstart)
+
+    # sort first by front, then by column 0, then by column 1, ...
+    # presorted order is only ascending if all objectives are minimized and all individuals feasible
+    if maximize is None and rows is None:
+        perm[:] = argfrontsort_presorted(ix, sfront)
+    else:
+        perm[:] = argfrontsort(x, front)
+
+    # unassign fronts beyond the limit; they are last in the permutation,
+    # where they are placed in their original order
+    if kfront is not None:
+        nassigned = numpy.count_nonzero(front < kfront)
+        front[perm[nassigned:]] = UNASSIGNED
+        perm[nassigned:] = numpy.sort(perm[nassigned:])
@@ -0,0 +1,324 @@
+import numpy
+from typing import Iterator
+from typing import Optional
+from pynds.relation import BLOCK_NELEM
+from pynds.relation import block_size
+from pynds.relation import dominance_relationship_block
+from pynds.relation import map_blocks
+from pynds.relation import relation_options
+from pynds.presort import UNASSIGNED
+from pynds.presort import front_limit_reached
+from pynds.presort import argfrontsort
+from pynds.presort import frontsort_matrix
+from pynds.stats import phase_start
+from pynds.stats import phase_stop
+from pynds.stats import count_relations
+
+# number of set bits in each byte, for numpy versions without ``bitwise_count``
+POPCOUNT_TABLE = numpy.array([bin(i).count("1") for i in range(256)], dtype = numpy.uint8)
+
+def bitset_nbytes(nindiv: int) -> int:
+    """
+    Number of bytes needed to store a bitset over ``nindiv`` individuals.
+
+    Parameters
+    ----------
+    nindiv : int
+        Number of individuals.
+
+    Returns
+    -------
+    out : int
+        Number of bytes per bitset.
+    """
+    return (nindiv + 7) // 8
+
+def bitset_popcount(b: numpy.ndarray, out: Optional[numpy.ndarray] = None) -> numpy.ndarray:
+    """
+    Count the number of set bits in each row of a matrix of bitsets.
+
+    Parameters
+    ----------
+    b : numpy.ndarray
+        A matrix of shape ``(n,nbytes)`` and dtype ``uint8`` containing bitsets.
+    out : numpy.ndarray, None
+        A vector of shape ``(n,)`` to store counts.
+        If ``None``, a new vector is allocated.
+
+    Returns
+    -------
+    out : numpy.ndarray
+        A vector of shape ``(n,)`` containing the number of set bits in each row.
+    """
+    if hasattr(numpy, "bitwise_count"):
+        counts = numpy.bitwise_count(b)
+    else:
+        counts = POPCOUNT_TABLE[b]
+    return numpy.sum(counts, axis = 1, out = out)
+
+def dominance_bitset_matrix(x: numpy.ndarray, dom: numpy.ndarray, domd: numpy.ndarray, blksize: Optional[int] = None, n_jobs: int = 1, sense: Optional[numpy.ndarray] = None, eps: Optional[numpy.ndarray] = None, cv: Optional[numpy.ndarray] = None) -> None:
+    """
+    Calculate the dominance relationships between all rows in a matrix as
+    bit-packed "dominates" and "dominated-by" bitsets.
+
+    Bit ``j`` of a row is stored in byte ``j // 8`` at bit position
+    ``7 - j % 8``, as by ``numpy.packbits``.
+
+    Parameters
+    ----------
+    x : numpy.ndarray
+        A matrix of shape ``(nindiv,nobj)`` containing objective function values.
+        Input matrix.
+    dom : numpy.ndarray
+        A matrix of shape ``(nindiv,nbytes)`` and dtype ``uint8``.
+        Output matrix. Bit ``j`` of row ``i`` is set if x[i] dominates x[j].
+    domd : numpy.ndarray
+        A matrix of shape ``(nindiv,nbytes)`` and dtype ``uint8``.
+        Output matrix. Bit ``j`` of row ``i`` is set if x[i] is dominated by x[j].
+    blksize : int, None
+        Number of rows to process per block.
+        If ``None``, choose a block size such that each ``(blksize,nindiv)``
+        temporary holds about ``pynds.relation.BLOCK_NELEM`` elements.
+    n_jobs : int
+        Number of threads over which to spread blocks.
+        If ``-1``, use all available processors.
+    sense : numpy.ndarray, None
+        A vector of shape ``(nobj,)`` containing ``1`` for minimized and
+        ``-1`` for maximized objectives. If ``None``, minimize all objectives.
+    eps : float, numpy.ndarray, None
+        Additive epsilon for each objective, as for
+        ``pynds.relation.dominance_relationship``.
+        If ``None``, use Pareto dominance.
+    cv : numpy.ndarray, None
+        A vector of shape ``(nindiv,)`` containing constraint violations.
+        If given, use Deb's constraint-domination.
+    """
+    # get number of individuals
+    nindiv = x.shape[0]
+
+    # test options once, rather than once per block
+    relation_options(x.shape[1], sense, eps)
+    if cv is not None and cv.shape != (nindiv,):
+        raise ValueError("Constraint violations ``cv`` are not the correct shape: expected ``{0}`` but received ``{1}``".format((nindiv,),cv.shape))
+
+    # get expected and observed shapes
+    eshape = (nindiv,bitset_nbytes(nindiv))
+
+    # test output sizes
+    if eshape != dom.shape:
+        raise ValueError("Output matrix ``dom`` is not the correct shape: expected ``{0}`` but received ``{1}``".format(eshape,dom.shape))
+    if eshape != domd.shape:
+        raise ValueError("Output matrix ``domd`` is not the correct shape: expected ``{0}`` but received ``{1}``".format(eshape,domd.shape))
+
+    # get block size
+    if blksize is None:
+        blksize = block_size(x.shape[0])
+    elif blksize < 1:
+        raise ValueError("``blksize`` must be a positive integer: received ``{0}``".format(blksize))
+
+    # calculate dominance relationships for one block of rows, then pack
+    def block(start: int, stop: int) -> None:
+        blk = numpy.empty((stop-start,nindiv), dtype = numpy.int8)
+        cvx = None if cv is None else cv[start:stop]
+        dominance_relationship_block(x[start:stop], x, blk, sense, eps, cvx, cv)
+        dom[start:stop] = numpy.packbits(blk < 0, axis = 1)
+        domd[start:stop] = numpy.packbits(blk > 0, axis = 1)
+
+    # calculate dominance relationships one block of rows at a time
+    tstart = phase_start()
+    map_blocks(block, nindiv, blksize, n_jobs)
+    count_relations(nindiv * nindiv)
+    phase_stop("matrix", tstart)
+
+def iter_fronts_bitset(x: numpy.ndarray, dom: numpy.ndarray, domd: numpy.ndarray, cnt: numpy.ndarray, rem: numpy.ndarray, n_jobs: int = 1, sense: Optional[numpy.ndarray] = None, eps: Optional[numpy.ndarray] = None, cv: Optional[numpy.ndarray] = None) -> Iterator[numpy.ndarray]:
+    """
+    Generate fronts one at a time using Deb's fast non-dominated sorting algorithm on
+    bit-packed dominance relationships,
+    without reordering ``x``.
+
+    Each front is yielded as soon as it is known, as a view of ``rem``
+    holding the row indices of its members in ascending order. Later fronts
+    are only calculated when requested, so callers may stop early.
+
+    Parameters are as for ``ndsort_bitset``.
+
+    Yields
+    ------
+    members : numpy.ndarray
+        A vector containing the row indices of the members of the next front.
+    """
+    # get the number of individuals
+    nindiv = x.shape[0]
+
+    # calculate pairwise dominance relationship bitsets
+    dominance_bitset_matrix(x, dom, domd, n_jobs = n_jobs, sense = sense, eps = eps, cv = cv)
+
+    # calculate domination counts: number of set bits in "dominated-by" bitsets
+    bitset_popcount(domd, out = cnt)
+
+    # number of front members whose bitsets are unpacked at once, and count decrements
+    step = max(1, BLOCK_NELEM // max(1, nindiv))
+    dec = numpy.empty(nindiv, dtype = cnt.dtype)
+
+    # first front: individuals which are dominated by no one
+    ix = numpy.flatnonzero(cnt == 0)
+    rem[0:len(ix)] = ix
+
+    # queue bounds for current front
+    start = 0
+    stop = len(ix)
+
+    # while the current front is not empty
+    while start < stop:
+        # get current front members
+        members = rem[start:stop]
+
+        # mark current front members as visited
+        cnt[members] = -1
+
+        # hand current front to the caller before calculating the next one
+        yield members
+
+        # decrement domination counts of individuals dominated by current front members,
+        # unpacking a bounded block of members at a time so temporaries stay O(BLOCK_NELEM)
+        dec[:] = 0
+        for i in range(0, len(members), step):
+            dec += numpy.sum(numpy.unpackbits(dom[members[i:i+step]], axis = 1, count = nindiv), axis = 0, dtype = cnt.dtype)
+        cnt -= dec
+
+        # next front: individuals whose domination count just reached zero
+        ix = numpy.flatnonzero((cnt == 0) & (dec > 0))
+        rem[stop:stop+len(ix)] = ix
+
+        # advance queue bounds
+        start = stop
+        stop += len(ix)
+
+def assign_bitset(x: numpy.ndarray, front: numpy.ndarray, dom: numpy.ndarray, domd: numpy.ndarray, cnt: numpy.ndarray, rem: numpy.ndarray, n_jobs: int = 1, kfront: Optional[int] = None, nfill: Optional[int] = None, sense: Optional[numpy.ndarray] = None, eps: Optional[numpy.ndarray] = None, cv: Optional[numpy.ndarray] = None) -> None:
+    """
+    Assign fronts using Deb's fast non-dominated sorting algorithm on
+    bit-packed dominance relationships, without reordering ``x``.
+
+    Parameters are as for ``ndsort_bitset``. On output, ``front`` contains front
+    assignments in the order of the rows of ``x``.
+    """
+    # mark all individuals as unassigned
+    front[:] = UNASSIGNED
+
+    # generate fronts lazily
+    fronts = iter_fronts_bitset(x, dom, domd, cnt, rem, n_jobs = n_jobs, sense = sense, eps = eps, cv = cv)
+
+    # current front counter and number of assigned individuals
+    nfront = 0
+    nassigned = 0
+
+    # while no early exit; dominance relationships are timed separately
+    tstart = phase_start()
+    while not front_limit_reached(nfront, nassigned, kfront, nfill):
+        # get next front, if any
+        members = next(fronts, None)
+        if members is None:
+            break
+
+        # make front assignments
+        front[members] = nfront
+        nassigned += len(members)
+
+        # increment front count
+        nfront += 1
+
+    phase_stop("peel", tstart)
+
+def ndsort_bitset(x: numpy.ndarray, front: numpy.ndarray, dom: numpy.ndarray, domd: numpy.ndarray, cnt: numpy.ndarray, rem: numpy.ndarray, n_jobs: int = 1, kfront: Optional[int] = None, nfill: Optional[int] = None, sense: Optional[numpy.ndarray] = None, eps: Optional[numpy.ndarray] = None, cv: Optional[numpy.ndarray] = None) -> None:
+    """
+    In-place non-dominated sorting using Deb's fast non-dominated sorting
+    algorithm on bit-packed dominance relationships.
+
+    Computational complexity: O(MN^2 + MNlogN)
+        O(MN^2) for calculating dominance relationship bitsets
+        O(N^2) for decrementing domination counts front by front
+        O(MNlogN) for final quicksorting based on dominance and objectives
+
+    Space complexity: O(N^2/4 + 3N)
+        O(N^2/8) bytes for storing "dominates" bitsets
+        O(N^2/8) bytes for storing "dominated-by" bitsets
+        O(N) for storing domination counts
+        O(N) for storing domination count decrements of the current front,
+            unpacked from at most ``BLOCK_NELEM // N`` bitsets at a time
+        O(N) for storing the queue of individuals in the current and next fronts
+
+    Size definitions:
+        M = number of objectives.
+        N = number of individuals.
+
+    Parameters
+    ----------
+    x : numpy.ndarray
+        A matrix of shape ``(N,M)`` containing objective values for individuals.
+    front : numpy.ndarray
+        A vector of shape ``(N,)`` containing front assignments.
+    dom : numpy.ndarray
+        A matrix of shape ``(N,(N+7)//8)`` and dtype ``uint8``.
+        Workspace holding "dominates" bitsets.
+    domd : numpy.ndarray
+        A matrix of shape ``(N,(N+7)//8)`` and dtype ``uint8``.
+        Workspace holding "dominated-by" bitsets.
+    cnt : numpy.ndarray
+        A vector of shape ``(N,)``
+        Workspace holding the number of individuals dominating each individual.
+    rem : numpy.ndarray
+        A vector of shape ``(N,)``
+        Workspace holding the queue of individuals in order of front assignment.
+    n_jobs : int
+        Number of threads over which to spread the calculation of dominance
+        relationships. If ``-1``, use all available processors.
+    kfront : int, None
+        Stop once ``kfront`` fronts have been assigned.
+    nfill : int, None
+        Stop once at least ``nfill`` individuals have been assigned.
+        Individuals left unassigned have front ``UNASSIGNED``; only assigned
+        individuals are sorted, and unassigned individuals are placed last.
+    sense : numpy.ndarray, None
+        A vector of shape ``(M,)`` containing ``1`` for minimized and ``-1``
+        for maximized objectives. If ``None``, minimize all objectives.
+    eps : float, numpy.ndarray, None
+        Additive epsilon for each objective; use epsilon-dominance instead of
+        Pareto dominance. Epsilon-dominance is not transitive: individuals
+        caught in dominance cycles are left ``UNASSIGNED``.
+        If ``None``, use Pareto dominance.
+    cv : numpy.ndarray, None
+        A vector of shape ``(N,)`` containing constraint violations; an
+        individual is feasible if its violation is ``<= 0``. If given, use
+        Deb's constraint-domination.
+        This vector is reordered in-place along with ``x``.
+    """
+    # assign fronts
+    assign_bitset(x, front, dom, domd, cnt, rem, n_jobs = n_jobs, kfront = kfront, nfill = nfill, sense = sense, eps = eps, cv = cv)
+
+    # quicksort first by front, then by column 0, then by column 1, ...
+    perm = frontsort_matrix(x, front)
+
+    # reorder constraint violations along with rows
+    if cv is not None:
+        cv[:] = cv[perm]
+
+def argndsort_bitset(x: numpy.ndarray, front: numpy.ndarray, perm: numpy.ndarray, dom: numpy.ndarray, domd: numpy.ndarray, cnt: numpy.ndarray, rem: numpy.ndarray, n_jobs: int = 1, kfront: Optional[int] = None, nfill: Optional[int] = None, sense: Optional[numpy.ndarray] = None, eps: Optional[numpy.ndarray] = None, cv: Optional[numpy.ndarray] = None) -> None:
+    """
+    Non-dominated sorting using Deb's fast non-dominated sorting algorithm
+    on bit-packed dominance relationships, returning the sorting permutation
+    instead of reordering ``x``.
+
+    Parameters are as for ``ndsort_bitset``, with the addition of:
+
+    Parameters
+    ----------
+    perm : numpy.ndarray
+        A vector of shape ``(N,)`` containing the sorting permutation.
+        Output vector. ``x[perm]`` is the sorted matrix and ``front[perm]``
+        its front assignments; ``front`` is in the order of the rows of ``x``.
+    """
+    # assign fronts
+    assign_bitset(x, front, dom, domd, cnt, rem, n_jobs = n_jobs, kfront = kfront, nfill = nfill, sense = sense, eps = eps, cv = cv)
+
+    # sorting indices: first by front, then by column 0, then by column 1, ...
+    perm[:] = argfrontsort(x, front)
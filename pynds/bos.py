@@ -0,0 +1,188 @@
+import numpy
+from typing import Optional
+from pynds.relation import dominated_by_any
+from pynds.relation import relation_options
+from pynds.presort import UNASSIGNED
+from pynds.presort import argfrontsort
+from pynds.presort import presort_keys
+from pynds.presort import permute_matrix
+from pynds.stats import phase_start
+from pynds.stats import phase_stop
+
+def bos_order(x: numpy.ndarray, order: numpy.ndarray, sense: Optional[numpy.ndarray] = None, cv: Optional[numpy.ndarray] = None) -> None:
+    """
+    Calculate per-objective sorting indices for Best Order Sort.
+
+    Row ``j`` of the output sorts individuals in ascending order of objective
+    ``j``, then by the first objective, then by subsequent objectives if
+    identical values exist. Individuals which dominate another individual
+    therefore always precede it in every row.
+
+    Parameters
+    ----------
+    x : numpy.ndarray
+        A matrix of shape ``(N,M)`` containing objective values for individuals.
+    order : numpy.ndarray
+        A matrix of shape ``(M,N)`` to store sorting indices.
+        Output matrix.
+    sense : numpy.ndarray, None
+        A vector of shape ``(M,)`` containing ``1`` for minimized and ``-1``
+        for maximized objectives; maximized objectives are sorted in
+        descending order. If ``None``, minimize all objectives.
+    cv : numpy.ndarray, None
+        A vector of shape ``(N,)`` containing constraint violations.
+        If given, every row sorts individuals by violation first.
+    """
+    # get the number of objectives
+    nobj = x.shape[1]
+
+    # get keys for tie breaking (must be in reverse order)
+    keys = presort_keys(x, sense)
+
+    # constraint violation is the most significant key
+    first = () if cv is None else (numpy.maximum(cv, 0),)
+
+    # sort by each objective first
+    tstart = phase_start()
+    for j in range(nobj):
+        order[j,:] = numpy.lexsort(keys + (keys[nobj-1-j],) + first)
+    phase_stop("presort", tstart)
+
+def ndsort_bos(x: numpy.ndarray, front: numpy.ndarray, perm: numpy.ndarray, order: numpy.ndarray, presorted: bool = False, sense: Optional[numpy.ndarray] = None, cv: Optional[numpy.ndarray] = None, kfront: Optional[int] = None) -> None:
+    """
+    In-place non-dominated sorting using the Best Order Sort algorithm.
+
+    Per-objective sorted orders are traversed in lockstep. The first time an
+    individual is seen, every individual which dominates it has already been
+    seen in that objective's order, so it is only compared against the
+    individuals already seen in that order, front by front.
+
+    Computational complexity: O(MN^2 + MNlogN)
+        O(MNlogN) for per-objective sorting
+        O(MN^2) for front searches (worst case); O(MNK) if ``kfront`` is given
+        O(MNlogN) for final quicksorting based on dominance and objectives
+
+    Space complexity: O(2MN)
+        O(MN) for storing per-objective sorting indices
+        O(MN) for storing individuals seen per objective and front
+
+    Size definitions:
+        K = number of individuals in the first ``kfront`` fronts.
+        M = number of objectives.
+        N = number of individuals.
+
+    Parameters
+    ----------
+    x : numpy.ndarray
+        A matrix of shape ``(N,M)`` containing objective values for individuals.
+    front : numpy.ndarray
+        A vector of shape ``(N,)`` containing front assignments.
+    perm : numpy.ndarray
+        A vector of shape ``(N,)`` containing the sorting permutation.
+        Output vector. The sorted matrix is the input matrix indexed by ``perm``.
+    order : numpy.ndarray
+        A matrix of shape ``(M,N)``
+        Workspace holding per-objective sorting indices.
+        On output, holds per-objective sorting indices for the sorted matrix,
+        so that it may be reused in a subsequent call.
+    presorted : bool
+        Whether ``order`` already holds per-objective sorting indices for
+        ``x``, as calculated by ``bos_order`` or a previous call with the
+        same ``sense`` and ``cv``.
+    sense : numpy.ndarray, None
+        A vector of shape ``(M,)`` containing ``1`` for minimized and ``-1``
+        for maximized objectives. If ``None``, minimize all objectives.
+        Rows are still ordered by ascending objective values within fronts.
+    cv : numpy.ndarray, None
+        A vector of shape ``(N,)`` containing constraint violations; an
+        individual is feasible if its violation is ``<= 0``. If given, use
+        Deb's constraint-domination.
+        This vector is reordered in-place along with ``x``.
+    kfront : int, None
+        Number of fronts to assign. Fronts at or beyond ``kfront`` are never
+        searched or stored, and their individuals are left unassigned with
+        front ``pynds.presort.UNASSIGNED`` and placed last in their original
+        order. If ``None``, assign every front.
+    """
+    # assign fronts and calculate the sorting permutation
+    argndsort_bos(x, front, perm, order, presorted, sense, cv, kfront)
+
+    # reorder objective matrix and front matrix
+    permute_matrix(x, front, perm)
+
+    # reorder constraint violations along with rows
+    if cv is not None:
+        cv[:] = cv[perm]
+
+    # remap sorting indices to the sorted matrix
+    inv = numpy.empty(x.shape[0], dtype = order.dtype)
+    inv[perm] = numpy.arange(x.shape[0])
+    order[:,:] = inv[order]
+
+def argndsort_bos(x: numpy.ndarray, front: numpy.ndarray, perm: numpy.ndarray, order: numpy.ndarray, presorted: bool = False, sense: Optional[numpy.ndarray] = None, cv: Optional[numpy.ndarray] = None, kfront: Optional[int] = None) -> None:
+    """
+    Non-dominated sorting using the Best Order Sort algorithm, returning the
+    sorting permutation instead of reordering ``x``.
+
+    Parameters are as for ``ndsort_bos``. On output, ``front`` contains
+    front assignments in the order of the rows of ``x``, ``x[perm]`` is the
+    sorted matrix, and ``order`` holds per-objective sorting indices for
+    ``x``, so that it may be reused in a subsequent call. ``cv`` is not
+    modified.
+    """
+    # get the number of individuals and objectives
+    nindiv = x.shape[0]
+    nobj = x.shape[1]
+
+    # get maximized objectives
+    maximize, _ = relation_options(nobj, sense)
+
+    # calculate per-objective sorting indices
+    if not presorted:
+        bos_order(x, order, sense, cv)
+
+    # mark all individuals as unranked
+    front[:] = -1
+    nranked = 0
+
+    # rank given to individuals beyond the front limit until they are unassigned
+    limit = nindiv if kfront is None else kfront
+
+    # individuals seen in each objective's order, grouped by front
+    seen = [[] for j in range(nobj)]
+
+    # traverse orders in lockstep until all individuals are ranked
+    tstart = phase_start()
+    for i in range(nindiv):
+        if nranked == nindiv:
+            break
+        for j in range(nobj):
+            s = order[j,i]                  # get next individual in objective j
+            fronts = seen[j]                # get individuals seen in objective j
+            k = front[s]
+            if k < 0:
+                # find first front in which no individual dominates s
+                xs = x[s]
+                cvs = None if cv is None else cv[s]
+                k = 0
+                while k < len(fronts):
+                    t = fronts[k]
+                    if not dominated_by_any(xs, x[t], maximize, cvs, None if cv is None else cv[t]):
+                        break
+                    k += 1
+                front[s] = k
+                nranked += 1
+            # individuals beyond the front limit are not stored
+            if k >= limit:
+                continue
+            # add individual to its front in objective j
+            while len(fronts) <= k:
+                fronts.append([])
+            fronts[k].append(s)
+    phase_stop("peel", tstart)
+
+    # unassign individuals beyond the front limit
+    front[front >= limit] = UNASSIGNED
+
+    # quicksort first by front, then by column 0, then by column 1, ...
+    perm[:] = argfrontsort(x, front)
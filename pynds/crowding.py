@@ -0,0 +1,260 @@
+import numpy
+from typing import Optional
+from typing import Tuple
+from pynds.presort import UNASSIGNED
+
+def crowding_distance(x: numpy.ndarray, front: numpy.ndarray, out: Optional[numpy.ndarray] = None) -> numpy.ndarray:
+    """
+    Calculate NSGA-II crowding distances for a non-dominated sorted matrix.
+
+    The matrix must be sorted first by front, then by column 0, as left by
+    every sorter in this package. Each front is therefore already ordered by
+    the first objective; for every other objective, all fronts are ordered
+    at once by a single sort keyed on front.
+
+    Computational complexity: O(MNlogN)
+        O((M-1)NlogN) for ordering fronts by objectives other than the first
+        O(MN) for accumulating distances
+
+    Size definitions:
+        M = number of objectives.
+        N = number of individuals.
+
+    Parameters
+    ----------
+    x : numpy.ndarray
+        A matrix of shape ``(N,M)`` containing objective values, sorted first
+        by front, then by column 0.
+    front : numpy.ndarray
+        A vector of shape ``(N,)`` containing sorted front assignments.
+        Individuals with front ``UNASSIGNED`` must be last.
+    out : numpy.ndarray, None
+        A vector of shape ``(N,)`` to store crowding distances.
+        If ``None``, a new vector is allocated.
+
+    Returns
+    -------
+    out : numpy.ndarray
+        A vector of shape ``(N,)`` containing crowding distances. Boundary
+        individuals of each front have infinite distance; unassigned
+        individuals have ``nan``.
+    """
+    # get the number of individuals and objectives
+    nindiv = x.shape[0]
+    nobj = x.shape[1]
+
+    # allocate output
+    if out is None:
+        out = numpy.empty(nindiv, dtype = float)
+    elif out.shape != (nindiv,):
+        raise ValueError("Output vector ``out`` is not the correct shape: expected ``{0}`` but received ``{1}``".format((nindiv,),out.shape))
+
+    # assigned individuals are first, in non-decreasing front order
+    n = int(numpy.sum(front != UNASSIGNED))
+    f = front[:n]
+    if numpy.any(f == UNASSIGNED) or numpy.any(f[1:] < f[:-1]):
+        raise ValueError("Front assignments ``front`` are not sorted")
+    out[:] = 0.0
+    out[n:] = numpy.nan
+
+    # front boundaries
+    first = numpy.ones(n, dtype = bool)
+    first[1:] = f[1:] != f[:-1]
+    last = numpy.ones(n, dtype = bool)
+    last[:-1] = first[1:]
+    interior = ~(first | last)
+    seg = numpy.cumsum(first) - 1
+    starts = numpy.flatnonzero(first)
+    stops = numpy.flatnonzero(last)
+
+    # position of interior individuals in their front
+    ix = numpy.flatnonzero(interior)
+
+    for j in range(nobj):
+        # order each front by objective j; the first objective is already ordered
+        if j == 0:
+            o = numpy.arange(n)
+        else:
+            o = numpy.lexsort((x[:n,j], f))
+        v = x[o,j]
+
+        # objective range of each front
+        span = (v[stops] - v[starts])[seg[ix]]
+
+        # normalized gap between neighbours of interior individuals
+        d = numpy.zeros(len(ix), dtype = float)
+        numpy.divide(v[ix+1] - v[ix-1], span, out = d, where = span > 0)
+
+        # accumulate distances; boundary individuals are infinitely distant
+        out[o[ix]] += d
+        out[o[~interior]] = numpy.inf
+
+    return out
+
+def reference_association(x: numpy.ndarray, refs: numpy.ndarray, ideal: Optional[numpy.ndarray] = None, nadir: Optional[numpy.ndarray] = None) -> Tuple[numpy.ndarray,numpy.ndarray]:
+    """
+    Associate individuals with NSGA-III reference directions.
+
+    Objectives are normalized to ``[0,1]`` using the ideal and nadir points,
+    then each individual is associated with the reference direction which
+    has the smallest perpendicular distance to it.
+
+    Parameters
+    ----------
+    x : numpy.ndarray
+        A matrix of shape ``(N,M)`` containing objective values.
+    refs : numpy.ndarray
+        A matrix of shape ``(R,M)`` containing reference points.
+    ideal : numpy.ndarray, None
+        A vector of shape ``(M,)`` containing the ideal point.
+        If ``None``, use the minimum of each objective.
+    nadir : numpy.ndarray, None
+        A vector of shape ``(M,)`` containing the nadir point.
+        If ``None``, use the maximum of each objective.
+
+    Returns
+    -------
+    out : tuple
+        A tuple ``(assoc, dist)`` of vectors of shape ``(N,)`` containing the
+        associated reference direction of each individual, and its
+        perpendicular distance to that direction.
+    """
+    # get ideal and nadir points
+    if ideal is None:
+        ideal = x.min(axis = 0)
+    if nadir is None:
+        nadir = x.max(axis = 0)
+
+    # normalize objectives; degenerate objectives are not scaled
+    scale = nadir - ideal
+    scale = numpy.where(scale > 0, scale, 1.0)
+    xn = (x - ideal) / scale
+
+    # unit reference directions
+    w = refs / numpy.linalg.norm(refs, axis = 1)[:,None]
+
+    # squared perpendicular distance to each direction
+    proj = xn @ w.T
+    dist2 = numpy.sum(xn**2, axis = 1)[:,None] - proj**2
+    numpy.maximum(dist2, 0.0, out = dist2)
+
+    # nearest direction
+    assoc = numpy.argmin(dist2, axis = 1)
+    dist = numpy.sqrt(dist2[numpy.arange(len(x)),assoc])
+
+    return assoc, dist
+
+def niche_count(assoc: numpy.ndarray, front: numpy.ndarray, nref: int, exclude_last: bool = True) -> numpy.ndarray:
+    """
+    Count individuals associated with each NSGA-III reference direction.
+
+    Parameters
+    ----------
+    assoc : numpy.ndarray
+        A vector of shape ``(N,)`` containing associated reference directions,
+        as calculated by ``reference_association``.
+    front : numpy.ndarray
+        A vector of shape ``(N,)`` containing front assignments.
+        Individuals with front ``UNASSIGNED`` are not counted.
+    nref : int
+        Number of reference directions.
+    exclude_last : bool
+        Whether to exclude the last assigned front, which NSGA-III selects
+        from using the niche counts of the preceding fronts.
+
+    Returns
+    -------
+    out : numpy.ndarray
+        A vector of shape ``(nref,)`` containing niche counts.
+    """
+    sel = front != UNASSIGNED
+    if exclude_last and numpy.any(sel):
+        sel &= front < front[sel].max()
+    return numpy.bincount(assoc[sel], minlength = nref)
+
+def niche_count_sorted(x: numpy.ndarray, front: numpy.ndarray, refs: numpy.ndarray, out: Optional[numpy.ndarray] = None, assoc: Optional[numpy.ndarray] = None, sense: Optional[numpy.ndarray] = None) -> numpy.ndarray:
+    """
+    Calculate NSGA-III niche counts for a non-dominated sorted matrix.
+
+    The matrix must be sorted first by front, as left by every sorter in this
+    package. Assigned individuals are associated with reference directions,
+    and individuals in every front before the last assigned front are
+    counted; the start of the last front is read from the sorted front
+    boundaries rather than found by a search over all fronts.
+
+    Computational complexity: O(MNR)
+        O(MNR) for associating individuals with reference directions
+        O(N + R) for counting niches
+
+    Size definitions:
+        M = number of objectives.
+        N = number of individuals.
+        R = number of reference points.
+
+    Parameters
+    ----------
+    x : numpy.ndarray
+        A matrix of shape ``(N,M)`` containing objective values, sorted first
+        by front.
+    front : numpy.ndarray
+        A vector of shape ``(N,)`` containing sorted front assignments.
+        Individuals with front ``UNASSIGNED`` must be last.
+    refs : numpy.ndarray
+        A matrix of shape ``(R,M)`` containing reference points.
+    out : numpy.ndarray, None
+        A vector of shape ``(R,)`` to store niche counts.
+        If ``None``, a new vector is allocated.
+    assoc : numpy.ndarray, None
+        A vector of shape ``(N,)`` to store the associated reference direction
+        of each individual; unassigned individuals have ``UNASSIGNED``.
+        If ``None``, associations are not stored.
+    sense : numpy.ndarray, None
+        A vector of shape ``(M,)`` containing ``1`` for minimized and ``-1``
+        for maximized objectives. If ``None``, minimize all objectives.
+
+    Returns
+    -------
+    out : numpy.ndarray
+        A vector of shape ``(R,)`` containing niche counts of the fronts
+        preceding the last assigned front.
+    """
+    # get the number of individuals and objectives
+    nindiv = x.shape[0]
+    nobj = x.shape[1]
+
+    # test reference points and allocate outputs
+    if refs.ndim != 2 or refs.shape[1] != nobj:
+        raise ValueError("Reference points ``refs`` are not the correct shape: expected ``(nref,{0})`` but received ``{1}``".format(nobj,refs.shape))
+    nref = refs.shape[0]
+    if out is None:
+        out = numpy.empty(nref, dtype = int)
+    elif out.shape != (nref,):
+        raise ValueError("Output vector ``out`` is not the correct shape: expected ``{0}`` but received ``{1}``".format((nref,),out.shape))
+    if assoc is not None and assoc.shape != (nindiv,):
+        raise ValueError("Output vector ``assoc`` is not the correct shape: expected ``{0}`` but received ``{1}``".format((nindiv,),assoc.shape))
+
+    # assigned individuals are first, in non-decreasing front order
+    n = int(numpy.sum(front != UNASSIGNED))
+    f = front[:n]
+    if numpy.any(f == UNASSIGNED) or numpy.any(f[1:] < f[:-1]):
+        raise ValueError("Front assignments ``front`` are not sorted")
+    out[:] = 0
+    if assoc is not None:
+        assoc[n:] = UNASSIGNED
+    if n == 0:
+        return out
+
+    # the last front starts at the last front boundary
+    first = numpy.flatnonzero(f[1:] != f[:-1])
+    start = int(first[-1]) + 1 if len(first) else 0
+
+    # associate assigned individuals; maximized objectives are negated
+    xs = x[:n] if sense is None else x[:n] * sense
+    a, _ = reference_association(xs, refs)
+    if assoc is not None:
+        assoc[:n] = a
+
+    # count individuals of the preceding fronts in each niche
+    out[:] = numpy.bincount(a[:start], minlength = nref)
+
+    return out
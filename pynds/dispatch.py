@@ -0,0 +1,837 @@
+import os
+import numpy
+from typing import Iterator
+from typing import Optional
+from typing import Tuple
+from pynds.naive import ndsort_naive
+from pynds.naive import ndsort_naive1
+from pynds.naive import ndsort_naive2
+from pynds.naive import argndsort_naive
+from pynds.naive import argndsort_naive1
+from pynds.naive import argndsort_naive2
+from pynds.fast import ndsort_fast
+from pynds.fast import argndsort_fast
+from pynds.fast import iter_fronts_fast
+from pynds.ens import ndsort_ens_ss
+from pynds.ens import ndsort_ens_bs
+from pynds.ens import argndsort_ens_ss
+from pynds.ens import argndsort_ens_bs
+from pynds.biobj import ndsort_biobj
+from pynds.biobj import argndsort_biobj
+from pynds.jensen import ndsort_jensen
+from pynds.jensen import argndsort_jensen
+from pynds.bos import ndsort_bos
+from pynds.bos import argndsort_bos
+from pynds.bitset import bitset_nbytes
+from pynds.bitset import ndsort_bitset
+from pynds.bitset import argndsort_bitset
+from pynds.bitset import iter_fronts_bitset
+from pynds.relation import BLOCK_NELEM
+from pynds.relation import relation_options
+from pynds.jit import jit_supported
+from pynds.presort import UNASSIGNED
+from pynds.crowding import crowding_distance
+from pynds.crowding import niche_count_sorted
+from pynds.presort import front_limit_reached
+from pynds.presort import argfrontsort
+from pynds.presort import frontsort_matrix
+from pynds.presort import unique_rows
+from pynds.workspace import Workspace
+from pynds.workspace import workspace_empty
+from pynds.stats import SortStats
+
+# populations with at most this many individuals are sorted with an O(N^2) workspace engine
+SMALL_NINDIV = 128
+
+# populations with at most this many individuals are sorted with the bit-packed
+# O(N^2/4) workspace engine, which outpaces divide-and-conquer below this size
+BITSET_NINDIV = 1024
+
+# engines which calculate dominance relationships between pairs of individuals,
+# and so support relations which are not transitive, such as epsilon-dominance
+RELATION_ENGINES = ("naive", "naive1", "naive2", "fast", "bitset")
+
+def truncate_fronts(front: numpy.ndarray, kfront: Optional[int] = None, nfill: Optional[int] = None) -> None:
+    """
+    Mark fronts beyond an early exit as ``UNASSIGNED``, for engines which
+    always assign every front.
+
+    Parameters
+    ----------
+    front : numpy.ndarray
+        A vector of shape ``(nindiv,)`` containing front assignments.
+        Modified in-place. Individuals already ``UNASSIGNED`` stay unassigned.
+    kfront : int, None
+        Keep the first ``kfront`` fronts.
+    nfill : int, None
+        Keep the fewest first fronts holding at least ``nfill`` individuals.
+    """
+    # nothing to do if no early exit was requested
+    if kfront is None and nfill is None:
+        return
+
+    # find first front which would not have been assigned
+    counts = numpy.bincount(front[front != UNASSIGNED])
+    nassigned = 0
+    cut = 0
+    while cut < len(counts) and not front_limit_reached(cut, nassigned, kfront, nfill):
+        nassigned += counts[cut]
+        cut += 1
+
+    # unassign later fronts
+    front[front >= cut] = UNASSIGNED
+
+def truncate_argfronts(front: numpy.ndarray, perm: numpy.ndarray, kfront: Optional[int] = None, nfill: Optional[int] = None) -> None:
+    """
+    Mark fronts beyond an early exit as ``UNASSIGNED``, as by
+    ``truncate_fronts``, and update a sorting permutation to match.
+
+    Parameters
+    ----------
+    front : numpy.ndarray
+        A vector of shape ``(nindiv,)`` containing front assignments.
+        Modified in-place. Individuals already ``UNASSIGNED`` stay unassigned.
+    perm : numpy.ndarray
+        A vector of shape ``(nindiv,)`` containing sorting indices, ordered
+        first by front, with unassigned individuals last. Modified in-place.
+    kfront : int, None
+        Keep the first ``kfront`` fronts.
+    nfill : int, None
+        Keep the fewest first fronts holding at least ``nfill`` individuals.
+    """
+    # nothing to do if no early exit was requested
+    if kfront is None and nfill is None:
+        return
+
+    # unassign later fronts
+    truncate_fronts(front, kfront, nfill)
+
+    # assigned individuals stay first; unassigned individuals are placed last, in their original order
+    nassigned = numpy.count_nonzero(front != UNASSIGNED)
+    perm[nassigned:] = numpy.sort(perm[nassigned:])
+
+def run_naive(x: numpy.ndarray, front: numpy.ndarray, n_jobs: int = 1, kfront: Optional[int] = None, nfill: Optional[int] = None, workspace: Optional[Workspace] = None, sense: Optional[numpy.ndarray] = None, eps: Optional[numpy.ndarray] = None, cv: Optional[numpy.ndarray] = None) -> None:
+    ndsort_naive(x, front, inplace = True, kfront = kfront, nfill = nfill, sense = sense, eps = eps, cv = cv)
+    perm = frontsort_matrix(x, front)
+    if cv is not None:
+        cv[:] = cv[perm]
+
+def run_naive1(x: numpy.ndarray, front: numpy.ndarray, n_jobs: int = 1, kfront: Optional[int] = None, nfill: Optional[int] = None, workspace: Optional[Workspace] = None, sense: Optional[numpy.ndarray] = None, eps: Optional[numpy.ndarray] = None, cv: Optional[numpy.ndarray] = None) -> None:
+    nindiv = x.shape[0]
+    rem = workspace_empty(workspace, "rem", nindiv, int)
+    mask = workspace_empty(workspace, "mask", nindiv, bool)
+    ndsort_naive1(x, front, rem, mask, kfront = kfront, nfill = nfill, sense = sense, eps = eps, cv = cv)
+
+def run_naive2(x: numpy.ndarray, front: numpy.ndarray, n_jobs: int = 1, kfront: Optional[int] = None, nfill: Optional[int] = None, workspace: Optional[Workspace] = None, sense: Optional[numpy.ndarray] = None, eps: Optional[numpy.ndarray] = None, cv: Optional[numpy.ndarray] = None) -> None:
+    nindiv = x.shape[0]
+    dom = workspace_empty(workspace, "dom", (nindiv,nindiv), int)
+    rem = workspace_empty(workspace, "rem", nindiv, int)
+    mask = workspace_empty(workspace, "mask", nindiv, bool)
+    ndsort_naive2(x, front, dom, rem, mask, n_jobs = n_jobs, kfront = kfront, nfill = nfill, sense = sense, eps = eps, cv = cv)
+
+def run_fast(x: numpy.ndarray, front: numpy.ndarray, n_jobs: int = 1, kfront: Optional[int] = None, nfill: Optional[int] = None, workspace: Optional[Workspace] = None, sense: Optional[numpy.ndarray] = None, eps: Optional[numpy.ndarray] = None, cv: Optional[numpy.ndarray] = None) -> None:
+    nindiv = x.shape[0]
+    dom = workspace_empty(workspace, "dom", (nindiv,nindiv), int)
+    cnt = workspace_empty(workspace, "cnt", nindiv, int)
+    rem = workspace_empty(workspace, "rem", nindiv, int)
+    ndsort_fast(x, front, dom, cnt, rem, n_jobs = n_jobs, kfront = kfront, nfill = nfill, sense = sense, eps = eps, cv = cv)
+
+def run_bitset(x: numpy.ndarray, front: numpy.ndarray, n_jobs: int = 1, kfront: Optional[int] = None, nfill: Optional[int] = None, workspace: Optional[Workspace] = None, sense: Optional[numpy.ndarray] = None, eps: Optional[numpy.ndarray] = None, cv: Optional[numpy.ndarray] = None) -> None:
+    nindiv = x.shape[0]
+    nbytes = bitset_nbytes(nindiv)
+    dom = workspace_empty(workspace, "dom", (nindiv,nbytes), numpy.uint8)
+    domd = workspace_empty(workspace, "domd", (nindiv,nbytes), numpy.uint8)
+    cnt = workspace_empty(workspace, "cnt", nindiv, int)
+    rem = workspace_empty(workspace, "rem", nindiv, int)
+    ndsort_bitset(x, front, dom, domd, cnt, rem, n_jobs = n_jobs, kfront = kfront, nfill = nfill, sense = sense, eps = eps, cv = cv)
+
+def require_transitive(engine: str, eps: Optional[numpy.ndarray] = None) -> None:
+    """
+    Test that epsilon-dominance is not requested from an engine which
+    presorts objective values: epsilon-dominance is not transitive and
+    cannot be presorted.
+    """
+    if eps is not None:
+        raise ValueError("Engine ``{0}`` does not support epsilon-dominance: use one of ``{1}``".format(engine, RELATION_ENGINES))
+
+def run_ens_ss(x: numpy.ndarray, front: numpy.ndarray, n_jobs: int = 1, kfront: Optional[int] = None, nfill: Optional[int] = None, workspace: Optional[Workspace] = None, sense: Optional[numpy.ndarray] = None, eps: Optional[numpy.ndarray] = None, cv: Optional[numpy.ndarray] = None) -> None:
+    require_transitive("ens_ss", eps)
+    nindiv = x.shape[0]
+    perm = workspace_empty(workspace, "perm", nindiv, int)
+    head = workspace_empty(workspace, "head", nindiv, int)
+    link = workspace_empty(workspace, "link", nindiv, int)
+    ndsort_ens_ss(x, front, perm, head, link, sense = sense, cv = cv, kfront = kfront)
+    truncate_fronts(front, kfront, nfill)
+
+def run_ens_bs(x: numpy.ndarray, front: numpy.ndarray, n_jobs: int = 1, kfront: Optional[int] = None, nfill: Optional[int] = None, workspace: Optional[Workspace] = None, sense: Optional[numpy.ndarray] = None, eps: Optional[numpy.ndarray] = None, cv: Optional[numpy.ndarray] = None) -> None:
+    require_transitive("ens_bs", eps)
+    nindiv = x.shape[0]
+    perm = workspace_empty(workspace, "perm", nindiv, int)
+    head = workspace_empty(workspace, "head", nindiv, int)
+    link = workspace_empty(workspace, "link", nindiv, int)
+    ndsort_ens_bs(x, front, perm, head, link, sense = sense, cv = cv, kfront = kfront)
+    truncate_fronts(front, kfront, nfill)
+
+def run_biobj(x: numpy.ndarray, front: numpy.ndarray, n_jobs: int = 1, kfront: Optional[int] = None, nfill: Optional[int] = None, workspace: Optional[Workspace] = None, sense: Optional[numpy.ndarray] = None, eps: Optional[numpy.ndarray] = None, cv: Optional[numpy.ndarray] = None) -> None:
+    require_transitive("biobj", eps)
+    perm = workspace_empty(workspace, "perm", x.shape[0], int)
+    ndsort_biobj(x, front, perm, sense = sense, cv = cv, kfront = kfront)
+    truncate_fronts(front, kfront, nfill)
+
+def run_jensen(x: numpy.ndarray, front: numpy.ndarray, n_jobs: int = 1, kfront: Optional[int] = None, nfill: Optional[int] = None, workspace: Optional[Workspace] = None, sense: Optional[numpy.ndarray] = None, eps: Optional[numpy.ndarray] = None, cv: Optional[numpy.ndarray] = None) -> None:
+    require_transitive("jensen", eps)
+    perm = workspace_empty(workspace, "perm", x.shape[0], int)
+    ndsort_jensen(x, front, perm, sense = sense, cv = cv)
+    truncate_fronts(front, kfront, nfill)
+
+def run_bos(x: numpy.ndarray, front: numpy.ndarray, n_jobs: int = 1, kfront: Optional[int] = None, nfill: Optional[int] = None, workspace: Optional[Workspace] = None, sense: Optional[numpy.ndarray] = None, eps: Optional[numpy.ndarray] = None, cv: Optional[numpy.ndarray] = None) -> None:
+    require_transitive("bos", eps)
+    perm = workspace_empty(workspace, "perm", x.shape[0], int)
+    order = workspace_empty(workspace, "order", (x.shape[1],x.shape[0]), int)
+    ndsort_bos(x, front, perm, order, sense = sense, cv = cv, kfront = kfront)
+    truncate_fronts(front, kfront, nfill)
+
+def argrun_naive(x: numpy.ndarray, front: numpy.ndarray, perm: numpy.ndarray, n_jobs: int = 1, kfront: Optional[int] = None, nfill: Optional[int] = None, workspace: Optional[Workspace] = None, sense: Optional[numpy.ndarray] = None, eps: Optional[numpy.ndarray] = None, cv: Optional[numpy.ndarray] = None) -> None:
+    argndsort_naive(x, front, perm, kfront = kfront, nfill = nfill, sense = sense, eps = eps, cv = cv)
+
+def argrun_naive1(x: numpy.ndarray, front: numpy.ndarray, perm: numpy.ndarray, n_jobs: int = 1, kfront: Optional[int] = None, nfill: Optional[int] = None, workspace: Optional[Workspace] = None, sense: Optional[numpy.ndarray] = None, eps: Optional[numpy.ndarray] = None, cv: Optional[numpy.ndarray] = None) -> None:
+    nindiv = x.shape[0]
+    rem = workspace_empty(workspace, "rem", nindiv, int)
+    mask = workspace_empty(workspace, "mask", nindiv, bool)
+    argndsort_naive1(x, front, perm, rem, mask, kfront = kfront, nfill = nfill, sense = sense, eps = eps, cv = cv)
+
+def argrun_naive2(x: numpy.ndarray, front: numpy.ndarray, perm: numpy.ndarray, n_jobs: int = 1, kfront: Optional[int] = None, nfill: Optional[int] = None, workspace: Optional[Workspace] = None, sense: Optional[numpy.ndarray] = None, eps: Optional[numpy.ndarray] = None, cv: Optional[numpy.ndarray] = None) -> None:
+    nindiv = x.shape[0]
+    dom = workspace_empty(workspace, "dom", (nindiv,nindiv), int)
+    rem = workspace_empty(workspace, "rem", nindiv, int)
+    mask = workspace_empty(workspace, "mask", nindiv, bool)
+    argndsort_naive2(x, front, perm, dom, rem, mask, n_jobs = n_jobs, kfront = kfront, nfill = nfill, sense = sense, eps = eps, cv = cv)
+
+def argrun_fast(x: numpy.ndarray, front: numpy.ndarray, perm: numpy.ndarray, n_jobs: int = 1, kfront: Optional[int] = None, nfill: Optional[int] = None, workspace: Optional[Workspace] = None, sense: Optional[numpy.ndarray] = None, eps: Optional[numpy.ndarray] = None, cv: Optional[numpy.ndarray] = None) -> None:
+    nindiv = x.shape[0]
+    dom = workspace_empty(workspace, "dom", (nindiv,nindiv), int)
+    cnt = workspace_empty(workspace, "cnt", nindiv, int)
+    rem = workspace_empty(workspace, "rem", nindiv, int)
+    argndsort_fast(x, front, perm, dom, cnt, rem, n_jobs = n_jobs, kfront = kfront, nfill = nfill, sense = sense, eps = eps, cv = cv)
+
+def argrun_bitset(x: numpy.ndarray, front: numpy.ndarray, perm: numpy.ndarray, n_jobs: int = 1, kfront: Optional[int] = None, nfill: Optional[int] = None, workspace: Optional[Workspace] = None, sense: Optional[numpy.ndarray] = None, eps: Optional[numpy.ndarray] = None, cv: Optional[numpy.ndarray] = None) -> None:
+    nindiv = x.shape[0]
+    nbytes = bitset_nbytes(nindiv)
+    dom = workspace_empty(workspace, "dom", (nindiv,nbytes), numpy.uint8)
+    domd = workspace_empty(workspace, "domd", (nindiv,nbytes), numpy.uint8)
+    cnt = workspace_empty(workspace, "cnt", nindiv, int)
+    rem = workspace_empty(workspace, "rem", nindiv, int)
+    argndsort_bitset(x, front, perm, dom, domd, cnt, rem, n_jobs = n_jobs, kfront = kfront, nfill = nfill, sense = sense, eps = eps, cv = cv)
+
+def argrun_ens_ss(x: numpy.ndarray, front: numpy.ndarray, perm: numpy.ndarray, n_jobs: int = 1, kfront: Optional[int] = None, nfill: Optional[int] = None, workspace: Optional[Workspace] = None, sense: Optional[numpy.ndarray] = None, eps: Optional[numpy.ndarray] = None, cv: Optional[numpy.ndarray] = None) -> None:
+    require_transitive("ens_ss", eps)
+    nindiv = x.shape[0]
+    head = workspace_empty(workspace, "head", nindiv, int)
+    link = workspace_empty(workspace, "link", nindiv, int)
+    argndsort_ens_ss(x, front, perm, head, link, sense = sense, cv = cv, kfront = kfront)
+    truncate_argfronts(front, perm, kfront, nfill)
+
+def argrun_ens_bs(x: numpy.ndarray, front: numpy.ndarray, perm: numpy.ndarray, n_jobs: int = 1, kfront: Optional[int] = None, nfill: Optional[int] = None, workspace: Optional[Workspace] = None, sense: Optional[numpy.ndarray] = None, eps: Optional[numpy.ndarray] = None, cv: Optional[numpy.ndarray] = None) -> None:
+    require_transitive("ens_bs", eps)
+    nindiv = x.shape[0]
+    head = workspace_empty(workspace, "head", nindiv, int)
+    link = workspace_empty(workspace, "link", nindiv, int)
+    argndsort_ens_bs(x, front, perm, head, link, sense = sense, cv = cv, kfront = kfront)
+    truncate_argfronts(front, perm, kfront, nfill)
+
+def argrun_biobj(x: numpy.ndarray, front: numpy.ndarray, perm: numpy.ndarray, n_jobs: int = 1, kfront: Optional[int] = None, nfill: Optional[int] = None, workspace: Optional[Workspace] = None, sense: Optional[numpy.ndarray] = None, eps: Optional[numpy.ndarray] = None, cv: Optional[numpy.ndarray] = None) -> None:
+    require_transitive("biobj", eps)
+    argndsort_biobj(x, front, perm, sense = sense, cv = cv, kfront = kfront)
+    truncate_argfronts(front, perm, kfront, nfill)
+
+def argrun_jensen(x: numpy.ndarray, front: numpy.ndarray, perm: numpy.ndarray, n_jobs: int = 1, kfront: Optional[int] = None, nfill: Optional[int] = None, workspace: Optional[Workspace] = None, sense: Optional[numpy.ndarray] = None, eps: Optional[numpy.ndarray] = None, cv: Optional[numpy.ndarray] = None) -> None:
+    require_transitive("jensen", eps)
+    argndsort_jensen(x, front, perm, sense = sense, cv = cv)
+    truncate_argfronts(front, perm, kfront, nfill)
+
+def argrun_bos(x: numpy.ndarray, front: numpy.ndarray, perm: numpy.ndarray, n_jobs: int = 1, kfront: Optional[int] = None, nfill: Optional[int] = None, workspace: Optional[Workspace] = None, sense: Optional[numpy.ndarray] = None, eps: Optional[numpy.ndarray] = None, cv: Optional[numpy.ndarray] = None) -> None:
+    require_transitive("bos", eps)
+    order = workspace_empty(workspace, "order", (x.shape[1],x.shape[0]), int)
+    argndsort_bos(x, front, perm, order, sense = sense, cv = cv, kfront = kfront)
+    truncate_argfronts(front, perm, kfront, nfill)
+
+# engine names and functions which allocate workspaces, or take them from a
+# workspace pool, and sort in-place
+# engines which do not calculate dominance relationship matrices ignore ``n_jobs``
+# engines which cannot stop early are truncated after sorting; engines which
+# only stop early for ``kfront`` are also truncated for ``nfill``
+ENGINES = {
+    "naive":  run_naive,
+    "naive1": run_naive1,
+    "naive2": run_naive2,
+    "fast":   run_fast,
+    "bitset": run_bitset,
+    "ens_ss": run_ens_ss,
+    "ens_bs": run_ens_bs,
+    "biobj":  run_biobj,
+    "jensen": run_jensen,
+    "bos":    run_bos,
+}
+
+# engine names and functions which calculate front assignments and sorting
+# permutations without modifying ``x``
+ARG_ENGINES = {
+    "naive":  argrun_naive,
+    "naive1": argrun_naive1,
+    "naive2": argrun_naive2,
+    "fast":   argrun_fast,
+    "bitset": argrun_bitset,
+    "ens_ss": argrun_ens_ss,
+    "ens_bs": argrun_ens_bs,
+    "biobj":  argrun_biobj,
+    "jensen": argrun_jensen,
+    "bos":    argrun_bos,
+}
+
+def available_memory() -> Optional[int]:
+    """
+    Get the amount of available physical memory.
+
+    Returns
+    -------
+    out : int, None
+        Available physical memory in bytes, or ``None`` if it cannot be determined.
+    """
+    try:
+        return os.sysconf("SC_AVPHYS_PAGES") * os.sysconf("SC_PAGE_SIZE")
+    except (AttributeError, ValueError, OSError):
+        return None
+
+def engine_memory(engine: str, nindiv: int, nobj: int) -> int:
+    """
+    Estimate the workspace memory needed by an engine.
+
+    Parameters
+    ----------
+    engine : str
+        Name of the engine.
+    nindiv : int
+        Number of individuals.
+    nobj : int
+        Number of objectives.
+
+    Returns
+    -------
+    out : int
+        Estimated workspace memory in bytes.
+    """
+    itemsize = numpy.dtype(int).itemsize
+    if engine == "naive2":
+        return itemsize * (nindiv * nindiv + 2 * nindiv)
+    if engine == "fast":
+        # count decrements, and the block of rows gathered while peeling a front
+        return itemsize * (nindiv * nindiv + 3 * nindiv) + (itemsize + 1) * min(nindiv * nindiv, BLOCK_NELEM)
+    if engine == "bitset":
+        return 2 * nindiv * bitset_nbytes(nindiv) + itemsize * 2 * nindiv
+    if engine in ("jensen", "bos"):
+        return itemsize * (2 * nobj * nindiv + 2 * nindiv)
+    return itemsize * 3 * nindiv
+
+def select_engine(nindiv: int, nobj: int, dtype: numpy.dtype = numpy.dtype(float), memory: Optional[int] = None, transitive: bool = True, limited: bool = False, compiled: bool = False) -> str:
+    """
+    Select the fastest available non-dominated sorting engine for a problem.
+
+    Parameters
+    ----------
+    nindiv : int
+        Number of individuals.
+    nobj : int
+        Number of objectives.
+    dtype : numpy.dtype
+        Data type of objective values.
+    memory : int, None
+        Memory budget in bytes for workspaces.
+        If ``None``, use the available physical memory, if it can be determined.
+    transitive : bool
+        Whether the dominance relation is transitive. If ``False``, as for
+        epsilon-dominance, only engines in ``RELATION_ENGINES`` are selected.
+    limited : bool
+        Whether sorting stops after ``kfront`` fronts. Limits on ``nfill``
+        alone do not count: the compiled ENS sweep only stops at ``kfront``.
+    compiled : bool
+        Whether compiled kernels support the input, as by
+        ``pynds.jit.jit_supported``.
+
+    Returns
+    -------
+    out : str
+        Name of the selected engine.
+    """
+    # non-numeric objectives only support element-wise comparisons
+    if numpy.dtype(dtype).kind not in "biuf":
+        return "naive1"
+
+    # relations which are not transitive need pairwise dominance relationships
+    if not transitive:
+        if memory is None:
+            memory = available_memory()
+        if memory is None or engine_memory("fast", nindiv, nobj) <= memory:
+            return "fast"
+        if engine_memory("bitset", nindiv, nobj) <= memory:
+            return "bitset"
+        return "naive1"
+
+    # two objectives: O(NlogN) sweep
+    if nobj == 2:
+        return "biobj"
+
+    # early exit: the compiled ENS sweep never searches fronts beyond
+    # ``kfront``; engines which stop peeling early still calculate every
+    # dominance relationship, which dominates their cost. ENS applies
+    # ``nfill`` only after a full sort, so ``nfill`` alone does not select it
+    if limited and compiled:
+        return "ens_ss"
+
+    # get memory budget
+    if memory is None:
+        memory = available_memory()
+
+    # small populations: O(N^2) dominance matrix is cheapest, if it fits
+    if nindiv <= SMALL_NINDIV and (memory is None or engine_memory("fast", nindiv, nobj) <= memory):
+        return "fast"
+
+    # small and medium populations: bit-packed dominance matrix, if it fits
+    if nindiv <= BITSET_NINDIV and (memory is None or engine_memory("bitset", nindiv, nobj) <= memory):
+        return "bitset"
+
+    # otherwise divide-and-conquer with O(MN) workspace
+    return "jensen"
+
+def resolve_engine(x: numpy.ndarray, engine: str = "auto", memory: Optional[int] = None, transitive: bool = True, limited: bool = False, compiled: bool = False) -> str:
+    """
+    Test an input matrix and resolve the name of the engine to sort it with.
+
+    Parameters
+    ----------
+    x : numpy.ndarray
+        A matrix of shape ``(nindiv,nobj)`` containing objective values for individuals.
+    engine : str
+        Name of the engine to use, or ``"auto"`` to select one using ``select_engine``.
+    memory : int, None
+        Memory budget in bytes for workspaces when ``engine == "auto"``.
+    transitive : bool
+        Whether the dominance relation is transitive, as for ``select_engine``.
+    limited : bool
+        Whether sorting stops after ``kfront`` fronts, as for ``select_engine``.
+    compiled : bool
+        Whether compiled kernels support the input, as for ``select_engine``.
+
+    Returns
+    -------
+    out : str
+        Name of the engine.
+    """
+    # test input shape
+    if x.ndim != 2:
+        raise ValueError("Input matrix ``x`` must have 2 dimensions: received ``{0}``".format(x.ndim))
+
+    # select engine
+    if engine == "auto":
+        return select_engine(x.shape[0], x.shape[1], x.dtype, memory, transitive, limited, compiled)
+    if engine not in ENGINES:
+        raise ValueError("Unknown engine ``{0}``: must be one of ``{1}``".format(engine, tuple(ENGINES)))
+    if not transitive and engine not in RELATION_ENGINES:
+        raise ValueError("Engine ``{0}`` does not support epsilon-dominance: use one of ``{1}``".format(engine, RELATION_ENGINES))
+    return engine
+
+def check_relation_options(x: numpy.ndarray, sense: Optional[numpy.ndarray] = None, eps: Optional[numpy.ndarray] = None, cv: Optional[numpy.ndarray] = None) -> None:
+    """
+    Test objective sense, epsilon, and constraint violation options before
+    any work is done.
+
+    Parameters
+    ----------
+    x : numpy.ndarray
+        A matrix of shape ``(nindiv,nobj)`` containing objective values for individuals.
+    sense : numpy.ndarray, None
+        A vector of shape ``(nobj,)`` containing ``1`` for minimized and
+        ``-1`` for maximized objectives.
+    eps : float, numpy.ndarray, None
+        Additive epsilon for each objective.
+    cv : numpy.ndarray, None
+        A vector of shape ``(nindiv,)`` containing constraint violations.
+    """
+    relation_options(x.shape[1], sense, eps)
+    if cv is not None and cv.shape != (x.shape[0],):
+        raise ValueError("Constraint violations ``cv`` are not the correct shape: expected ``{0}`` but received ``{1}``".format((x.shape[0],),cv.shape))
+
+def output_vector(name: str, out: Optional[numpy.ndarray], nindiv: int) -> numpy.ndarray:
+    """
+    Allocate an integer output vector, or test the shape of a given one.
+
+    Parameters
+    ----------
+    name : str
+        Name of the output vector, for error messages.
+    out : numpy.ndarray, None
+        Output vector. If ``None``, a new vector is allocated.
+    nindiv : int
+        Number of individuals.
+
+    Returns
+    -------
+    out : numpy.ndarray
+        A vector of shape ``(nindiv,)``.
+    """
+    if out is None:
+        return numpy.empty(nindiv, dtype = int)
+    if out.shape != (nindiv,):
+        raise ValueError("Output vector ``{0}`` is not the correct shape: expected ``{1}`` but received ``{2}``".format(name,(nindiv,),out.shape))
+    return out
+
+def argrun_unique(engine: str, x: numpy.ndarray, front: numpy.ndarray, perm: numpy.ndarray, memory: Optional[int] = None, n_jobs: int = 1, kfront: Optional[int] = None, nfill: Optional[int] = None, workspace: Optional[Workspace] = None, sense: Optional[numpy.ndarray] = None, eps: Optional[numpy.ndarray] = None, cv: Optional[numpy.ndarray] = None) -> str:
+    """
+    Collapse identical individuals, sort one representative of each with an
+    engine, then expand front assignments to every individual.
+
+    Identical individuals never dominate one another, so they share a front
+    and only need to be compared once. ``nfill`` counts every individual, so
+    it is applied after expanding front assignments.
+
+    Returns
+    -------
+    out : str
+        Name of the engine which was used, selected for the unique individuals
+        if ``engine == "auto"``.
+    """
+    # one representative of each run of identical rows
+    first, inverse = unique_rows(x, cv)
+    xu = x[first]
+    cvu = None if cv is None else cv[first]
+
+    # select engine for the unique individuals
+    engine = resolve_engine(xu, engine, memory, eps is None, kfront is not None, jit_supported(xu, sense, eps, cvu))
+
+    # sort unique individuals
+    nunique = len(first)
+    fu = workspace_empty(workspace, "ufront", nunique, int)
+    pu = workspace_empty(workspace, "uperm", nunique, int)
+    ARG_ENGINES[engine](xu, fu, pu, n_jobs = n_jobs, kfront = kfront, workspace = workspace, sense = sense, eps = eps, cv = cvu)
+
+    # expand front assignments to identical individuals
+    front[:] = fu[inverse]
+    truncate_fronts(front, nfill = nfill)
+    perm[:] = argfrontsort(x, front)
+
+    return engine
+
+def ndsort(x: numpy.ndarray, front: Optional[numpy.ndarray] = None, engine: str = "auto", memory: Optional[int] = None, n_jobs: int = 1, kfront: Optional[int] = None, nfill: Optional[int] = None, workspace: Optional[Workspace] = None, crowding: Optional[numpy.ndarray] = None, refs: Optional[numpy.ndarray] = None, niche: Optional[numpy.ndarray] = None, sense: Optional[numpy.ndarray] = None, eps: Optional[numpy.ndarray] = None, cv: Optional[numpy.ndarray] = None, dedup: bool = False, stats: Optional[SortStats] = None) -> Tuple[numpy.ndarray,str]:
+    """
+    In-place non-dominated sorting using an automatically selected engine.
+
+    Workspaces are allocated for the selected engine, or taken from a
+    workspace pool if one is given. After sorting, rows are
+    ordered first by front, then by column 0, then by column 1, ...
+
+    Parameters
+    ----------
+    x : numpy.ndarray
+        A matrix of shape ``(nindiv,nobj)`` containing objective values for individuals.
+        This matrix is modified in-place.
+    front : numpy.ndarray, None
+        A vector of shape ``(nindiv,)`` to store front assignments.
+        If ``None``, a new vector is allocated.
+    engine : str
+        Name of the engine to use, or ``"auto"`` to select one using ``select_engine``.
+        Must be ``"auto"`` or a key of ``ENGINES``.
+    memory : int, None
+        Memory budget in bytes for workspaces when ``engine == "auto"``.
+        If ``None``, use the available physical memory, if it can be determined.
+    n_jobs : int
+        Number of threads over which to spread the calculation of dominance
+        relationships, for engines which calculate them.
+        If ``-1``, use all available processors.
+    kfront : int, None
+        Stop once ``kfront`` fronts have been assigned.
+    nfill : int, None
+        Stop once at least ``nfill`` individuals have been assigned.
+        Individuals left unassigned have front ``pynds.presort.UNASSIGNED``
+        and are placed last, in an engine-dependent order.
+    workspace : pynds.workspace.Workspace, None
+        Workspace pool from which to take workspaces, so that repeated sorts
+        at similar sizes allocate nothing. If ``None``, workspaces are allocated.
+    crowding : numpy.ndarray, None
+        A vector of shape ``(nindiv,)`` to store NSGA-II crowding distances of
+        the sorted individuals, calculated from the sorted order and front
+        boundaries. If ``None``, crowding distances are not calculated.
+    refs : numpy.ndarray, None
+        A matrix of shape ``(nref,nobj)`` containing NSGA-III reference points.
+        If given, ``niche`` must also be given.
+    niche : numpy.ndarray, None
+        A vector of shape ``(nref,)`` to store NSGA-III niche counts of the
+        fronts preceding the last assigned front, calculated from the sorted
+        front boundaries. If ``None``, niche counts are not calculated.
+    sense : numpy.ndarray, None
+        A vector of shape ``(nobj,)`` containing ``1`` for minimized and
+        ``-1`` for maximized objectives. If ``None``, minimize all objectives.
+        Rows are still ordered by ascending objective values within fronts.
+    eps : float, numpy.ndarray, None
+        Additive epsilon for each objective; use epsilon-dominance instead of
+        Pareto dominance. Only supported by ``RELATION_ENGINES``; individuals
+        caught in epsilon-dominance cycles are left ``UNASSIGNED``.
+        If ``None``, use Pareto dominance.
+    cv : numpy.ndarray, None
+        A vector of shape ``(nindiv,)`` containing constraint violations; an
+        individual is feasible if its violation is ``<= 0``. If given, use
+        Deb's constraint-domination.
+        This vector is reordered in-place along with ``x``.
+    dedup : bool
+        Whether to collapse identical individuals before sorting, so that
+        only unique individuals are compared. This is much faster for
+        populations with many duplicates, as in converged populations.
+        Identical individuals always share a front, with or without ``dedup``.
+    stats : pynds.stats.SortStats, None
+        Statistics collector to fill with dominance comparison counts, phase
+        times and front sizes. If ``None``, statistics are not collected.
+
+    Returns
+    -------
+    out : tuple
+        A tuple ``(front, engine)`` containing front assignments and the name
+        of the engine which was used.
+    """
+    # collect statistics while sorting
+    if stats is not None:
+        with stats:
+            out = ndsort(x, front, engine, memory, n_jobs, kfront, nfill, workspace, crowding, refs, niche, sense, eps, cv, dedup)
+        stats.record_fronts(out[0])
+        return out
+
+    # test input and select engine
+    requested = engine
+    engine = resolve_engine(x, engine, memory, eps is None, kfront is not None, jit_supported(x, sense, eps, cv))
+    check_relation_options(x, sense, eps, cv)
+    if (refs is None) != (niche is None):
+        raise ValueError("Reference points ``refs`` and niche counts ``niche`` must be given together")
+
+    # allocate output
+    front = output_vector("front", front, x.shape[0])
+
+    # sort unique individuals with an engine selected for them, then reorder
+    if dedup:
+        perm = workspace_empty(workspace, "perm", x.shape[0], int)
+        engine = argrun_unique(requested, x, front, perm, memory = memory, n_jobs = n_jobs, kfront = kfront, nfill = nfill, workspace = workspace, sense = sense, eps = eps, cv = cv)
+        x[:,:] = x[perm]
+        front[:] = front[perm]
+        if cv is not None:
+            cv[:] = cv[perm]
+
+    # sort
+    else:
+        ENGINES[engine](x, front, n_jobs = n_jobs, kfront = kfront, nfill = nfill, workspace = workspace, sense = sense, eps = eps, cv = cv)
+
+    # crowding distances, reusing the ordering of each front by column 0
+    if crowding is not None:
+        crowding_distance(x, front, out = crowding)
+
+    # niche counts of reference directions, reusing the front boundaries
+    if refs is not None:
+        niche_count_sorted(x, front, refs, out = niche, sense = sense)
+
+    return front, engine
+
+def argndsort(x: numpy.ndarray, front: Optional[numpy.ndarray] = None, perm: Optional[numpy.ndarray] = None, engine: str = "auto", memory: Optional[int] = None, n_jobs: int = 1, kfront: Optional[int] = None, nfill: Optional[int] = None, workspace: Optional[Workspace] = None, sense: Optional[numpy.ndarray] = None, eps: Optional[numpy.ndarray] = None, cv: Optional[numpy.ndarray] = None, dedup: bool = False, stats: Optional[SortStats] = None) -> Tuple[numpy.ndarray,numpy.ndarray,str]:
+    """
+    Non-dominated sorting using an automatically selected engine, returning
+    the sorting permutation instead of reordering ``x``.
+
+    ``x`` is not modified: every engine assigns fronts and calculates the
+    permutation without reordering ``x``.
+
+    Parameters
+    ----------
+    x : numpy.ndarray
+        A matrix of shape ``(nindiv,nobj)`` containing objective values for individuals.
+    front : numpy.ndarray, None
+        A vector of shape ``(nindiv,)`` to store front assignments, in the
+        order of the rows of ``x``. If ``None``, a new vector is allocated.
+    perm : numpy.ndarray, None
+        A vector of shape ``(nindiv,)`` to store the sorting permutation.
+        ``x[perm]`` is ordered first by front, then by column 0, then by
+        column 1, ... If ``None``, a new vector is allocated.
+    engine : str
+        Name of the engine to use, or ``"auto"`` to select one using ``select_engine``.
+        Must be ``"auto"`` or a key of ``ARG_ENGINES``.
+    memory : int, None
+        Memory budget in bytes for workspaces when ``engine == "auto"``.
+        If ``None``, use the available physical memory, if it can be determined.
+    n_jobs : int
+        Number of threads over which to spread the calculation of dominance
+        relationships, for engines which calculate them.
+        If ``-1``, use all available processors.
+    kfront : int, None
+        Stop once ``kfront`` fronts have been assigned.
+    nfill : int, None
+        Stop once at least ``nfill`` individuals have been assigned.
+        Individuals left unassigned have front ``pynds.presort.UNASSIGNED``
+        and are placed last, in their original order.
+    workspace : pynds.workspace.Workspace, None
+        Workspace pool from which to take workspaces, so that repeated sorts
+        at similar sizes allocate nothing. If ``None``, workspaces are allocated.
+    sense : numpy.ndarray, None
+        A vector of shape ``(nobj,)`` containing ``1`` for minimized and
+        ``-1`` for maximized objectives. If ``None``, minimize all objectives.
+        Rows are still ordered by ascending objective values within fronts.
+    eps : float, numpy.ndarray, None
+        Additive epsilon for each objective; use epsilon-dominance instead of
+        Pareto dominance. Only supported by ``RELATION_ENGINES``; individuals
+        caught in epsilon-dominance cycles are left ``UNASSIGNED``.
+        If ``None``, use Pareto dominance.
+    cv : numpy.ndarray, None
+        A vector of shape ``(nindiv,)`` containing constraint violations; an
+        individual is feasible if its violation is ``<= 0``. If given, use
+        Deb's constraint-domination. This vector is not modified.
+    dedup : bool
+        Whether to collapse identical individuals before sorting, as for
+        ``ndsort``.
+    stats : pynds.stats.SortStats, None
+        Statistics collector to fill with dominance comparison counts, phase
+        times and front sizes. If ``None``, statistics are not collected.
+
+    Returns
+    -------
+    out : tuple
+        A tuple ``(perm, front, engine)`` containing the sorting permutation,
+        front assignments, and the name of the engine which was used.
+    """
+    # collect statistics while sorting
+    if stats is not None:
+        with stats:
+            out = argndsort(x, front, perm, engine, memory, n_jobs, kfront, nfill, workspace, sense, eps, cv, dedup)
+        stats.record_fronts(out[1])
+        return out
+
+    # test input and select engine
+    requested = engine
+    engine = resolve_engine(x, engine, memory, eps is None, kfront is not None, jit_supported(x, sense, eps, cv))
+    check_relation_options(x, sense, eps, cv)
+
+    # allocate outputs
+    front = output_vector("front", front, x.shape[0])
+    perm = output_vector("perm", perm, x.shape[0])
+
+    # sort unique individuals with an engine selected for them
+    if dedup:
+        engine = argrun_unique(requested, x, front, perm, memory = memory, n_jobs = n_jobs, kfront = kfront, nfill = nfill, workspace = workspace, sense = sense, eps = eps, cv = cv)
+        return perm, front, engine
+
+    # sort
+    ARG_ENGINES[engine](x, front, perm, n_jobs = n_jobs, kfront = kfront, nfill = nfill, workspace = workspace, sense = sense, eps = eps, cv = cv)
+
+    return perm, front, engine
+
+def iter_fronts_stats(fronts: Iterator[numpy.ndarray], stats: SortStats) -> Iterator[numpy.ndarray]:
+    """
+    Collect statistics while generating fronts.
+
+    Parameters
+    ----------
+    fronts : Iterator
+        A generator of vectors containing the row indices of each front.
+    stats : pynds.stats.SortStats
+        Statistics collector, active only while the next front is calculated.
+
+    Yields
+    ------
+    members : numpy.ndarray
+        A vector containing the row indices of the members of the next front.
+    """
+    stats.front_sizes = []
+    while True:
+        with stats:
+            members = next(fronts, None)
+        if members is None:
+            return
+        stats.front_sizes.append(len(members))
+        yield members
+
+def iter_fronts(x: numpy.ndarray, engine: str = "auto", memory: Optional[int] = None, n_jobs: int = 1, workspace: Optional[Workspace] = None, sense: Optional[numpy.ndarray] = None, eps: Optional[numpy.ndarray] = None, cv: Optional[numpy.ndarray] = None, stats: Optional[SortStats] = None) -> Iterator[numpy.ndarray]:
+    """
+    Lazy non-dominated sorting, generating the row indices of each front as
+    soon as it is known. ``x`` is not modified.
+
+    Dominance relationships are calculated when the first front is requested;
+    each later front is only calculated when requested, so consumers may stop
+    early or process a front while later fronts are pending.
+
+    Parameters
+    ----------
+    x : numpy.ndarray
+        A matrix of shape ``(nindiv,nobj)`` containing objective values for individuals.
+    engine : str
+        Name of the engine to use: ``"fast"``, ``"bitset"``, or ``"auto"`` to
+        use ``"fast"`` if its workspace fits in memory and ``"bitset"`` otherwise.
+    memory : int, None
+        Memory budget in bytes for workspaces when ``engine == "auto"``.
+        If ``None``, use the available physical memory, if it can be determined.
+    n_jobs : int
+        Number of threads over which to spread the calculation of dominance
+        relationships. If ``-1``, use all available processors.
+    workspace : pynds.workspace.Workspace, None
+        Workspace pool from which to take workspaces. If ``None``, workspaces
+        are allocated. Workspaces must not be reused until the generator is done.
+    sense : numpy.ndarray, None
+        A vector of shape ``(nobj,)`` containing ``1`` for minimized and
+        ``-1`` for maximized objectives. If ``None``, minimize all objectives.
+        Rows are still ordered by ascending objective values within fronts.
+    eps : float, numpy.ndarray, None
+        Additive epsilon for each objective; use epsilon-dominance instead of
+        Pareto dominance. Only supported by ``RELATION_ENGINES``; individuals
+        caught in epsilon-dominance cycles are left ``UNASSIGNED``.
+        If ``None``, use Pareto dominance.
+    cv : numpy.ndarray, None
+        A vector of shape ``(nindiv,)`` containing constraint violations; an
+        individual is feasible if its violation is ``<= 0``. If given, use
+        Deb's constraint-domination. This vector is not modified.
+    stats : pynds.stats.SortStats, None
+        Statistics collector to fill with dominance comparison counts, phase
+        times and the sizes of the fronts generated so far; statistics are
+        only collected while the generator is advanced.
+        If ``None``, statistics are not collected.
+
+    Returns
+    -------
+    out : Iterator
+        A generator of vectors containing the row indices of the members of
+        each front, in ascending order.
+    """
+    # test input shape
+    if x.ndim != 2:
+        raise ValueError("Input matrix ``x`` must have 2 dimensions: received ``{0}``".format(x.ndim))
+
+    # test options
+    check_relation_options(x, sense, eps, cv)
+
+    # get the number of individuals and objectives
+    nindiv = x.shape[0]
+    nobj = x.shape[1]
+
+    # select engine
+    if engine == "auto":
+        if memory is None:
+            memory = available_memory()
+        engine = "fast" if memory is None or engine_memory("fast", nindiv, nobj) <= memory else "bitset"
+    elif engine not in ("fast", "bitset"):
+        raise ValueError("Unknown engine ``{0}``: must be one of ``{1}``".format(engine, ("auto", "fast", "bitset")))
+
+    # allocate workspaces and start generating fronts
+    cnt = workspace_empty(workspace, "cnt", nindiv, int)
+    rem = workspace_empty(workspace, "rem", nindiv, int)
+    if engine == "fast":
+        dom = workspace_empty(workspace, "dom", (nindiv,nindiv), int)
+        fronts = iter_fronts_fast(x, dom, cnt, rem, n_jobs = n_jobs, sense = sense, eps = eps, cv = cv)
+    else:
+        nbytes = bitset_nbytes(nindiv)
+        dom = workspace_empty(workspace, "dom", (nindiv,nbytes), numpy.uint8)
+        domd = workspace_empty(workspace, "domd", (nindiv,nbytes), numpy.uint8)
+        fronts = iter_fronts_bitset(x, dom, domd, cnt, rem, n_jobs = n_jobs, sense = sense, eps = eps, cv = cv)
+
+    # collect statistics while generating fronts
+    if stats is not None:
+        return iter_fronts_stats(fronts, stats)
+    return fronts
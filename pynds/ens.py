@@ -0,0 +1,295 @@
+import numpy
+from typing import Optional
+from pynds.relation import dominated_by_any
+from pynds.relation import relation_options
+from pynds.presort import UNASSIGNED
+from pynds.presort import argpresort
+from pynds.presort import argfrontsort
+from pynds.presort import permute_matrix
+from pynds.jit import jit_limit
+from pynds.jit import jit_supported
+from pynds.jit import assign_ens_kernel
+from pynds.stats import count_relations
+from pynds.stats import phase_start
+from pynds.stats import phase_stop
+from pynds.biobj import argndsort_biobj
+
+def ens_sweep(x: numpy.ndarray, ix: numpy.ndarray, front: numpy.ndarray, binary: bool, maximize: Optional[numpy.ndarray] = None, cv: Optional[numpy.ndarray] = None, kfront: Optional[int] = None) -> None:
+    """
+    Assign fronts to individuals in presorted order by searching for the
+    first front which contains no individual dominating them. Each front is
+    searched with one vectorized comparison against all of its members.
+
+    Parameters
+    ----------
+    x : numpy.ndarray
+        A matrix of shape ``(N,M)`` containing objective values for individuals.
+    ix : numpy.ndarray
+        A vector of shape ``(N,)`` containing presorting indices.
+    front : numpy.ndarray
+        A vector of shape ``(N,)`` containing front assignments.
+        Output vector, in the order of the rows of ``x``.
+    binary : bool
+        Whether to use binary search instead of sequential search over fronts.
+    maximize : numpy.ndarray, None
+        A boolean vector of shape ``(M,)`` of maximized objectives, as
+        returned by ``pynds.relation.relation_options``. If ``None``,
+        minimize all objectives.
+    cv : numpy.ndarray, None
+        A vector of shape ``(N,)`` containing constraint violations.
+        If given, use Deb's constraint-domination.
+    kfront : int, None
+        Number of fronts to assign. Individuals dominated by a member of each
+        of the first ``kfront`` fronts are left unassigned and are not added
+        to any front. If ``None``, assign every front.
+    """
+    # row indices of the members of each front
+    members = []
+    nfront = 0
+
+    # for each individual in presorted order
+    for s in ix.tolist():
+        xs = x[s]
+        cvs = None if cv is None else cv[s]
+        if binary:
+            # binary search for first front not dominating the individual
+            lo = 0
+            hi = nfront
+            while lo < hi:
+                mid = (lo + hi) // 2
+                m = members[mid]
+                if dominated_by_any(xs, x[m], maximize, cvs, None if cv is None else cv[m]):
+                    lo = mid + 1
+                else:
+                    hi = mid
+            k = lo
+        else:
+            # sequential search for first front not dominating the individual
+            k = 0
+            while k < nfront:
+                m = members[k]
+                if not dominated_by_any(xs, x[m], maximize, cvs, None if cv is None else cv[m]):
+                    break
+                k += 1
+
+        # if dominated by all fronts, create a new front, unless the
+        # individual is beyond the front limit: leave it unassigned
+        if k == nfront:
+            if kfront is not None and nfront >= kfront:
+                front[s] = UNASSIGNED
+                continue
+            members.append([])
+            nfront += 1
+
+        # add individual to front
+        members[k].append(s)
+        front[s] = k
+
+def ndsort_ens(x: numpy.ndarray, front: numpy.ndarray, perm: numpy.ndarray, head: numpy.ndarray, link: numpy.ndarray, binary: bool, sense: Optional[numpy.ndarray] = None, cv: Optional[numpy.ndarray] = None, kfront: Optional[int] = None) -> None:
+    """
+    In-place non-dominated sorting using the efficient non-dominated sorting
+    (ENS) algorithm, with either sequential or binary search over fronts.
+
+    After presorting, an individual can only be dominated by individuals
+    which precede it. Individuals are therefore assigned to fronts one by one
+    in presorted order by searching for the first front which contains no
+    individual dominating it. Each front is searched with one vectorized
+    comparison against all of its members, or with a compiled kernel which
+    stops at the first dominating member if numba is installed
+    (``pip install pynds[jit]``).
+
+    Computational complexity: O(MN^2 + MNlogN)
+        O(MNlogN) for presorting
+        O(MN^2) for front searches (worst case); O(MNK) if ``kfront`` is given
+        O(MNlogN) for final quicksorting based on dominance and objectives
+
+    Space complexity: O(2N)
+        O(N) for storing the most recently added member of each front
+        O(N) for storing linked lists of front members
+
+    Size definitions:
+        K = number of individuals in the first ``kfront`` fronts.
+        M = number of objectives.
+        N = number of individuals.
+
+    Parameters
+    ----------
+    x : numpy.ndarray
+        A matrix of shape ``(N,M)`` containing objective values for individuals.
+    front : numpy.ndarray
+        A vector of shape ``(N,)`` containing front assignments.
+    perm : numpy.ndarray
+        A vector of shape ``(N,)`` containing the sorting permutation.
+        Output vector. The sorted matrix is the input matrix indexed by ``perm``.
+    head : numpy.ndarray
+        A vector of shape ``(N,)``
+        Workspace holding the most recently added member of each front.
+        Only used by the compiled kernel.
+    link : numpy.ndarray
+        A vector of shape ``(N,)``
+        Workspace holding the previously added member of the same front.
+        Only used by the compiled kernel.
+    binary : bool
+        Whether to use binary search (ENS-BS) instead of sequential search
+        (ENS-SS) over fronts.
+    sense : numpy.ndarray, None
+        A vector of shape ``(M,)`` containing ``1`` for minimized and ``-1``
+        for maximized objectives; maximized objectives are presorted in
+        descending order. If ``None``, minimize all objectives.
+        Rows are still ordered by ascending objective values within fronts.
+    cv : numpy.ndarray, None
+        A vector of shape ``(N,)`` containing constraint violations; an
+        individual is feasible if its violation is ``<= 0``. If given, use
+        Deb's constraint-domination, presorting by violation first.
+        This vector is reordered in-place along with ``x``.
+    kfront : int, None
+        Number of fronts to assign. Fronts at or beyond ``kfront`` are never
+        searched, and their individuals are left unassigned with front
+        ``pynds.presort.UNASSIGNED`` and placed last in their original order.
+        If ``None``, assign every front.
+
+    Notes
+    -----
+    If ``M == 2``, sorting is delegated to ``pynds.biobj.ndsort_biobj``.
+    """
+    # assign fronts and calculate the sorting permutation
+    argndsort_ens(x, front, perm, head, link, binary, sense, cv, kfront)
+
+    # reorder objective matrix and front matrix
+    permute_matrix(x, front, perm)
+
+    # reorder constraint violations along with rows
+    if cv is not None:
+        cv[:] = cv[perm]
+
+def argndsort_ens(x: numpy.ndarray, front: numpy.ndarray, perm: numpy.ndarray, head: numpy.ndarray, link: numpy.ndarray, binary: bool, sense: Optional[numpy.ndarray] = None, cv: Optional[numpy.ndarray] = None, kfront: Optional[int] = None) -> None:
+    """
+    Non-dominated sorting using the efficient non-dominated sorting (ENS)
+    algorithm, returning the sorting permutation instead of reordering ``x``.
+
+    Parameters are as for ``ndsort_ens``. On output, ``front`` contains
+    front assignments in the order of the rows of ``x``, and ``x[perm]`` is
+    the sorted matrix. ``cv`` is not modified.
+
+    Notes
+    -----
+    If ``M == 2``, sorting is delegated to ``pynds.biobj.argndsort_biobj``.
+    """
+    # get the number of objectives
+    nobj = x.shape[1]
+
+    # use sweep specialized for two objectives
+    if nobj == 2:
+        argndsort_biobj(x, front, perm, sense, cv, kfront)
+        return
+
+    # presort individuals
+    ix = argpresort(x, sense, cv)
+
+    # assign fronts, using the compiled loops if numba is installed
+    tstart = phase_start()
+    if jit_supported(x, sense, None, cv):
+        ncompare = assign_ens_kernel(x, ix, front, head, link, binary, jit_limit(kfront))
+        count_relations(ncompare, ncompare)
+    else:
+        ens_sweep(x, ix, front, binary, relation_options(x.shape[1], sense)[0], cv, kfront)
+    phase_stop("peel", tstart)
+
+    # quicksort first by front, then by column 0, then by column 1, ...
+    perm[:] = argfrontsort(x, front)
+
+def ndsort_ens_ss(x: numpy.ndarray, front: numpy.ndarray, perm: numpy.ndarray, head: numpy.ndarray, link: numpy.ndarray, sense: Optional[numpy.ndarray] = None, cv: Optional[numpy.ndarray] = None, kfront: Optional[int] = None) -> None:
+    """
+    In-place non-dominated sorting using the efficient non-dominated sorting
+    algorithm with sequential search (ENS-SS).
+
+    Parameters
+    ----------
+    x : numpy.ndarray
+        A matrix of shape ``(N,M)`` containing objective values for individuals.
+    front : numpy.ndarray
+        A vector of shape ``(N,)`` containing front assignments.
+    perm : numpy.ndarray
+        A vector of shape ``(N,)`` containing the sorting permutation.
+        Output vector. The sorted matrix is the input matrix indexed by ``perm``.
+    head : numpy.ndarray
+        A vector of shape ``(N,)``
+        Workspace holding the most recently added member of each front.
+    link : numpy.ndarray
+        A vector of shape ``(N,)``
+        Workspace holding the previously added member of the same front.
+    sense : numpy.ndarray, None
+        A vector of shape ``(M,)`` containing ``1`` for minimized and ``-1``
+        for maximized objectives; maximized objectives are presorted in
+        descending order. If ``None``, minimize all objectives.
+        Rows are still ordered by ascending objective values within fronts.
+    cv : numpy.ndarray, None
+        A vector of shape ``(N,)`` containing constraint violations; an
+        individual is feasible if its violation is ``<= 0``. If given, use
+        Deb's constraint-domination, presorting by violation first.
+        This vector is reordered in-place along with ``x``.
+    kfront : int, None
+        Number of fronts to assign. Fronts at or beyond ``kfront`` are never
+        searched, and their individuals are left unassigned with front
+        ``pynds.presort.UNASSIGNED`` and placed last in their original order.
+        If ``None``, assign every front.
+    """
+    ndsort_ens(x, front, perm, head, link, False, sense, cv, kfront)
+
+def ndsort_ens_bs(x: numpy.ndarray, front: numpy.ndarray, perm: numpy.ndarray, head: numpy.ndarray, link: numpy.ndarray, sense: Optional[numpy.ndarray] = None, cv: Optional[numpy.ndarray] = None, kfront: Optional[int] = None) -> None:
+    """
+    In-place non-dominated sorting using the efficient non-dominated sorting
+    algorithm with binary search (ENS-BS).
+
+    Parameters
+    ----------
+    x : numpy.ndarray
+        A matrix of shape ``(N,M)`` containing objective values for individuals.
+    front : numpy.ndarray
+        A vector of shape ``(N,)`` containing front assignments.
+    perm : numpy.ndarray
+        A vector of shape ``(N,)`` containing the sorting permutation.
+        Output vector. The sorted matrix is the input matrix indexed by ``perm``.
+    head : numpy.ndarray
+        A vector of shape ``(N,)``
+        Workspace holding the most recently added member of each front.
+    link : numpy.ndarray
+        A vector of shape ``(N,)``
+        Workspace holding the previously added member of the same front.
+    sense : numpy.ndarray, None
+        A vector of shape ``(M,)`` containing ``1`` for minimized and ``-1``
+        for maximized objectives; maximized objectives are presorted in
+        descending order. If ``None``, minimize all objectives.
+        Rows are still ordered by ascending objective values within fronts.
+    cv : numpy.ndarray, None
+        A vector of shape ``(N,)`` containing constraint violations; an
+        individual is feasible if its violation is ``<= 0``. If given, use
+        Deb's constraint-domination, presorting by violation first.
+        This vector is reordered in-place along with ``x``.
+    kfront : int, None
+        Number of fronts to assign. Fronts at or beyond ``kfront`` are never
+        searched, and their individuals are left unassigned with front
+        ``pynds.presort.UNASSIGNED`` and placed last in their original order.
+        If ``None``, assign every front.
+    """
+    ndsort_ens(x, front, perm, head, link, True, sense, cv, kfront)
+
+def argndsort_ens_ss(x: numpy.ndarray, front: numpy.ndarray, perm: numpy.ndarray, head: numpy.ndarray, link: numpy.ndarray, sense: Optional[numpy.ndarray] = None, cv: Optional[numpy.ndarray] = None, kfront: Optional[int] = None) -> None:
+    """
+    Non-dominated sorting using the efficient non-dominated sorting
+    algorithm with sequential search (ENS-SS), returning the sorting
+    permutation instead of reordering ``x``.
+
+    Parameters are as for ``ndsort_ens_ss``.
+    """
+    argndsort_ens(x, front, perm, head, link, False, sense, cv, kfront)
+
+def argndsort_ens_bs(x: numpy.ndarray, front: numpy.ndarray, perm: numpy.ndarray, head: numpy.ndarray, link: numpy.ndarray, sense: Optional[numpy.ndarray] = None, cv: Optional[numpy.ndarray] = None, kfront: Optional[int] = None) -> None:
+    """
+    Non-dominated sorting using the efficient non-dominated sorting
+    algorithm with binary search (ENS-BS), returning the sorting
+    permutation instead of reordering ``x``.
+
+    Parameters are as for ``ndsort_ens_bs``.
+    """
+    argndsort_ens(x, front, perm, head, link, True, sense, cv, kfront)
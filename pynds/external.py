@@ -0,0 +1,391 @@
+import os
+import tempfile
+import numpy
+from numpy.lib.format import open_memmap
+from typing import List
+from typing import Optional
+from typing import Tuple
+from pynds.relation import dominance_relationship_block
+
+# number of rows loaded into memory at once when sorting and merging runs
+EXTERNAL_CHUNKSIZE = 2**20
+
+# number of rows per block when comparing blocks of individuals
+EXTERNAL_BLKSIZE = 2048
+
+def spill_empty(tmpdir: str, name: str, shape: Tuple[int,...], dtype: numpy.dtype) -> numpy.memmap:
+    """
+    Create an uninitialized array which is spilled to a ``.npy`` file.
+
+    Parameters
+    ----------
+    tmpdir : str
+        Directory in which to create the file.
+    name : str
+        Name of the file, without extension.
+    shape : tuple
+        Shape of the array.
+    dtype : numpy.dtype
+        Data type of the array.
+
+    Returns
+    -------
+    out : numpy.memmap
+        A memory-mapped array of shape ``shape`` and dtype ``dtype``.
+    """
+    shape = tuple(shape) if numpy.ndim(shape) > 0 else (int(shape),)
+    return open_memmap(os.path.join(tmpdir, name + ".npy"), mode = "w+", dtype = dtype, shape = shape)
+
+def lexsort_rows(x: numpy.ndarray, front: Optional[numpy.ndarray] = None) -> numpy.ndarray:
+    """
+    Calculate indices which stably sort a matrix first by front, if given,
+    then by the first column, then by subsequent columns if identical values
+    exist.
+
+    Parameters
+    ----------
+    x : numpy.ndarray
+        A matrix of shape ``(n,m)`` containing objective values.
+    front : numpy.ndarray, None
+        A vector of shape ``(n,)`` containing front assignments.
+
+    Returns
+    -------
+    out : numpy.ndarray
+        A vector of shape ``(n,)`` containing sorting indices.
+    """
+    # get keys (must be in reverse order)
+    keys = tuple(x[:,i] for i in range(x.shape[1]))[::-1]
+    if front is not None:
+        keys += (front,)
+    return numpy.lexsort(keys)
+
+def merge_runs(a: Tuple[numpy.ndarray,...], b: Tuple[numpy.ndarray,...], out: Tuple[numpy.ndarray,...], chunksize: int) -> None:
+    """
+    Merge two sorted runs, loading at most ``chunksize`` rows of each run
+    into memory at once.
+
+    A run is a tuple ``(x, index, front)`` of arrays of equal length holding
+    sorted rows, their input row indices, and their front assignments, or
+    ``None`` if runs are not sorted by front.
+
+    Each step loads the next chunk of both runs and sorts them together.
+    Every row up to the smaller of the last rows of the two chunks is in its
+    final position and is written out; later rows are reloaded by the next
+    step. At least one whole chunk is written per step.
+
+    Parameters
+    ----------
+    a : tuple
+        First sorted run.
+    b : tuple
+        Second sorted run. Ties are placed after rows of the first run.
+    out : tuple
+        Output run with length equal to the sum of the lengths of ``a`` and ``b``.
+    chunksize : int
+        Number of rows of each run to load at once.
+    """
+    # get run lengths
+    na = len(a[0])
+    nb = len(b[0])
+
+    # run positions and output position
+    pa = 0
+    pb = 0
+    po = 0
+
+    while pa < na or pb < nb:
+        # load the next chunk of both runs, the first run first to keep ties stable
+        sa = slice(pa, min(pa + chunksize, na))
+        sb = slice(pb, min(pb + chunksize, nb))
+        la = sa.stop - sa.start
+        lb = sb.stop - sb.start
+        x = numpy.concatenate((a[0][sa], b[0][sb]))
+        ix = numpy.concatenate((a[1][sa], b[1][sb]))
+        front = None if a[2] is None else numpy.concatenate((a[2][sa], b[2][sb]))
+
+        # sort chunks together and find the sorted position of their last rows
+        order = lexsort_rows(x, front)
+        inv = numpy.empty(len(order), dtype = numpy.int64)
+        inv[order] = numpy.arange(len(order))
+
+        # rows up to the smaller last row are final; if a run is exhausted, all are
+        if la == 0 or lb == 0:
+            cut = la + lb
+        else:
+            cut = min(inv[la-1], inv[la+lb-1]) + 1
+        keep = order[:cut]
+
+        # write final rows
+        so = slice(po, po + cut)
+        out[0][so] = x[keep]
+        out[1][so] = ix[keep]
+        if front is not None:
+            out[2][so] = front[keep]
+
+        # advance positions
+        ka = int(numpy.sum(keep < la))
+        pa += ka
+        pb += cut - ka
+        po += cut
+
+def external_argsort(x: numpy.ndarray, perm: numpy.ndarray, tmpdir: str, front: Optional[numpy.ndarray] = None, xout: Optional[numpy.ndarray] = None, chunksize: int = EXTERNAL_CHUNKSIZE) -> None:
+    """
+    Calculate indices which sort a matrix first by front, if given, then by
+    the first column, then by subsequent columns if identical values exist,
+    using an external merge sort.
+
+    Chunks of rows are sorted in memory and spilled to disk as sorted runs,
+    then runs are merged in pairs until one run remains. At most two chunks
+    of rows are held in memory at once.
+
+    Computational complexity: O(MNlogN)
+    Space complexity: O(MC) in memory, O(MN) on disk
+
+    Size definitions:
+        C = number of rows per chunk.
+        M = number of objectives.
+        N = number of individuals.
+
+    Parameters
+    ----------
+    x : numpy.ndarray
+        A matrix of shape ``(N,M)`` containing objective values, which may be
+        a ``numpy.memmap``. This matrix is not modified.
+    perm : numpy.ndarray
+        A vector of shape ``(N,)`` to store sorting indices, which may be a
+        ``numpy.memmap``. Output vector.
+    tmpdir : str
+        Directory in which to spill runs.
+    front : numpy.ndarray, None
+        A vector of shape ``(N,)`` containing front assignments to sort by first.
+    xout : numpy.ndarray, None
+        A matrix of shape ``(N,M)`` to store the sorted matrix, which may be a
+        ``numpy.memmap``. If ``None``, the sorted matrix is not stored.
+    chunksize : int
+        Number of rows to load into memory at once.
+    """
+    # get the number of individuals and objectives
+    nindiv = x.shape[0]
+    nobj = x.shape[1]
+
+    # test chunk size
+    if chunksize < 1:
+        raise ValueError("``chunksize`` must be a positive integer: received ``{0}``".format(chunksize))
+
+    # run counter for unique file names
+    nrun = 0
+
+    def spill_run(n: int) -> Tuple[numpy.ndarray,...]:
+        nonlocal nrun
+        name = "run{0}".format(nrun)
+        nrun += 1
+        rx = spill_empty(tmpdir, name + "_x", (n,nobj), x.dtype)
+        ri = spill_empty(tmpdir, name + "_index", n, numpy.int64)
+        rf = None if front is None else spill_empty(tmpdir, name + "_front", n, front.dtype)
+        return (rx, ri, rf)
+
+    def delete_run(run: Tuple[numpy.ndarray,...]) -> None:
+        for arr in run:
+            if arr is not None:
+                os.remove(arr.filename)
+
+    # sort chunks in memory and spill them as runs
+    runs: List[Tuple[numpy.ndarray,...]] = []
+    for start in range(0, nindiv, chunksize):
+        stop = min(start + chunksize, nindiv)
+        xc = numpy.asarray(x[start:stop])
+        fc = None if front is None else numpy.asarray(front[start:stop])
+        order = lexsort_rows(xc, fc)
+        run = spill_run(stop - start)
+        run[0][:] = xc[order]
+        run[1][:] = start + order
+        if fc is not None:
+            run[2][:] = fc[order]
+        runs.append(run)
+
+    # merge runs in pairs; earlier runs hold earlier rows, so ties stay stable
+    while len(runs) > 1:
+        merged = []
+        for i in range(0, len(runs) - 1, 2):
+            out = spill_run(len(runs[i][0]) + len(runs[i+1][0]))
+            merge_runs(runs[i], runs[i+1], out, chunksize)
+            delete_run(runs[i])
+            delete_run(runs[i+1])
+            merged.append(out)
+        if len(runs) % 2 == 1:
+            merged.append(runs[-1])
+        runs = merged
+
+    # copy final run to outputs one chunk at a time
+    if len(runs) == 1:
+        for start in range(0, nindiv, chunksize):
+            stop = min(start + chunksize, nindiv)
+            perm[start:stop] = runs[0][1][start:stop]
+            if xout is not None:
+                xout[start:stop] = runs[0][0][start:stop]
+        delete_run(runs[0])
+
+def external_fronts(xs: numpy.ndarray, front: numpy.ndarray, blksize: int = EXTERNAL_BLKSIZE) -> None:
+    """
+    Assign fronts to a presorted matrix one block of rows at a time.
+
+    In presorted order, an individual can only be dominated by individuals
+    before it, so its front is one more than the largest front of the
+    individuals dominating it. Each block of rows is compared against every
+    earlier block, whose front assignments have already been spilled to
+    ``front``, then fronts within the block are assigned by peeling. Earlier
+    blocks whose ideal point is not weakly better than the nadir point of
+    the current block cannot dominate any of its rows and are skipped.
+
+    Computational complexity: O(MN^2)
+    Space complexity: O(B^2 + MN/B) in memory
+
+    Size definitions:
+        B = number of rows per block.
+        M = number of objectives.
+        N = number of individuals.
+
+    Parameters
+    ----------
+    xs : numpy.ndarray
+        A presorted matrix of shape ``(N,M)`` containing objective values,
+        which may be a ``numpy.memmap``.
+    front : numpy.ndarray
+        A vector of shape ``(N,)`` to store front assignments in presorted
+        order, which may be a ``numpy.memmap``. Output vector.
+    blksize : int
+        Number of rows per block.
+    """
+    # get the number of individuals
+    nindiv = xs.shape[0]
+
+    # test block size
+    if blksize < 1:
+        raise ValueError("``blksize`` must be a positive integer: received ``{0}``".format(blksize))
+
+    # ideal points of completed blocks
+    starts = list(range(0, nindiv, blksize))
+    ideal = numpy.empty((len(starts),xs.shape[1]), dtype = xs.dtype)
+
+    for k, start in enumerate(starts):
+        stop = min(start + blksize, nindiv)
+        xk = numpy.asarray(xs[start:stop])
+        nk = stop - start
+        ideal[k] = xk.min(axis = 0)
+        nadir = xk.max(axis = 0)
+
+        # lowest possible front of each row, given dominators in earlier blocks
+        low = numpy.zeros(nk, dtype = numpy.int64)
+        for j in range(k):
+            # skip blocks which cannot dominate any row of this block
+            if numpy.any(ideal[j] > nadir):
+                continue
+            # order earlier rows by descending front, so that the first
+            # dominator of each row has the largest front
+            sj = slice(starts[j], min(starts[j] + blksize, nindiv))
+            fj = numpy.asarray(front[sj])
+            order = numpy.argsort(-fj, kind = "stable")
+            xj = numpy.asarray(xs[sj])[order]
+            fj = fj[order]
+            dom = numpy.empty((nk,len(xj)), dtype = numpy.int8)
+            dominance_relationship_block(xk, xj, dom)
+            hit = dom > 0
+            first = numpy.argmax(hit, axis = 1)
+            dominated = hit[numpy.arange(nk),first]
+            numpy.maximum(low, numpy.where(dominated, fj[first] + 1, 0), out = low)
+
+        # "dominates" relationships within this block
+        dom = numpy.empty((nk,nk), dtype = numpy.int8)
+        dominance_relationship_block(xk, xk, dom)
+        dom = dom < 0
+
+        # peel fronts within this block: each row is raised above its dominators
+        fk = low
+        cnt = numpy.sum(dom, axis = 0)
+        cur = numpy.flatnonzero(cnt == 0)
+        while len(cur) > 0:
+            cnt[cur] = -1
+            d = dom[cur]
+            numpy.maximum(fk, numpy.max(numpy.where(d, fk[cur,None] + 1, 0), axis = 0), out = fk)
+            cnt -= numpy.sum(d, axis = 0)
+            cur = numpy.flatnonzero(cnt == 0)
+
+        # spill block front assignments
+        front[start:stop] = fk
+
+def argndsort_external(x: numpy.ndarray, front: numpy.ndarray, perm: Optional[numpy.ndarray] = None, tmpdir: Optional[str] = None, chunksize: int = EXTERNAL_CHUNKSIZE, blksize: int = EXTERNAL_BLKSIZE) -> None:
+    """
+    Out-of-core non-dominated sorting of a matrix which may be larger than
+    memory, such as a ``numpy.memmap`` of a ``.npy`` file.
+
+    The matrix is presorted with an external merge sort, fronts are assigned
+    one block of presorted rows at a time as by ``external_fronts`` with
+    front assignments spilled to disk, then the sorting permutation is
+    calculated with a second external merge sort keyed on front. Memory use
+    is bounded by the chunk and block sizes, independent of ``N``.
+
+    Computational complexity: O(MN^2 + MNlogN)
+        O(MN^2) for comparing blocks of rows, less blocks which are skipped
+        O(MNlogN) for external presorting and final sorting
+
+    Space complexity: O(MC + B^2 + MN/B) in memory, O(MN) on disk
+
+    Size definitions:
+        B = number of rows per block.
+        C = number of rows per chunk.
+        M = number of objectives.
+        N = number of individuals.
+
+    Parameters
+    ----------
+    x : numpy.ndarray
+        A matrix of shape ``(N,M)`` containing objective values, which may be
+        a ``numpy.memmap``. This matrix is not modified.
+    front : numpy.ndarray
+        A vector of shape ``(N,)`` to store front assignments in the order of
+        the rows of ``x``, which may be a ``numpy.memmap``. Output vector.
+    perm : numpy.ndarray, None
+        A vector of shape ``(N,)`` to store the sorting permutation, which may
+        be a ``numpy.memmap``. ``x[perm]`` is ordered first by front, then by
+        column 0, then by column 1, ... If ``None``, it is not calculated.
+    tmpdir : str, None
+        Directory in which to spill intermediate arrays. A temporary
+        directory is created inside it, and removed when sorting is done.
+        If ``None``, use the default temporary directory.
+    chunksize : int
+        Number of rows to load into memory at once when sorting.
+    blksize : int
+        Number of rows per block when comparing blocks of individuals.
+    """
+    # get the number of individuals and objectives
+    nindiv = x.shape[0]
+    nobj = x.shape[1]
+
+    # test output sizes
+    if front.shape != (nindiv,):
+        raise ValueError("Output vector ``front`` is not the correct shape: expected ``{0}`` but received ``{1}``".format((nindiv,),front.shape))
+    if perm is not None and perm.shape != (nindiv,):
+        raise ValueError("Output vector ``perm`` is not the correct shape: expected ``{0}`` but received ``{1}``".format((nindiv,),perm.shape))
+
+    with tempfile.TemporaryDirectory(dir = tmpdir) as spilldir:
+        # presort rows and spill the presorted matrix
+        ix = spill_empty(spilldir, "presort_index", nindiv, numpy.int64)
+        xs = spill_empty(spilldir, "presort_x", (nindiv,nobj), x.dtype)
+        external_argsort(x, ix, spilldir, xout = xs, chunksize = chunksize)
+
+        # assign fronts in presorted order, spilled to disk
+        fs = spill_empty(spilldir, "presort_front", nindiv, numpy.int64)
+        external_fronts(xs, fs, blksize)
+
+        # scatter front assignments to input order one chunk at a time
+        for start in range(0, nindiv, chunksize):
+            stop = min(start + chunksize, nindiv)
+            front[ix[start:stop]] = fs[start:stop]
+
+        # close spilled arrays before the directory is removed
+        del ix, xs, fs
+
+        # sort first by front, then by column 0, then by column 1, ...
+        if perm is not None:
+            external_argsort(x, perm, spilldir, front = front, chunksize = chunksize)
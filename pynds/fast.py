@@ -0,0 +1,200 @@
+import numpy
+from typing import Iterator
+from typing import Optional
+from pynds.relation import BLOCK_NELEM
+from pynds.relation import dominance_relationship_matrix
+from pynds.presort import UNASSIGNED
+from pynds.presort import front_limit_reached
+from pynds.presort import argfrontsort
+from pynds.presort import frontsort_matrix
+from pynds.stats import phase_start
+from pynds.stats import phase_stop
+
+def iter_fronts_fast(x: numpy.ndarray, dom: numpy.ndarray, cnt: numpy.ndarray, rem: numpy.ndarray, n_jobs: int = 1, sense: Optional[numpy.ndarray] = None, eps: Optional[numpy.ndarray] = None, cv: Optional[numpy.ndarray] = None) -> Iterator[numpy.ndarray]:
+    """
+    Generate fronts one at a time using Deb's fast non-dominated sorting
+    algorithm, without reordering ``x``.
+
+    Each front is yielded as soon as it is known, as a view of ``rem``
+    holding the row indices of its members in ascending order. Later fronts
+    are only calculated when requested, so callers may stop early.
+
+    Parameters are as for ``ndsort_fast``.
+
+    Yields
+    ------
+    members : numpy.ndarray
+        A vector containing the row indices of the members of the next front.
+    """
+    # calculate pairwise dominance relationships
+    dominance_relationship_matrix(x, dom, n_jobs = n_jobs, sense = sense, eps = eps, cv = cv)
+
+    # get the number of individuals
+    nindiv = x.shape[0]
+
+    # calculate domination counts: number of individuals dominating each individual
+    numpy.sum(dom > 0, axis = 1, out = cnt)
+
+    # number of front members whose rows are compared at once, and count decrements
+    step = max(1, BLOCK_NELEM // max(1, nindiv))
+    dec = numpy.empty(nindiv, dtype = cnt.dtype)
+
+    # first front: individuals which are dominated by no one
+    ix = numpy.flatnonzero(cnt == 0)
+    rem[0:len(ix)] = ix
+
+    # queue bounds for current front
+    start = 0
+    stop = len(ix)
+
+    # while the current front is not empty
+    while start < stop:
+        # get current front members
+        members = rem[start:stop]
+
+        # mark current front members as visited
+        cnt[members] = -1
+
+        # hand current front to the caller before calculating the next one
+        yield members
+
+        # decrement domination counts of individuals dominated by current front members,
+        # gathering a bounded block of rows at a time so temporaries stay O(BLOCK_NELEM)
+        dec[:] = 0
+        for i in range(0, len(members), step):
+            dec += numpy.count_nonzero(dom[members[i:i+step]] < 0, axis = 0)
+        cnt -= dec
+
+        # next front: individuals whose domination count just reached zero
+        ix = numpy.flatnonzero((cnt == 0) & (dec > 0))
+        rem[stop:stop+len(ix)] = ix
+
+        # advance queue bounds
+        start = stop
+        stop += len(ix)
+
+def assign_fast(x: numpy.ndarray, front: numpy.ndarray, dom: numpy.ndarray, cnt: numpy.ndarray, rem: numpy.ndarray, n_jobs: int = 1, kfront: Optional[int] = None, nfill: Optional[int] = None, sense: Optional[numpy.ndarray] = None, eps: Optional[numpy.ndarray] = None, cv: Optional[numpy.ndarray] = None) -> None:
+    """
+    Assign fronts using Deb's fast non-dominated sorting algorithm, without
+    reordering ``x``.
+
+    Parameters are as for ``ndsort_fast``. On output, ``front`` contains front
+    assignments in the order of the rows of ``x``.
+    """
+    # mark all individuals as unassigned
+    front[:] = UNASSIGNED
+
+    # generate fronts lazily
+    fronts = iter_fronts_fast(x, dom, cnt, rem, n_jobs = n_jobs, sense = sense, eps = eps, cv = cv)
+
+    # current front counter and number of assigned individuals
+    nfront = 0
+    nassigned = 0
+
+    # while no early exit; dominance relationships are timed separately
+    tstart = phase_start()
+    while not front_limit_reached(nfront, nassigned, kfront, nfill):
+        # get next front, if any
+        members = next(fronts, None)
+        if members is None:
+            break
+
+        # make front assignments
+        front[members] = nfront
+        nassigned += len(members)
+
+        # increment front count
+        nfront += 1
+
+    phase_stop("peel", tstart)
+
+def ndsort_fast(x: numpy.ndarray, front: numpy.ndarray, dom: numpy.ndarray, cnt: numpy.ndarray, rem: numpy.ndarray, n_jobs: int = 1, kfront: Optional[int] = None, nfill: Optional[int] = None, sense: Optional[numpy.ndarray] = None, eps: Optional[numpy.ndarray] = None, cv: Optional[numpy.ndarray] = None) -> None:
+    """
+    In-place non-dominated sorting using Deb's fast non-dominated sorting algorithm.
+
+    Computational complexity: O(MN^2 + MNlogN)
+        O(MN^2) for calculating dominance relationship matrix
+        O(N^2) for decrementing domination counts front by front
+        O(MNlogN) for final quicksorting based on dominance and objectives
+
+    Space complexity: O(N^2 + 3N)
+        O(N^2) for storing dominance relationship matrix
+        O(N) for storing domination counts
+        O(N) for storing domination count decrements of the current front,
+            gathered from at most ``BLOCK_NELEM // N`` rows at a time
+        O(N) for storing the queue of individuals in the current and next fronts
+
+    Size definitions:
+        M = number of objectives.
+        N = number of individuals.
+
+    Row ``i`` of the dominance relationship matrix serves as the list of
+    individuals dominated by individual ``i`` (entries equal to ``-1``).
+
+    Parameters
+    ----------
+    x : numpy.ndarray
+        A matrix of shape ``(N,M)`` containing objective values for individuals.
+    front : numpy.ndarray
+        A vector of shape ``(N,)`` containing front assignments.
+    dom : numpy.ndarray
+        A matrix of shape ``(N,N)``.
+        Workspace holding pairwise dominance relationships.
+    cnt : numpy.ndarray
+        A vector of shape ``(N,)``
+        Workspace holding the number of individuals dominating each individual.
+    rem : numpy.ndarray
+        A vector of shape ``(N,)``
+        Workspace holding the queue of individuals in order of front assignment.
+    n_jobs : int
+        Number of threads over which to spread the calculation of dominance
+        relationships. If ``-1``, use all available processors.
+    kfront : int, None
+        Stop once ``kfront`` fronts have been assigned.
+    nfill : int, None
+        Stop once at least ``nfill`` individuals have been assigned.
+        Individuals left unassigned have front ``UNASSIGNED``; only assigned
+        individuals are sorted, and unassigned individuals are placed last.
+    sense : numpy.ndarray, None
+        A vector of shape ``(M,)`` containing ``1`` for minimized and ``-1``
+        for maximized objectives. If ``None``, minimize all objectives.
+    eps : float, numpy.ndarray, None
+        Additive epsilon for each objective; use epsilon-dominance instead of
+        Pareto dominance. Epsilon-dominance is not transitive: individuals
+        caught in dominance cycles are left ``UNASSIGNED``.
+        If ``None``, use Pareto dominance.
+    cv : numpy.ndarray, None
+        A vector of shape ``(N,)`` containing constraint violations; an
+        individual is feasible if its violation is ``<= 0``. If given, use
+        Deb's constraint-domination.
+        This vector is reordered in-place along with ``x``.
+    """
+    # assign fronts
+    assign_fast(x, front, dom, cnt, rem, n_jobs = n_jobs, kfront = kfront, nfill = nfill, sense = sense, eps = eps, cv = cv)
+
+    # quicksort first by front, then by column 0, then by column 1, ...
+    perm = frontsort_matrix(x, front)
+
+    # reorder constraint violations along with rows
+    if cv is not None:
+        cv[:] = cv[perm]
+
+def argndsort_fast(x: numpy.ndarray, front: numpy.ndarray, perm: numpy.ndarray, dom: numpy.ndarray, cnt: numpy.ndarray, rem: numpy.ndarray, n_jobs: int = 1, kfront: Optional[int] = None, nfill: Optional[int] = None, sense: Optional[numpy.ndarray] = None, eps: Optional[numpy.ndarray] = None, cv: Optional[numpy.ndarray] = None) -> None:
+    """
+    Non-dominated sorting using Deb's fast non-dominated sorting algorithm,
+    returning the sorting permutation instead of reordering ``x``.
+
+    Parameters are as for ``ndsort_fast``, with the addition of:
+
+    Parameters
+    ----------
+    perm : numpy.ndarray
+        A vector of shape ``(N,)`` containing the sorting permutation.
+        Output vector. ``x[perm]`` is the sorted matrix and ``front[perm]``
+        its front assignments; ``front`` is in the order of the rows of ``x``.
+    """
+    # assign fronts
+    assign_fast(x, front, dom, cnt, rem, n_jobs = n_jobs, kfront = kfront, nfill = nfill, sense = sense, eps = eps, cv = cv)
+
+    # sorting indices: first by front, then by column 0, then by column 1, ...
+    perm[:] = argfrontsort(x, front)
@@ -0,0 +1,161 @@
+import numpy
+from typing import Iterator
+from pynds.presort import UNASSIGNED
+
+class Fronts:
+    """
+    Fronts of a non-dominated sorting, stored in a compressed sparse row
+    (CSR) layout: a permutation of individuals ordered by front, plus the
+    offsets at which each front starts.
+
+    The individuals in front ``k`` are ``perm[offsets[k]:offsets[k+1]]``.
+    Individuals left unassigned by an early exit follow the last front.
+    Fronts are returned as views of ``perm``, so access to any front is
+    O(1) and copies nothing.
+    """
+
+    def __init__(self, perm: numpy.ndarray, offsets: numpy.ndarray) -> None:
+        """
+        Constructor for Fronts.
+
+        Parameters
+        ----------
+        perm : numpy.ndarray
+            A vector of shape ``(nindiv,)`` containing individual indices
+            ordered by front.
+        offsets : numpy.ndarray
+            A non-decreasing vector of shape ``(nfront+1,)`` containing the
+            start of each front in ``perm``, followed by the number of
+            assigned individuals.
+        """
+        if offsets.ndim != 1 or len(offsets) < 1 or offsets[0] != 0 or offsets[-1] > len(perm):
+            raise ValueError("``offsets`` must be non-decreasing from ``0`` to at most ``{0}``: received ``{1}``".format(len(perm), offsets))
+        self.perm = perm
+        self.offsets = offsets
+
+    @classmethod
+    def from_sorted(cls, perm: numpy.ndarray, sfront: numpy.ndarray) -> "Fronts":
+        """
+        Construct from a sorting permutation and sorted front assignments.
+
+        Parameters
+        ----------
+        perm : numpy.ndarray
+            A vector of shape ``(nindiv,)`` containing the sorting permutation.
+        sfront : numpy.ndarray
+            A vector of shape ``(nindiv,)`` containing front assignments in
+            sorted order: non-decreasing, followed by any ``UNASSIGNED``.
+
+        Returns
+        -------
+        out : Fronts
+            Fronts of the sorting.
+        """
+        counts = numpy.bincount(sfront[sfront != UNASSIGNED])
+        offsets = numpy.zeros(len(counts) + 1, dtype = perm.dtype)
+        numpy.cumsum(counts, out = offsets[1:])
+        return cls(perm, offsets)
+
+    @classmethod
+    def from_labels(cls, front: numpy.ndarray) -> "Fronts":
+        """
+        Construct from front assignments in the order of individuals.
+
+        Parameters
+        ----------
+        front : numpy.ndarray
+            A vector of shape ``(nindiv,)`` containing front assignments.
+
+        Returns
+        -------
+        out : Fronts
+            Fronts of the sorting. Within each front, individuals are in
+            ascending order of index.
+        """
+        # place unassigned individuals last
+        key = numpy.where(front == UNASSIGNED, numpy.iinfo(front.dtype).max, front)
+        perm = numpy.argsort(key, kind = "stable")
+        return cls.from_sorted(perm, front[perm])
+
+    @property
+    def nindiv(self) -> int:
+        """
+        Number of individuals, including unassigned individuals.
+        """
+        return len(self.perm)
+
+    @property
+    def nfront(self) -> int:
+        """
+        Number of fronts.
+        """
+        return len(self.offsets) - 1
+
+    @property
+    def sizes(self) -> numpy.ndarray:
+        """
+        A vector of shape ``(nfront,)`` containing the number of individuals in each front.
+        """
+        return numpy.diff(self.offsets)
+
+    @property
+    def unassigned(self) -> numpy.ndarray:
+        """
+        A view of the individuals left unassigned by an early exit.
+        """
+        return self.perm[self.offsets[-1]:]
+
+    def __len__(self) -> int:
+        """
+        Number of fronts.
+        """
+        return self.nfront
+
+    def __getitem__(self, k: int) -> numpy.ndarray:
+        """
+        A view of the individuals in front ``k``.
+        """
+        return self.perm[self.span(k)]
+
+    def __iter__(self) -> Iterator[numpy.ndarray]:
+        """
+        Iterate over views of the individuals in each front.
+        """
+        for k in range(self.nfront):
+            yield self.perm[self.offsets[k]:self.offsets[k+1]]
+
+    def span(self, k: int) -> slice:
+        """
+        Positions of front ``k`` in ``perm``, which are also its rows in a
+        matrix sorted by ``perm``.
+
+        Parameters
+        ----------
+        k : int
+            Front number. Negative numbers count from the last front.
+
+        Returns
+        -------
+        out : slice
+            Slice of positions.
+        """
+        nfront = self.nfront
+        if k < 0:
+            k += nfront
+        if k < 0 or k >= nfront:
+            raise IndexError("Front ``{0}`` out of range for ``{1}`` fronts".format(k, nfront))
+        return slice(int(self.offsets[k]), int(self.offsets[k+1]))
+
+    def labels(self) -> numpy.ndarray:
+        """
+        Front assignments in the order of individuals.
+
+        Returns
+        -------
+        out : numpy.ndarray
+            A vector of shape ``(nindiv,)`` containing front assignments.
+        """
+        out = numpy.empty(self.nindiv, dtype = int)
+        out[self.perm[:self.offsets[-1]]] = numpy.repeat(numpy.arange(self.nfront), self.sizes)
+        out[self.unassigned] = UNASSIGNED
+        return out
@@ -0,0 +1,266 @@
+import numpy
+from typing import Optional
+from pynds.relation import dominance_relationship_block
+from pynds.relation import relation_options
+from pynds.presort import UNASSIGNED
+from pynds.presort import argpresort
+
+class IncrementalSorter:
+    """
+    Stateful non-dominated sorter supporting insertion and removal of
+    individuals with incremental front updates.
+
+    Individuals are identified by integer ids, which are returned on
+    insertion and remain valid until the individual is removed. Ids of
+    removed individuals may be reused by later insertions.
+
+    Dominance is transitive, so inserting or removing an individual can only
+    change the fronts of the individuals which it dominates. Only those
+    individuals are reassigned, in presorted order, using a stored
+    "dominated-by" relationship matrix.
+
+    Objective sense is fixed for the sorter; constraint violations are given
+    per individual on insertion, and individuals inserted without them are
+    feasible. Epsilon-dominance is not supported, because it is not
+    transitive.
+
+    Space complexity: O(N^2)
+        O(N^2) booleans for storing "dominated-by" relationships
+    """
+
+    def __init__(self, nobj: int, capacity: int = 64, sense: Optional[numpy.ndarray] = None) -> None:
+        """
+        Constructor for IncrementalSorter.
+
+        Parameters
+        ----------
+        nobj : int
+            Number of objectives.
+        capacity : int
+            Initial number of individuals for which to allocate storage.
+            Storage grows as needed.
+        sense : numpy.ndarray, None
+            A vector of shape ``(nobj,)`` containing ``1`` for minimized and
+            ``-1`` for maximized objectives. If ``None``, minimize all objectives.
+        """
+        if nobj < 1:
+            raise ValueError("``nobj`` must be a positive integer: received ``{0}``".format(nobj))
+        relation_options(nobj, sense)
+        capacity = max(1, capacity)
+        self._nobj = nobj
+        self._sense = sense
+        self._x = numpy.empty((capacity,nobj), dtype = float)
+        self._cv = numpy.zeros(capacity, dtype = float)
+        self._front = numpy.full(capacity, UNASSIGNED, dtype = int)
+        self._alive = numpy.zeros(capacity, dtype = bool)
+        self._domd = numpy.zeros((capacity,capacity), dtype = bool)
+        self._counts = numpy.zeros(0, dtype = int)
+
+    def __len__(self) -> int:
+        """
+        Number of individuals.
+        """
+        return int(self._alive.sum())
+
+    @property
+    def ids(self) -> numpy.ndarray:
+        """
+        Ids of individuals, in ascending order.
+        """
+        return numpy.flatnonzero(self._alive)
+
+    @property
+    def x(self) -> numpy.ndarray:
+        """
+        Objective values of individuals, in order of ``ids``.
+        """
+        return self._x[self._alive]
+
+    @property
+    def cv(self) -> numpy.ndarray:
+        """
+        Constraint violations of individuals, in order of ``ids``.
+        """
+        return self._cv[self._alive]
+
+    @property
+    def front(self) -> numpy.ndarray:
+        """
+        Front assignments of individuals, in order of ``ids``.
+        """
+        return self._front[self._alive]
+
+    @property
+    def front_counts(self) -> numpy.ndarray:
+        """
+        Number of individuals in each front.
+        """
+        return self._counts.copy()
+
+    @property
+    def nfront(self) -> int:
+        """
+        Number of fronts.
+        """
+        return len(self._counts)
+
+    def get_front(self, ids: numpy.ndarray) -> numpy.ndarray:
+        """
+        Get front assignments of individuals.
+
+        Parameters
+        ----------
+        ids : numpy.ndarray
+            Ids of individuals.
+
+        Returns
+        -------
+        out : numpy.ndarray
+            Front assignments of individuals.
+        """
+        ids = self._check_ids(numpy.asarray(ids, dtype = int))
+        return self._front[ids]
+
+    def _check_ids(self, ids: numpy.ndarray) -> numpy.ndarray:
+        """
+        Test that ids refer to individuals, raising ``KeyError`` otherwise.
+        Ids outside storage are tested before indexing, so negative ids do
+        not wrap around.
+        """
+        valid = (ids >= 0) & (ids < len(self._alive))
+        valid[valid] = self._alive[ids[valid]]
+        if not numpy.all(valid):
+            raise KeyError("Ids do not refer to individuals: ``{0}``".format(ids[~valid]))
+        return ids
+
+    def _grow(self, capacity: int) -> None:
+        """
+        Grow storage to hold at least ``capacity`` individuals.
+        """
+        old = len(self._alive)
+        if capacity <= old:
+            return
+        new = max(capacity, 2 * old)
+        x = numpy.empty((new,self._nobj), dtype = float)
+        x[:old] = self._x
+        cv = numpy.zeros(new, dtype = float)
+        cv[:old] = self._cv
+        front = numpy.full(new, UNASSIGNED, dtype = int)
+        front[:old] = self._front
+        alive = numpy.zeros(new, dtype = bool)
+        alive[:old] = self._alive
+        domd = numpy.zeros((new,new), dtype = bool)
+        domd[:old,:old] = self._domd
+        self._x = x
+        self._cv = cv
+        self._front = front
+        self._alive = alive
+        self._domd = domd
+
+    def _count(self, front: numpy.ndarray, delta: int) -> None:
+        """
+        Add ``delta`` to the front counts of fronts in ``front``.
+        """
+        if len(front) == 0:
+            return
+        nfront = int(front.max()) + 1
+        if nfront > len(self._counts):
+            self._counts = numpy.concatenate((self._counts, numpy.zeros(nfront - len(self._counts), dtype = int)))
+        numpy.add.at(self._counts, front, delta)
+        # drop empty trailing fronts
+        nonzero = numpy.flatnonzero(self._counts)
+        self._counts = self._counts[:nonzero[-1]+1] if len(nonzero) > 0 else self._counts[:0]
+
+    def _reassign(self, ix: numpy.ndarray) -> None:
+        """
+        Reassign fronts of individuals ``ix``, which must include every
+        individual whose front may have changed.
+        """
+        if len(ix) == 0:
+            return
+        # remove old assignments from counts
+        self._count(self._front[ix][self._front[ix] != UNASSIGNED], -1)
+        # dominators precede dominated individuals in presorted order
+        ix = ix[argpresort(self._x[ix], self._sense, self._cv[ix])]
+        alive = self._alive
+        front = self._front
+        domd = self._domd
+        for i in ix:
+            dominators = domd[i] & alive
+            front[i] = front[dominators].max() + 1 if dominators.any() else 0
+        # add new assignments to counts
+        self._count(front[ix], 1)
+
+    def insert(self, points: numpy.ndarray, cv: Optional[numpy.ndarray] = None) -> numpy.ndarray:
+        """
+        Insert individuals and update fronts.
+
+        Parameters
+        ----------
+        points : numpy.ndarray
+            A matrix of shape ``(k,nobj)`` containing objective values of new individuals.
+        cv : numpy.ndarray, None
+            A vector of shape ``(k,)`` containing constraint violations of new
+            individuals; an individual is feasible if its violation is ``<= 0``.
+            If ``None``, new individuals are feasible.
+
+        Returns
+        -------
+        out : numpy.ndarray
+            A vector of shape ``(k,)`` containing ids of new individuals.
+        """
+        points = numpy.asarray(points, dtype = float)
+        if points.ndim != 2 or points.shape[1] != self._nobj:
+            raise ValueError("Input matrix ``points`` must have shape ``(k,{0})``: received ``{1}``".format(self._nobj, points.shape))
+        if cv is not None:
+            cv = numpy.asarray(cv, dtype = float)
+            if cv.shape != (len(points),):
+                raise ValueError("Constraint violations ``cv`` are not the correct shape: expected ``{0}`` but received ``{1}``".format((len(points),),cv.shape))
+
+        # allocate ids from free storage
+        nalive = len(self)
+        self._grow(nalive + len(points))
+        out = numpy.flatnonzero(~self._alive)[:len(points)]
+        self._x[out] = points
+        self._cv[out] = 0 if cv is None else cv
+        self._front[out] = UNASSIGNED
+        self._alive[out] = True
+
+        # calculate dominance relationships between new and all individuals
+        alive = self.ids
+        rel = numpy.empty((len(out),len(alive)), dtype = numpy.int8)
+        dominance_relationship_block(self._x[out], self._x[alive], rel, self._sense, None, self._cv[out], self._cv[alive])
+        self._domd[numpy.ix_(out,alive)] = rel > 0
+        self._domd[numpy.ix_(alive,out)] = (rel < 0).T
+
+        # new individuals and individuals they dominate may change fronts
+        affected = numpy.any(self._domd[numpy.ix_(alive,out)], axis = 1)
+        affected[numpy.searchsorted(alive, out)] = True
+        self._reassign(alive[affected])
+
+        return out
+
+    def remove(self, ids: numpy.ndarray) -> None:
+        """
+        Remove individuals and update fronts.
+
+        Parameters
+        ----------
+        ids : numpy.ndarray
+            Ids of individuals to remove.
+        """
+        ids = self._check_ids(numpy.unique(numpy.asarray(ids, dtype = int)))
+
+        # remove individuals
+        self._count(self._front[ids], -1)
+        self._alive[ids] = False
+        self._front[ids] = UNASSIGNED
+
+        # individuals dominated by removed individuals may change fronts
+        alive = self.ids
+        affected = numpy.any(self._domd[numpy.ix_(alive,ids)], axis = 1)
+        self._reassign(alive[affected])
+
+        # clear relationships of removed individuals
+        self._domd[ids,:] = False
+        self._domd[:,ids] = False
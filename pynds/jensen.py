@@ -0,0 +1,383 @@
+import numpy
+from typing import Optional
+from pynds.relation import relation_options
+from pynds.presort import dense_rank
+from pynds.presort import argfrontsort
+from pynds.presort import assign_infeasible
+from pynds.presort import presort_runs
+from pynds.presort import argfrontsort_presorted
+from pynds.presort import permute_matrix
+from pynds.stats import count_relations
+from pynds.stats import phase_start
+from pynds.stats import phase_stop
+
+# subproblems with at most this many individuals are solved by brute force
+JENSEN_BRUTE_A = 32
+
+# subproblems with at most this many pairs are solved by brute force
+JENSEN_BRUTE_B = 1024
+
+class Fenwick:
+    """
+    Fenwick tree for prefix maximum queries over integer coordinates.
+    Stores values ``>= 0``; empty prefixes have a maximum of ``-1``.
+    """
+    def __init__(self, n: int) -> None:
+        """
+        Constructor for Fenwick.
+
+        Parameters
+        ----------
+        n : int
+            Number of coordinates.
+        """
+        self.n = n
+        self.tree = [-1] * (n + 1)
+
+    def update(self, i: int, v: int) -> None:
+        """
+        Raise the value at coordinate ``i`` to at least ``v``.
+
+        Parameters
+        ----------
+        i : int
+            Coordinate in ``[0,n)``.
+        v : int
+            Value.
+        """
+        tree = self.tree
+        i += 1
+        while i <= self.n:
+            if tree[i] < v:
+                tree[i] = v
+            i += i & (-i)
+
+    def query(self, i: int) -> int:
+        """
+        Maximum value over coordinates ``[0,i]``.
+
+        Parameters
+        ----------
+        i : int
+            Coordinate in ``[0,n)``.
+
+        Returns
+        -------
+        out : int
+            Prefix maximum, or ``-1`` if no values were stored.
+        """
+        tree = self.tree
+        out = -1
+        i += 1
+        while i > 0:
+            if tree[i] > out:
+                out = tree[i]
+            i -= i & (-i)
+        return out
+
+def sweep_a(r: numpy.ndarray, rank: numpy.ndarray, S: numpy.ndarray) -> None:
+    """
+    Assign ranks within a set of individuals using the first two objectives.
+
+    Parameters
+    ----------
+    r : numpy.ndarray
+        A matrix of shape ``(N,M)`` containing objective ranks for individuals.
+    rank : numpy.ndarray
+        A vector of shape ``(N,)`` containing front ranks. Modified in-place.
+    S : numpy.ndarray
+        Presorted indices of individuals which are equal in objectives ``2..M-1``.
+    """
+    # compress second objective coordinates
+    r1 = r[S,1]
+    c1 = numpy.searchsorted(numpy.unique(r1), r1).tolist()
+    tree = Fenwick(len(c1))
+    # in presorted order, every processed individual dominates the current
+    # individual if it is not worse in the second objective
+    for s,c in zip(S.tolist(), c1):
+        q = tree.query(c) + 1
+        if rank[s] < q:
+            rank[s] = q
+        tree.update(c, int(rank[s]))
+
+def sweep_b(r: numpy.ndarray, rank: numpy.ndarray, L: numpy.ndarray, H: numpy.ndarray) -> None:
+    """
+    Update ranks of individuals in ``H`` from ranks of individuals in ``L``
+    using the first two objectives.
+
+    Parameters
+    ----------
+    r : numpy.ndarray
+        A matrix of shape ``(N,M)`` containing objective ranks for individuals.
+    rank : numpy.ndarray
+        A vector of shape ``(N,)`` containing front ranks. Modified in-place.
+    L : numpy.ndarray
+        Presorted indices of individuals with final ranks.
+    H : numpy.ndarray
+        Presorted indices of individuals to update, which are not better than
+        individuals in ``L`` in objectives ``2..M-1``.
+    """
+    # merge by first objective, visiting L before H on ties
+    S = numpy.concatenate((L, H))
+    isH = numpy.concatenate((numpy.zeros(len(L), dtype = bool), numpy.ones(len(H), dtype = bool)))
+    ix = numpy.lexsort((isH, r[S,0]))
+    S = S[ix]
+    isH = isH[ix]
+
+    # compress second objective coordinates
+    r1 = r[S,1]
+    c1 = numpy.searchsorted(numpy.unique(r1), r1).tolist()
+    tree = Fenwick(len(c1))
+    for s,h,c in zip(S.tolist(), isH.tolist(), c1):
+        if h:
+            q = tree.query(c) + 1
+            if rank[s] < q:
+                rank[s] = q
+        else:
+            tree.update(c, int(rank[s]))
+
+def brute_a(r: numpy.ndarray, rank: numpy.ndarray, S: numpy.ndarray, k: int) -> None:
+    """
+    Assign ranks within a small set of individuals using objectives ``0..k``.
+
+    Parameters
+    ----------
+    r : numpy.ndarray
+        A matrix of shape ``(N,M)`` containing objective ranks for individuals.
+    rank : numpy.ndarray
+        A vector of shape ``(N,)`` containing front ranks. Modified in-place.
+    S : numpy.ndarray
+        Presorted indices of individuals which are equal in objectives ``k+1..M-1``.
+    k : int
+        Last objective to consider.
+    """
+    rs = r[S,:k+1]
+    # D[i,j] == True if individual j is not worse than individual i in all objectives
+    D = numpy.all(rs[None,:,:] <= rs[:,None,:], axis = 2)
+    count_relations(D.size)
+    for i in range(1, len(S)):
+        d = D[i,:i]
+        if d.any():
+            q = rank[S[:i][d]].max() + 1
+            if rank[S[i]] < q:
+                rank[S[i]] = q
+
+def brute_b(r: numpy.ndarray, rank: numpy.ndarray, L: numpy.ndarray, H: numpy.ndarray, k: int) -> None:
+    """
+    Update ranks of a small set of individuals in ``H`` from ranks of
+    individuals in ``L`` using objectives ``0..k``.
+
+    Parameters
+    ----------
+    r : numpy.ndarray
+        A matrix of shape ``(N,M)`` containing objective ranks for individuals.
+    rank : numpy.ndarray
+        A vector of shape ``(N,)`` containing front ranks. Modified in-place.
+    L : numpy.ndarray
+        Presorted indices of individuals with final ranks.
+    H : numpy.ndarray
+        Presorted indices of individuals to update.
+    k : int
+        Last objective to consider.
+    """
+    # D[i,j] == True if individual L[i] is not worse than individual H[j] in all objectives
+    D = numpy.all(r[L,None,:k+1] <= r[None,H,:k+1], axis = 2)
+    count_relations(D.size)
+    q = numpy.where(D, rank[L][:,None] + 1, 0).max(axis = 0)
+    rank[H] = numpy.maximum(rank[H], q)
+
+def helper_a(r: numpy.ndarray, rank: numpy.ndarray, S: numpy.ndarray, k: int) -> None:
+    """
+    Assign ranks within a set of individuals using objectives ``0..k``.
+
+    Parameters
+    ----------
+    r : numpy.ndarray
+        A matrix of shape ``(N,M)`` containing objective ranks for individuals.
+    rank : numpy.ndarray
+        A vector of shape ``(N,)`` containing front ranks. Modified in-place.
+    S : numpy.ndarray
+        Presorted indices of individuals which are equal in objectives ``k+1..M-1``.
+    k : int
+        Last objective to consider.
+    """
+    if len(S) < 2:
+        return
+    if k == 0:
+        # equal in all other objectives: each individual dominates the next
+        # rank[S[i]] = max(rank[S[i]], rank[S[i-1]] + 1)
+        i = numpy.arange(len(S))
+        rank[S] = numpy.maximum.accumulate(rank[S] - i) + i
+        return
+    if len(S) <= JENSEN_BRUTE_A:
+        brute_a(r, rank, S, k)
+        return
+    if k == 1:
+        sweep_a(r, rank, S)
+        return
+    v = r[S,k]
+    # if all values are equal, then objective k does not matter
+    if v.min() == v.max():
+        helper_a(r, rank, S, k-1)
+        return
+    # split into lesser, equal, and greater than the median (Fortin et al.)
+    m = numpy.partition(v, len(v) // 2)[len(v) // 2]
+    L = S[v < m]
+    M = S[v == m]
+    H = S[v > m]
+    helper_a(r, rank, L, k)
+    helper_b(r, rank, L, M, k-1)
+    helper_a(r, rank, M, k-1)
+    helper_b(r, rank, S[v <= m], H, k-1)
+    helper_a(r, rank, H, k)
+
+def helper_b(r: numpy.ndarray, rank: numpy.ndarray, L: numpy.ndarray, H: numpy.ndarray, k: int) -> None:
+    """
+    Update ranks of individuals in ``H`` from ranks of individuals in ``L``
+    using objectives ``0..k``.
+
+    Parameters
+    ----------
+    r : numpy.ndarray
+        A matrix of shape ``(N,M)`` containing objective ranks for individuals.
+    rank : numpy.ndarray
+        A vector of shape ``(N,)`` containing front ranks. Modified in-place.
+    L : numpy.ndarray
+        Presorted indices of individuals with final ranks.
+    H : numpy.ndarray
+        Presorted indices of individuals to update, which are not better than
+        individuals in ``L`` in objectives ``k+1..M-1``.
+    k : int
+        Last objective to consider.
+    """
+    if len(L) == 0 or len(H) == 0:
+        return
+    if k == 0 or len(L) * len(H) <= JENSEN_BRUTE_B:
+        brute_b(r, rank, L, H, k)
+        return
+    if k == 1:
+        sweep_b(r, rank, L, H)
+        return
+    lv = r[L,k]
+    hv = r[H,k]
+    # L is not worse in objective k: objective k does not matter
+    if lv.max() <= hv.min():
+        helper_b(r, rank, L, H, k-1)
+        return
+    # L is worse in objective k: nothing in L can dominate anything in H
+    if lv.min() > hv.max():
+        return
+    # split both sets around the median (Fortin et al.)
+    v = numpy.concatenate((lv, hv))
+    m = numpy.partition(v, len(v) // 2)[len(v) // 2]
+    helper_b(r, rank, L[lv < m], H[hv < m], k)
+    helper_b(r, rank, L[lv <= m], H[hv >= m], k-1)
+    helper_b(r, rank, L[lv > m], H[hv > m], k)
+
+def ndsort_jensen(x: numpy.ndarray, front: numpy.ndarray, perm: numpy.ndarray, sense: Optional[numpy.ndarray] = None, cv: Optional[numpy.ndarray] = None) -> None:
+    """
+    In-place non-dominated sorting using Jensen's divide-and-conquer algorithm,
+    generalized by Fortin et al. to handle duplicate objective values.
+
+    Objective values are replaced by their dense ranks, best first, and
+    identical individuals are merged after presorting the ranks. Sets of
+    individuals are then recursively split around the median of an
+    objective, with two-objective base cases solved by sweeping.
+
+    Computational complexity: O(NlogN^(M-1))
+        O(MNlogN) for presorting and ranking objective values
+        O(NlogN^(M-1)) for divide-and-conquer front assignment
+        O(NlogN) for final sorting based on dominance and objectives
+
+    Space complexity: O(MN)
+        O(MN) for storing objective ranks of unique individuals
+
+    Size definitions:
+        M = number of objectives.
+        N = number of individuals.
+
+    Parameters
+    ----------
+    x : numpy.ndarray
+        A matrix of shape ``(N,M)`` containing objective values for individuals.
+    front : numpy.ndarray
+        A vector of shape ``(N,)`` containing front assignments.
+    perm : numpy.ndarray
+        A vector of shape ``(N,)`` containing the sorting permutation.
+        Output vector. The sorted matrix is the input matrix indexed by ``perm``.
+    sense : numpy.ndarray, None
+        A vector of shape ``(M,)`` containing ``1`` for minimized and ``-1``
+        for maximized objectives; maximized objectives are ranked in
+        descending order. If ``None``, minimize all objectives.
+        Rows are still ordered by ascending objective values within fronts.
+    cv : numpy.ndarray, None
+        A vector of shape ``(N,)`` containing constraint violations; an
+        individual is feasible if its violation is ``<= 0``. If given, use
+        Deb's constraint-domination: feasible individuals are divided and
+        conquered, and infeasible individuals follow in order of increasing
+        violation. This vector is reordered in-place along with ``x``.
+    """
+    # assign fronts and calculate the sorting permutation
+    argndsort_jensen(x, front, perm, sense, cv)
+
+    # reorder objective matrix and front matrix
+    permute_matrix(x, front, perm)
+
+    # reorder constraint violations along with rows
+    if cv is not None:
+        cv[:] = cv[perm]
+
+def argndsort_jensen(x: numpy.ndarray, front: numpy.ndarray, perm: numpy.ndarray, sense: Optional[numpy.ndarray] = None, cv: Optional[numpy.ndarray] = None) -> None:
+    """
+    Non-dominated sorting using Jensen's divide-and-conquer algorithm,
+    returning the sorting permutation instead of reordering ``x``.
+
+    Parameters are as for ``ndsort_jensen``. On output, ``front`` contains
+    front assignments in the order of the rows of ``x``, and ``x[perm]`` is
+    the sorted matrix.
+    """
+    # get the number of objectives
+    nobj = x.shape[1]
+
+    # get maximized objectives
+    maximize, _ = relation_options(nobj, sense)
+
+    # constraint-domination: only feasible individuals are divided and conquered
+    rows = None if cv is None else numpy.flatnonzero(cv <= 0)
+    nsel = x.shape[0] if rows is None else len(rows)
+
+    # replace objective values with dense ranks, best first, one column at a time
+    tstart = phase_start()
+    r = numpy.empty((nsel,nobj), dtype = numpy.int64)
+    for j in range(nobj):
+        col = x[:,j] if rows is None else x[rows,j]
+        r[:,j] = dense_rank(col, maximize is not None and maximize[j])
+    phase_stop("presort", tstart)
+
+    # presort individuals and merge identical individuals, which are contiguous after presorting
+    ix, new = presort_runs(r)
+    group = numpy.cumsum(new) - 1
+    uniq = ix[new]
+
+    # assign front ranks to unique individuals, in presorted order
+    tstart = phase_start()
+    rank = numpy.zeros(nsel, dtype = numpy.int64)
+    helper_a(r, rank, uniq, nobj-1)
+
+    # expand front ranks to identical individuals
+    sfront = rank[uniq][group]
+
+    # make front assignments in the order of the rows of x
+    if rows is None:
+        front[ix] = sfront
+    else:
+        front[rows[ix]] = sfront
+        assign_infeasible(front, cv, sfront.max() + 1 if nsel > 0 else 0)
+    phase_stop("peel", tstart)
+
+    # sort first by front, then by column 0, then by column 1, ...
+    # presorted order is only ascending if all objectives are minimized and all individuals feasible
+    if maximize is None and rows is None:
+        perm[:] = argfrontsort_presorted(ix, sfront)
+    else:
+        perm[:] = argfrontsort(x, front)
@@ -0,0 +1,316 @@
+import numpy
+from typing import Callable
+from typing import Optional
+
+# numba is an optional dependency: ``pip install pynds[jit]``
+try:
+    import numba
+except ImportError:
+    numba = None
+
+# whether compiled kernels are available
+JIT_AVAILABLE = numba is not None
+
+# limit passed to compiled kernels for ``kfront`` and ``nfill`` of ``None``
+NO_LIMIT = -1
+
+def jit(func: Callable) -> Callable:
+    """
+    Compile a function in nopython mode if numba is installed, otherwise
+    return it unchanged. The interpreted function is always available as
+    ``py_func``.
+
+    Parameters
+    ----------
+    func : Callable
+        Function written using only loops and scalar operations on arrays.
+
+    Returns
+    -------
+    out : Callable
+        Compiled or interpreted function.
+    """
+    if numba is None:
+        func.py_func = func
+        return func
+    return numba.njit(cache = True)(func)
+
+def jit_limit(limit: Optional[int]) -> int:
+    """
+    Convert an early exit limit to a compiled kernel argument.
+
+    Parameters
+    ----------
+    limit : int, None
+        ``kfront`` or ``nfill``, or ``None`` if there is no limit.
+
+    Returns
+    -------
+    out : int
+        ``limit``, or ``NO_LIMIT`` if ``limit`` is ``None``.
+    """
+    return NO_LIMIT if limit is None else limit
+
+def jit_supported(x: numpy.ndarray, sense: Optional[numpy.ndarray] = None, eps: Optional[numpy.ndarray] = None, cv: Optional[numpy.ndarray] = None) -> bool:
+    """
+    Determine whether compiled kernels can sort a matrix.
+
+    Compiled kernels implement Pareto dominance for minimization of numeric
+    objectives; other options use the interpreted NumPy code.
+
+    Parameters
+    ----------
+    x : numpy.ndarray
+        A matrix of shape ``(nindiv,nobj)`` containing objective values.
+    sense : numpy.ndarray, None
+        Objective sense option.
+    eps : float, numpy.ndarray, None
+        Epsilon option.
+    cv : numpy.ndarray, None
+        Constraint violation option.
+
+    Returns
+    -------
+    out : bool
+        Whether compiled kernels are available and support the input.
+    """
+    return JIT_AVAILABLE and x.dtype.kind in "biuf" and x.dtype != numpy.float16 and sense is None and eps is None and cv is None
+
+@jit
+def dominance_relationship_kernel(x: numpy.ndarray, y: numpy.ndarray) -> int:
+    """
+    Determine the dominance relationship between two vectors, as by
+    ``pynds.relation.dominance_relationship``, in one pass over objectives
+    which stops as soon as the vectors are known to be non-dominated.
+    """
+    x_lt_y = False                      # whether x is better in any objective
+    y_lt_x = False                      # whether y is better in any objective
+    for j in range(x.shape[0]):         # for each objective
+        if x[j] < y[j]:
+            x_lt_y = True
+        elif y[j] < x[j]:
+            y_lt_x = True
+        if x_lt_y and y_lt_x:           # each is better somewhere: non-dominated
+            return 0
+    if x_lt_y:
+        return -1
+    if y_lt_x:
+        return 1
+    return 0
+
+@jit
+def limit_reached_kernel(nfront: int, nassigned: int, kfront: int, nfill: int) -> bool:
+    """
+    Determine whether enough fronts have been assigned to stop sorting early,
+    as by ``pynds.presort.front_limit_reached``, with ``NO_LIMIT`` for ``None``.
+    """
+    if kfront >= 0 and nfront >= kfront:
+        return True
+    if nfill >= 0 and nassigned >= nfill:
+        return True
+    return False
+
+@jit
+def assign_naive1_kernel(x: numpy.ndarray, front: numpy.ndarray, rem: numpy.ndarray, mask: numpy.ndarray, kfront: int, nfill: int) -> int:
+    """
+    Assign fronts using the naive algorithm, variant 1, as by
+    ``pynds.naive.assign_naive1``, with ``NO_LIMIT`` for ``None``.
+    Returns the number of dominance relationships evaluated.
+    """
+    nindiv = x.shape[0]
+
+    # initialize number of remaining individuals, indices for remaining individuals, nondominated mask
+    nrem = nindiv
+    for i in range(nrem):
+        rem[i] = i
+        mask[i] = False
+        front[i] = -1
+
+    # current front counter and number of dominance relationships evaluated
+    nfront = 0
+    ncompare = 0
+
+    # while not all individuals have been assigned front labels and no early exit
+    while nrem > 0 and not limit_reached_kernel(nfront, nindiv - nrem, kfront, nfill):
+        # make current front assignments
+        nnew = 0
+        for i in range(nrem):
+            ix = rem[i]
+            nondominated = True
+            for j in range(nrem):
+                jx = rem[j]
+                ncompare += 1
+                if dominance_relationship_kernel(x[ix], x[jx]) > 0:
+                    nondominated = False
+                    break
+            mask[i] = nondominated
+            if nondominated:
+                front[ix] = nfront
+                nnew += 1
+
+        # remaining individuals form dominance cycles: leave unassigned
+        if nnew == 0:
+            break
+
+        # shrink remaining individuals
+        offset = 0
+        n = nrem
+        for i in range(n):
+            if mask[i]:
+                offset += 1
+                nrem -= 1
+                continue
+            rem[i-offset] = rem[i]
+
+        # increment front count
+        nfront += 1
+
+    return ncompare
+
+@jit
+def assign_naive2_kernel(dom: numpy.ndarray, front: numpy.ndarray, rem: numpy.ndarray, mask: numpy.ndarray, kfront: int, nfill: int) -> None:
+    """
+    Assign fronts from a dominance relationship matrix using the naive
+    algorithm, variant 2, as by ``pynds.naive.assign_naive2``, with
+    ``NO_LIMIT`` for ``None``.
+    """
+    nindiv = dom.shape[0]
+
+    # initialize number of remaining individuals, indices for remaining individuals, nondominated mask
+    nrem = nindiv
+    for i in range(nrem):
+        rem[i] = i
+        mask[i] = False
+        front[i] = -1
+
+    # current front counter
+    nfront = 0
+
+    # while not all individuals have been assigned front labels and no early exit
+    while nrem > 0 and not limit_reached_kernel(nfront, nindiv - nrem, kfront, nfill):
+        # make current front assignments
+        nnew = 0
+        for i in range(nrem):
+            ix = rem[i]
+            nondominated = True
+            for j in range(nrem):
+                jx = rem[j]
+                if dom[ix,jx] > 0:
+                    nondominated = False
+                    break
+            mask[i] = nondominated
+            if nondominated:
+                front[ix] = nfront
+                nnew += 1
+
+        # remaining individuals form dominance cycles: leave unassigned
+        if nnew == 0:
+            break
+
+        # shrink remaining individuals
+        offset = 0
+        n = nrem
+        for i in range(n):
+            if mask[i]:
+                offset += 1
+                nrem -= 1
+                continue
+            rem[i-offset] = rem[i]
+
+        # increment front count
+        nfront += 1
+
+@jit
+def assign_biobj_kernel(key: numpy.ndarray, front: numpy.ndarray, tails: numpy.ndarray) -> int:
+    """
+    Assign fronts to presorted individuals by sweeping over their keys, as by
+    ``pynds.biobj.ndsort_biobj_sweep``, keeping front tails in ``tails``.
+    Returns the number of fronts.
+    """
+    nfront = 0
+    for i in range(key.shape[0]):
+        k = key[i]
+        # binary search for first front whose tail key is not less than k
+        lo = 0
+        hi = nfront
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if tails[mid] < k:
+                lo = mid + 1
+            else:
+                hi = mid
+        # if dominated by all fronts, create a new front
+        if lo == nfront:
+            nfront += 1
+        # individual is new front tail
+        tails[lo] = k
+        front[i] = lo
+    return nfront
+
+@jit
+def ens_dominated_kernel(x: numpy.ndarray, ix: numpy.ndarray, head: numpy.ndarray, link: numpy.ndarray, k: int, i: int):
+    """
+    Determine whether a presorted individual is dominated by any member of a
+    front kept as a linked list, visiting the most recently added member
+    first. Returns whether it is dominated and the number of dominance
+    relationships evaluated.
+    """
+    ncompare = 0
+    j = head[k]
+    while j >= 0:
+        ncompare += 1
+        if dominance_relationship_kernel(x[ix[i]], x[ix[j]]) > 0:
+            return True, ncompare
+        j = link[j]
+    return False, ncompare
+
+@jit
+def assign_ens_kernel(x: numpy.ndarray, ix: numpy.ndarray, front: numpy.ndarray, head: numpy.ndarray, link: numpy.ndarray, binary: bool, kfront: int) -> int:
+    """
+    Assign fronts to presorted individuals using the efficient non-dominated
+    sorting algorithm, as by ``pynds.ens.ens_sweep``, keeping front members
+    in the linked lists ``head`` and ``link``, with ``NO_LIMIT`` for a
+    ``kfront`` of ``None``. Returns the number of dominance relationships
+    evaluated.
+    """
+    nindiv = x.shape[0]
+    nfront = 0
+    ncompare = 0
+    for i in range(nindiv):
+        if binary:
+            # binary search for first front not dominating the individual
+            lo = 0
+            hi = nfront
+            while lo < hi:
+                mid = (lo + hi) // 2
+                dominated, n = ens_dominated_kernel(x, ix, head, link, mid, i)
+                ncompare += n
+                if dominated:
+                    lo = mid + 1
+                else:
+                    hi = mid
+            k = lo
+        else:
+            # sequential search for first front not dominating the individual
+            k = 0
+            while k < nfront:
+                dominated, n = ens_dominated_kernel(x, ix, head, link, k, i)
+                ncompare += n
+                if not dominated:
+                    break
+                k += 1
+
+        # if dominated by all fronts, create a new front, unless the
+        # individual is beyond the front limit: leave it unassigned
+        if k == nfront:
+            if kfront >= 0 and nfront >= kfront:
+                front[ix[i]] = -1
+                continue
+            head[k] = -1
+            nfront += 1
+
+        # add individual to front
+        link[i] = head[k]
+        head[k] = i
+        front[ix[i]] = k
+    return ncompare
@@ -1,12 +1,29 @@
 import numpy
 from pynds.relation import dominance_relationship
 from pynds.relation import dominance_relationship_matrix
+from typing import Optional
+from typing import Tuple
+from typing import Union
+from pynds.presort import UNASSIGNED
+from pynds.presort import front_limit_reached
+from pynds.presort import argfrontsort
+from pynds.presort import frontsort_matrix
+from pynds.fronts import Fronts
+from pynds.crowding import crowding_distance
+from pynds.crowding import niche_count_sorted
+from pynds.stats import count_relations
+from pynds.stats import phase_start
+from pynds.stats import phase_stop
+from pynds.jit import jit_limit
+from pynds.jit import jit_supported
+from pynds.jit import assign_naive1_kernel
+from pynds.jit import assign_naive2_kernel
 
 def krange(start: int, stop: int, skip: int):
     yield from range(start, skip)
     yield from range(skip+1, stop)
 
-def ndsort_naive(x: numpy.ndarray, front: numpy.ndarray, inplace: bool = True) -> numpy.ndarray:
+def ndsort_naive(x: numpy.ndarray, front: numpy.ndarray, inplace: bool = True, kfront: Optional[int] = None, nfill: Optional[int] = None, return_fronts: bool = False, sense: Optional[numpy.ndarray] = None, eps: Optional[numpy.ndarray] = None, cv: Optional[numpy.ndarray] = None) -> Union[numpy.ndarray,Tuple[numpy.ndarray,Fronts]]:
     """
     Non-dominated sorting using the naive algorithm.
 
@@ -22,11 +39,33 @@ def ndsort_naive(x: numpy.ndarray, front: numpy.ndarray, inplace: bool = True) -
         Pointer to output front assignment array.
     inplace : bool
         Whether to modify the matrix in-place or return a modified copy.
+    kfront : int, None
+        Stop once ``kfront`` fronts have been assigned.
+    nfill : int, None
+        Stop once at least ``nfill`` individuals have been assigned.
+        Individuals left unassigned have front ``UNASSIGNED`` and are placed last.
+    return_fronts : bool
+        Whether to also return the fronts as a ``pynds.fronts.Fronts`` object
+        holding the input row indices of each front.
+    sense : numpy.ndarray, None
+        A vector of shape ``(M,)`` containing ``1`` for minimized and ``-1``
+        for maximized objectives. If ``None``, minimize all objectives.
+    eps : float, numpy.ndarray, None
+        Additive epsilon for each objective; use epsilon-dominance instead of
+        Pareto dominance. Epsilon-dominance is not transitive: individuals
+        caught in dominance cycles are left ``UNASSIGNED``.
+        If ``None``, use Pareto dominance.
+    cv : numpy.ndarray, None
+        A vector of shape ``(N,)`` containing constraint violations; an
+        individual is feasible if its violation is ``<= 0``. If given, use
+        Deb's constraint-domination.
+        If ``inplace``, this vector is reordered in-place along with ``x``.
     
     Returns
     -------
-    out : numpy.ndarray
+    out : numpy.ndarray, tuple
         Output matrix non-dominated sorted matrix.
+        If ``return_fronts``, a tuple ``(out, fronts)``.
     """
     # define output
     out = x if inplace else x.copy()
@@ -34,14 +73,18 @@ def ndsort_naive(x: numpy.ndarray, front: numpy.ndarray, inplace: bool = True) -
     # get the number of individuals and objectives
     nindiv = out.shape[0]
 
+    # input row indices, swapped along with rows
+    perm = numpy.arange(nindiv)
+
     # starting index
     start = 0
 
     # starting front
     current_front = 0
 
-    # while 
-    while start < nindiv:
+    # while not all individuals have been assigned front labels and no early exit
+    tstart = phase_start()
+    while start < nindiv and not front_limit_reached(current_front, start, kfront, nfill):
         bookkeeping = []
         # for each individual
         for indiv in range(start, nindiv):
@@ -49,70 +92,156 @@ def ndsort_naive(x: numpy.ndarray, front: numpy.ndarray, inplace: bool = True) -
             # for each other individual
             for other in krange(start, nindiv, indiv):
                 # if individual is dominated by other individual, mark as dominated and break
-                if dominance_relationship(out[indiv], out[other]) > 0:
+                cvi = None if cv is None else cv[perm[indiv]]
+                cvo = None if cv is None else cv[perm[other]]
+                if dominance_relationship(out[indiv], out[other], sense, eps, cvi, cvo) > 0:
                     nondominated = False
                     break
             # if individual is nondominated, store index in bookkeeping
             if nondominated:
                 bookkeeping.append(indiv)
+        # remaining individuals form dominance cycles (epsilon-dominance): leave unassigned
+        if len(bookkeeping) == 0:
+            break
         # for each index found in the bookkeeping, swap and store front
         for ix in bookkeeping:
             out[[start,ix],:] = out[[ix,start],:]
+            perm[[start,ix]] = perm[[ix,start]]
             front[start] = current_front
             start += 1
         # increment front
         current_front += 1
+    phase_stop("peel", tstart)
+    # mark individuals left by an early exit
+    front[start:] = UNASSIGNED
+    # reorder constraint violations along with rows
+    if inplace and cv is not None:
+        cv[:] = cv[perm]
+    if return_fronts:
+        return out, Fronts.from_sorted(perm, front)
     return out
 
-def ndsort_naive1(x: numpy.ndarray, front: numpy.ndarray, rem: numpy.ndarray, mask: numpy.ndarray) -> None:
+def argndsort_naive(x: numpy.ndarray, front: numpy.ndarray, perm: numpy.ndarray, kfront: Optional[int] = None, nfill: Optional[int] = None, sense: Optional[numpy.ndarray] = None, eps: Optional[numpy.ndarray] = None, cv: Optional[numpy.ndarray] = None) -> Fronts:
     """
-    In-place non-dominated sorting using the naive algorithm, variant 1.
+    Non-dominated sorting using the naive algorithm, returning the sorting
+    permutation instead of reordering ``x``. Indices are swapped in place
+    of rows.
 
     Computational complexity: O(MN^3 + MNlogN)
-        O(MN^3) for naively traversing dominance relationships.
-        O(MNlogN) for final quicksorting based on dominance and objectives
-
-    Space complexity: O(2N)
-        O(N) for storing remaining indices left to sort
-        O(N) for storing mask of values which were nondominated
-
-    Size definitions:
-        M = number of objectives.
-        N = number of individuals.
-
-    This Python code is meant to be close to what would be found in C, so that it can be easily translated.
+    Space complexity: O(N) (for bookkeeping)
 
     Parameters
     ----------
     x : numpy.ndarray
-        A matrix of shape ``(M,N)`` containing objective values for individuals.
+        Input matrix of shape ``(nindiv,nobj)`` to non-dominated sort.
+        This matrix is not modified.
     front : numpy.ndarray
-        A vector of shape ``(N,)`` containing front assignments.
-    dom : numpy.ndarray
-        A matrix of shape ``(N,N)``.
-        Workspace holding pairwise dominance relationships.
-    rem : numpy.ndarray
-        A vector of shape ``(N,)``
-        Workspace holding remaining indices to visit
-    mask : numpy.ndarray
-        A vector of shape ``(N,)``
-        Workspace holding indices marked as nondominated
+        Pointer to output front assignment array, in the order of the rows of ``x``.
+    perm : numpy.ndarray
+        Pointer to output sorting permutation. ``x[perm]`` is the sorted
+        matrix and ``front[perm]`` its front assignments.
+    kfront : int, None
+        Stop once ``kfront`` fronts have been assigned.
+    nfill : int, None
+        Stop once at least ``nfill`` individuals have been assigned.
+        Individuals left unassigned have front ``UNASSIGNED`` and are placed last.
+    sense : numpy.ndarray, None
+        A vector of shape ``(M,)`` containing ``1`` for minimized and ``-1``
+        for maximized objectives. If ``None``, minimize all objectives.
+    eps : float, numpy.ndarray, None
+        Additive epsilon for each objective; use epsilon-dominance instead of
+        Pareto dominance. Epsilon-dominance is not transitive: individuals
+        caught in dominance cycles are left ``UNASSIGNED``.
+        If ``None``, use Pareto dominance.
+    cv : numpy.ndarray, None
+        A vector of shape ``(N,)`` containing constraint violations; an
+        individual is feasible if its violation is ``<= 0``. If given, use
+        Deb's constraint-domination. This vector is not modified.
+
+    Returns
+    -------
+    out : Fronts
+        Fronts holding the row indices of each front.
     """
     # get the number of individuals
     nindiv = x.shape[0]
-    nobj = x.shape[1]
+
+    # row indices, swapped instead of rows
+    perm[:] = numpy.arange(nindiv)
+    front[:] = UNASSIGNED
+
+    # starting index
+    start = 0
+
+    # starting front
+    current_front = 0
+
+    # while not all individuals have been assigned front labels and no early exit
+    tstart = phase_start()
+    while start < nindiv and not front_limit_reached(current_front, start, kfront, nfill):
+        bookkeeping = []
+        # for each individual
+        for indiv in range(start, nindiv):
+            nondominated = True
+            # for each other individual
+            for other in krange(start, nindiv, indiv):
+                # if individual is dominated by other individual, mark as dominated and break
+                cvi = None if cv is None else cv[perm[indiv]]
+                cvo = None if cv is None else cv[perm[other]]
+                if dominance_relationship(x[perm[indiv]], x[perm[other]], sense, eps, cvi, cvo) > 0:
+                    nondominated = False
+                    break
+            # if individual is nondominated, store index in bookkeeping
+            if nondominated:
+                bookkeeping.append(indiv)
+        # remaining individuals form dominance cycles (epsilon-dominance): leave unassigned
+        if len(bookkeeping) == 0:
+            break
+        # for each index found in the bookkeeping, swap and store front
+        for ix in bookkeeping:
+            perm[[start,ix]] = perm[[ix,start]]
+            front[perm[start]] = current_front
+            start += 1
+        # increment front
+        current_front += 1
+    phase_stop("peel", tstart)
+
+    # sorting indices: first by front, then by column 0, then by column 1, ...
+    perm[:] = argfrontsort(x, front)
+
+    return Fronts.from_sorted(perm, front[perm])
+
+def assign_naive1(x: numpy.ndarray, front: numpy.ndarray, rem: numpy.ndarray, mask: numpy.ndarray, kfront: Optional[int] = None, nfill: Optional[int] = None, sense: Optional[numpy.ndarray] = None, eps: Optional[numpy.ndarray] = None, cv: Optional[numpy.ndarray] = None) -> None:
+    """
+    Assign fronts using the naive algorithm, variant 1, without reordering
+    ``x``.
+
+    Parameters are as for ``ndsort_naive1``. On output, ``front`` contains front
+    assignments in the order of the rows of ``x``.
+    """
+    # use the compiled loops if numba is installed and the options allow it
+    tstart = phase_start()
+    if jit_supported(x, sense, eps, cv):
+        ncompare = assign_naive1_kernel(x, front, rem, mask, jit_limit(kfront), jit_limit(nfill))
+        count_relations(ncompare, ncompare)
+        phase_stop("peel", tstart)
+        return
+
+    # get the number of individuals
+    nindiv = x.shape[0]
 
     # initialize number of remaining individuals, indices for remaining individuals, nondominated mask
     nrem = nindiv
     for i in range(nrem):
         rem[i] = i
         mask[i] = False
+        front[i] = UNASSIGNED
 
     # current front counter
     nfront = 0
 
-    # while not all individuals have been assigned front labels
-    while nrem > 0:
+    # while not all individuals have been assigned front labels and no early exit
+    while nrem > 0 and not front_limit_reached(nfront, nindiv - nrem, kfront, nfill):
         # make current front assignments
         for i in range(nrem):               # for each remaining index in remaining index array
             ix = rem[i]                     # get index for current individual
@@ -120,12 +249,18 @@ def ndsort_naive1(x: numpy.ndarray, front: numpy.ndarray, rem: numpy.ndarray, ma
             for j in range(nrem):           # for each other individual in remaining index array
                 jx = rem[j]                 # get index for other individual
                 # if individual is dominated, mark as dominated and break loop
-                if dominance_relationship(x[ix],x[jx]) > 0:
+                cvi = None if cv is None else cv[ix]
+                cvj = None if cv is None else cv[jx]
+                if dominance_relationship(x[ix],x[jx],sense,eps,cvi,cvj) > 0:
                     nondominated = False    # set nondominated status to False
                     break
             mask[i] = nondominated          # assign nondomination status to mask array
             if nondominated:                # make front assignment for current individual
                 front[ix] = nfront
+
+        # remaining individuals form dominance cycles (epsilon-dominance): leave unassigned
+        if not numpy.any(mask[:nrem]):
+            break
         
         # shrink remaining individuals
         offset = 0                          # initialize offset to 0
@@ -139,30 +274,17 @@ def ndsort_naive1(x: numpy.ndarray, front: numpy.ndarray, rem: numpy.ndarray, ma
         # increment front count
         nfront += 1
 
-    # quicksort first by front, then by column 0, then by column 1, ...
-    # use numpy because I'm lazy; would need to implement this in C.
-
-    # get keys (must be in reverse order)
-    keys = tuple(x[:,i] for i in range(nobj))[::-1] + (front,)
+    phase_stop("peel", tstart)
 
-    # indirect sort indices for reordering
-    ix = numpy.lexsort(keys)
-    
-    # reorder objective matrix and front matrix
-    x[:,:] = x[ix,:]
-    front[:] = front[ix]
-
-def ndsort_naive2(x: numpy.ndarray, front: numpy.ndarray, dom: numpy.ndarray, rem: numpy.ndarray, mask: numpy.ndarray) -> None:
+def ndsort_naive1(x: numpy.ndarray, front: numpy.ndarray, rem: numpy.ndarray, mask: numpy.ndarray, kfront: Optional[int] = None, nfill: Optional[int] = None, crowding: Optional[numpy.ndarray] = None, refs: Optional[numpy.ndarray] = None, niche: Optional[numpy.ndarray] = None, sense: Optional[numpy.ndarray] = None, eps: Optional[numpy.ndarray] = None, cv: Optional[numpy.ndarray] = None) -> Fronts:
     """
-    In-place non-dominated sorting using the naive algorithm, variant 2.
+    In-place non-dominated sorting using the naive algorithm, variant 1.
 
-    Computational complexity: O(MN^3 + MN^2 + MNlogN)
-        O(MN^3) for naively traversing dominance relationship matrix.
-        O(MN^2) for calculating dominance relationship matrix
+    Computational complexity: O(MN^3 + MNlogN)
+        O(MN^3) for naively traversing dominance relationships.
         O(MNlogN) for final quicksorting based on dominance and objectives
 
-    Space complexity: O(N^2 + 2N)
-        O(N^2) for storing dominance relationship matrix
+    Space complexity: O(2N)
         O(N) for storing remaining indices left to sort
         O(N) for storing mask of values which were nondominated
 
@@ -187,25 +309,128 @@ def ndsort_naive2(x: numpy.ndarray, front: numpy.ndarray, dom: numpy.ndarray, re
     mask : numpy.ndarray
         A vector of shape ``(N,)``
         Workspace holding indices marked as nondominated
+    kfront : int, None
+        Stop once ``kfront`` fronts have been assigned.
+    nfill : int, None
+        Stop once at least ``nfill`` individuals have been assigned.
+        Individuals left unassigned have front ``UNASSIGNED``; only assigned
+        individuals are sorted, and unassigned individuals are placed last.
+    crowding : numpy.ndarray, None
+        A vector of shape ``(N,)`` to store NSGA-II crowding distances of the
+        sorted individuals, calculated from the sorted order and front
+        boundaries. If ``None``, crowding distances are not calculated.
+    refs : numpy.ndarray, None
+        A matrix of shape ``(R,M)`` containing NSGA-III reference points.
+        If given, ``niche`` must also be given.
+    niche : numpy.ndarray, None
+        A vector of shape ``(R,)`` to store NSGA-III niche counts of the
+        fronts preceding the last assigned front, calculated from the sorted
+        front boundaries. If ``None``, niche counts are not calculated.
+    sense : numpy.ndarray, None
+        A vector of shape ``(M,)`` containing ``1`` for minimized and ``-1``
+        for maximized objectives. If ``None``, minimize all objectives.
+    eps : float, numpy.ndarray, None
+        Additive epsilon for each objective; use epsilon-dominance instead of
+        Pareto dominance. Epsilon-dominance is not transitive: individuals
+        caught in dominance cycles are left ``UNASSIGNED``.
+        If ``None``, use Pareto dominance.
+    cv : numpy.ndarray, None
+        A vector of shape ``(N,)`` containing constraint violations; an
+        individual is feasible if its violation is ``<= 0``. If given, use
+        Deb's constraint-domination.
+        This vector is reordered in-place along with ``x``.
+
+    Returns
+    -------
+    out : Fronts
+        Fronts holding the input row indices of each front. Front ``k``
+        occupies rows ``out.span(k)`` of the sorted matrix.
+    """
+    # test reference point options
+    if (refs is None) != (niche is None):
+        raise ValueError("Reference points ``refs`` and niche counts ``niche`` must be given together")
+
+    # assign fronts
+    assign_naive1(x, front, rem, mask, kfront = kfront, nfill = nfill, sense = sense, eps = eps, cv = cv)
+
+    # quicksort first by front, then by column 0, then by column 1, ...
+    # use numpy because I'm lazy; would need to implement this in C.
+    perm = frontsort_matrix(x, front)
+
+    # reorder constraint violations along with rows
+    if cv is not None:
+        cv[:] = cv[perm]
+
+    # crowding distances, reusing the ordering of each front by column 0
+    if crowding is not None:
+        crowding_distance(x, front, out = crowding)
+
+    # niche counts of reference directions, reusing the front boundaries
+    if refs is not None:
+        niche_count_sorted(x, front, refs, out = niche, sense = sense)
+
+    return Fronts.from_sorted(perm, front)
+
+def argndsort_naive1(x: numpy.ndarray, front: numpy.ndarray, perm: numpy.ndarray, rem: numpy.ndarray, mask: numpy.ndarray, kfront: Optional[int] = None, nfill: Optional[int] = None, sense: Optional[numpy.ndarray] = None, eps: Optional[numpy.ndarray] = None, cv: Optional[numpy.ndarray] = None) -> Fronts:
+    """
+    Non-dominated sorting using the naive algorithm, variant 1, returning
+    the sorting permutation instead of reordering ``x``.
+
+    Parameters are as for ``ndsort_naive1``, with the addition of:
+
+    Parameters
+    ----------
+    perm : numpy.ndarray
+        A vector of shape ``(N,)`` containing the sorting permutation.
+        Output vector. ``x[perm]`` is the sorted matrix and ``front[perm]``
+        its front assignments; ``front`` is in the order of the rows of ``x``.
+
+    Returns
+    -------
+    out : Fronts
+        Fronts holding the row indices of each front.
+    """
+    # assign fronts
+    assign_naive1(x, front, rem, mask, kfront = kfront, nfill = nfill, sense = sense, eps = eps, cv = cv)
+
+    # sorting indices: first by front, then by column 0, then by column 1, ...
+    perm[:] = argfrontsort(x, front)
+
+    return Fronts.from_sorted(perm, front[perm])
+
+def assign_naive2(x: numpy.ndarray, front: numpy.ndarray, dom: numpy.ndarray, rem: numpy.ndarray, mask: numpy.ndarray, n_jobs: int = 1, kfront: Optional[int] = None, nfill: Optional[int] = None, sense: Optional[numpy.ndarray] = None, eps: Optional[numpy.ndarray] = None, cv: Optional[numpy.ndarray] = None) -> None:
+    """
+    Assign fronts using the naive algorithm, variant 2, without reordering
+    ``x``.
+
+    Parameters are as for ``ndsort_naive2``. On output, ``front`` contains front
+    assignments in the order of the rows of ``x``.
     """
     # get the number of individuals
     nindiv = x.shape[0]
-    nobj = x.shape[1]
 
     # calculate pairwise dominance relationships
-    dominance_relationship_matrix(x, dom)
+    dominance_relationship_matrix(x, dom, n_jobs = n_jobs, sense = sense, eps = eps, cv = cv)
+
+    # use the compiled loops if numba is installed and the options allow it
+    tstart = phase_start()
+    if jit_supported(x, sense, eps, cv):
+        assign_naive2_kernel(dom, front, rem, mask, jit_limit(kfront), jit_limit(nfill))
+        phase_stop("peel", tstart)
+        return
 
     # initialize number of remaining individuals, indices for remaining individuals, nondominated mask
     nrem = nindiv
     for i in range(nrem):
         rem[i] = i
         mask[i] = False
+        front[i] = UNASSIGNED
 
     # current front counter
     nfront = 0
 
-    # while not all individuals have been assigned front labels
-    while nrem > 0:
+    # while not all individuals have been assigned front labels and no early exit
+    while nrem > 0 and not front_limit_reached(nfront, nindiv - nrem, kfront, nfill):
         # make current front assignments
         for i in range(nrem):               # for each remaining index in remaining index array
             ix = rem[i]                     # get index for current individual
@@ -218,6 +443,10 @@ def ndsort_naive2(x: numpy.ndarray, front: numpy.ndarray, dom: numpy.ndarray, re
             mask[i] = nondominated          # assign nondomination status to mask array
             if nondominated:                # make front assignment for current individual
                 front[ix] = nfront
+
+        # remaining individuals form dominance cycles (epsilon-dominance): leave unassigned
+        if not numpy.any(mask[:nrem]):
+            break
         
         # shrink remaining individuals
         offset = 0                          # initialize offset to 0
@@ -231,15 +460,131 @@ def ndsort_naive2(x: numpy.ndarray, front: numpy.ndarray, dom: numpy.ndarray, re
         # increment front count
         nfront += 1
 
+    phase_stop("peel", tstart)
+
+def ndsort_naive2(x: numpy.ndarray, front: numpy.ndarray, dom: numpy.ndarray, rem: numpy.ndarray, mask: numpy.ndarray, n_jobs: int = 1, kfront: Optional[int] = None, nfill: Optional[int] = None, crowding: Optional[numpy.ndarray] = None, refs: Optional[numpy.ndarray] = None, niche: Optional[numpy.ndarray] = None, sense: Optional[numpy.ndarray] = None, eps: Optional[numpy.ndarray] = None, cv: Optional[numpy.ndarray] = None) -> Fronts:
+    """
+    In-place non-dominated sorting using the naive algorithm, variant 2.
+
+    Computational complexity: O(MN^3 + MN^2 + MNlogN)
+        O(MN^3) for naively traversing dominance relationship matrix.
+        O(MN^2) for calculating dominance relationship matrix
+        O(MNlogN) for final quicksorting based on dominance and objectives
+
+    Space complexity: O(N^2 + 2N)
+        O(N^2) for storing dominance relationship matrix
+        O(N) for storing remaining indices left to sort
+        O(N) for storing mask of values which were nondominated
+
+    Size definitions:
+        M = number of objectives.
+        N = number of individuals.
+
+    This Python code is meant to be close to what would be found in C, so that it can be easily translated.
+
+    Parameters
+    ----------
+    x : numpy.ndarray
+        A matrix of shape ``(M,N)`` containing objective values for individuals.
+    front : numpy.ndarray
+        A vector of shape ``(N,)`` containing front assignments.
+    dom : numpy.ndarray
+        A matrix of shape ``(N,N)``.
+        Workspace holding pairwise dominance relationships.
+    rem : numpy.ndarray
+        A vector of shape ``(N,)``
+        Workspace holding remaining indices to visit
+    mask : numpy.ndarray
+        A vector of shape ``(N,)``
+        Workspace holding indices marked as nondominated
+    n_jobs : int
+        Number of threads over which to spread the calculation of dominance
+        relationships. If ``-1``, use all available processors.
+    kfront : int, None
+        Stop once ``kfront`` fronts have been assigned.
+    nfill : int, None
+        Stop once at least ``nfill`` individuals have been assigned.
+        Individuals left unassigned have front ``UNASSIGNED``; only assigned
+        individuals are sorted, and unassigned individuals are placed last.
+    crowding : numpy.ndarray, None
+        A vector of shape ``(N,)`` to store NSGA-II crowding distances of the
+        sorted individuals, calculated from the sorted order and front
+        boundaries. If ``None``, crowding distances are not calculated.
+    refs : numpy.ndarray, None
+        A matrix of shape ``(R,M)`` containing NSGA-III reference points.
+        If given, ``niche`` must also be given.
+    niche : numpy.ndarray, None
+        A vector of shape ``(R,)`` to store NSGA-III niche counts of the
+        fronts preceding the last assigned front, calculated from the sorted
+        front boundaries. If ``None``, niche counts are not calculated.
+    sense : numpy.ndarray, None
+        A vector of shape ``(M,)`` containing ``1`` for minimized and ``-1``
+        for maximized objectives. If ``None``, minimize all objectives.
+    eps : float, numpy.ndarray, None
+        Additive epsilon for each objective; use epsilon-dominance instead of
+        Pareto dominance. Epsilon-dominance is not transitive: individuals
+        caught in dominance cycles are left ``UNASSIGNED``.
+        If ``None``, use Pareto dominance.
+    cv : numpy.ndarray, None
+        A vector of shape ``(N,)`` containing constraint violations; an
+        individual is feasible if its violation is ``<= 0``. If given, use
+        Deb's constraint-domination.
+        This vector is reordered in-place along with ``x``.
+
+    Returns
+    -------
+    out : Fronts
+        Fronts holding the input row indices of each front. Front ``k``
+        occupies rows ``out.span(k)`` of the sorted matrix.
+    """
+    # test reference point options
+    if (refs is None) != (niche is None):
+        raise ValueError("Reference points ``refs`` and niche counts ``niche`` must be given together")
+
+    # assign fronts
+    assign_naive2(x, front, dom, rem, mask, n_jobs = n_jobs, kfront = kfront, nfill = nfill, sense = sense, eps = eps, cv = cv)
+
     # quicksort first by front, then by column 0, then by column 1, ...
     # use numpy because I'm lazy; would need to implement this in C.
+    perm = frontsort_matrix(x, front)
 
-    # get keys (must be in reverse order)
-    keys = tuple(x[:,i] for i in range(nobj))[::-1] + (front,)
+    # reorder constraint violations along with rows
+    if cv is not None:
+        cv[:] = cv[perm]
 
-    # indirect sort indices for reordering
-    ix = numpy.lexsort(keys)
-    
-    # reorder objective matrix and front matrix
-    x[:,:] = x[ix,:]
-    front[:] = front[ix]
+    # crowding distances, reusing the ordering of each front by column 0
+    if crowding is not None:
+        crowding_distance(x, front, out = crowding)
+
+    # niche counts of reference directions, reusing the front boundaries
+    if refs is not None:
+        niche_count_sorted(x, front, refs, out = niche, sense = sense)
+
+    return Fronts.from_sorted(perm, front)
+
+def argndsort_naive2(x: numpy.ndarray, front: numpy.ndarray, perm: numpy.ndarray, dom: numpy.ndarray, rem: numpy.ndarray, mask: numpy.ndarray, n_jobs: int = 1, kfront: Optional[int] = None, nfill: Optional[int] = None, sense: Optional[numpy.ndarray] = None, eps: Optional[numpy.ndarray] = None, cv: Optional[numpy.ndarray] = None) -> Fronts:
+    """
+    Non-dominated sorting using the naive algorithm, variant 2, returning
+    the sorting permutation instead of reordering ``x``.
+
+    Parameters are as for ``ndsort_naive2``, with the addition of:
+
+    Parameters
+    ----------
+    perm : numpy.ndarray
+        A vector of shape ``(N,)`` containing the sorting permutation.
+        Output vector. ``x[perm]`` is the sorted matrix and ``front[perm]``
+        its front assignments; ``front`` is in the order of the rows of ``x``.
+
+    Returns
+    -------
+    out : Fronts
+        Fronts holding the row indices of each front.
+    """
+    # assign fronts
+    assign_naive2(x, front, dom, rem, mask, n_jobs = n_jobs, kfront = kfront, nfill = nfill, sense = sense, eps = eps, cv = cv)
+
+    # sorting indices: first by front, then by column 0, then by column 1, ...
+    perm[:] = argfrontsort(x, front)
+
+    return Fronts.from_sorted(perm, front[perm])
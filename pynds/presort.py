@@ -1,4 +1,179 @@
 import numpy
+from typing import Optional
+from typing import Tuple
+from pynds.relation import relation_options
+from pynds.stats import phase_start
+from pynds.stats import phase_stop
+
+# front assignment of individuals left unassigned by an early exit
+UNASSIGNED = -1
+
+def front_limit_reached(nfront: int, nassigned: int, kfront: Optional[int] = None, nfill: Optional[int] = None) -> bool:
+    """
+    Determine whether enough fronts have been assigned to stop sorting early.
+
+    Parameters
+    ----------
+    nfront : int
+        Number of fronts assigned so far.
+    nassigned : int
+        Number of individuals assigned to fronts so far.
+    kfront : int, None
+        Stop once ``kfront`` fronts have been assigned.
+        If ``None``, do not stop based on the number of fronts.
+    nfill : int, None
+        Stop once at least ``nfill`` individuals have been assigned.
+        If ``None``, do not stop based on the number of individuals.
+    
+    Returns
+    -------
+    out : bool
+        Whether sorting may stop.
+    """
+    if kfront is not None and nfront >= kfront:
+        return True
+    if nfill is not None and nassigned >= nfill:
+        return True
+    return False
+
+def dense_rank(v: numpy.ndarray, descending: bool = False) -> numpy.ndarray:
+    """
+    Calculate dense ranks of a vector: equal values share a rank, and ranks
+    of distinct values are consecutive integers starting from 0.
+
+    Parameters
+    ----------
+    v : numpy.ndarray
+        A vector of shape ``(n,)``.
+    descending : bool
+        Whether to rank the greatest value first, as for maximized objectives.
+
+    Returns
+    -------
+    out : numpy.ndarray
+        A vector of shape ``(n,)`` containing dense ranks.
+    """
+    ix = numpy.argsort(v)
+    vs = v[ix]
+    new = numpy.empty(len(v), dtype = bool)
+    new[:1] = False
+    new[1:] = vs[1:] != vs[:-1]
+    out = numpy.empty(len(v), dtype = numpy.int64)
+    out[ix] = numpy.cumsum(new)
+    if descending:
+        numpy.subtract(numpy.count_nonzero(new), out, out = out)
+    return out
+
+def descending_key(v: numpy.ndarray) -> numpy.ndarray:
+    """
+    Calculate a sorting key which orders a vector from its greatest to its
+    least value, as for maximized objectives: integers and booleans are
+    bitwise inverted, which cannot overflow, and other values are negated.
+
+    Parameters
+    ----------
+    v : numpy.ndarray
+        A vector of shape ``(n,)``.
+
+    Returns
+    -------
+    out : numpy.ndarray
+        A vector of shape ``(n,)`` containing sorting keys.
+    """
+    if v.dtype.kind in "biu":
+        return numpy.invert(v)
+    return numpy.negative(v)
+
+def presort_keys(x: numpy.ndarray, sense: Optional[numpy.ndarray] = None, cv: Optional[numpy.ndarray] = None) -> Tuple[numpy.ndarray,...]:
+    """
+    Get the sorting keys which presort a matrix, for ``numpy.lexsort``.
+
+    Parameters
+    ----------
+    x : numpy.ndarray
+        A matrix of shape ``(n,m)`` containing objective values.
+    sense : numpy.ndarray, None
+        A vector of shape ``(m,)`` containing ``1`` for minimized and ``-1``
+        for maximized objectives. If ``None``, minimize all objectives.
+    cv : numpy.ndarray, None
+        A vector of shape ``(n,)`` containing constraint violations.
+        If given, rows are presorted by violation first, all feasible
+        violations (``<= 0``) being equal.
+
+    Returns
+    -------
+    out : tuple
+        Sorting keys, least significant first: columns in reverse order, with
+        maximized columns replaced by ``descending_key``, then violations.
+    """
+    # get each column and use as a key, reversing the order of maximized columns only
+    maximize, _ = relation_options(x.shape[1], sense)
+    keys = tuple(x[:,i] if maximize is None or not maximize[i] else descending_key(x[:,i]) for i in range(x.shape[1]))
+
+    # constraint violation is the most significant key
+    if cv is not None:
+        keys = (numpy.maximum(cv, 0),) + keys
+
+    # reverse keys because lexsort uses last key first
+    return keys[::-1]
+
+def assign_infeasible(front: numpy.ndarray, cv: numpy.ndarray, nfront: int) -> None:
+    """
+    Assign fronts to infeasible individuals under Deb's constraint-domination,
+    after the fronts of the feasible individuals.
+
+    Infeasible individuals are dominated by every feasible individual and by
+    every less violating individual, so they follow the last feasible front
+    in order of increasing violation; equal violations share a front.
+
+    Parameters
+    ----------
+    front : numpy.ndarray
+        A vector of shape ``(n,)`` containing front assignments of feasible
+        individuals. Modified in-place.
+    cv : numpy.ndarray
+        A vector of shape ``(n,)`` containing constraint violations; an
+        individual is feasible if its violation is ``<= 0``.
+    nfront : int
+        Number of fronts of feasible individuals.
+    """
+    infeasible = numpy.flatnonzero(cv > 0)
+    front[infeasible] = nfront + dense_rank(cv[infeasible])
+
+def argpresort(x: numpy.ndarray, sense: Optional[numpy.ndarray] = None, cv: Optional[numpy.ndarray] = None) -> numpy.ndarray:
+    """
+    Calculate indices which presort a matrix in ascending order, starting with
+    the first column, then considering subsequent columns if identical values
+    exist. Assumes objectives are minimizing, unless ``sense`` is given.
+
+    Parameters
+    ----------
+    x : numpy.ndarray
+        A matrix to sort of shape ``(n,m)``.
+    sense : numpy.ndarray, None
+        A vector of shape ``(m,)`` containing ``1`` for minimized and ``-1``
+        for maximized objectives. Maximized columns are presorted in
+        descending order. If ``None``, minimize all objectives.
+    cv : numpy.ndarray, None
+        A vector of shape ``(n,)`` containing constraint violations. If given,
+        presort by violation first, so that individuals which
+        constraint-dominate another always precede it.
+    
+    Returns
+    -------
+    out : numpy.ndarray
+        A vector of shape ``(n,)`` containing sorting indices such that
+        ``x[out]`` is the presorted matrix.
+    """
+    # get sorting keys
+    keys = presort_keys(x, sense, cv)
+
+    # calculate indices
+    tstart = phase_start()
+    out = numpy.lexsort(keys)
+    phase_stop("presort", tstart)
+
+    return out
 
 def presort_matrix(x: numpy.ndarray, inplace: bool = True) -> numpy.ndarray:
     """
@@ -24,11 +199,8 @@ def presort_matrix(x: numpy.ndarray, inplace: bool = True) -> numpy.ndarray:
     out : numpy.ndarray
         A pointer to the sorted matrix.
     """
-    # get each column and use as a key
-    keys = tuple(x[:,i] for i in range(x.shape[1]))
-
-    # calculate indices, but reverse keys because lexsort uses last key first
-    ix = numpy.lexsort(keys[::-1])
+    # calculate sorting indices
+    ix = argpresort(x)
 
     # copy pointer to x
     out = x
@@ -39,4 +211,199 @@ def presort_matrix(x: numpy.ndarray, inplace: bool = True) -> numpy.ndarray:
     else:
         out = x[ix,:]
     
-    return out
\ No newline at end of file
+    return out
+
+def presort_runs(x: numpy.ndarray, cv: Optional[numpy.ndarray] = None) -> Tuple[numpy.ndarray,numpy.ndarray]:
+    """
+    Find runs of identical rows in a matrix, which are contiguous after
+    presorting.
+
+    Parameters
+    ----------
+    x : numpy.ndarray
+        A matrix of shape ``(n,m)`` containing objective values.
+    cv : numpy.ndarray, None
+        A vector of shape ``(n,)`` containing constraint violations. If given,
+        rows are only identical if their violations are also identical; all
+        feasible violations (``<= 0``) are identical.
+
+    Returns
+    -------
+    out : tuple
+        A tuple ``(ix, new)`` containing presorting indices such that
+        ``x[ix]`` is the presorted matrix, and a boolean vector of shape
+        ``(n,)`` which marks the first row of each run in presorted order.
+    """
+    # get number of rows
+    n = x.shape[0]
+
+    # presort, breaking ties between identical rows by violation
+    if cv is None:
+        ix = argpresort(x)
+    else:
+        cv = numpy.maximum(cv, 0)
+        keys = tuple(x[:,i] for i in range(x.shape[1]))[::-1]
+        tstart = phase_start()
+        ix = numpy.lexsort((cv,) + keys)
+        phase_stop("presort", tstart)
+
+    # a run starts wherever a presorted row differs from the previous row
+    xs = x[ix]
+    new = numpy.empty(n, dtype = bool)
+    new[:1] = True
+    new[1:] = numpy.any(xs[1:] != xs[:-1], axis = 1)
+    if cv is not None:
+        cvs = cv[ix]
+        new[1:] |= cvs[1:] != cvs[:-1]
+
+    return ix, new
+
+def unique_rows(x: numpy.ndarray, cv: Optional[numpy.ndarray] = None) -> Tuple[numpy.ndarray,numpy.ndarray]:
+    """
+    Collapse identical rows of a matrix.
+
+    Identical individuals never dominate one another and so always share a
+    front: sorting one representative of each run of identical rows, then
+    expanding front assignments, gives the same fronts as sorting every row.
+
+    Parameters
+    ----------
+    x : numpy.ndarray
+        A matrix of shape ``(n,m)`` containing objective values.
+    cv : numpy.ndarray, None
+        A vector of shape ``(n,)`` containing constraint violations, as for
+        ``presort_runs``.
+
+    Returns
+    -------
+    out : tuple
+        A tuple ``(first, inverse)`` containing a vector of shape ``(u,)``
+        holding the row index of one representative of each unique row, in
+        presorted order, and a vector of shape ``(n,)`` such that row ``i``
+        is identical to row ``first[inverse[i]]``.
+    """
+    # find runs of identical rows
+    ix, new = presort_runs(x, cv)
+
+    # first row of each run, and the run of each row
+    first = ix[new]
+    inverse = numpy.empty(len(ix), dtype = numpy.int64)
+    inverse[ix] = numpy.cumsum(new) - 1
+
+    return first, inverse
+
+def argfrontsort(x: numpy.ndarray, front: numpy.ndarray) -> numpy.ndarray:
+    """
+    Calculate indices which sort a matrix first by front, then by the first
+    column, then by subsequent columns if identical values exist.
+
+    Parameters
+    ----------
+    x : numpy.ndarray
+        A matrix of shape ``(n,m)`` containing objective values.
+    front : numpy.ndarray
+        A vector of shape ``(n,)`` containing front assignments.
+    
+    Returns
+    -------
+    out : numpy.ndarray
+        A vector of shape ``(n,)`` containing sorting indices.
+        Individuals with front ``UNASSIGNED`` are not sorted; they are
+        placed last, in their original order.
+    """
+    # get assigned individuals
+    sel = numpy.flatnonzero(front != UNASSIGNED)
+
+    # if all individuals are assigned, sort everything
+    if len(sel) == len(front):
+        # get keys (must be in reverse order)
+        keys = tuple(x[:,i] for i in range(x.shape[1]))[::-1] + (front,)
+
+        # indirect sort indices for reordering
+        tstart = phase_start()
+        out = numpy.lexsort(keys)
+        phase_stop("lexsort", tstart)
+
+        return out
+
+    # otherwise, only sort assigned individuals
+    keys = tuple(x[sel,i] for i in range(x.shape[1]))[::-1] + (front[sel],)
+    tstart = phase_start()
+    out = numpy.concatenate((sel[numpy.lexsort(keys)], numpy.flatnonzero(front == UNASSIGNED)))
+    phase_stop("lexsort", tstart)
+
+    return out
+
+def frontsort_matrix(x: numpy.ndarray, front: numpy.ndarray) -> numpy.ndarray:
+    """
+    In-place sort of a matrix and its front assignments, first by front, then
+    by the first column, then by subsequent columns if identical values exist.
+
+    Parameters
+    ----------
+    x : numpy.ndarray
+        A matrix of shape ``(n,m)`` containing objective values.
+        This matrix is modified in-place.
+    front : numpy.ndarray
+        A vector of shape ``(n,)`` containing front assignments.
+        This vector is modified in-place.
+    
+    Returns
+    -------
+    out : numpy.ndarray
+        A vector of shape ``(n,)`` containing the sorting indices which were applied.
+    """
+    # indirect sort indices for reordering
+    out = argfrontsort(x, front)
+
+    # reorder objective matrix and front matrix
+    permute_matrix(x, front, out)
+
+    return out
+
+def permute_matrix(x: numpy.ndarray, front: numpy.ndarray, perm: numpy.ndarray) -> None:
+    """
+    In-place reordering of a matrix and its front assignments by sorting
+    indices, as calculated by ``argfrontsort``.
+
+    Parameters
+    ----------
+    x : numpy.ndarray
+        A matrix of shape ``(n,m)`` containing objective values.
+        This matrix is modified in-place.
+    front : numpy.ndarray
+        A vector of shape ``(n,)`` containing front assignments.
+        This vector is modified in-place.
+    perm : numpy.ndarray
+        A vector of shape ``(n,)`` containing sorting indices.
+    """
+    tstart = phase_start()
+    x[:,:] = x[perm,:]
+    front[:] = front[perm]
+    phase_stop("lexsort", tstart)
+
+def argfrontsort_presorted(ix: numpy.ndarray, sfront: numpy.ndarray) -> numpy.ndarray:
+    """
+    Calculate indices which sort a matrix first by front, then by the first
+    column, then by subsequent columns, from its presorting indices.
+
+    Presorted order is kept within fronts by a stable sort on fronts, which
+    is identical to sorting by front, then column 0, then column 1, ...
+
+    Parameters
+    ----------
+    ix : numpy.ndarray
+        A vector of shape ``(n,)`` containing presorting indices.
+    sfront : numpy.ndarray
+        A vector of shape ``(n,)`` containing front assignments in presorted
+        order: ``sfront[i]`` is the front of row ``ix[i]``.
+
+    Returns
+    -------
+    out : numpy.ndarray
+        A vector of shape ``(n,)`` containing sorting indices.
+    """
+    tstart = phase_start()
+    out = ix[numpy.argsort(sfront, kind = "stable")]
+    phase_stop("lexsort", tstart)
+    return out
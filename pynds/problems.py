@@ -0,0 +1,184 @@
+import numpy
+from typing import Optional
+from typing import Union
+
+# number of distance variables used by DTLZ and WFG-like problems
+PROBLEM_NDIST = 5
+
+def distance(nindiv: int, rng: numpy.random.Generator) -> numpy.ndarray:
+    """
+    Generate distance function values for DTLZ and WFG-like problems, as the
+    sum of squared deviations of ``PROBLEM_NDIST`` uniform variables from
+    ``0.5``. Individuals with a distance of ``0`` lie on the Pareto front.
+
+    Parameters
+    ----------
+    nindiv : int
+        Number of individuals.
+    rng : numpy.random.Generator
+        Random number generator.
+
+    Returns
+    -------
+    out : numpy.ndarray
+        A vector of shape ``(nindiv,)`` containing distances in ``[0,1.25]``.
+    """
+    return numpy.sum((rng.random((nindiv,PROBLEM_NDIST)) - 0.5)**2, axis = 1)
+
+def problem_uniform(nindiv: int, nobj: int, rng: Optional[Union[numpy.random.Generator,int]] = None) -> numpy.ndarray:
+    """
+    Generate objective values uniformly at random in ``[0,1)``.
+
+    Fronts are many and small for few objectives, and few and large for many
+    objectives.
+
+    Parameters
+    ----------
+    nindiv : int
+        Number of individuals.
+    nobj : int
+        Number of objectives.
+    rng : numpy.random.Generator, int, None
+        Random number generator, or seed for a new generator. If ``None``,
+        use a new unseeded generator.
+
+    Returns
+    -------
+    out : numpy.ndarray
+        A matrix of shape ``(nindiv,nobj)`` containing objective values.
+    """
+    rng = numpy.random.default_rng(rng)
+    return rng.random((nindiv,nobj))
+
+def problem_dtlz1(nindiv: int, nobj: int, rng: Optional[Union[numpy.random.Generator,int]] = None) -> numpy.ndarray:
+    """
+    Generate objective values for a DTLZ1-like problem: individuals with
+    uniform position variables scaled away from a linear Pareto front
+    ``sum(f) == 0.5`` by a random distance.
+
+    Parameters are as for ``problem_uniform``.
+    """
+    rng = numpy.random.default_rng(rng)
+    theta = rng.random((nindiv,nobj-1))
+    out = numpy.empty((nindiv,nobj), dtype = float)
+    for i in range(nobj):
+        out[:,i] = numpy.prod(theta[:,:nobj-1-i], axis = 1)
+        if i > 0:
+            out[:,i] *= 1.0 - theta[:,nobj-1-i]
+    out *= 0.5 * (1.0 + distance(nindiv, rng))[:,None]
+    return out
+
+def problem_dtlz2(nindiv: int, nobj: int, rng: Optional[Union[numpy.random.Generator,int]] = None) -> numpy.ndarray:
+    """
+    Generate objective values for a DTLZ2-like problem: individuals with
+    uniform position variables scaled away from a spherical Pareto front
+    ``sum(f**2) == 1`` by a random distance.
+
+    Parameters are as for ``problem_uniform``.
+    """
+    rng = numpy.random.default_rng(rng)
+    theta = 0.5 * numpy.pi * rng.random((nindiv,nobj-1))
+    out = numpy.empty((nindiv,nobj), dtype = float)
+    for i in range(nobj):
+        out[:,i] = numpy.prod(numpy.cos(theta[:,:nobj-1-i]), axis = 1)
+        if i > 0:
+            out[:,i] *= numpy.sin(theta[:,nobj-1-i])
+    out *= (1.0 + distance(nindiv, rng))[:,None]
+    return out
+
+def problem_wfg(nindiv: int, nobj: int, rng: Optional[Union[numpy.random.Generator,int]] = None) -> numpy.ndarray:
+    """
+    Generate objective values for a WFG2-like problem: a convex Pareto front
+    with a disconnected last objective, shifted by a random distance, with
+    objective ``i`` scaled by ``2*(i+1)``.
+
+    Parameters are as for ``problem_uniform``.
+    """
+    rng = numpy.random.default_rng(rng)
+    theta = rng.random((nindiv,max(nobj-1,1)))
+    out = numpy.empty((nindiv,nobj), dtype = float)
+    # convex shape functions
+    for i in range(nobj-1):
+        out[:,i] = numpy.prod(1.0 - numpy.cos(0.5 * numpy.pi * theta[:,:nobj-1-i]), axis = 1)
+        if i > 0:
+            out[:,i] *= 1.0 - numpy.sin(0.5 * numpy.pi * theta[:,nobj-1-i])
+    # disconnected shape function
+    out[:,nobj-1] = 1.0 - theta[:,0] * numpy.cos(5.0 * numpy.pi * theta[:,0])**2
+    out *= 2.0 * numpy.arange(1, nobj+1)
+    out += distance(nindiv, rng)[:,None]
+    return out
+
+def problem_single_front(nindiv: int, nobj: int, rng: Optional[Union[numpy.random.Generator,int]] = None) -> numpy.ndarray:
+    """
+    Generate objective values which all lie on the hyperplane ``sum(f) == 1``,
+    so that every individual is in the first front.
+
+    Parameters are as for ``problem_uniform``.
+    """
+    rng = numpy.random.default_rng(rng)
+    out = rng.random((nindiv,nobj))
+    out /= out.sum(axis = 1)[:,None]
+    return out
+
+def problem_many_fronts(nindiv: int, nobj: int, rng: Optional[Union[numpy.random.Generator,int]] = None, size: int = 4) -> numpy.ndarray:
+    """
+    Generate objective values in many small fronts: front ``k`` lies on the
+    hyperplane ``sum(f - k) == 1`` with ``k <= f <= k + 1``, so that every
+    individual of front ``k`` dominates every individual of front ``k+1``.
+
+    Parameters are as for ``problem_uniform``, with the addition of:
+
+    Parameters
+    ----------
+    size : int
+        Number of individuals per front; the last front may be smaller.
+    """
+    rng = numpy.random.default_rng(rng)
+    out = problem_single_front(nindiv, nobj, rng)
+    out += rng.permutation(numpy.arange(nindiv) // size)[:,None]
+    return out
+
+def problem_duplicates(nindiv: int, nobj: int, rng: Optional[Union[numpy.random.Generator,int]] = None, nunique: Optional[int] = None) -> numpy.ndarray:
+    """
+    Generate objective values with heavy duplication: rows are drawn with
+    replacement from a small set of unique uniform random rows.
+
+    Parameters are as for ``problem_uniform``, with the addition of:
+
+    Parameters
+    ----------
+    nunique : int, None
+        Number of unique rows. If ``None``, use ``ceil(sqrt(nindiv))``.
+    """
+    rng = numpy.random.default_rng(rng)
+    if nunique is None:
+        nunique = int(numpy.ceil(numpy.sqrt(nindiv)))
+    unique = rng.random((max(nunique,1),nobj))
+    return unique[rng.integers(0, len(unique), nindiv)]
+
+def problem_integer(nindiv: int, nobj: int, rng: Optional[Union[numpy.random.Generator,int]] = None, nlevel: int = 10) -> numpy.ndarray:
+    """
+    Generate integer objective values uniformly at random in ``[0,nlevel)``,
+    with many ties in each objective.
+
+    Parameters are as for ``problem_uniform``, with the addition of:
+
+    Parameters
+    ----------
+    nlevel : int
+        Number of distinct values per objective.
+    """
+    rng = numpy.random.default_rng(rng)
+    return rng.integers(0, nlevel, (nindiv,nobj))
+
+# problem names and generators
+PROBLEMS = {
+    "uniform":      problem_uniform,
+    "dtlz1":        problem_dtlz1,
+    "dtlz2":        problem_dtlz2,
+    "wfg":          problem_wfg,
+    "single_front": problem_single_front,
+    "many_fronts":  problem_many_fronts,
+    "duplicates":   problem_duplicates,
+    "integer":      problem_integer,
+}
@@ -1,9 +1,133 @@
+import os
 import numpy
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable
+from typing import Optional
+from typing import Tuple
+from pynds import stats
 
-def dominance_relationship(x: numpy.ndarray, y: numpy.ndarray) -> int:
+# target number of elements in each temporary created for one block of rows
+BLOCK_NELEM = 2**22
+
+def block_size(nindiv: int) -> int:
+    """
+    Determine the number of rows to process per block when comparing a block
+    of rows against ``nindiv`` rows.
+
+    Objectives are compared one at a time, so temporaries have shape
+    ``(blksize,nindiv)`` whatever the number of objectives.
+
+    Parameters
+    ----------
+    nindiv : int
+        Number of rows each row in a block is compared against.
+    
+    Returns
+    -------
+    out : int
+        Number of rows per block. Always at least 1.
+    """
+    return max(1, BLOCK_NELEM // max(1, nindiv))
+
+def resolve_n_jobs(n_jobs: int) -> int:
+    """
+    Resolve the number of threads to use.
+
+    Parameters
+    ----------
+    n_jobs : int
+        Requested number of threads. If ``-1``, use all available processors.
+    
+    Returns
+    -------
+    out : int
+        Number of threads. Always at least 1.
+    """
+    if n_jobs == -1:
+        return os.cpu_count() or 1
+    if n_jobs < 1:
+        raise ValueError("``n_jobs`` must be a positive integer or -1: received ``{0}``".format(n_jobs))
+    return n_jobs
+
+def map_blocks(func: Callable[[int,int],None], nindiv: int, blksize: int, n_jobs: int = 1) -> None:
+    """
+    Apply a function to consecutive blocks of rows, optionally across a
+    thread pool. NumPy releases the GIL inside its array kernels, so blocks
+    run concurrently.
+
+    Parameters
+    ----------
+    func : Callable
+        Function ``func(start, stop)`` processing rows ``start:stop``.
+        Calls must write to disjoint outputs.
+    nindiv : int
+        Number of rows.
+    blksize : int
+        Maximum number of rows per block.
+        If threads would be left idle, blocks are made smaller.
+    n_jobs : int
+        Number of threads. If ``-1``, use all available processors.
+    """
+    # get number of threads
+    n_jobs = resolve_n_jobs(n_jobs)
+
+    # serial processing
+    if n_jobs == 1:
+        for start in range(0, nindiv, blksize):
+            func(start, min(start + blksize, nindiv))
+        return
+
+    # give each thread at least one block
+    blksize = max(1, min(blksize, -(-nindiv // n_jobs)))
+
+    # parallel processing; raises any exception raised in a block
+    with ThreadPoolExecutor(max_workers = n_jobs) as executor:
+        futures = [executor.submit(func, start, min(start + blksize, nindiv)) for start in range(0, nindiv, blksize)]
+        for future in futures:
+            future.result()
+
+def relation_options(nobj: int, sense: Optional[numpy.ndarray] = None, eps: Optional[numpy.ndarray] = None) -> Tuple[Optional[numpy.ndarray],Optional[numpy.ndarray]]:
+    """
+    Test and broadcast objective sense and epsilon options.
+
+    Parameters
+    ----------
+    nobj : int
+        Number of objectives.
+    sense : numpy.ndarray, None
+        A vector of shape ``(nobj,)`` containing ``1`` for minimized and
+        ``-1`` for maximized objectives. If ``None``, minimize all objectives.
+    eps : float, numpy.ndarray, None
+        A scalar or vector of shape ``(nobj,)`` containing non-negative
+        additive epsilons. If ``None``, use Pareto dominance.
+
+    Returns
+    -------
+    out : tuple
+        A tuple ``(maximize, eps)`` containing a boolean vector of maximized
+        objectives, or ``None`` if all objectives are minimized, and a vector
+        of epsilons, or ``None`` if all epsilons are zero.
+    """
+    maximize = None
+    if sense is not None:
+        sense = numpy.asarray(sense)
+        if sense.shape != (nobj,) or not numpy.all(numpy.abs(sense) == 1):
+            raise ValueError("``sense`` must be a vector of ``1`` and ``-1`` of shape ``{0}``: received ``{1}``".format((nobj,),sense))
+        maximize = sense < 0
+        if not numpy.any(maximize):
+            maximize = None
+    if eps is not None:
+        eps = numpy.broadcast_to(numpy.asarray(eps, dtype = float), (nobj,))
+        if numpy.any(eps < 0):
+            raise ValueError("``eps`` must be non-negative: received ``{0}``".format(eps))
+        if not numpy.any(eps > 0):
+            eps = None
+    return maximize, eps
+
+def dominance_relationship(x: numpy.ndarray, y: numpy.ndarray, sense: Optional[numpy.ndarray] = None, eps: Optional[numpy.ndarray] = None, cvx: Optional[float] = None, cvy: Optional[float] = None) -> int:
     """
     Determine the dominance relationship between two vectors.
-    Assumes that objectives are to be minimized.
+    Assumes that objectives are to be minimized, unless ``sense`` is given.
     Assumes that all objective values are numbers or infinity.
     NaN values will not be handled correctly.
 
@@ -13,6 +137,20 @@ def dominance_relationship(x: numpy.ndarray, y: numpy.ndarray) -> int:
         First vector for which to determine the dominance relationship.
     y : numpy.ndarray
         Second vector for which to determine the dominance relationship.
+    sense : numpy.ndarray, None
+        A vector containing ``1`` for minimized and ``-1`` for maximized
+        objectives. If ``None``, minimize all objectives.
+    eps : float, numpy.ndarray, None
+        Additive epsilon for each objective: x epsilon-dominates y if
+        ``x - eps <= y`` in every objective and not vice versa. Requires
+        finite objective values. If ``None``, use Pareto dominance.
+    cvx : float, None
+        Constraint violation of x; ``cvx <= 0`` is feasible.
+    cvy : float, None
+        Constraint violation of y. If both ``cvx`` and ``cvy`` are given,
+        use Deb's constraint-domination: a feasible vector dominates an
+        infeasible one, and of two infeasible vectors the less violating
+        one dominates.
     
     Returns
     -------
@@ -24,25 +162,183 @@ def dominance_relationship(x: numpy.ndarray, y: numpy.ndarray) -> int:
         If x is dominated by y, then return 1.
             (x > y) == 1
     """
-    x_le_y = numpy.all(x <= y)
-    y_le_x = numpy.all(x >= y)
-    x_lt_y = numpy.any(x < y)
-    y_lt_x = numpy.any(x > y)
+    # count comparison if statistics are being collected
+    if stats.ACTIVE is not None:
+        stats.ACTIVE.count(1, 1)
+
+    # constraint-domination: infeasible pairs are decided by violation
+    if cvx is not None and cvy is not None:
+        cvx = max(cvx, 0)
+        cvy = max(cvy, 0)
+        if cvx > 0 or cvy > 0:
+            return -1 if cvx < cvy else (1 if cvx > cvy else 0)
 
-    x_dom_y = x_le_y and x_lt_y
-    y_dom_x = y_le_x and y_lt_x
+    # Pareto dominance for minimization
+    if sense is None and eps is None:
+        x_le_y = numpy.all(x <= y)
+        y_le_x = numpy.all(x >= y)
+        x_lt_y = numpy.any(x < y)
+        y_lt_x = numpy.any(x > y)
 
-    if x_dom_y:
+        x_dom_y = x_le_y and x_lt_y
+        y_dom_x = y_le_x and y_lt_x
+
+        if x_dom_y:
+            return -1
+        elif y_dom_x:
+            return 1
+        else:
+            return 0
+
+    # x weakly (epsilon-)dominates y in every objective, and vice versa
+    if eps is None:
+        le = x <= y
+        ge = x >= y
+    else:
+        eps = numpy.asarray(eps)
+        d = x - y
+        le = d <= eps
+        ge = d >= -eps
+    if sense is not None:
+        maximize = numpy.asarray(sense) < 0
+        le, ge = numpy.where(maximize, ge, le), numpy.where(maximize, le, ge)
+    x_le_y = numpy.all(le)
+    y_le_x = numpy.all(ge)
+
+    if x_le_y and not y_le_x:
         return -1
-    elif y_dom_x:
+    elif y_le_x and not x_le_y:
         return 1
     else:
         return 0
 
-def dominance_relationship_matrix(x: numpy.ndarray, dom: numpy.ndarray) -> None:
+def dominance_relationship_block(x: numpy.ndarray, y: numpy.ndarray, out: numpy.ndarray, sense: Optional[numpy.ndarray] = None, eps: Optional[numpy.ndarray] = None, cvx: Optional[numpy.ndarray] = None, cvy: Optional[numpy.ndarray] = None) -> None:
+    """
+    Calculate the dominance relationships between each row in ``x`` and each
+    row in ``y`` using broadcast array operations.
+
+    x dominates y if x is at least as good as y in every objective and y is
+    not at least as good as x in every objective, so only two comparisons
+    are needed per objective.
+
+    Parameters
+    ----------
+    x : numpy.ndarray
+        A matrix of shape ``(nrow,nobj)`` containing objective function values.
+        Input matrix.
+    y : numpy.ndarray
+        A matrix of shape ``(ncol,nobj)`` containing objective function values.
+        Input matrix.
+    out : numpy.ndarray
+        A matrix of shape ``(nrow,ncol)`` to store dominance relationships.
+        Output matrix.
+        If x[i] dominates y[j],           then out[i,j] == -1.
+        If x[i] is non-dominated by y[j], then out[i,j] == 0.
+        If x[i] is dominated by y[j],     then out[i,j] == 1.
+    sense : numpy.ndarray, None
+        A vector of shape ``(nobj,)`` containing ``1`` for minimized and
+        ``-1`` for maximized objectives. If ``None``, minimize all objectives.
+    eps : float, numpy.ndarray, None
+        Additive epsilon for each objective, as for ``dominance_relationship``.
+        If ``None``, use Pareto dominance.
+    cvx : numpy.ndarray, None
+        A vector of shape ``(nrow,)`` containing constraint violations of ``x``.
+    cvy : numpy.ndarray, None
+        A vector of shape ``(ncol,)`` containing constraint violations of ``y``.
+        If both are given, use Deb's constraint-domination.
+    """
+    # get shape of output
+    shape = (x.shape[0],y.shape[0])
+
+    # get options
+    maximize, eps = relation_options(x.shape[1], sense, eps)
+
+    # weak (epsilon-)dominance in either direction, accumulated one objective
+    # at a time on (nrow,ncol) matrices
+    x_le_y = numpy.ones(shape, dtype = bool)
+    y_le_x = numpy.ones(shape, dtype = bool)
+    tmp = numpy.empty(shape, dtype = bool)
+    for j in range(x.shape[1]):
+        xj = x[:,j,None]
+        yj = y[None,:,j]
+        le, ge = (x_le_y, y_le_x) if maximize is None or not maximize[j] else (y_le_x, x_le_y)
+        if eps is None or eps[j] == 0:
+            le &= numpy.less_equal(xj, yj, out = tmp)
+            ge &= numpy.greater_equal(xj, yj, out = tmp)
+        else:
+            d = numpy.subtract(xj, yj)
+            le &= numpy.less_equal(d, eps[j], out = tmp)
+            ge &= numpy.greater_equal(d, -eps[j], out = tmp)
+
+    # dominance in either direction; these are mutually exclusive
+    x_dom_y = x_le_y & ~y_le_x
+    y_dom_x = numpy.logical_and(y_le_x, ~x_le_y, out = y_le_x)
+
+    # store -1, 0, 1
+    out[:,:] = y_dom_x
+    out -= x_dom_y
+
+    # constraint-domination: infeasible pairs are decided by violation
+    if cvx is not None and cvy is not None:
+        cx = numpy.maximum(cvx, 0)[:,None]
+        cy = numpy.maximum(cvy, 0)[None,:]
+        infeasible = (cx > 0) | (cy > 0)
+        out[infeasible] = numpy.sign(cx - cy)[infeasible]
+
+def dominated_by_any(y: numpy.ndarray, x: numpy.ndarray, maximize: Optional[numpy.ndarray] = None, cvy: Optional[float] = None, cvx: Optional[numpy.ndarray] = None) -> bool:
+    """
+    Determine whether a vector is dominated by any row of a matrix, using
+    one broadcast comparison against all rows.
+
+    Parameters
+    ----------
+    y : numpy.ndarray
+        A vector of shape ``(nobj,)`` containing objective function values.
+    x : numpy.ndarray
+        A matrix of shape ``(nrow,nobj)`` containing objective function values.
+    maximize : numpy.ndarray, None
+        A boolean vector of shape ``(nobj,)`` of maximized objectives, as
+        returned by ``relation_options``. If ``None``, minimize all objectives.
+    cvy : float, None
+        Constraint violation of ``y``.
+    cvx : numpy.ndarray, None
+        A vector of shape ``(nrow,)`` containing constraint violations of ``x``.
+        If both are given, use Deb's constraint-domination.
+
+    Returns
+    -------
+    out : bool
+        Whether any row of ``x`` dominates ``y``.
+    """
+    # count comparisons if statistics are being collected
+    if stats.ACTIVE is not None:
+        stats.ACTIVE.count(x.shape[0])
+
+    # x[i] is at least as good as y in every objective, and better in one
+    if maximize is None:
+        dom = numpy.all(x <= y, axis = 1) & numpy.any(x < y, axis = 1)
+    else:
+        le = numpy.where(maximize, x >= y, x <= y)
+        lt = numpy.where(maximize, x > y, x < y)
+        dom = numpy.all(le, axis = 1) & numpy.any(lt, axis = 1)
+
+    # constraint-domination: infeasible pairs are decided by violation
+    if cvx is not None and cvy is not None:
+        cx = numpy.maximum(cvx, 0)
+        cy = max(cvy, 0)
+        dom = numpy.where((cx > 0) | (cy > 0), cx < cy, dom)
+
+    return bool(numpy.any(dom))
+
+def dominance_relationship_matrix(x: numpy.ndarray, dom: numpy.ndarray, blksize: Optional[int] = None, n_jobs: int = 1, sense: Optional[numpy.ndarray] = None, eps: Optional[numpy.ndarray] = None, cv: Optional[numpy.ndarray] = None) -> None:
     """
     Calculate the dominance relationships between all rows in a matrix.
 
+    Rows are processed in blocks of ``blksize`` rows against all other rows,
+    so that boolean temporaries never exceed ``5 * blksize * nindiv``
+    elements per block. Blocks write to disjoint rows of ``dom``, so the
+    output does not depend on the number of threads.
+
     Parameters
     ----------
     x : numpy.ndarray
@@ -54,10 +350,31 @@ def dominance_relationship_matrix(x: numpy.ndarray, dom: numpy.ndarray) -> None:
         If x[i] dominates x[j],           then dom[i,j] == -1.
         If x[i] is non-dominated by x[j], then dom[i,j] == 0.
         If x[i] is dominated by x[j],     then dom[i,j] == 1.
+    blksize : int, None
+        Number of rows to process per block.
+        If ``None``, choose a block size such that each ``(blksize,nindiv)``
+        temporary holds about ``BLOCK_NELEM`` elements.
+    n_jobs : int
+        Number of threads over which to spread blocks.
+        If ``-1``, use all available processors.
+    sense : numpy.ndarray, None
+        A vector of shape ``(nobj,)`` containing ``1`` for minimized and
+        ``-1`` for maximized objectives. If ``None``, minimize all objectives.
+    eps : float, numpy.ndarray, None
+        Additive epsilon for each objective, as for ``dominance_relationship``.
+        If ``None``, use Pareto dominance.
+    cv : numpy.ndarray, None
+        A vector of shape ``(nindiv,)`` containing constraint violations.
+        If given, use Deb's constraint-domination.
     """
     # get number of individuals
     nindiv = x.shape[0]
 
+    # test options once, rather than once per block
+    relation_options(x.shape[1], sense, eps)
+    if cv is not None and cv.shape != (nindiv,):
+        raise ValueError("Constraint violations ``cv`` are not the correct shape: expected ``{0}`` but received ``{1}``".format((nindiv,),cv.shape))
+
     # get expected and observed shapes
     eshape = (nindiv,nindiv)
     dshape = dom.shape
@@ -66,7 +383,19 @@ def dominance_relationship_matrix(x: numpy.ndarray, dom: numpy.ndarray) -> None:
     if eshape != dshape:
         raise ValueError("Output matrix ``dom`` is not the correct shape: expected ``{0}`` but received ``{1}``".format(eshape,dshape))
     
-    # calculate dominance relationships
-    for i in range(nindiv):
-        for j in range(nindiv):
-            dom[i,j] = dominance_relationship(x[i], x[j])
+    # get block size
+    if blksize is None:
+        blksize = block_size(x.shape[0])
+    elif blksize < 1:
+        raise ValueError("``blksize`` must be a positive integer: received ``{0}``".format(blksize))
+
+    # calculate dominance relationships for one block of rows
+    def block(start: int, stop: int) -> None:
+        cvx = None if cv is None else cv[start:stop]
+        dominance_relationship_block(x[start:stop], x, dom[start:stop], sense, eps, cvx, cv)
+
+    # calculate dominance relationships one block of rows at a time
+    tstart = stats.phase_start()
+    map_blocks(block, nindiv, blksize, n_jobs)
+    stats.count_relations(nindiv * nindiv)
+    stats.phase_stop("matrix", tstart)
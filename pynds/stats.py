@@ -0,0 +1,211 @@
+import time
+import numpy
+from typing import Dict
+from typing import Optional
+
+# phases timed by sorters:
+# presort: lexicographic presorting of individuals by objectives
+# matrix:  calculation of pairwise dominance relationship matrices
+# peel:    assignment of individuals to fronts
+# lexsort: final sorting by front, then by column 0, then by column 1, ...
+# total:   time spent inside the collecting ``with`` block
+STATS_PHASES = ("presort", "matrix", "peel", "lexsort", "total")
+
+# statistics collector which sorters report to, or ``None`` if disabled
+ACTIVE = None
+
+class SortStats:
+    """
+    Opt-in statistics collected while sorting: numbers of dominance
+    comparisons, time spent in each phase, and front sizes.
+
+    Statistics are collected while the object is active, either as a
+    ``with`` block or by passing it as ``stats`` to ``pynds.ndsort``,
+    ``pynds.argndsort`` or ``pynds.iter_fronts``. Sorters report to the
+    active collector through ``count_relations``, ``phase_start`` and
+    ``phase_stop``, which only test whether a collector is active while
+    collection is disabled.
+
+    Phase times are exclusive: time spent in a nested phase, such as the
+    presorting done by a front assignment, counts only towards the nested
+    phase. The ``total`` time includes all phases and any time outside them.
+    Statistics from successive sorts accumulate until ``reset``. Collection
+    is process-wide: collectors should not be active in several threads at
+    once.
+
+    Attributes
+    ----------
+    ncall : int
+        Number of calls to a scalar dominance relationship function, either
+        ``pynds.relation.dominance_relationship`` or its compiled kernel.
+    ncompare : int
+        Number of pairwise dominance relationships evaluated, either by
+        scalar calls or in dominance relationship matrices.
+    time : dict
+        Time in seconds spent in each phase of ``STATS_PHASES``.
+    front_sizes : list
+        Number of individuals in each front of the last sort, excluding
+        unassigned individuals. Only recorded by the top-level functions
+        or by ``record_fronts``.
+    """
+
+    def __init__(self) -> None:
+        """
+        Constructor for SortStats.
+        """
+        self.reset()
+        self._previous = []
+        self._entered = 0.0
+
+    def reset(self) -> None:
+        """
+        Reset all statistics to zero.
+        """
+        self.ncall = 0
+        self.ncompare = 0
+        self.time = {phase: 0.0 for phase in STATS_PHASES}
+        self.front_sizes = []
+        self._stack = []
+
+    @property
+    def nfront(self) -> int:
+        """
+        Number of fronts of the last sort.
+        """
+        return len(self.front_sizes)
+
+    def count(self, ncompare: int, ncall: int = 0) -> None:
+        """
+        Count dominance comparisons.
+
+        Parameters
+        ----------
+        ncompare : int
+            Number of pairwise dominance relationships evaluated.
+        ncall : int
+            Number of calls to a scalar dominance relationship function.
+        """
+        self.ncompare += ncompare
+        self.ncall += ncall
+
+    def start(self) -> float:
+        """
+        Start timing a phase.
+
+        Returns
+        -------
+        out : float
+            Start time, to pass to ``stop``.
+        """
+        out = time.perf_counter()
+        self._stack.append([out, 0.0])
+        return out
+
+    def stop(self, phase: str) -> None:
+        """
+        Stop timing the most recently started phase and add its exclusive
+        time to ``phase``.
+
+        Parameters
+        ----------
+        phase : str
+            Name of the phase: one of ``STATS_PHASES``.
+        """
+        start, nested = self._stack.pop()
+        elapsed = time.perf_counter() - start
+        self.time[phase] += elapsed - nested
+        # exclude this phase from the enclosing phase
+        if len(self._stack) > 0:
+            self._stack[-1][1] += elapsed
+
+    def record_fronts(self, front: numpy.ndarray) -> None:
+        """
+        Record front sizes from front assignments.
+
+        Parameters
+        ----------
+        front : numpy.ndarray
+            A vector of shape ``(nindiv,)`` containing front assignments;
+            negative assignments are unassigned.
+        """
+        self.front_sizes = numpy.bincount(front[front >= 0]).tolist()
+
+    def as_dict(self) -> Dict:
+        """
+        Get statistics as a dictionary.
+
+        Returns
+        -------
+        out : dict
+            Dictionary holding ``ncall``, ``ncompare``, ``nfront``,
+            ``front_sizes`` and the time of each phase as ``time_<phase>``.
+        """
+        out = {"ncall": self.ncall, "ncompare": self.ncompare, "nfront": self.nfront, "front_sizes": list(self.front_sizes)}
+        for phase in STATS_PHASES:
+            out["time_" + phase] = self.time[phase]
+        return out
+
+    def __enter__(self) -> "SortStats":
+        """
+        Activate collection, saving the previously active collector.
+        """
+        global ACTIVE
+        self._previous.append(ACTIVE)
+        ACTIVE = self
+        # only the outermost block is timed
+        if len(self._previous) == 1:
+            self._entered = time.perf_counter()
+        return self
+
+    def __exit__(self, *args) -> None:
+        """
+        Deactivate collection, restoring the previously active collector.
+        """
+        global ACTIVE
+        ACTIVE = self._previous.pop()
+        if len(self._previous) == 0:
+            self.time["total"] += time.perf_counter() - self._entered
+            # phases interrupted by exceptions are discarded
+            del self._stack[:]
+
+def count_relations(ncompare: int, ncall: int = 0) -> None:
+    """
+    Count dominance comparisons in the active collector, if any.
+
+    Parameters
+    ----------
+    ncompare : int
+        Number of pairwise dominance relationships evaluated.
+    ncall : int
+        Number of calls to a scalar dominance relationship function.
+    """
+    if ACTIVE is not None:
+        ACTIVE.count(ncompare, ncall)
+
+def phase_start() -> Optional[float]:
+    """
+    Start timing a phase in the active collector, if any.
+
+    Returns
+    -------
+    out : float, None
+        Start time, or ``None`` if no collector is active. Pass it to
+        ``phase_stop``.
+    """
+    if ACTIVE is None:
+        return None
+    return ACTIVE.start()
+
+def phase_stop(phase: str, start: Optional[float]) -> None:
+    """
+    Stop timing a phase started by ``phase_start``.
+
+    Parameters
+    ----------
+    phase : str
+        Name of the phase: one of ``STATS_PHASES``.
+    start : float, None
+        Value returned by ``phase_start``. If ``None``, do nothing.
+    """
+    if start is not None and ACTIVE is not None:
+        ACTIVE.stop(phase)
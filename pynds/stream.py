@@ -0,0 +1,208 @@
+import numpy
+from typing import Iterable
+from typing import Optional
+from pynds.archive import FILTER_BLKSIZE
+from pynds.archive import nondominated_mask
+from pynds.relation import block_size
+from pynds.relation import dominance_relationship_block
+from pynds.relation import relation_options
+
+class ParetoFilter:
+    """
+    Streaming filter which keeps the first front of a stream of individuals
+    arriving in chunks, without ranking later fronts.
+
+    Each chunk is compared against the running front with vectorized
+    dominance relationships: individuals dominated by the running front are
+    dropped, the rest are reduced to their own first front, and members of
+    the running front dominated by one of these candidates are evicted.
+    Dropping first is exact because dominance is transitive. Memory is
+    proportional to the size of the running front and of one chunk, not to
+    the length of the stream.
+
+    Ties follow ``pynds.relation.dominance_relationship``: identical
+    individuals do not dominate each other, so duplicates are kept.
+
+    Objective sense and constraint-domination are supported, as both keep
+    dominance transitive; epsilon-dominance is not.
+
+    Computational complexity: O(MKF + MKB + MKlogK) per chunk
+        O(MKF) for comparing the chunk against the running front
+        O(MKlogK + MKB) for finding the first front of the rest of the chunk
+
+    Space complexity: O(MF + MK)
+
+    Size definitions:
+        B = block size.
+        F = number of individuals in the running front.
+        K = number of individuals per chunk.
+        M = number of objectives.
+    """
+
+    def __init__(self, nobj: int, blksize: int = FILTER_BLKSIZE, sense: Optional[numpy.ndarray] = None) -> None:
+        """
+        Constructor for ParetoFilter.
+
+        Parameters
+        ----------
+        nobj : int
+            Number of objectives.
+        blksize : int
+            Number of individuals per block when finding the first front of
+            each chunk, as for ``pynds.archive.nondominated_mask``.
+        sense : numpy.ndarray, None
+            A vector of shape ``(nobj,)`` containing ``1`` for minimized and
+            ``-1`` for maximized objectives. If ``None``, minimize all objectives.
+        """
+        if nobj < 1:
+            raise ValueError("``nobj`` must be a positive integer: received ``{0}``".format(nobj))
+        if blksize < 1:
+            raise ValueError("``blksize`` must be a positive integer: received ``{0}``".format(blksize))
+        relation_options(nobj, sense)
+        self.nobj = nobj
+        self.blksize = blksize
+        self.sense = sense
+        self.front = numpy.empty((0,nobj), dtype = float)
+        self.cv = numpy.empty(0, dtype = float)
+        self.index = numpy.empty(0, dtype = numpy.int64)
+        self.nseen = 0
+
+    def __len__(self) -> int:
+        """
+        Number of individuals in the running front.
+        """
+        return len(self.front)
+
+    def update(self, chunk: numpy.ndarray, cv: Optional[numpy.ndarray] = None) -> numpy.ndarray:
+        """
+        Filter a chunk of individuals into the running front.
+
+        Parameters
+        ----------
+        chunk : numpy.ndarray
+            A matrix of shape ``(K,nobj)`` containing objective values.
+        cv : numpy.ndarray, None
+            A vector of shape ``(K,)`` containing constraint violations; an
+            individual is feasible if its violation is ``<= 0``. If ``None``,
+            individuals of the chunk are feasible.
+
+        Returns
+        -------
+        out : numpy.ndarray
+            A boolean vector of shape ``(K,)`` which is ``True`` for
+            individuals of the chunk which entered the running front. They
+            may be evicted by later chunks.
+        """
+        chunk = numpy.asarray(chunk)
+        if chunk.ndim != 2 or chunk.shape[1] != self.nobj:
+            raise ValueError("Chunk ``chunk`` is not the correct shape: expected ``(K,{0})`` but received ``{1}``".format(self.nobj,chunk.shape))
+        if cv is not None:
+            cv = numpy.asarray(cv, dtype = float)
+            if cv.shape != (len(chunk),):
+                raise ValueError("Constraint violations ``cv`` are not the correct shape: expected ``{0}`` but received ``{1}``".format((len(chunk),),cv.shape))
+
+        # get the number of individuals in the chunk and the running front
+        nchunk = len(chunk)
+        nfront = len(self.front)
+
+        # constraint violations, which are only compared if any are positive
+        cvc = numpy.zeros(nchunk, dtype = float) if cv is None else cv
+        cvf = self.cv
+        if cv is None and not numpy.any(cvf > 0):
+            cvc = cvf = None
+
+        # drop individuals dominated by the running front; this usually removes
+        # most of the chunk before it is filtered against itself
+        dropped = numpy.zeros(nchunk, dtype = bool)
+        if nfront > 0:
+            step = block_size(nfront)
+            for start in range(0, nchunk, step):
+                stop = min(start + step, nchunk)
+                dom = numpy.empty((stop-start,nfront), dtype = numpy.int8)
+                dominance_relationship_block(chunk[start:stop], self.front, dom, self.sense, None, None if cvc is None else cvc[start:stop], cvf)
+                dropped[start:stop] = numpy.any(dom > 0, axis = 1)
+
+        # reduce remaining individuals to their own first front
+        rem = numpy.flatnonzero(~dropped)
+        cand = rem[nondominated_mask(chunk[rem], self.blksize, self.sense, None if cvc is None else cvc[rem])]
+        xc = chunk[cand]
+
+        # evict members of the running front dominated by a candidate
+        evicted = numpy.zeros(nfront, dtype = bool)
+        if nfront > 0:
+            step = block_size(nfront)
+            for start in range(0, len(cand), step):
+                stop = min(start + step, len(cand))
+                dom = numpy.empty((stop-start,nfront), dtype = numpy.int8)
+                dominance_relationship_block(xc[start:stop], self.front, dom, self.sense, None, None if cvc is None else cvc[cand[start:stop]], cvf)
+                evicted |= numpy.any(dom < 0, axis = 0)
+
+        # update running front
+        out = numpy.zeros(nchunk, dtype = bool)
+        out[cand] = True
+        keep = ~evicted
+        self.front = numpy.concatenate((self.front[keep], xc))
+        self.cv = numpy.concatenate((self.cv[keep], numpy.zeros(len(cand)) if cv is None else cv[cand]))
+        self.index = numpy.concatenate((self.index[keep], self.nseen + cand))
+        self.nseen += nchunk
+
+        return out
+
+    def extend(self, chunks: Iterable[numpy.ndarray]) -> "ParetoFilter":
+        """
+        Filter every chunk of a stream into the running front.
+
+        Parameters
+        ----------
+        chunks : Iterable
+            An iterable of matrices of shape ``(K,nobj)``, where ``K`` may
+            differ between chunks.
+
+        Returns
+        -------
+        out : ParetoFilter
+            This filter.
+        """
+        for chunk in chunks:
+            self.update(chunk)
+        return self
+
+def pareto_filter(chunks: Iterable[numpy.ndarray], nobj: Optional[int] = None, blksize: int = FILTER_BLKSIZE, sense: Optional[numpy.ndarray] = None) -> ParetoFilter:
+    """
+    Find the first front of a stream of individuals arriving in chunks.
+
+    Parameters
+    ----------
+    chunks : Iterable
+        An iterable of matrices of shape ``(K,nobj)``, where ``K`` may differ
+        between chunks.
+    nobj : int, None
+        Number of objectives. If ``None``, use the number of columns of the
+        first chunk.
+    blksize : int
+        Number of individuals per block when finding the first front of
+        each chunk.
+    sense : numpy.ndarray, None
+        A vector of shape ``(nobj,)`` containing ``1`` for minimized and
+        ``-1`` for maximized objectives. If ``None``, minimize all objectives.
+
+    Returns
+    -------
+    out : ParetoFilter
+        A filter holding the first front of the stream in ``front``, and the
+        positions of its members in the stream in ``index``.
+    """
+    chunks = iter(chunks)
+
+    # get number of objectives from the first chunk
+    if nobj is None:
+        first = next(chunks, None)
+        if first is None:
+            raise ValueError("Cannot infer ``nobj`` from an empty stream")
+        first = numpy.asarray(first)
+        out = ParetoFilter(first.shape[-1], blksize, sense)
+        out.update(first)
+    else:
+        out = ParetoFilter(nobj, blksize, sense)
+
+    return out.extend(chunks)
@@ -0,0 +1,91 @@
+import numpy
+from typing import Optional
+from typing import Tuple
+
+class Workspace:
+    """
+    Pool of named, reusable workspace buffers.
+
+    Each name owns one flat byte buffer, which is grown when a larger
+    workspace is requested and otherwise reused. Requests return views of
+    the buffer with the requested shape and dtype, so repeated sorts at the
+    same or smaller sizes allocate nothing.
+
+    Views returned for the same name share memory: a view is only valid
+    until the next request for that name.
+    """
+
+    def __init__(self) -> None:
+        """
+        Constructor for Workspace.
+        """
+        self.buffers = {}
+
+    @property
+    def nbytes(self) -> int:
+        """
+        Total number of bytes held by all buffers.
+        """
+        return sum(b.nbytes for b in self.buffers.values())
+
+    def clear(self) -> None:
+        """
+        Release all buffers.
+        """
+        self.buffers.clear()
+
+    def get(self, name: str, shape: Tuple[int,...], dtype: numpy.dtype) -> numpy.ndarray:
+        """
+        Get an uninitialized workspace array.
+
+        Parameters
+        ----------
+        name : str
+            Name of the workspace buffer.
+        shape : tuple
+            Shape of the workspace array.
+        dtype : numpy.dtype
+            Data type of the workspace array.
+
+        Returns
+        -------
+        out : numpy.ndarray
+            A C-contiguous array of shape ``shape`` and dtype ``dtype`` which
+            is a view of the named buffer.
+        """
+        dtype = numpy.dtype(dtype)
+        shape = tuple(shape) if numpy.ndim(shape) > 0 else (int(shape),)
+        nbytes = int(numpy.prod(shape, dtype = numpy.int64)) * dtype.itemsize
+
+        # grow buffer if it is too small
+        buf = self.buffers.get(name)
+        if buf is None or buf.nbytes < nbytes:
+            buf = numpy.empty(nbytes, dtype = numpy.uint8)
+            self.buffers[name] = buf
+
+        return buf[:nbytes].view(dtype).reshape(shape)
+
+def workspace_empty(workspace: Optional[Workspace], name: str, shape: Tuple[int,...], dtype: numpy.dtype) -> numpy.ndarray:
+    """
+    Get an uninitialized workspace array from a workspace pool, or allocate
+    a new one if no pool is given.
+
+    Parameters
+    ----------
+    workspace : Workspace, None
+        Workspace pool. If ``None``, a new array is allocated.
+    name : str
+        Name of the workspace buffer.
+    shape : tuple
+        Shape of the workspace array.
+    dtype : numpy.dtype
+        Data type of the workspace array.
+
+    Returns
+    -------
+    out : numpy.ndarray
+        An array of shape ``shape`` and dtype ``dtype``.
+    """
+    if workspace is None:
+        return numpy.empty(shape, dtype = dtype)
+    return workspace.get(name, shape, dtype)
@@ -34,6 +34,9 @@ pynds_requirements_python = ">=3.6"
 pynds_requirements_install = [
     "numpy",
 ]
+pynds_requirements_extras = {
+    "jit" : ["numba",],
+}
 
 # package metadata: package locations
 pynds_package_directory = {"" : setup_location}
@@ -55,5 +58,6 @@ setuptools.setup(
     package_dir = pynds_package_directory,
     packages = pynds_packages,
     python_requires = pynds_requirements_python,
-    install_requires = pynds_requirements_install
+    install_requires = pynds_requirements_install,
+    extras_require = pynds_requirements_extras
 )
@@ -0,0 +1,107 @@
+import pytest
+import numpy
+from pynds.archive import ParetoArchive
+from pynds.archive import nondominated_mask
+from pynds.naive import ndsort_naive2
+from pynds.dispatch import argndsort
+
+################################################################################
+################################ Test Fixtures #################################
+################################################################################
+
+@pytest.fixture(params = [1,10,300])
+def nindiv(request):
+    yield request.param
+
+@pytest.fixture(params = [1,2,3,5])
+def nobj(request):
+    yield request.param
+
+@pytest.fixture(params = [1,2])
+def ndecimal(request):
+    yield request.param
+
+@pytest.fixture
+def xmat(nindiv, nobj, ndecimal):
+    # round to create ties and duplicate rows
+    yield numpy.random.random((nindiv,nobj)).round(ndecimal)
+
+def first_front(x):
+    # first front in sorted order
+    nindiv = x.shape[0]
+    x = x.copy()
+    front = numpy.empty(nindiv, dtype = int)
+    dom = numpy.empty((nindiv,nindiv), dtype = int)
+    rem = numpy.empty(nindiv, dtype = int)
+    mask = numpy.empty(nindiv, dtype = bool)
+    ndsort_naive2(x, front, dom, rem, mask)
+    return x[front == 0]
+
+def rowsort(x):
+    return x[numpy.lexsort(x.T[::-1])]
+
+def first_front_mask(x, sense = None, cv = None):
+    # first front under objective sense and constraint-domination
+    perm, front, used = argndsort(x, engine = "naive2", sense = sense, cv = cv)
+    return front == 0
+
+################################################################################
+################################## Unit Tests ##################################
+################################################################################
+
+def test_nondominated_mask(xmat):
+    mask = nondominated_mask(xmat, blksize = 7)
+    assert numpy.all(rowsort(xmat[mask]) == first_front(xmat))
+
+def test_ParetoArchive_insert(xmat, nobj):
+    archive = ParetoArchive(nobj, leaf_size = 4)
+    for p in xmat:
+        dominated = archive.is_dominated(p)
+        assert archive.insert(p) == (not dominated)
+    assert len(archive) == len(archive.points)
+    assert numpy.all(rowsort(archive.points) == first_front(xmat))
+
+def test_ParetoArchive_update(xmat, nindiv, nobj):
+    archive = ParetoArchive(nobj, leaf_size = 4)
+    half = nindiv // 2
+    archive.update(xmat[:half])
+    out = archive.update(xmat[half:])
+    assert numpy.all(rowsort(archive.points) == first_front(xmat))
+    # individuals in the second batch are archived if in the overall first front
+    assert numpy.all(out == nondominated_mask(xmat)[half:])
+
+def test_nondominated_mask_sense_cv(xmat, nindiv, nobj):
+    sense = numpy.where(numpy.arange(nobj) % 2 == 0, -1, 1)
+    cv = numpy.random.randint(-2, 3, size = nindiv) * 0.5
+    mask = nondominated_mask(xmat, blksize = 7, sense = sense, cv = cv)
+    assert numpy.all(mask == first_front_mask(xmat, sense, cv))
+
+@pytest.mark.parametrize("constrained", [False,True])
+def test_ParetoArchive_sense_cv(constrained, xmat, nindiv, nobj):
+    sense = numpy.where(numpy.arange(nobj) % 2 == 0, -1, 1)
+    cv = numpy.random.randint(-2, 3, size = nindiv) * 0.5 if constrained else None
+    archive = ParetoArchive(nobj, leaf_size = 4, sense = sense)
+    for i, p in enumerate(xmat):
+        c = None if cv is None else cv[i]
+        dominated = archive.is_dominated(p, c)
+        assert archive.insert(p, c) == (not dominated)
+    assert numpy.all(rowsort(archive.points) == rowsort(xmat[first_front_mask(xmat, sense, cv)]))
+
+    archive = ParetoArchive(nobj, leaf_size = 4, sense = sense)
+    half = nindiv // 2
+    archive.update(xmat[:half], None if cv is None else cv[:half])
+    out = archive.update(xmat[half:], None if cv is None else cv[half:])
+    assert numpy.all(out == first_front_mask(xmat, sense, cv)[half:])
+
+def test_ParetoArchive_ValueError(nobj):
+    archive = ParetoArchive(nobj)
+    with pytest.raises(ValueError):
+        archive.insert(numpy.zeros(nobj+1))
+    with pytest.raises(ValueError):
+        archive.update(numpy.zeros((3,nobj+1)))
+    with pytest.raises(ValueError):
+        archive.update(numpy.zeros((3,nobj)), numpy.zeros(2))
+    with pytest.raises(ValueError):
+        ParetoArchive(nobj, sense = numpy.ones(nobj+1))
+    with pytest.raises(ValueError):
+        ParetoArchive(nobj, leaf_size = 0)
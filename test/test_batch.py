@@ -0,0 +1,123 @@
+import pytest
+import numpy
+from pynds.batch import ndsort_batch
+from pynds.batch import ndsort_ragged
+from pynds.naive import ndsort_naive2
+from pynds.dispatch import ndsort
+
+################################################################################
+################################ Test Fixtures #################################
+################################################################################
+
+@pytest.fixture(params = [1,4])
+def nbatch(request):
+    yield request.param
+
+@pytest.fixture(params = [1,10,100])
+def nindiv(request):
+    yield request.param
+
+@pytest.fixture(params = [1,2,3,5])
+def nobj(request):
+    yield request.param
+
+@pytest.fixture
+def xarr(nbatch, nindiv, nobj):
+    # round to create ties and duplicate rows
+    yield numpy.random.random((nbatch,nindiv,nobj)).round(1)
+
+def naive2(x):
+    # sorted matrix and fronts
+    nindiv = x.shape[0]
+    x = x.copy()
+    front = numpy.empty(nindiv, dtype = int)
+    dom = numpy.empty((nindiv,nindiv), dtype = int)
+    rem = numpy.empty(nindiv, dtype = int)
+    mask = numpy.empty(nindiv, dtype = bool)
+    ndsort_naive2(x, front, dom, rem, mask)
+    return x, front
+
+################################################################################
+################################## Unit Tests ##################################
+################################################################################
+
+def test_ndsort_batch_matches_ndsort_naive2(xarr, nbatch, nindiv):
+    x1 = xarr.copy()
+    front1 = numpy.empty((nbatch,nindiv), dtype = int)
+    perm = numpy.empty((nbatch,nindiv), dtype = int)
+    dom = numpy.empty((nbatch,nindiv,nindiv), dtype = int)
+    cnt = numpy.empty((nbatch,nindiv), dtype = int)
+    ndsort_batch(x1, front1, perm, dom, cnt)
+
+    for b in range(nbatch):
+        x2, front2 = naive2(xarr[b])
+        assert numpy.all(front1[b] == front2)
+        assert numpy.all(x1[b] == x2)
+        assert numpy.all(xarr[b][perm[b]] == x1[b])
+
+def test_ndsort_ragged_matches_ndsort_naive2(nobj):
+    sizes = numpy.array([5,0,37,1,100])
+    offsets = numpy.concatenate(([0], numpy.cumsum(sizes)))
+    xmat = numpy.random.random((offsets[-1],nobj)).round(1)
+
+    x1 = xmat.copy()
+    front1 = numpy.empty(offsets[-1], dtype = int)
+    perm = numpy.empty(offsets[-1], dtype = int)
+    ndsort_ragged(x1, offsets, front1, perm)
+
+    assert numpy.all(xmat[perm] == x1)
+    for start, stop in zip(offsets[:-1], offsets[1:]):
+        x2, front2 = naive2(xmat[start:stop])
+        assert numpy.all(front1[start:stop] == front2)
+        assert numpy.all(x1[start:stop] == x2)
+        assert numpy.all((perm[start:stop] >= start) & (perm[start:stop] < stop))
+
+def test_ndsort_batch_sense_cv(xarr, nbatch, nindiv, nobj):
+    sense = numpy.where(numpy.arange(nobj) % 2 == 0, 1, -1)
+    cv = numpy.random.randint(-2, 3, size = (nbatch,nindiv)) * 0.5
+    x1 = xarr.copy()
+    cv1 = cv.copy()
+    front1 = numpy.empty((nbatch,nindiv), dtype = int)
+    perm = numpy.empty((nbatch,nindiv), dtype = int)
+    dom = numpy.empty((nbatch,nindiv,nindiv), dtype = int)
+    cnt = numpy.empty((nbatch,nindiv), dtype = int)
+    ndsort_batch(x1, front1, perm, dom, cnt, sense = sense, cv = cv1)
+
+    for b in range(nbatch):
+        x2 = xarr[b].copy()
+        cv2 = cv[b].copy()
+        front2, used = ndsort(x2, engine = "naive2", sense = sense, cv = cv2)
+        assert numpy.all(front1[b] == front2)
+        assert numpy.all(x1[b] == x2)
+        assert numpy.all(cv1[b] == cv2)
+        assert numpy.all(xarr[b][perm[b]] == x1[b])
+
+def test_ndsort_ragged_sense_cv(nobj):
+    sizes = numpy.array([5,0,37,1,100])
+    offsets = numpy.concatenate(([0], numpy.cumsum(sizes)))
+    xmat = numpy.random.random((offsets[-1],nobj)).round(1)
+    sense = numpy.where(numpy.arange(nobj) % 2 == 0, -1, 1)
+    cv = numpy.random.randint(-2, 3, size = offsets[-1]) * 0.5
+
+    x1 = xmat.copy()
+    cv1 = cv.copy()
+    front1 = numpy.empty(offsets[-1], dtype = int)
+    perm = numpy.empty(offsets[-1], dtype = int)
+    ndsort_ragged(x1, offsets, front1, perm, sense = sense, cv = cv1)
+
+    assert numpy.all(cv[perm] == cv1)
+    for start, stop in zip(offsets[:-1], offsets[1:]):
+        x2 = xmat[start:stop].copy()
+        cv2 = cv[start:stop].copy()
+        front2, used = ndsort(x2, engine = "naive2", sense = sense, cv = cv2)
+        assert numpy.all(front1[start:stop] == front2)
+        assert numpy.all(x1[start:stop] == x2)
+
+def test_ndsort_ragged_ValueError(nobj):
+    x = numpy.random.random((10,nobj))
+    front = numpy.empty(10, dtype = int)
+    perm = numpy.empty(10, dtype = int)
+    with pytest.raises(ValueError):
+        ndsort_ragged(x, numpy.array([0,5,9]), front, perm)
+    with pytest.raises(ValueError):
+        ndsort_ragged(x, numpy.array([0,6,5,10]), front, perm)
@@ -0,0 +1,102 @@
+import pytest
+import numpy
+from pynds.benchmark import BENCHMARK_FIELDS
+from pynds.benchmark import time_engine
+from pynds.benchmark import expected_time
+from pynds.benchmark import benchmark
+from pynds.benchmark import write_results
+from pynds.benchmark import read_results
+from pynds.benchmark import compare_results
+from pynds.benchmark import main
+from pynds.dispatch import ENGINES
+from pynds.dispatch import ndsort
+
+################################################################################
+################################ Test Fixtures #################################
+################################################################################
+
+@pytest.fixture(scope = "module")
+def records():
+    yield benchmark(engines = ["naive1","fast","biobj","jensen"], problems = ["uniform","integer"], sizes = [10,50], nobjs = [2,3], repeat = 2)
+
+################################################################################
+################################## Unit Tests ##################################
+################################################################################
+
+@pytest.mark.parametrize("engine", [e for e in ENGINES if e != "biobj"])
+def test_time_engine(engine):
+    x = numpy.random.random((50,3))
+    front = numpy.empty(50, dtype = int)
+    t = time_engine(engine, x, front, repeat = 3)
+    assert len(t) == 3
+    assert numpy.all(t >= 0.0)
+    # matrix is not modified; front holds assignments of the sorted matrix
+    expected, _ = ndsort(x.copy())
+    assert numpy.all(front == expected)
+
+def test_time_engine_budget():
+    x = numpy.random.random((50,3))
+    t = time_engine("naive1", x, repeat = 100, budget = 0.0)
+    assert len(t) == 1
+
+def test_expected_time():
+    assert expected_time([], [], 1000) == 0.0
+    assert expected_time([1.0], [100], 1000) == pytest.approx(10.0)
+    assert expected_time([1.0,4.0], [100,200], 400) == pytest.approx(16.0)
+    # growth is at least linear
+    assert expected_time([1.0,1.0], [100,200], 400) == pytest.approx(2.0)
+
+def test_benchmark(records):
+    assert len(records) == 4 * 2 * 2 * 2
+    for r in records:
+        assert tuple(r) == BENCHMARK_FIELDS
+        if r["engine"] == "biobj" and r["nobj"] != 2:
+            assert r["status"] == "nobj"
+            assert r["median"] is None
+        else:
+            assert r["status"] == "ok"
+            assert 1 <= r["nrun"] <= 2
+            assert r["min"] <= r["median"] <= r["max"]
+    # every engine finds the same number of fronts
+    nfront = {}
+    for r in records:
+        if r["status"] == "ok":
+            key = (r["problem"], r["nobj"], r["nindiv"])
+            assert nfront.setdefault(key, r["nfront"]) == r["nfront"]
+
+def test_benchmark_skip():
+    out = benchmark(engines = ["fast","jensen"], problems = ["uniform"], sizes = [10,20], nobjs = [3], repeat = 1, memory = 2000)
+    assert [r["status"] for r in out] == ["ok","ok","memory","ok"]
+    out = benchmark(engines = ["naive1"], problems = ["uniform"], sizes = [10,20,40], nobjs = [3], repeat = 1, budget = 0.0)
+    assert [r["status"] for r in out] == ["ok","budget","budget"]
+
+def test_benchmark_ValueError():
+    with pytest.raises(ValueError):
+        benchmark(engines = ["unknown"])
+    with pytest.raises(ValueError):
+        benchmark(problems = ["unknown"])
+
+@pytest.mark.parametrize("name", ["results.json","results.csv"])
+def test_write_results(name, records, tmp_path):
+    path = str(tmp_path / name)
+    write_results(records, path)
+    assert read_results(path) == records
+
+def test_compare_results(records):
+    assert compare_results(records, records) == []
+    slower = [dict(r, median = None if r["median"] is None else 2.0 * r["median"]) for r in records]
+    out = compare_results(records, slower, tolerance = 0.5)
+    assert len(out) == sum(r["median"] is not None for r in records)
+    assert all(r["ratio"] == pytest.approx(2.0) for r in out)
+    assert compare_results(records, slower, tolerance = 1.5) == []
+
+def test_main(tmp_path):
+    path = str(tmp_path / "results.json")
+    argv = ["--engines","fast","--problems","uniform","--sizes","20","--nobj","3","--repeat","1"]
+    assert main(argv + ["--output",path]) == 0
+    # compare against an impossibly fast baseline
+    baseline = read_results(path)
+    for r in baseline:
+        r["median"] = 1e-12
+    write_results(baseline, path)
+    assert main(argv + ["--baseline",path]) == 1
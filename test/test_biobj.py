@@ -0,0 +1,134 @@
+import pytest
+import numpy
+import pynds.jit
+from pynds.biobj import ndsort_biobj
+from pynds.biobj import argndsort_biobj
+from pynds.naive import ndsort_naive2
+from pynds.dispatch import argndsort
+
+################################################################################
+################################ Test Fixtures #################################
+################################################################################
+
+@pytest.fixture
+def nindiv():
+    yield 300
+
+@pytest.fixture(params = [1,2])
+def ndecimal(request):
+    yield request.param
+
+@pytest.fixture
+def xmat(nindiv, ndecimal):
+    # round to create ties and duplicate rows
+    yield numpy.random.random((nindiv,2)).round(ndecimal)
+
+################################################################################
+################################## Unit Tests ##################################
+################################################################################
+
+def test_ndsort_biobj_matches_ndsort_naive2(xmat, nindiv):
+    x1 = xmat.copy()
+    front1 = numpy.empty(nindiv, dtype = int)
+    perm = numpy.empty(nindiv, dtype = int)
+    ndsort_biobj(x1, front1, perm)
+
+    x2 = xmat.copy()
+    front2 = numpy.empty(nindiv, dtype = int)
+    dom = numpy.empty((nindiv,nindiv), dtype = int)
+    rem = numpy.empty(nindiv, dtype = int)
+    mask = numpy.empty(nindiv, dtype = bool)
+    ndsort_naive2(x2, front2, dom, rem, mask)
+
+    assert numpy.all(front1 == front2)
+    assert numpy.all(x1 == x2)
+    assert numpy.all(xmat[perm] == x1)
+
+def test_ndsort_biobj_integer_ties():
+    # many ties in each objective and many duplicate rows
+    xmat = numpy.random.randint(0, 8, (300,2))
+    x1 = xmat.copy()
+    front1 = numpy.empty(300, dtype = int)
+    perm = numpy.empty(300, dtype = int)
+    ndsort_biobj(x1, front1, perm)
+
+    x2 = xmat.copy()
+    front2 = numpy.empty(300, dtype = int)
+    ndsort_naive2(x2, front2, numpy.empty((300,300), dtype = int), numpy.empty(300, dtype = int), numpy.empty(300, dtype = bool))
+
+    assert numpy.all(front1 == front2)
+    assert numpy.all(x1 == x2)
+
+def test_ndsort_biobj_without_jit(xmat, nindiv, monkeypatch):
+    monkeypatch.setattr(pynds.jit, "JIT_AVAILABLE", False)
+    test_ndsort_biobj_matches_ndsort_naive2(xmat, nindiv)
+
+def test_ndsort_biobj_million_points(monkeypatch):
+    # the compiled sweep agrees with the pure numpy sweep on a large input;
+    # timings are reported by test_speedtest.py
+    pytest.importorskip("numba")
+    nindiv = 10**6
+    # round to create ties and duplicate rows
+    xmat = numpy.random.random((nindiv,2)).round(3)
+    x1 = xmat.copy()
+    front1 = numpy.empty(nindiv, dtype = int)
+    perm1 = numpy.empty(nindiv, dtype = int)
+    ndsort_biobj(x1, front1, perm1)
+
+    monkeypatch.setattr(pynds.jit, "JIT_AVAILABLE", False)
+    x2 = xmat.copy()
+    front2 = numpy.empty(nindiv, dtype = int)
+    perm2 = numpy.empty(nindiv, dtype = int)
+    ndsort_biobj(x2, front2, perm2)
+
+    assert numpy.all(front1 == front2)
+    assert numpy.all(x1 == x2)
+    assert numpy.all(xmat[perm1] == x1)
+
+def test_argndsort_biobj(xmat, nindiv):
+    x = xmat.copy()
+    front = numpy.empty(nindiv, dtype = int)
+    perm = numpy.empty(nindiv, dtype = int)
+    argndsort_biobj(x, front, perm)
+    assert numpy.all(x == xmat)
+
+    x1 = xmat.copy()
+    front1 = numpy.empty(nindiv, dtype = int)
+    ndsort_biobj(x1, front1, numpy.empty(nindiv, dtype = int))
+    assert numpy.all(x[perm] == x1)
+    assert numpy.all(front[perm] == front1)
+
+def test_ndsort_biobj_ValueError():
+    x = numpy.random.random((10,3))
+    front = numpy.empty(10, dtype = int)
+    perm = numpy.empty(10, dtype = int)
+    with pytest.raises(ValueError):
+        ndsort_biobj(x, front, perm)
+
+def test_argndsort_biobj_sense_cv(xmat, nindiv):
+    # sense and constraint violations are applied without copying x or cv
+    sense = numpy.array([1,-1])
+    cv = numpy.random.randint(-2, 3, size = nindiv) * 0.5
+    x = xmat.copy()
+    cvs = cv.copy()
+    front = numpy.empty(nindiv, dtype = int)
+    perm = numpy.empty(nindiv, dtype = int)
+    argndsort_biobj(x, front, perm, sense = sense, cv = cvs)
+    assert numpy.all(x == xmat)
+    assert numpy.all(cvs == cv)
+
+    eperm, expected, used = argndsort(xmat, engine = "naive2", sense = sense, cv = cv)
+    assert numpy.all(front == expected)
+    assert numpy.all(perm == eperm)
+
+@pytest.mark.parametrize("kfront", [0,1,3])
+def test_argndsort_biobj_kfront(kfront, xmat, nindiv):
+    cv = numpy.random.randint(-2, 3, size = nindiv) * 0.5
+    for c in (None, cv):
+        front = numpy.empty(nindiv, dtype = int)
+        perm = numpy.empty(nindiv, dtype = int)
+        argndsort_biobj(xmat, front, perm, cv = c, kfront = kfront)
+        eperm, expected, used = argndsort(xmat, engine = "naive2", cv = c, kfront = kfront)
+        assert numpy.all(front == expected)
+        # duplicate rows may be permuted within fronts
+        assert numpy.all(xmat[perm] == xmat[eperm])
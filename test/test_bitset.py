@@ -0,0 +1,96 @@
+import pytest
+import numpy
+import pynds.bitset
+from pynds.bitset import bitset_nbytes
+from pynds.bitset import bitset_popcount
+from pynds.bitset import dominance_bitset_matrix
+from pynds.bitset import ndsort_bitset
+from pynds.relation import dominance_relationship_matrix
+from pynds.naive import ndsort_naive2
+
+################################################################################
+################################ Test Fixtures #################################
+################################################################################
+
+@pytest.fixture(params = [1,13,200])
+def nindiv(request):
+    yield request.param
+
+@pytest.fixture(params = [1,2,3,5])
+def nobj(request):
+    yield request.param
+
+@pytest.fixture
+def xmat(nindiv, nobj):
+    # round to create ties and duplicate rows
+    yield numpy.random.random((nindiv,nobj)).round(1)
+
+@pytest.fixture
+def bitsets(nindiv):
+    nbytes = bitset_nbytes(nindiv)
+    yield numpy.empty((nindiv,nbytes), dtype = numpy.uint8), numpy.empty((nindiv,nbytes), dtype = numpy.uint8)
+
+################################################################################
+################################## Unit Tests ##################################
+################################################################################
+
+def test_bitset_popcount():
+    b = numpy.array([[0,0],[255,1],[3,128]], dtype = numpy.uint8)
+    assert numpy.all(bitset_popcount(b) == [0,9,3])
+
+def test_dominance_bitset_matrix(xmat, nindiv, bitsets):
+    dom, domd = bitsets
+    dominance_bitset_matrix(xmat, dom, domd, 7)
+    mat = numpy.empty((nindiv,nindiv), dtype = int)
+    dominance_relationship_matrix(xmat, mat)
+    assert numpy.all(numpy.unpackbits(dom, axis = 1, count = nindiv) == (mat < 0))
+    assert numpy.all(numpy.unpackbits(domd, axis = 1, count = nindiv) == (mat > 0))
+    assert numpy.all(bitset_popcount(domd) == numpy.sum(mat > 0, axis = 1))
+
+def test_dominance_bitset_matrix_n_jobs(xmat, bitsets):
+    dom, domd = bitsets
+    dominance_bitset_matrix(xmat, dom, domd)
+    pdom = numpy.empty_like(dom)
+    pdomd = numpy.empty_like(domd)
+    dominance_bitset_matrix(xmat, pdom, pdomd, 5, n_jobs = 3)
+    assert numpy.all(pdom == dom)
+    assert numpy.all(pdomd == domd)
+
+def test_ndsort_bitset_matches_ndsort_naive2(xmat, nindiv, bitsets):
+    x1 = xmat.copy()
+    front1 = numpy.empty(nindiv, dtype = int)
+    cnt = numpy.empty(nindiv, dtype = int)
+    rem = numpy.empty(nindiv, dtype = int)
+    ndsort_bitset(x1, front1, bitsets[0], bitsets[1], cnt, rem)
+
+    x2 = xmat.copy()
+    front2 = numpy.empty(nindiv, dtype = int)
+    dom = numpy.empty((nindiv,nindiv), dtype = int)
+    mask = numpy.empty(nindiv, dtype = bool)
+    ndsort_naive2(x2, front2, dom, rem, mask)
+
+    assert numpy.all(front1 == front2)
+    assert numpy.all(x1 == x2)
+
+def test_ndsort_bitset_bounded_peel(xmat, nindiv, bitsets, monkeypatch):
+    # unpack one front member's bitset at a time
+    monkeypatch.setattr(pynds.bitset, "BLOCK_NELEM", 1)
+    x1 = xmat.copy()
+    front1 = numpy.empty(nindiv, dtype = int)
+    ndsort_bitset(x1, front1, bitsets[0], bitsets[1], numpy.empty(nindiv, dtype = int), numpy.empty(nindiv, dtype = int))
+
+    x2 = xmat.copy()
+    front2 = numpy.empty(nindiv, dtype = int)
+    ndsort_naive2(x2, front2, numpy.empty((nindiv,nindiv), dtype = int), numpy.empty(nindiv, dtype = int), numpy.empty(nindiv, dtype = bool))
+
+    assert numpy.all(front1 == front2)
+    assert numpy.all(x1 == x2)
+
+def test_dominance_bitset_matrix_ValueError():
+    x = numpy.random.random((10,2))
+    good = numpy.empty((10,2), dtype = numpy.uint8)
+    bad = numpy.empty((10,10), dtype = numpy.uint8)
+    with pytest.raises(ValueError):
+        dominance_bitset_matrix(x, bad, good)
+    with pytest.raises(ValueError):
+        dominance_bitset_matrix(x, good, bad)
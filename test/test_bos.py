@@ -0,0 +1,110 @@
+import pytest
+import numpy
+from pynds.bos import ndsort_bos
+from pynds.bos import argndsort_bos
+from pynds.naive import ndsort_naive2
+from pynds.dispatch import argndsort
+
+################################################################################
+################################ Test Fixtures #################################
+################################################################################
+
+@pytest.fixture
+def nindiv():
+    yield 200
+
+@pytest.fixture(params = [1,2,3,5,8])
+def nobj(request):
+    yield request.param
+
+@pytest.fixture
+def xmat(nindiv, nobj):
+    # round to create ties and duplicate rows
+    yield numpy.random.random((nindiv,nobj)).round(1)
+
+################################################################################
+################################## Unit Tests ##################################
+################################################################################
+
+def test_ndsort_bos_matches_ndsort_naive2(xmat, nindiv, nobj):
+    x1 = xmat.copy()
+    front1 = numpy.empty(nindiv, dtype = int)
+    perm = numpy.empty(nindiv, dtype = int)
+    order = numpy.empty((nobj,nindiv), dtype = int)
+    ndsort_bos(x1, front1, perm, order)
+
+    x2 = xmat.copy()
+    front2 = numpy.empty(nindiv, dtype = int)
+    dom = numpy.empty((nindiv,nindiv), dtype = int)
+    rem = numpy.empty(nindiv, dtype = int)
+    mask = numpy.empty(nindiv, dtype = bool)
+    ndsort_naive2(x2, front2, dom, rem, mask)
+
+    assert numpy.all(front1 == front2)
+    assert numpy.all(x1 == x2)
+    assert numpy.all(xmat[perm] == x1)
+
+def test_ndsort_bos_presorted(xmat, nindiv, nobj):
+    front = numpy.empty(nindiv, dtype = int)
+    perm = numpy.empty(nindiv, dtype = int)
+    order = numpy.empty((nobj,nindiv), dtype = int)
+    ndsort_bos(xmat, front, perm, order)
+
+    # returned orders must sort the sorted matrix
+    for j in range(nobj):
+        assert numpy.all(numpy.diff(xmat[order[j],j]) >= 0)
+
+    # reuse orders on the sorted matrix
+    tmp = xmat.copy()
+    front2 = numpy.empty(nindiv, dtype = int)
+    ndsort_bos(xmat, front2, perm, order, presorted = True)
+    assert numpy.all(front == front2)
+    assert numpy.all(xmat == tmp)
+    assert numpy.all(perm == numpy.arange(nindiv))
+
+def test_argndsort_bos(xmat, nindiv, nobj):
+    x = xmat.copy()
+    front = numpy.empty(nindiv, dtype = int)
+    perm = numpy.empty(nindiv, dtype = int)
+    order = numpy.empty((nobj,nindiv), dtype = int)
+    argndsort_bos(x, front, perm, order)
+    assert numpy.all(x == xmat)
+
+    # returned orders sort the unmodified matrix, and may be reused
+    for j in range(nobj):
+        assert numpy.all(numpy.diff(x[order[j],j]) >= 0)
+    front2 = numpy.empty(nindiv, dtype = int)
+    argndsort_bos(x, front2, perm, order, presorted = True)
+    assert numpy.all(front2 == front)
+
+    x1 = xmat.copy()
+    front1 = numpy.empty(nindiv, dtype = int)
+    ndsort_bos(x1, front1, numpy.empty(nindiv, dtype = int), order)
+    assert numpy.all(x[perm] == x1)
+    assert numpy.all(front[perm] == front1)
+
+def test_argndsort_bos_sense_cv(xmat, nindiv, nobj):
+    # sense and constraint violations are applied without copying x or cv
+    sense = numpy.where(numpy.arange(nobj) % 2 == 0, 1, -1)
+    cv = numpy.random.randint(-2, 3, size = nindiv) * 0.5
+    x = xmat.copy()
+    cvs = cv.copy()
+    front = numpy.empty(nindiv, dtype = int)
+    perm = numpy.empty(nindiv, dtype = int)
+    argndsort_bos(x, front, perm, numpy.empty((nobj,nindiv), dtype = int), sense = sense, cv = cvs)
+    assert numpy.all(x == xmat)
+    assert numpy.all(cvs == cv)
+
+    eperm, expected, used = argndsort(xmat, engine = "naive2", sense = sense, cv = cv)
+    assert numpy.all(front == expected)
+    assert numpy.all(perm == eperm)
+
+@pytest.mark.parametrize("kfront", [0,1,3])
+def test_argndsort_bos_kfront(kfront, xmat, nindiv, nobj):
+    front = numpy.empty(nindiv, dtype = int)
+    perm = numpy.empty(nindiv, dtype = int)
+    argndsort_bos(xmat, front, perm, numpy.empty((nobj,nindiv), dtype = int), kfront = kfront)
+    eperm, expected, used = argndsort(xmat, engine = "naive2", kfront = kfront)
+    assert numpy.all(front == expected)
+    # duplicate rows may be permuted within fronts
+    assert numpy.all(xmat[perm] == xmat[eperm])
@@ -0,0 +1,153 @@
+import pytest
+import numpy
+from pynds.crowding import crowding_distance
+from pynds.crowding import reference_association
+from pynds.crowding import niche_count
+from pynds.crowding import niche_count_sorted
+from pynds.dispatch import ENGINES
+from pynds.dispatch import ndsort
+from pynds.naive import ndsort_naive1
+from pynds.naive import ndsort_naive2
+from pynds.presort import UNASSIGNED
+
+################################################################################
+################################ Test Fixtures #################################
+################################################################################
+
+@pytest.fixture(params = [1,2,50])
+def nindiv(request):
+    yield request.param
+
+@pytest.fixture(params = [2,3])
+def nobj(request):
+    yield request.param
+
+@pytest.fixture
+def xmat(nindiv, nobj):
+    # round to create ties and duplicate rows
+    yield numpy.random.random((nindiv,nobj)).round(1)
+
+def crowding_loop(x, front):
+    # textbook NSGA-II crowding distance, one front and objective at a time
+    out = numpy.full(len(x), numpy.nan)
+    for k in numpy.unique(front[front != UNASSIGNED]):
+        ix = numpy.flatnonzero(front == k)
+        out[ix] = 0.0
+        for j in range(x.shape[1]):
+            o = ix[numpy.argsort(x[ix,j], kind = "stable")]
+            span = x[o[-1],j] - x[o[0],j]
+            out[o[0]] = out[o[-1]] = numpy.inf
+            for i in range(1, len(o) - 1):
+                if span > 0:
+                    out[o[i]] += (x[o[i+1],j] - x[o[i-1],j]) / span
+    return out
+
+################################################################################
+################################## Unit Tests ##################################
+################################################################################
+
+def test_crowding_distance_matches_loop(xmat, nindiv):
+    for kfront in [None, 2]:
+        x = xmat.copy()
+        front, _ = ndsort(x, engine = "fast", kfront = kfront)
+        out = crowding_distance(x, front)
+        assert numpy.allclose(out, crowding_loop(x, front), equal_nan = True)
+
+def test_crowding_distance_naive(xmat, nindiv):
+    x1 = xmat.copy()
+    front = numpy.empty(nindiv, dtype = int)
+    crowding1 = numpy.empty(nindiv, dtype = float)
+    ndsort_naive1(x1, front, numpy.empty(nindiv, dtype = int), numpy.empty(nindiv, dtype = bool), crowding = crowding1)
+    assert numpy.allclose(crowding1, crowding_loop(x1, front))
+
+    x2 = xmat.copy()
+    crowding2 = numpy.empty(nindiv, dtype = float)
+    ndsort_naive2(x2, front, numpy.empty((nindiv,nindiv), dtype = int), numpy.empty(nindiv, dtype = int), numpy.empty(nindiv, dtype = bool), crowding = crowding2)
+    assert numpy.allclose(crowding2, crowding1)
+
+@pytest.mark.parametrize("engine", list(ENGINES))
+def test_ndsort_crowding(engine, xmat, nindiv, nobj):
+    if engine == "biobj" and nobj != 2:
+        pytest.skip("biobj requires two objectives")
+    crowding = numpy.empty(nindiv, dtype = float)
+    front, _ = ndsort(xmat, engine = engine, crowding = crowding)
+    assert numpy.allclose(crowding, crowding_loop(xmat, front))
+
+def test_crowding_distance_ValueError():
+    x = numpy.random.random((5,2))
+    with pytest.raises(ValueError):
+        crowding_distance(x, numpy.array([1,0,0,0,0]))
+    with pytest.raises(ValueError):
+        crowding_distance(x, numpy.zeros(5, dtype = int), out = numpy.empty(4))
+
+def test_reference_association():
+    refs = numpy.array([[1.0,0.0],[0.5,0.5],[0.0,1.0]])
+    x = numpy.array([[0.0,1.0],[1.0,0.0],[0.5,0.5],[0.9,1.0]])
+    assoc, dist = reference_association(x, refs, ideal = numpy.zeros(2), nadir = numpy.ones(2))
+    assert numpy.all(assoc == [2,0,1,1])
+    assert numpy.allclose(dist[:3], 0.0, atol = 1e-6)
+    front = numpy.array([0,0,0,1])
+    assert numpy.all(niche_count(assoc, front, 3) == [1,1,1])
+    assert numpy.all(niche_count(assoc, front, 3, exclude_last = False) == [1,2,1])
+
+def test_niche_count_sorted(xmat, nindiv, nobj):
+    refs = numpy.random.random((4,nobj))
+    for kfront in [None, 2]:
+        x = xmat.copy()
+        front, _ = ndsort(x, engine = "fast", kfront = kfront)
+        assoc = numpy.empty(nindiv, dtype = int)
+        niche = niche_count_sorted(x, front, refs, assoc = assoc)
+        sel = front != UNASSIGNED
+        eassoc, _ = reference_association(x[sel], refs)
+        assert numpy.all(assoc[sel] == eassoc)
+        assert numpy.all(assoc[~sel] == UNASSIGNED)
+        assert numpy.all(niche == niche_count(assoc, front, len(refs)))
+
+def test_niche_count_sorted_sense(xmat, nobj):
+    refs = numpy.random.random((4,nobj))
+    sense = numpy.ones(nobj)
+    sense[0] = -1
+    x = xmat.copy()
+    front, _ = ndsort(x, engine = "fast", sense = sense)
+    assoc = numpy.empty(len(x), dtype = int)
+    niche_count_sorted(x, front, refs, assoc = assoc, sense = sense)
+    eassoc, _ = reference_association(x * sense, refs)
+    assert numpy.all(assoc == eassoc)
+
+@pytest.mark.parametrize("engine", list(ENGINES))
+def test_ndsort_niche(engine, xmat, nindiv, nobj):
+    if engine == "biobj" and nobj != 2:
+        pytest.skip("biobj requires two objectives")
+    refs = numpy.random.random((4,nobj))
+    niche = numpy.empty(4, dtype = int)
+    crowding = numpy.empty(nindiv, dtype = float)
+    front, _ = ndsort(xmat, engine = engine, crowding = crowding, refs = refs, niche = niche)
+    assert numpy.allclose(crowding, crowding_loop(xmat, front))
+    assoc, _ = reference_association(xmat, refs)
+    assert numpy.all(niche == niche_count(assoc, front, len(refs)))
+
+def test_niche_count_naive(xmat, nindiv, nobj):
+    refs = numpy.random.random((4,nobj))
+    x1 = xmat.copy()
+    front = numpy.empty(nindiv, dtype = int)
+    niche1 = numpy.empty(4, dtype = int)
+    ndsort_naive1(x1, front, numpy.empty(nindiv, dtype = int), numpy.empty(nindiv, dtype = bool), refs = refs, niche = niche1)
+    assoc, _ = reference_association(x1, refs)
+    assert numpy.all(niche1 == niche_count(assoc, front, len(refs)))
+
+    x2 = xmat.copy()
+    niche2 = numpy.empty(4, dtype = int)
+    ndsort_naive2(x2, front, numpy.empty((nindiv,nindiv), dtype = int), numpy.empty(nindiv, dtype = int), numpy.empty(nindiv, dtype = bool), refs = refs, niche = niche2)
+    assert numpy.all(niche2 == niche1)
+
+def test_niche_count_sorted_ValueError():
+    x = numpy.random.random((5,2))
+    refs = numpy.random.random((3,2))
+    with pytest.raises(ValueError):
+        niche_count_sorted(x, numpy.array([1,0,0,0,0]), refs)
+    with pytest.raises(ValueError):
+        niche_count_sorted(x, numpy.zeros(5, dtype = int), refs[:,:1])
+    with pytest.raises(ValueError):
+        niche_count_sorted(x, numpy.zeros(5, dtype = int), refs, out = numpy.empty(2, dtype = int))
+    with pytest.raises(ValueError):
+        ndsort(x, refs = refs)
@@ -0,0 +1,303 @@
+import pytest
+import numpy
+import pynds
+from pynds.dispatch import ENGINES
+from pynds.dispatch import ARG_ENGINES
+from pynds.dispatch import argndsort
+from pynds.dispatch import iter_fronts
+from pynds.dispatch import ndsort
+from pynds.dispatch import RELATION_ENGINES
+from pynds.dispatch import select_engine
+from pynds.dispatch import truncate_fronts
+from pynds.presort import UNASSIGNED
+from pynds.workspace import Workspace
+from pynds.naive import ndsort_naive2
+
+################################################################################
+################################ Test Fixtures #################################
+################################################################################
+
+@pytest.fixture
+def nindiv():
+    yield 150
+
+@pytest.fixture(params = [2,3,5])
+def nobj(request):
+    yield request.param
+
+@pytest.fixture
+def xmat(nindiv, nobj):
+    # round to create ties and duplicate rows
+    yield numpy.random.random((nindiv,nobj)).round(1)
+
+@pytest.fixture
+def naive2(xmat, nindiv):
+    x = xmat.copy()
+    front = numpy.empty(nindiv, dtype = int)
+    dom = numpy.empty((nindiv,nindiv), dtype = int)
+    rem = numpy.empty(nindiv, dtype = int)
+    mask = numpy.empty(nindiv, dtype = bool)
+    ndsort_naive2(x, front, dom, rem, mask)
+    yield x, front
+
+@pytest.fixture
+def sense(nobj):
+    # maximize every other objective
+    yield numpy.where(numpy.arange(nobj) % 2 == 0, 1, -1)
+
+@pytest.fixture
+def cvec(nindiv):
+    # about half of the individuals are infeasible, with tied violations
+    yield numpy.random.random(nindiv).round(1) - 0.5
+
+################################################################################
+################################## Unit Tests ##################################
+################################################################################
+
+def test_ndsort_toplevel():
+    assert pynds.ndsort is ndsort
+    assert pynds.argndsort is argndsort
+    assert pynds.iter_fronts is iter_fronts
+
+def test_ndsort_auto(xmat, naive2):
+    front, engine = ndsort(xmat)
+    assert engine in ENGINES
+    assert numpy.all(front == naive2[1])
+    assert numpy.all(xmat == naive2[0])
+
+@pytest.mark.parametrize("engine", list(ENGINES))
+def test_ndsort_engine(engine, xmat, nobj, naive2):
+    if engine == "biobj" and nobj != 2:
+        pytest.skip("biobj requires two objectives")
+    front = numpy.empty(xmat.shape[0], dtype = int)
+    out, used = ndsort(xmat, front, engine = engine)
+    assert out is front
+    assert used == engine
+    assert numpy.all(front == naive2[1])
+    assert numpy.all(xmat == naive2[0])
+
+@pytest.mark.parametrize("engine", list(ENGINES))
+@pytest.mark.parametrize("kfront,nfill", [(0,None),(1,None),(3,None),(None,1),(None,50),(2,10)])
+def test_ndsort_early_exit(engine, kfront, nfill, xmat, nobj, naive2):
+    if engine == "biobj" and nobj != 2:
+        pytest.skip("biobj requires two objectives")
+    front, used = ndsort(xmat, engine = engine, kfront = kfront, nfill = nfill)
+
+    # expected: complete sort with later fronts unassigned
+    expected = naive2[1].copy()
+    truncate_fronts(expected, kfront, nfill)
+    nassigned = numpy.sum(expected != UNASSIGNED)
+
+    assert numpy.all(front == expected)
+    assert numpy.all(xmat[:nassigned] == naive2[0][:nassigned])
+    assert sorted(map(tuple, xmat[nassigned:])) == sorted(map(tuple, naive2[0][nassigned:]))
+
+def test_truncate_fronts():
+    front = numpy.array([0,0,1,2,2,2,3])
+    for kfront,nfill,cut in [(None,None,4),(0,None,0),(2,None,2),(None,3,2),(None,4,3),(3,1,1),(10,None,4)]:
+        tmp = front.copy()
+        truncate_fronts(tmp, kfront, nfill)
+        assert numpy.all(tmp == numpy.where(front < cut, front, UNASSIGNED))
+
+def test_select_engine():
+    assert select_engine(1000, 2) == "biobj"
+    assert select_engine(100, 3) == "fast"
+    assert select_engine(100000, 3) == "jensen"
+    # O(N^2) workspace must respect the memory budget
+    assert select_engine(100, 3, memory = 8192) == "bitset"
+    assert select_engine(100, 3, memory = 1024) == "jensen"
+    assert select_engine(100, 3, dtype = object) == "naive1"
+    # medium populations use the bit-packed matrix while it fits
+    assert select_engine(1000, 3) == "bitset"
+    assert select_engine(1000, 3, memory = 2**16) == "jensen"
+    # early exits use the compiled ENS sweep, which stops at ``kfront``
+    assert select_engine(100000, 3, limited = True, compiled = True) == "ens_ss"
+    assert select_engine(100, 3, limited = True, compiled = True) == "ens_ss"
+    assert select_engine(100000, 3, limited = True) == "jensen"
+    assert select_engine(1000, 2, limited = True, compiled = True) == "biobj"
+    assert select_engine(1000, 3, limited = True, compiled = True, transitive = False) in RELATION_ENGINES
+
+def test_ndsort_auto_limited():
+    # with compiled kernels, kfront selects an engine which stops early
+    pytest.importorskip("numba")
+    x = numpy.random.random((500,3))
+    front, used = ndsort(x.copy(), kfront = 1)
+    assert used == "ens_ss"
+    perm, front, used = argndsort(x, kfront = 2, nfill = 100)
+    assert used == "ens_ss"
+    # nfill alone is applied after a full sort and keeps the default selection
+    perm, front, used = argndsort(x, nfill = 100)
+    assert used == select_engine(500, 3)
+    # options without compiled support keep the default selection
+    front, used = ndsort(x.copy(), kfront = 1, sense = numpy.array([1,-1,1]))
+    assert used == select_engine(500, 3)
+
+def test_ndsort_ValueError(xmat):
+    with pytest.raises(ValueError):
+        ndsort(xmat, engine = "unknown")
+    with pytest.raises(ValueError):
+        ndsort(xmat[0])
+    with pytest.raises(ValueError):
+        ndsort(xmat, numpy.empty(1, dtype = int))
+
+@pytest.mark.parametrize("engine", list(ARG_ENGINES))
+@pytest.mark.parametrize("kfront,nfill", [(None,None),(1,None),(None,50)])
+def test_argndsort_engine(engine, kfront, nfill, xmat, nobj, naive2):
+    if engine == "biobj" and nobj != 2:
+        pytest.skip("biobj requires two objectives")
+    x = xmat.copy()
+    perm, front, used = argndsort(x, engine = engine, kfront = kfront, nfill = nfill)
+    assert used == engine
+
+    # input is not modified
+    assert numpy.all(x == xmat)
+
+    # expected: complete sort with later fronts unassigned
+    expected = naive2[1].copy()
+    truncate_fronts(expected, kfront, nfill)
+    nassigned = numpy.sum(expected != UNASSIGNED)
+
+    assert numpy.all(front[perm] == expected)
+    assert numpy.all(xmat[perm][:nassigned] == naive2[0][:nassigned])
+    assert numpy.all(numpy.sort(perm) == numpy.arange(len(perm)))
+    # unassigned individuals are placed last, in their original order
+    assert numpy.all(numpy.diff(perm[nassigned:]) > 0)
+
+def test_argndsort_ValueError(xmat):
+    with pytest.raises(ValueError):
+        argndsort(xmat, engine = "unknown")
+    with pytest.raises(ValueError):
+        argndsort(xmat, perm = numpy.empty(1, dtype = int))
+
+@pytest.mark.parametrize("engine", ["auto","fast","bitset"])
+def test_iter_fronts(engine, xmat, naive2):
+    x = xmat.copy()
+    perm, front, used = argndsort(x, engine = "naive2")
+
+    # each generated front holds the row indices of one front, in ascending order
+    nfront = 0
+    for k, members in enumerate(iter_fronts(x, engine = engine)):
+        assert numpy.all(members == numpy.flatnonzero(front == k))
+        nfront += 1
+    assert nfront == front.max() + 1
+    assert numpy.all(x == xmat)
+
+def test_iter_fronts_lazy(xmat):
+    ws = Workspace()
+    fronts = iter_fronts(xmat, engine = "fast", workspace = ws)
+    first = next(fronts)
+
+    # only the first front is marked; no domination counts were decremented yet
+    cnt = ws.get("cnt", xmat.shape[0], int)
+    assert numpy.all(numpy.flatnonzero(cnt == -1) == first)
+    assert numpy.all(cnt[cnt != -1] > 0)
+    fronts.close()
+
+def test_iter_fronts_ValueError(xmat):
+    with pytest.raises(ValueError):
+        iter_fronts(xmat, engine = "jensen")
+    with pytest.raises(ValueError):
+        iter_fronts(xmat[0])
+
+@pytest.mark.parametrize("engine", list(ENGINES))
+@pytest.mark.parametrize("constrained", [False,True])
+def test_ndsort_sense_cv(engine, constrained, xmat, nobj, sense, cvec):
+    if engine == "biobj" and nobj != 2:
+        pytest.skip("biobj requires two objectives")
+    cv = cvec if constrained else None
+
+    # expected: pairwise relations with the same options
+    perm, expected, used = argndsort(xmat, engine = "naive2", sense = sense, cv = cv)
+
+    x = xmat.copy()
+    cvs = None if cv is None else cv.copy()
+    front, used = ndsort(x, engine = engine, sense = sense, cv = cvs)
+    assert numpy.all(front == expected[perm])
+    assert numpy.all(x == xmat[perm])
+    # violations are reordered along with rows; duplicate rows may be in any order
+    if constrained:
+        assert sorted(map(tuple, numpy.column_stack((x, cvs)))) == sorted(map(tuple, numpy.column_stack((xmat, cv))))
+
+def test_ndsort_sense_negated(xmat, sense):
+    # maximizing an objective is minimizing its negation
+    perm, front, used = argndsort(xmat, sense = sense)
+    nperm, nfront, used = argndsort(xmat * sense)
+    assert numpy.all(front == nfront)
+
+def test_ndsort_cv_feasible_first(xmat, cvec):
+    perm, front, used = argndsort(xmat, cv = cvec)
+    # every feasible individual is in an earlier front than every infeasible one
+    assert front[cvec <= 0].max() < front[cvec > 0].min()
+    # infeasible individuals are ranked by violation alone
+    infeasible = numpy.flatnonzero(cvec > 0)
+    order = numpy.argsort(cvec[infeasible], kind = "stable")
+    assert numpy.all(numpy.diff(front[infeasible][order]) >= 0)
+
+@pytest.mark.parametrize("engine", list(ARG_ENGINES))
+@pytest.mark.parametrize("eps", [0.1,"vector"])
+def test_argndsort_eps(engine, eps, xmat, nobj, cvec):
+    if eps == "vector":
+        eps = numpy.linspace(0.0, 0.2, nobj)
+    if engine not in RELATION_ENGINES:
+        with pytest.raises(ValueError):
+            argndsort(xmat, engine = engine, eps = eps)
+        return
+    perm, front, used = argndsort(xmat, engine = engine, eps = eps, cv = cvec)
+    eperm, expected, used = argndsort(xmat, engine = "naive2", eps = eps, cv = cvec)
+    assert numpy.all(front == expected)
+    assert numpy.all(perm == eperm)
+
+def test_ndsort_eps_auto(xmat):
+    front, used = ndsort(xmat.copy(), eps = 0.1)
+    assert used in RELATION_ENGINES
+    assert select_engine(100000, 3, transitive = False) in RELATION_ENGINES
+    assert select_engine(100000, 3, memory = 1024, transitive = False) == "naive1"
+
+def test_ndsort_options_ValueError(xmat, nobj):
+    with pytest.raises(ValueError):
+        ndsort(xmat, sense = numpy.ones(nobj + 1))
+    with pytest.raises(ValueError):
+        ndsort(xmat, eps = -1.0)
+    with pytest.raises(ValueError):
+        argndsort(xmat, cv = numpy.zeros(1))
+    with pytest.raises(ValueError):
+        ndsort(xmat, engine = "jensen", eps = 0.1)
+    with pytest.raises(ValueError):
+        iter_fronts(xmat, cv = numpy.zeros(1))
+
+@pytest.mark.parametrize("engine", ["fast","bitset"])
+def test_iter_fronts_options(engine, xmat, sense, cvec):
+    perm, front, used = argndsort(xmat, engine = "naive2", sense = sense, eps = 0.05, cv = cvec)
+    nfront = 0
+    for k, members in enumerate(iter_fronts(xmat, engine = engine, sense = sense, eps = 0.05, cv = cvec)):
+        assert numpy.all(members == numpy.flatnonzero(front == k))
+        nfront += 1
+    assert nfront == front.max() + 1
+
+@pytest.mark.parametrize("engine", ["auto"] + list(ENGINES))
+@pytest.mark.parametrize("kfront,nfill", [(None,None),(2,None),(None,50)])
+def test_ndsort_dedup(engine, kfront, nfill, nobj, nindiv, cvec):
+    if engine == "biobj" and nobj != 2:
+        pytest.skip("biobj requires two objectives")
+    # a converged population: few unique individuals, each repeated many times
+    xmat = numpy.random.random((10,nobj)).round(1)[numpy.random.randint(10, size = nindiv)]
+
+    # expected: sort every individual
+    perm, expected, used = argndsort(xmat, engine = "naive2", kfront = kfront, nfill = nfill)
+
+    uperm, ufront, used = argndsort(xmat, engine = engine, kfront = kfront, nfill = nfill, dedup = True)
+    assert numpy.all(ufront == expected)
+    assert numpy.all(xmat[uperm] == xmat[perm])
+
+    x = xmat.copy()
+    front, used = ndsort(x, engine = engine, kfront = kfront, nfill = nfill, dedup = True)
+    assert numpy.all(front == expected[perm])
+    assert numpy.all(x == xmat[perm])
+
+def test_ndsort_dedup_cv(nobj, nindiv):
+    # identical individuals with different violations are not collapsed
+    xmat = numpy.random.random((10,nobj)).round(1)[numpy.random.randint(10, size = nindiv)]
+    cv = numpy.random.randint(-2, 3, size = nindiv) * 0.5
+    perm, expected, used = argndsort(xmat, engine = "naive2", cv = cv)
+    uperm, ufront, used = argndsort(xmat, cv = cv, dedup = True)
+    assert numpy.all(ufront == expected)
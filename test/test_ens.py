@@ -0,0 +1,101 @@
+import pytest
+import numpy
+import pynds.jit
+from pynds.ens import ndsort_ens_ss
+from pynds.ens import ndsort_ens_bs
+from pynds.ens import argndsort_ens_ss
+from pynds.ens import argndsort_ens_bs
+from pynds.naive import ndsort_naive2
+from pynds.dispatch import argndsort
+
+################################################################################
+################################ Test Fixtures #################################
+################################################################################
+
+@pytest.fixture
+def nindiv():
+    yield 200
+
+@pytest.fixture(params = [1,2,3,5,8])
+def nobj(request):
+    yield request.param
+
+@pytest.fixture
+def xmat(nindiv, nobj):
+    # round to create ties and duplicate rows
+    yield numpy.random.random((nindiv,nobj)).round(1)
+
+@pytest.fixture
+def naive2(xmat, nindiv):
+    x = xmat.copy()
+    front = numpy.empty(nindiv, dtype = int)
+    dom = numpy.empty((nindiv,nindiv), dtype = int)
+    rem = numpy.empty(nindiv, dtype = int)
+    mask = numpy.empty(nindiv, dtype = bool)
+    ndsort_naive2(x, front, dom, rem, mask)
+    yield x, front
+
+################################################################################
+################################## Unit Tests ##################################
+################################################################################
+
+@pytest.mark.parametrize("sorter", [ndsort_ens_ss, ndsort_ens_bs])
+def test_ndsort_ens_matches_ndsort_naive2(sorter, xmat, nindiv, naive2):
+    x = xmat.copy()
+    front = numpy.empty(nindiv, dtype = int)
+    perm = numpy.empty(nindiv, dtype = int)
+    head = numpy.empty(nindiv, dtype = int)
+    link = numpy.empty(nindiv, dtype = int)
+    sorter(x, front, perm, head, link)
+
+    assert numpy.all(front == naive2[1])
+    assert numpy.all(x == naive2[0])
+    assert numpy.all(xmat[perm] == x)
+
+@pytest.mark.parametrize("sorter", [ndsort_ens_ss, ndsort_ens_bs])
+def test_ndsort_ens_without_jit(sorter, xmat, nindiv, naive2, monkeypatch):
+    monkeypatch.setattr(pynds.jit, "JIT_AVAILABLE", False)
+    test_ndsort_ens_matches_ndsort_naive2(sorter, xmat, nindiv, naive2)
+
+@pytest.mark.parametrize("sorter", [argndsort_ens_ss, argndsort_ens_bs])
+def test_argndsort_ens(sorter, xmat, nindiv, naive2):
+    x = xmat.copy()
+    front = numpy.empty(nindiv, dtype = int)
+    perm = numpy.empty(nindiv, dtype = int)
+    sorter(x, front, perm, numpy.empty(nindiv, dtype = int), numpy.empty(nindiv, dtype = int))
+    assert numpy.all(x == xmat)
+    assert numpy.all(x[perm] == naive2[0])
+    assert numpy.all(front[perm] == naive2[1])
+
+@pytest.mark.parametrize("sorter", [argndsort_ens_ss, argndsort_ens_bs])
+def test_argndsort_ens_sense_cv(sorter, xmat, nindiv):
+    # sense and constraint violations are applied without copying x or cv
+    sense = numpy.where(numpy.arange(xmat.shape[1]) % 2 == 0, 1, -1)
+    cv = numpy.random.randint(-2, 3, size = nindiv) * 0.5
+    x = xmat.copy()
+    cvs = cv.copy()
+    front = numpy.empty(nindiv, dtype = int)
+    perm = numpy.empty(nindiv, dtype = int)
+    sorter(x, front, perm, numpy.empty(nindiv, dtype = int), numpy.empty(nindiv, dtype = int), sense = sense, cv = cvs)
+    assert numpy.all(x == xmat)
+    assert numpy.all(cvs == cv)
+
+    eperm, expected, used = argndsort(xmat, engine = "naive2", sense = sense, cv = cv)
+    assert numpy.all(front == expected)
+    assert numpy.all(perm == eperm)
+
+@pytest.mark.parametrize("sorter", [argndsort_ens_ss, argndsort_ens_bs])
+@pytest.mark.parametrize("kfront", [0,1,3])
+def test_argndsort_ens_kfront(sorter, kfront, xmat, nindiv):
+    front = numpy.empty(nindiv, dtype = int)
+    perm = numpy.empty(nindiv, dtype = int)
+    sorter(xmat, front, perm, numpy.empty(nindiv, dtype = int), numpy.empty(nindiv, dtype = int), kfront = kfront)
+    eperm, expected, used = argndsort(xmat, engine = "naive2", kfront = kfront)
+    assert numpy.all(front == expected)
+    # duplicate rows may be permuted within fronts
+    assert numpy.all(xmat[perm] == xmat[eperm])
+
+@pytest.mark.parametrize("kfront", [1,3])
+def test_argndsort_ens_kfront_without_jit(kfront, xmat, nindiv, monkeypatch):
+    monkeypatch.setattr(pynds.jit, "JIT_AVAILABLE", False)
+    test_argndsort_ens_kfront(argndsort_ens_ss, kfront, xmat, nindiv)
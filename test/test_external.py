@@ -0,0 +1,95 @@
+import os
+import pytest
+import numpy
+from pynds.external import argndsort_external
+from pynds.external import external_argsort
+from pynds.external import external_fronts
+from pynds.presort import argpresort
+from pynds.presort import presort_matrix
+from pynds.naive import argndsort_naive2
+
+################################################################################
+################################ Test Fixtures #################################
+################################################################################
+
+@pytest.fixture(params = [0,1,500])
+def nindiv(request):
+    yield request.param
+
+@pytest.fixture(params = [1,2,3,5])
+def nobj(request):
+    yield request.param
+
+@pytest.fixture
+def xmat(nindiv, nobj):
+    # round to create ties and duplicate rows
+    yield numpy.random.random((nindiv,nobj)).round(1)
+
+@pytest.fixture
+def xmap(xmat, tmp_path):
+    # matrix stored in a ``.npy`` file and memory-mapped read-only
+    filename = os.path.join(str(tmp_path), "x.npy")
+    numpy.save(filename, xmat)
+    yield numpy.load(filename, mmap_mode = "r")
+
+def naive2(x):
+    # sorting permutation and fronts
+    nindiv = x.shape[0]
+    front = numpy.empty(nindiv, dtype = int)
+    perm = numpy.empty(nindiv, dtype = int)
+    dom = numpy.empty((nindiv,nindiv), dtype = int)
+    rem = numpy.empty(nindiv, dtype = int)
+    mask = numpy.empty(nindiv, dtype = bool)
+    argndsort_naive2(x, front, perm, dom, rem, mask)
+    return perm, front
+
+################################################################################
+################################## Unit Tests ##################################
+################################################################################
+
+@pytest.mark.parametrize("chunksize", [5,64,1000])
+def test_external_argsort(chunksize, xmat, xmap, tmp_path):
+    perm = numpy.empty(len(xmat), dtype = int)
+    xout = numpy.empty(xmat.shape, dtype = xmat.dtype)
+    external_argsort(xmap, perm, str(tmp_path), xout = xout, chunksize = chunksize)
+    # external merge sort is stable, as is lexsort
+    assert numpy.all(perm == argpresort(xmat))
+    assert numpy.all(xout == xmat[perm])
+    # runs are deleted
+    assert os.listdir(str(tmp_path)) == ["x.npy"]
+
+@pytest.mark.parametrize("blksize", [3,16,1000])
+def test_external_fronts(blksize, xmat):
+    xs = presort_matrix(xmat.copy())
+    front = numpy.empty(len(xs), dtype = int)
+    external_fronts(xs, front, blksize)
+    assert numpy.all(front == naive2(xs)[1])
+
+@pytest.mark.parametrize("chunksize,blksize", [(13,8),(1000,1000)])
+def test_argndsort_external(chunksize, blksize, xmat, xmap, tmp_path):
+    front = numpy.empty(len(xmat), dtype = int)
+    perm = numpy.empty(len(xmat), dtype = int)
+    argndsort_external(xmap, front, perm, tmpdir = str(tmp_path), chunksize = chunksize, blksize = blksize)
+    eperm, efront = naive2(xmat)
+    assert numpy.all(front == efront)
+    assert numpy.all(perm == eperm)
+    # spilled arrays are deleted
+    assert os.listdir(str(tmp_path)) == ["x.npy"]
+
+def test_argndsort_external_memmap_output(tmp_path):
+    # outputs may also be memory-mapped
+    xmat = numpy.random.random((200,3)).round(1)
+    front = numpy.lib.format.open_memmap(os.path.join(str(tmp_path), "front.npy"), mode = "w+", dtype = numpy.int64, shape = (200,))
+    argndsort_external(xmat, front, tmpdir = str(tmp_path), chunksize = 50, blksize = 32)
+    assert numpy.all(front == naive2(xmat)[1])
+
+def test_argndsort_external_ValueError(tmp_path):
+    xmat = numpy.random.random((10,2))
+    with pytest.raises(ValueError):
+        argndsort_external(xmat, numpy.empty(9, dtype = int))
+    with pytest.raises(ValueError):
+        argndsort_external(xmat, numpy.empty(10, dtype = int), numpy.empty(9, dtype = int))
+    with pytest.raises(ValueError):
+        argndsort_external(xmat, numpy.empty(10, dtype = int), chunksize = 0)
+    with pytest.raises(ValueError):
+        argndsort_external(xmat, numpy.empty(10, dtype = int), blksize = 0)
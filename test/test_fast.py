@@ -0,0 +1,78 @@
+import pytest
+import numpy
+import pynds.fast
+from pynds.fast import ndsort_fast
+from pynds.naive import ndsort_naive2
+
+################################################################################
+################################ Test Fixtures #################################
+################################################################################
+
+@pytest.fixture
+def nindiv():
+    yield 200
+
+@pytest.fixture(params = [1,2,3,5])
+def nobj(request):
+    yield request.param
+
+@pytest.fixture
+def xmat(nindiv, nobj):
+    # round to create ties and duplicate rows
+    yield numpy.random.random((nindiv,nobj)).round(1)
+
+################################################################################
+################################## Unit Tests ##################################
+################################################################################
+
+def test_ndsort_fast_matches_ndsort_naive2(xmat, nindiv):
+    x1 = xmat.copy()
+    front1 = numpy.empty(nindiv, dtype = int)
+    dom = numpy.empty((nindiv,nindiv), dtype = int)
+    cnt = numpy.empty(nindiv, dtype = int)
+    rem = numpy.empty(nindiv, dtype = int)
+    ndsort_fast(x1, front1, dom, cnt, rem)
+
+    x2 = xmat.copy()
+    front2 = numpy.empty(nindiv, dtype = int)
+    mask = numpy.empty(nindiv, dtype = bool)
+    ndsort_naive2(x2, front2, dom, rem, mask)
+
+    assert numpy.all(front1 == front2)
+    assert numpy.all(x1 == x2)
+
+def test_ndsort_fast_n_jobs(xmat, nindiv):
+    x1 = xmat.copy()
+    front1 = numpy.empty(nindiv, dtype = int)
+    dom = numpy.empty((nindiv,nindiv), dtype = int)
+    cnt = numpy.empty(nindiv, dtype = int)
+    rem = numpy.empty(nindiv, dtype = int)
+    ndsort_fast(x1, front1, dom, cnt, rem)
+
+    x2 = xmat.copy()
+    front2 = numpy.empty(nindiv, dtype = int)
+    ndsort_fast(x2, front2, dom, cnt, rem, n_jobs = 4)
+
+    assert numpy.all(front1 == front2)
+    assert numpy.all(x1 == x2)
+
+def test_ndsort_fast_bounded_peel(xmat, nindiv, monkeypatch):
+    # gather one front member's row at a time
+    monkeypatch.setattr(pynds.fast, "BLOCK_NELEM", 1)
+    x1 = xmat.copy()
+    front1 = numpy.empty(nindiv, dtype = int)
+    dom = numpy.empty((nindiv,nindiv), dtype = int)
+    ndsort_fast(x1, front1, dom, numpy.empty(nindiv, dtype = int), numpy.empty(nindiv, dtype = int))
+
+    x2 = xmat.copy()
+    front2 = numpy.empty(nindiv, dtype = int)
+    ndsort_naive2(x2, front2, dom, numpy.empty(nindiv, dtype = int), numpy.empty(nindiv, dtype = bool))
+
+    assert numpy.all(front1 == front2)
+    assert numpy.all(x1 == x2)
+
+def test_ndsort_fast_empty():
+    x = numpy.empty((0,3), dtype = float)
+    front = numpy.empty(0, dtype = int)
+    ndsort_fast(x, front, numpy.empty((0,0), dtype = int), numpy.empty(0, dtype = int), numpy.empty(0, dtype = int))
+    assert front.shape == (0,)
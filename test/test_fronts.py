@@ -0,0 +1,91 @@
+import pytest
+import numpy
+from pynds.fronts import Fronts
+from pynds.presort import UNASSIGNED
+from pynds.naive import ndsort_naive
+from pynds.naive import ndsort_naive1
+from pynds.naive import ndsort_naive2
+from pynds.naive import argndsort_naive
+from pynds.naive import argndsort_naive1
+from pynds.naive import argndsort_naive2
+
+################################################################################
+################################ Test Fixtures #################################
+################################################################################
+
+@pytest.fixture
+def nindiv():
+    yield 60
+
+@pytest.fixture(params = [2,3])
+def nobj(request):
+    yield request.param
+
+@pytest.fixture
+def xmat(nindiv, nobj):
+    # round to create ties and duplicate rows
+    yield numpy.random.random((nindiv,nobj)).round(1)
+
+@pytest.fixture
+def workspaces(nindiv):
+    dom = numpy.empty((nindiv,nindiv), dtype = int)
+    rem = numpy.empty(nindiv, dtype = int)
+    mask = numpy.empty(nindiv, dtype = bool)
+    yield dom, rem, mask
+
+def check_fronts(fronts, front):
+    # fronts match front assignments in input order
+    assert fronts.nindiv == len(front)
+    assert numpy.all(fronts.labels() == front)
+    assert numpy.all(fronts.sizes == numpy.bincount(front[front != UNASSIGNED], minlength = fronts.nfront))
+    for k, members in enumerate(fronts):
+        assert numpy.all(front[members] == k)
+        assert numpy.shares_memory(members, fronts.perm)
+    assert numpy.all(front[fronts.unassigned] == UNASSIGNED)
+
+################################################################################
+################################## Unit Tests ##################################
+################################################################################
+
+def test_Fronts_from_labels():
+    front = numpy.array([2,0,UNASSIGNED,1,0,2])
+    fronts = Fronts.from_labels(front)
+    assert len(fronts) == 3
+    assert numpy.all(fronts.offsets == [0,2,3,5])
+    assert numpy.all(fronts[0] == [1,4])
+    assert numpy.all(fronts[-1] == [0,5])
+    assert numpy.all(fronts.unassigned == [2])
+    assert fronts.span(1) == slice(2,3)
+    check_fronts(fronts, front)
+    with pytest.raises(IndexError):
+        fronts[3]
+
+def test_Fronts_ValueError():
+    with pytest.raises(ValueError):
+        Fronts(numpy.arange(3), numpy.array([1,3]))
+    with pytest.raises(ValueError):
+        Fronts(numpy.arange(3), numpy.array([0,4]))
+
+def test_ndsort_naive_fronts(xmat, nindiv, workspaces):
+    dom, rem, mask = workspaces
+    front = numpy.empty(nindiv, dtype = int)
+
+    # in-place sorters: fronts hold input row indices, spans hold sorted rows
+    for sort, args in [(ndsort_naive1, (rem, mask)), (ndsort_naive2, (dom, rem, mask))]:
+        x = xmat.copy()
+        fronts = sort(x, front, *args)
+        assert numpy.all(xmat[fronts.perm] == x)
+        for k in range(fronts.nfront):
+            assert numpy.all(front[fronts.span(k)] == k)
+            assert numpy.all(xmat[fronts[k]] == x[fronts.span(k)])
+
+    x = xmat.copy()
+    out, fronts = ndsort_naive(x, front, return_fronts = True, kfront = 2)
+    assert numpy.all(xmat[fronts.perm] == out)
+    assert fronts.nfront == 2
+
+    # argsort variants: fronts hold row indices
+    perm = numpy.empty(nindiv, dtype = int)
+    for sort, args in [(argndsort_naive, ()), (argndsort_naive1, (rem, mask)), (argndsort_naive2, (dom, rem, mask))]:
+        fronts = sort(xmat, front, perm, *args, nfill = nindiv // 2)
+        check_fronts(fronts, front)
@@ -0,0 +1,117 @@
+import pytest
+import numpy
+from pynds.incremental import IncrementalSorter
+from pynds.jensen import ndsort_jensen
+
+################################################################################
+################################ Test Fixtures #################################
+################################################################################
+
+@pytest.fixture(params = [1,10,100])
+def nindiv(request):
+    yield request.param
+
+@pytest.fixture(params = [1,2,3,4])
+def nobj(request):
+    yield request.param
+
+@pytest.fixture
+def xmat(nindiv, nobj):
+    # round to create ties and duplicate rows
+    yield numpy.random.random((nindiv,nobj)).round(1)
+
+def expected_front(x, sense = None, cv = None):
+    # front assignments in input order
+    nindiv = x.shape[0]
+    xs = x.copy()
+    cvs = None if cv is None else cv.copy()
+    front = numpy.empty(nindiv, dtype = int)
+    perm = numpy.empty(nindiv, dtype = int)
+    ndsort_jensen(xs, front, perm, sense = sense, cv = cvs)
+    out = numpy.empty(nindiv, dtype = int)
+    out[perm] = front
+    return out
+
+################################################################################
+################################## Unit Tests ##################################
+################################################################################
+
+def test_IncrementalSorter_insert(xmat, nindiv, nobj):
+    sorter = IncrementalSorter(nobj, capacity = 4)
+    # insert in several batches
+    for chunk in numpy.array_split(xmat, 3):
+        sorter.insert(chunk)
+    assert len(sorter) == nindiv
+    assert numpy.all(sorter.x == xmat)
+    front = expected_front(xmat)
+    assert numpy.all(sorter.front == front)
+    assert numpy.all(sorter.front_counts == numpy.bincount(front))
+    assert sorter.nfront == front.max() + 1
+
+def test_IncrementalSorter_remove(xmat, nindiv, nobj):
+    sorter = IncrementalSorter(nobj)
+    ids = sorter.insert(xmat)
+    # remove half of the individuals, then reinsert some
+    removed = ids[::2]
+    sorter.remove(removed)
+    keep = numpy.setdiff1d(ids, removed)
+    assert numpy.all(sorter.ids == keep)
+    assert numpy.all(sorter.front == expected_front(xmat[keep]))
+    new = sorter.insert(xmat[removed[::2]])
+    assert numpy.all(numpy.isin(new, removed))
+    x = sorter.x
+    front = expected_front(x)
+    assert numpy.all(sorter.front == front)
+    assert numpy.all(sorter.get_front(sorter.ids) == front)
+    assert numpy.all(sorter.front_counts == numpy.bincount(front, minlength = 0))
+
+def test_IncrementalSorter_sense_cv(xmat, nindiv, nobj):
+    sense = numpy.where(numpy.arange(nobj) % 2 == 0, -1, 1)
+    cv = numpy.random.randint(-2, 3, size = nindiv) * 0.5
+    sorter = IncrementalSorter(nobj, capacity = 4, sense = sense)
+    for chunk, cvchunk in zip(numpy.array_split(xmat, 3), numpy.array_split(cv, 3)):
+        sorter.insert(chunk, cvchunk)
+    assert numpy.all(sorter.cv == cv)
+    assert numpy.all(sorter.front == expected_front(xmat, sense, cv))
+    # remove individuals, then reinsert them as feasible
+    removed = sorter.ids[::3]
+    sorter.remove(removed)
+    keep = numpy.setdiff1d(numpy.arange(nindiv), removed)
+    assert numpy.all(sorter.front == expected_front(xmat[keep], sense, cv[keep]))
+    sorter.insert(xmat[removed])
+    cv2 = cv.copy()
+    cv2[removed] = 0
+    assert numpy.all(sorter.front == expected_front(xmat, sense, cv2))
+
+def test_IncrementalSorter_remove_all(xmat, nindiv, nobj):
+    sorter = IncrementalSorter(nobj)
+    ids = sorter.insert(xmat)
+    sorter.remove(ids)
+    assert len(sorter) == 0
+    assert sorter.nfront == 0
+    with pytest.raises(KeyError):
+        sorter.remove(ids[:1])
+
+def test_IncrementalSorter_KeyError(xmat, nindiv, nobj):
+    # storage is exactly full
+    capacity = nindiv
+    sorter = IncrementalSorter(nobj, capacity = capacity)
+    sorter.insert(xmat)
+    # negative ids and ids beyond storage do not refer to individuals
+    for ids in ([-1], [capacity], [0,capacity+5], [-capacity]):
+        with pytest.raises(KeyError):
+            sorter.get_front(ids)
+        with pytest.raises(KeyError):
+            sorter.remove(ids)
+    # failed removals leave the sorter unchanged
+    assert len(sorter) == nindiv
+    assert numpy.all(sorter.front == expected_front(xmat))
+
+def test_IncrementalSorter_ValueError(nobj):
+    sorter = IncrementalSorter(nobj)
+    with pytest.raises(ValueError):
+        sorter.insert(numpy.random.random((3,nobj+1)))
+    with pytest.raises(ValueError):
+        sorter.insert(numpy.random.random((3,nobj)), numpy.zeros(2))
+    with pytest.raises(ValueError):
+        IncrementalSorter(nobj, sense = numpy.ones(nobj+1))
@@ -0,0 +1,77 @@
+import pytest
+import numpy
+from pynds.jensen import ndsort_jensen
+from pynds.jensen import argndsort_jensen
+from pynds.naive import ndsort_naive2
+from pynds.dispatch import argndsort
+
+################################################################################
+################################ Test Fixtures #################################
+################################################################################
+
+@pytest.fixture(params = [1,10,300])
+def nindiv(request):
+    yield request.param
+
+@pytest.fixture(params = [1,2,3,4,5])
+def nobj(request):
+    yield request.param
+
+@pytest.fixture(params = [1,2])
+def ndecimal(request):
+    yield request.param
+
+@pytest.fixture
+def xmat(nindiv, nobj, ndecimal):
+    # round to create ties and duplicate rows
+    yield numpy.random.random((nindiv,nobj)).round(ndecimal)
+
+################################################################################
+################################## Unit Tests ##################################
+################################################################################
+
+def test_ndsort_jensen_matches_ndsort_naive2(xmat, nindiv):
+    x1 = xmat.copy()
+    front1 = numpy.empty(nindiv, dtype = int)
+    perm = numpy.empty(nindiv, dtype = int)
+    ndsort_jensen(x1, front1, perm)
+
+    x2 = xmat.copy()
+    front2 = numpy.empty(nindiv, dtype = int)
+    dom = numpy.empty((nindiv,nindiv), dtype = int)
+    rem = numpy.empty(nindiv, dtype = int)
+    mask = numpy.empty(nindiv, dtype = bool)
+    ndsort_naive2(x2, front2, dom, rem, mask)
+
+    assert numpy.all(front1 == front2)
+    assert numpy.all(x1 == x2)
+    assert numpy.all(xmat[perm] == x1)
+
+def test_argndsort_jensen(xmat, nindiv):
+    x = xmat.copy()
+    front = numpy.empty(nindiv, dtype = int)
+    perm = numpy.empty(nindiv, dtype = int)
+    argndsort_jensen(x, front, perm)
+    assert numpy.all(x == xmat)
+
+    x1 = xmat.copy()
+    front1 = numpy.empty(nindiv, dtype = int)
+    ndsort_jensen(x1, front1, numpy.empty(nindiv, dtype = int))
+    assert numpy.all(x[perm] == x1)
+    assert numpy.all(front[perm] == front1)
+
+def test_argndsort_jensen_sense_cv(xmat, nindiv):
+    # sense and constraint violations are applied without copying x or cv
+    sense = numpy.where(numpy.arange(xmat.shape[1]) % 2 == 0, 1, -1)
+    cv = numpy.random.randint(-2, 3, size = nindiv) * 0.5
+    x = xmat.copy()
+    cvs = cv.copy()
+    front = numpy.empty(nindiv, dtype = int)
+    perm = numpy.empty(nindiv, dtype = int)
+    argndsort_jensen(x, front, perm, sense = sense, cv = cvs)
+    assert numpy.all(x == xmat)
+    assert numpy.all(cvs == cv)
+
+    eperm, expected, used = argndsort(xmat, engine = "naive2", sense = sense, cv = cv)
+    assert numpy.all(front == expected)
+    assert numpy.all(perm == eperm)
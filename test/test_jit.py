@@ -0,0 +1,130 @@
+import pytest
+import numpy
+import pynds.jit
+from pynds.jit import NO_LIMIT
+from pynds.jit import jit_limit
+from pynds.jit import jit_supported
+from pynds.jit import dominance_relationship_kernel
+from pynds.jit import assign_naive1_kernel
+from pynds.jit import assign_naive2_kernel
+from pynds.jit import assign_biobj_kernel
+from pynds.jit import assign_ens_kernel
+from pynds.ens import ens_sweep
+from pynds.presort import argpresort
+from pynds.biobj import ndsort_biobj_sweep
+from pynds.relation import dominance_relationship
+from pynds.relation import dominance_relationship_matrix
+from pynds.naive import assign_naive1
+from pynds.naive import assign_naive2
+from pynds.naive import ndsort_naive2
+from pynds.presort import UNASSIGNED
+
+################################################################################
+################################ Test Fixtures #################################
+################################################################################
+
+@pytest.fixture(params = [1,2,3,5])
+def nobj(request):
+    yield request.param
+
+@pytest.fixture(params = [float,int])
+def xmat(request, nobj):
+    # round to create ties and duplicate rows
+    yield (numpy.random.random((200,nobj)) * 10).round().astype(request.param)
+
+@pytest.fixture(params = [(None,None),(2,None),(None,50),(0,None)])
+def limits(request):
+    yield request.param
+
+def run_numpy(func, *args, **kwargs):
+    # run a function with compiled kernels disabled
+    saved = pynds.jit.JIT_AVAILABLE
+    pynds.jit.JIT_AVAILABLE = False
+    try:
+        func(*args, **kwargs)
+    finally:
+        pynds.jit.JIT_AVAILABLE = saved
+
+################################################################################
+################################## Unit Tests ##################################
+################################################################################
+
+def test_jit_limit():
+    assert jit_limit(None) == NO_LIMIT
+    assert jit_limit(0) == 0
+    assert jit_limit(3) == 3
+
+def test_jit_supported(xmat, nobj):
+    assert jit_supported(xmat) == pynds.jit.JIT_AVAILABLE
+    assert not jit_supported(xmat, sense = numpy.ones(nobj))
+    assert not jit_supported(xmat, eps = 0.1)
+    assert not jit_supported(xmat, cv = numpy.zeros(len(xmat)))
+    assert not jit_supported(xmat.astype(object))
+
+def test_dominance_relationship_kernel(xmat):
+    for func in (dominance_relationship_kernel, dominance_relationship_kernel.py_func):
+        for i in range(20):
+            for j in range(20):
+                assert func(xmat[i], xmat[j]) == dominance_relationship(xmat[i], xmat[j])
+
+@pytest.mark.parametrize("compiled", [True,False])
+def test_assign_naive1_kernel(compiled, xmat, limits):
+    kfront, nfill = limits
+    n = len(xmat)
+    kernel = assign_naive1_kernel if compiled else assign_naive1_kernel.py_func
+    front = numpy.empty(n, dtype = int)
+    kernel(xmat, front, numpy.empty(n, dtype = int), numpy.empty(n, dtype = bool), jit_limit(kfront), jit_limit(nfill))
+    expected = numpy.empty(n, dtype = int)
+    run_numpy(assign_naive1, xmat, expected, numpy.empty(n, dtype = int), numpy.empty(n, dtype = bool), kfront = kfront, nfill = nfill)
+    assert numpy.all(front == expected)
+
+@pytest.mark.parametrize("compiled", [True,False])
+def test_assign_naive2_kernel(compiled, xmat, limits):
+    kfront, nfill = limits
+    n = len(xmat)
+    kernel = assign_naive2_kernel if compiled else assign_naive2_kernel.py_func
+    dom = numpy.empty((n,n), dtype = numpy.int8)
+    dominance_relationship_matrix(xmat, dom)
+    front = numpy.empty(n, dtype = int)
+    kernel(dom, front, numpy.empty(n, dtype = int), numpy.empty(n, dtype = bool), jit_limit(kfront), jit_limit(nfill))
+    expected = numpy.empty(n, dtype = int)
+    run_numpy(assign_naive2, xmat, expected, dom, numpy.empty(n, dtype = int), numpy.empty(n, dtype = bool), kfront = kfront, nfill = nfill)
+    assert numpy.all(front == expected)
+    assert numpy.all(front[front != UNASSIGNED] >= 0)
+
+@pytest.mark.parametrize("compiled", [True,False])
+def test_assign_biobj_kernel(compiled):
+    kernel = assign_biobj_kernel if compiled else assign_biobj_kernel.py_func
+    key = numpy.random.randint(0, 50, 300).astype(numpy.int64)
+    front = numpy.empty(300, dtype = numpy.int64)
+    nfront = kernel(key, front, numpy.empty(300, dtype = numpy.int64))
+    expected = ndsort_biobj_sweep(key.tolist())
+    assert numpy.all(front == expected)
+    assert nfront == max(expected) + 1
+
+@pytest.mark.parametrize("compiled", [True,False])
+@pytest.mark.parametrize("binary", [True,False])
+@pytest.mark.parametrize("kfront", [None,0,2])
+def test_assign_ens_kernel(compiled, binary, kfront, xmat):
+    n = len(xmat)
+    kernel = assign_ens_kernel if compiled else assign_ens_kernel.py_func
+    ix = argpresort(xmat)
+    front = numpy.empty(n, dtype = int)
+    ncompare = kernel(xmat, ix, front, numpy.empty(n, dtype = int), numpy.empty(n, dtype = int), binary, jit_limit(kfront))
+    expected = numpy.empty(n, dtype = int)
+    ens_sweep(xmat, ix, expected, binary, kfront = kfront)
+    assert numpy.all(front == expected)
+    assert ncompare > 0 or n < 2 or kfront == 0
+
+def test_assign_naive_jit_parity(xmat):
+    # sorters give identical results with and without compiled kernels
+    pytest.importorskip("numba")
+    n = len(xmat)
+    x1 = xmat.copy()
+    front1 = numpy.empty(n, dtype = int)
+    ndsort_naive2(x1, front1, numpy.empty((n,n), dtype = numpy.int8), numpy.empty(n, dtype = int), numpy.empty(n, dtype = bool))
+    x2 = xmat.copy()
+    front2 = numpy.empty(n, dtype = int)
+    run_numpy(ndsort_naive2, x2, front2, numpy.empty((n,n), dtype = numpy.int8), numpy.empty(n, dtype = int), numpy.empty(n, dtype = bool))
+    assert numpy.all(x1 == x2)
+    assert numpy.all(front1 == front2)
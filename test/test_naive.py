@@ -4,6 +4,9 @@ from pynds.naive import krange
 from pynds.naive import ndsort_naive
 from pynds.naive import ndsort_naive1
 from pynds.naive import ndsort_naive2
+from pynds.naive import argndsort_naive
+from pynds.naive import argndsort_naive1
+from pynds.naive import argndsort_naive2
 from matplotlib import pyplot
 from pynds.relation import dominance_relationship
 
@@ -177,3 +180,17 @@ def test_ndsort_naive2(xmat, rankvec, dommat, remvec, maskvec):
     pyplot.scatter(xmat[:,0], xmat[:,1], c=rankvec, cmap='tab20')
     pyplot.savefig("test_naive2.png")
     pyplot.close()
+
+def test_argndsort_naive(xmat, rankvec, dommat, remvec, maskvec):
+    x = xmat.copy()
+    ndsort_naive2(x, rankvec, dommat, remvec, maskvec)
+
+    # each variant leaves the input untouched and matches the in-place sort
+    perm = numpy.empty(len(xmat), dtype = int)
+    front = numpy.empty(len(xmat), dtype = int)
+    for argndsort, args in [(argndsort_naive, ()), (argndsort_naive1, (remvec, maskvec)), (argndsort_naive2, (dommat, remvec, maskvec))]:
+        xin = xmat.copy()
+        argndsort(xin, front, perm, *args)
+        assert numpy.all(xin == xmat)
+        assert numpy.all(xmat[perm] == x)
+        assert numpy.all(front[perm] == rankvec)
@@ -1,6 +1,11 @@
 import pytest
 import numpy
+from pynds.presort import argpresort
 from pynds.presort import presort_matrix
+from pynds.presort import argfrontsort
+from pynds.presort import presort_runs
+from pynds.presort import unique_rows
+from pynds.presort import UNASSIGNED
 
 ################
 ### Fixtures ###
@@ -40,3 +45,41 @@ def test_presort_matrix_inplace_False(xmat, xmat_sorted):
     assert id(out) != id(xmat)
     assert numpy.all(out == xmat_sorted)
     assert numpy.all(xmat == tmp)
+
+def test_argpresort(xmat, xmat_sorted):
+    tmp = xmat.copy()
+    ix = argpresort(xmat)
+    assert numpy.all(xmat[ix] == xmat_sorted)
+    assert numpy.all(xmat == tmp)
+
+def test_argfrontsort_unassigned(xmat, nsoln):
+    front = numpy.random.randint(-1, 3, nsoln)
+    ix = argfrontsort(xmat, front)
+    nassigned = numpy.sum(front != UNASSIGNED)
+    # assigned individuals are sorted by front, then by objectives
+    sel = numpy.flatnonzero(front != UNASSIGNED)
+    keys = tuple(xmat[sel,i] for i in range(xmat.shape[1]))[::-1] + (front[sel],)
+    assert numpy.all(ix[:nassigned] == sel[numpy.lexsort(keys)])
+    # unassigned individuals are last, in original order
+    assert numpy.all(ix[nassigned:] == numpy.flatnonzero(front == UNASSIGNED))
+
+def test_presort_runs(xmat, xmat_sorted):
+    # few unique rows, so that runs are long
+    x = xmat[numpy.random.randint(10, size = len(xmat))]
+    ix, new = presort_runs(x)
+    assert numpy.all(x[ix] == numpy.unique(x, axis = 0)[numpy.cumsum(new) - 1])
+
+def test_unique_rows(xmat):
+    x = xmat[numpy.random.randint(10, size = len(xmat))]
+    first, inverse = unique_rows(x)
+    assert len(first) == len(numpy.unique(x, axis = 0))
+    assert numpy.all(x[first][inverse] == x)
+
+def test_unique_rows_cv(xmat):
+    x = xmat[numpy.zeros(len(xmat), dtype = int)]
+    # feasible violations are all identical
+    cv = numpy.array([-1.0, 0.0, 0.5, 0.5, 1.0] * (len(xmat) // 5))
+    first, inverse = unique_rows(x, cv)
+    assert len(first) == 3
+    assert numpy.all(numpy.maximum(cv[first][inverse], 0) == numpy.maximum(cv, 0))
+
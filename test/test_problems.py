@@ -0,0 +1,66 @@
+import pytest
+import numpy
+from pynds.problems import PROBLEMS
+from pynds.problems import problem_single_front
+from pynds.problems import problem_many_fronts
+from pynds.problems import problem_duplicates
+from pynds.problems import problem_integer
+from pynds.naive import argndsort_naive2
+
+################################################################################
+################################ Test Fixtures #################################
+################################################################################
+
+@pytest.fixture(params = [1,2,3,5])
+def nobj(request):
+    yield request.param
+
+@pytest.fixture(params = list(PROBLEMS))
+def problem(request):
+    yield request.param
+
+def fronts(x):
+    # front assignments in the order of the rows of x
+    n = len(x)
+    front = numpy.empty(n, dtype = int)
+    perm = numpy.empty(n, dtype = int)
+    argndsort_naive2(x, front, perm, numpy.empty((n,n), dtype = numpy.int8), numpy.empty(n, dtype = int), numpy.empty(n, dtype = bool))
+    return front
+
+################################################################################
+################################## Unit Tests ##################################
+################################################################################
+
+@pytest.mark.parametrize("nindiv", [0,1,100])
+def test_problem_shape(problem, nindiv, nobj):
+    x = PROBLEMS[problem](nindiv, nobj, 0)
+    assert x.shape == (nindiv,nobj)
+    assert x.dtype.kind in "if"
+    assert numpy.all(numpy.isfinite(x))
+
+def test_problem_seed(problem, nobj):
+    x1 = PROBLEMS[problem](100, nobj, 42)
+    x2 = PROBLEMS[problem](100, nobj, numpy.random.default_rng(42))
+    assert numpy.all(x1 == x2)
+
+def test_problem_single_front(nobj):
+    x = problem_single_front(200, nobj, 0)
+    assert numpy.all(fronts(x) == 0)
+
+@pytest.mark.parametrize("size", [1,4,7])
+def test_problem_many_fronts(size, nobj):
+    x = problem_many_fronts(200, nobj, 0, size = size)
+    front = fronts(x)
+    assert front.max() + 1 == -(-200 // size)
+    assert numpy.all(numpy.bincount(front)[:-1] == size)
+
+@pytest.mark.parametrize("nunique", [None,1,10])
+def test_problem_duplicates(nunique, nobj):
+    x = problem_duplicates(400, nobj, 0, nunique = nunique)
+    expected = 20 if nunique is None else nunique
+    assert len(numpy.unique(x, axis = 0)) <= expected
+
+def test_problem_integer(nobj):
+    x = problem_integer(400, nobj, 0, nlevel = 3)
+    assert x.dtype.kind == "i"
+    assert numpy.all((x >= 0) & (x < 3))
@@ -1,7 +1,11 @@
 import pytest
 import numpy
 from pynds.relation import dominance_relationship
-# from pynds.relation import maximizing_dominance_relationship
+from pynds.relation import dominance_relationship_matrix
+from pynds.relation import dominated_by_any
+from pynds.relation import relation_options
+from pynds.relation import block_size
+from pynds.relation import BLOCK_NELEM
 
 def test_minimizing_dominance_relationship_1d():
     # x dominates y
@@ -93,86 +97,216 @@ def test_minimizing_dominance_relationship_3d():
     y = numpy.array([0.0, 0.0, 1.0], dtype = float)
     assert dominance_relationship(x, y) == 1
 
-# def test_maximizing_dominance_relationship_1d():
-#     # x dominates y
-#     x = numpy.array([0.0], dtype = float)
-#     y = numpy.array([1.0], dtype = float)
-#     assert maximizing_dominance_relationship(x, y) == minimizing_dominance_relationship(-x, -y)
-
-#     # x is nondominated by y
-#     x = numpy.array([0.0], dtype = float)
-#     y = numpy.array([0.0], dtype = float)
-#     assert maximizing_dominance_relationship(x, y) == minimizing_dominance_relationship(-x, -y)
-
-#     # x is dominated by y
-#     x = numpy.array([1.0], dtype = float)
-#     y = numpy.array([0.0], dtype = float)
-#     assert maximizing_dominance_relationship(x, y) == minimizing_dominance_relationship(-x, -y)
-
-# def test_maximizing_dominance_relationship_2d():
-#     # x dominates y
-#     x = numpy.array([0.0, 0.0], dtype = float)
-#     y = numpy.array([1.0, 1.0], dtype = float)
-#     assert maximizing_dominance_relationship(x, y) == minimizing_dominance_relationship(-x, -y)
-#     x = numpy.array([1.0, 0.0], dtype = float)
-#     y = numpy.array([1.0, 1.0], dtype = float)
-#     assert maximizing_dominance_relationship(x, y) == minimizing_dominance_relationship(-x, -y)
-
-#     # x is nondominated by y
-#     x = numpy.array([0.0, 0.0], dtype = float)
-#     y = numpy.array([0.0, 0.0], dtype = float)
-#     assert maximizing_dominance_relationship(x, y) == minimizing_dominance_relationship(-x, -y)
-#     x = numpy.array([1.0, 0.0], dtype = float)
-#     y = numpy.array([0.0, 1.0], dtype = float)
-#     assert maximizing_dominance_relationship(x, y) == minimizing_dominance_relationship(-x, -y)
-#     x = numpy.array([0.0, 1.0], dtype = float)
-#     y = numpy.array([1.0, 0.0], dtype = float)
-#     assert maximizing_dominance_relationship(x, y) == minimizing_dominance_relationship(-x, -y)
-
-#     # x is dominated by y
-#     x = numpy.array([1.0, 1.0], dtype = float)
-#     y = numpy.array([0.0, 0.0], dtype = float)
-#     assert maximizing_dominance_relationship(x, y) == minimizing_dominance_relationship(-x, -y)
-#     x = numpy.array([1.0, 1.0], dtype = float)
-#     y = numpy.array([0.0, 1.0], dtype = float)
-#     assert maximizing_dominance_relationship(x, y) == minimizing_dominance_relationship(-x, -y)
-
-# def test_maximizing_dominance_relationship_3d():
-#     # x dominates y
-#     x = numpy.array([0.0, 0.0, 0.0], dtype = float)
-#     y = numpy.array([1.0, 1.0, 1.0], dtype = float)
-#     assert maximizing_dominance_relationship(x, y) == minimizing_dominance_relationship(-x, -y)
-#     x = numpy.array([1.0, 0.0, 0.0], dtype = float)
-#     y = numpy.array([1.0, 1.0, 1.0], dtype = float)
-#     assert maximizing_dominance_relationship(x, y) == minimizing_dominance_relationship(-x, -y)
-#     x = numpy.array([0.0, 1.0, 0.0], dtype = float)
-#     y = numpy.array([1.0, 1.0, 1.0], dtype = float)
-#     assert maximizing_dominance_relationship(x, y) == minimizing_dominance_relationship(-x, -y)
-#     x = numpy.array([0.0, 0.0, 1.0], dtype = float)
-#     y = numpy.array([1.0, 1.0, 1.0], dtype = float)
-#     assert maximizing_dominance_relationship(x, y) == minimizing_dominance_relationship(-x, -y)
-
-#     # x is nondominated by y
-#     x = numpy.array([1.0, 0.0, 0.0], dtype = float)
-#     y = numpy.array([0.0, 1.0, 1.0], dtype = float)
-#     assert maximizing_dominance_relationship(x, y) == minimizing_dominance_relationship(-x, -y)
-#     x = numpy.array([0.0, 1.0, 0.0], dtype = float)
-#     y = numpy.array([1.0, 0.0, 1.0], dtype = float)
-#     assert maximizing_dominance_relationship(x, y) == minimizing_dominance_relationship(-x, -y)
-#     x = numpy.array([0.0, 0.0, 1.0], dtype = float)
-#     y = numpy.array([1.0, 1.0, 0.0], dtype = float)
-#     assert maximizing_dominance_relationship(x, y) == minimizing_dominance_relationship(-x, -y)
-
-#     # x is dominated by y
-#     x = numpy.array([1.0, 1.0, 1.0], dtype = float)
-#     y = numpy.array([0.0, 0.0, 0.0], dtype = float)
-#     assert maximizing_dominance_relationship(x, y) == minimizing_dominance_relationship(-x, -y)
-#     x = numpy.array([1.0, 1.0, 1.0], dtype = float)
-#     y = numpy.array([1.0, 0.0, 0.0], dtype = float)
-#     assert maximizing_dominance_relationship(x, y) == minimizing_dominance_relationship(-x, -y)
-#     x = numpy.array([1.0, 1.0, 1.0], dtype = float)
-#     y = numpy.array([0.0, 1.0, 0.0], dtype = float)
-#     assert maximizing_dominance_relationship(x, y) == minimizing_dominance_relationship(-x, -y)
-#     x = numpy.array([1.0, 1.0, 1.0], dtype = float)
-#     y = numpy.array([0.0, 0.0, 1.0], dtype = float)
-#     assert maximizing_dominance_relationship(x, y) == minimizing_dominance_relationship(-x, -y)
+def loop_dominance_relationship_matrix(x):
+    nindiv = x.shape[0]
+    dom = numpy.empty((nindiv,nindiv), dtype = int)
+    for i in range(nindiv):
+        for j in range(nindiv):
+            dom[i,j] = dominance_relationship(x[i], x[j])
+    return dom
+
+@pytest.mark.parametrize("nobj", [1,2,3,5])
+@pytest.mark.parametrize("blksize", [None,1,7,1000])
+def test_dominance_relationship_matrix(nobj, blksize):
+    # round to create ties and duplicate rows
+    x = numpy.random.random((60,nobj)).round(1)
+    dom = numpy.empty((60,60), dtype = int)
+    dominance_relationship_matrix(x, dom, blksize)
+    assert numpy.all(dom == loop_dominance_relationship_matrix(x))
+
+@pytest.mark.parametrize("n_jobs", [2,4,-1])
+def test_dominance_relationship_matrix_n_jobs(n_jobs):
+    x = numpy.random.random((300,3)).round(1)
+    serial = numpy.empty((300,300), dtype = int)
+    dominance_relationship_matrix(x, serial)
+    for blksize in [None,1,17]:
+        parallel = numpy.empty((300,300), dtype = int)
+        dominance_relationship_matrix(x, parallel, blksize, n_jobs)
+        assert numpy.all(parallel == serial)
+
+def test_block_size():
+    # temporaries have one element per pair of rows, whatever the number of objectives
+    assert block_size(1000) == BLOCK_NELEM // 1000
+    assert block_size(0) == BLOCK_NELEM
+    assert block_size(2 * BLOCK_NELEM) == 1
+
+def test_dominance_relationship_matrix_ValueError():
+    x = numpy.random.random((10,2))
+    with pytest.raises(ValueError):
+        dominance_relationship_matrix(x, numpy.empty((10,9), dtype = int))
+    with pytest.raises(ValueError):
+        dominance_relationship_matrix(x, numpy.empty((10,10), dtype = int), 0)
+    with pytest.raises(ValueError):
+        dominance_relationship_matrix(x, numpy.empty((10,10), dtype = int), n_jobs = 0)
+
+def test_maximizing_dominance_relationship_1d():
+    # x dominates y
+    x = numpy.array([0.0], dtype = float)
+    y = numpy.array([1.0], dtype = float)
+    assert dominance_relationship(x, y, sense = -numpy.ones(len(x))) == dominance_relationship(-x, -y)
+
+    # x is nondominated by y
+    x = numpy.array([0.0], dtype = float)
+    y = numpy.array([0.0], dtype = float)
+    assert dominance_relationship(x, y, sense = -numpy.ones(len(x))) == dominance_relationship(-x, -y)
+
+    # x is dominated by y
+    x = numpy.array([1.0], dtype = float)
+    y = numpy.array([0.0], dtype = float)
+    assert dominance_relationship(x, y, sense = -numpy.ones(len(x))) == dominance_relationship(-x, -y)
+
+def test_maximizing_dominance_relationship_2d():
+    # x dominates y
+    x = numpy.array([0.0, 0.0], dtype = float)
+    y = numpy.array([1.0, 1.0], dtype = float)
+    assert dominance_relationship(x, y, sense = -numpy.ones(len(x))) == dominance_relationship(-x, -y)
+    x = numpy.array([1.0, 0.0], dtype = float)
+    y = numpy.array([1.0, 1.0], dtype = float)
+    assert dominance_relationship(x, y, sense = -numpy.ones(len(x))) == dominance_relationship(-x, -y)
+
+    # x is nondominated by y
+    x = numpy.array([0.0, 0.0], dtype = float)
+    y = numpy.array([0.0, 0.0], dtype = float)
+    assert dominance_relationship(x, y, sense = -numpy.ones(len(x))) == dominance_relationship(-x, -y)
+    x = numpy.array([1.0, 0.0], dtype = float)
+    y = numpy.array([0.0, 1.0], dtype = float)
+    assert dominance_relationship(x, y, sense = -numpy.ones(len(x))) == dominance_relationship(-x, -y)
+    x = numpy.array([0.0, 1.0], dtype = float)
+    y = numpy.array([1.0, 0.0], dtype = float)
+    assert dominance_relationship(x, y, sense = -numpy.ones(len(x))) == dominance_relationship(-x, -y)
+
+    # x is dominated by y
+    x = numpy.array([1.0, 1.0], dtype = float)
+    y = numpy.array([0.0, 0.0], dtype = float)
+    assert dominance_relationship(x, y, sense = -numpy.ones(len(x))) == dominance_relationship(-x, -y)
+    x = numpy.array([1.0, 1.0], dtype = float)
+    y = numpy.array([0.0, 1.0], dtype = float)
+    assert dominance_relationship(x, y, sense = -numpy.ones(len(x))) == dominance_relationship(-x, -y)
+
+def test_maximizing_dominance_relationship_3d():
+    # x dominates y
+    x = numpy.array([0.0, 0.0, 0.0], dtype = float)
+    y = numpy.array([1.0, 1.0, 1.0], dtype = float)
+    assert dominance_relationship(x, y, sense = -numpy.ones(len(x))) == dominance_relationship(-x, -y)
+    x = numpy.array([1.0, 0.0, 0.0], dtype = float)
+    y = numpy.array([1.0, 1.0, 1.0], dtype = float)
+    assert dominance_relationship(x, y, sense = -numpy.ones(len(x))) == dominance_relationship(-x, -y)
+    x = numpy.array([0.0, 1.0, 0.0], dtype = float)
+    y = numpy.array([1.0, 1.0, 1.0], dtype = float)
+    assert dominance_relationship(x, y, sense = -numpy.ones(len(x))) == dominance_relationship(-x, -y)
+    x = numpy.array([0.0, 0.0, 1.0], dtype = float)
+    y = numpy.array([1.0, 1.0, 1.0], dtype = float)
+    assert dominance_relationship(x, y, sense = -numpy.ones(len(x))) == dominance_relationship(-x, -y)
+
+    # x is nondominated by y
+    x = numpy.array([1.0, 0.0, 0.0], dtype = float)
+    y = numpy.array([0.0, 1.0, 1.0], dtype = float)
+    assert dominance_relationship(x, y, sense = -numpy.ones(len(x))) == dominance_relationship(-x, -y)
+    x = numpy.array([0.0, 1.0, 0.0], dtype = float)
+    y = numpy.array([1.0, 0.0, 1.0], dtype = float)
+    assert dominance_relationship(x, y, sense = -numpy.ones(len(x))) == dominance_relationship(-x, -y)
+    x = numpy.array([0.0, 0.0, 1.0], dtype = float)
+    y = numpy.array([1.0, 1.0, 0.0], dtype = float)
+    assert dominance_relationship(x, y, sense = -numpy.ones(len(x))) == dominance_relationship(-x, -y)
+
+    # x is dominated by y
+    x = numpy.array([1.0, 1.0, 1.0], dtype = float)
+    y = numpy.array([0.0, 0.0, 0.0], dtype = float)
+    assert dominance_relationship(x, y, sense = -numpy.ones(len(x))) == dominance_relationship(-x, -y)
+    x = numpy.array([1.0, 1.0, 1.0], dtype = float)
+    y = numpy.array([1.0, 0.0, 0.0], dtype = float)
+    assert dominance_relationship(x, y, sense = -numpy.ones(len(x))) == dominance_relationship(-x, -y)
+    x = numpy.array([1.0, 1.0, 1.0], dtype = float)
+    y = numpy.array([0.0, 1.0, 0.0], dtype = float)
+    assert dominance_relationship(x, y, sense = -numpy.ones(len(x))) == dominance_relationship(-x, -y)
+    x = numpy.array([1.0, 1.0, 1.0], dtype = float)
+    y = numpy.array([0.0, 0.0, 1.0], dtype = float)
+    assert dominance_relationship(x, y, sense = -numpy.ones(len(x))) == dominance_relationship(-x, -y)
+
+def test_mixed_sense_dominance_relationship():
+    sense = numpy.array([1, -1, 1])
+    for _ in range(100):
+        x, y = numpy.random.random((2,3)).round(1)
+        assert dominance_relationship(x, y, sense = sense) == dominance_relationship(x * sense, y * sense)
+
+def test_epsilon_dominance_relationship():
+    # x epsilon-dominates y only if x is better than y by more than eps in some objective
+    x = numpy.array([0.0, 0.0], dtype = float)
+    y = numpy.array([0.5, 0.5], dtype = float)
+    assert dominance_relationship(x, y) == -1
+    assert dominance_relationship(x, y, eps = 0.5) == 0
+    assert dominance_relationship(x, y, eps = 0.25) == -1
+    assert dominance_relationship(y, x, eps = 0.25) == 1
+
+    # a worse objective is tolerated within eps
+    x = numpy.array([0.0, 1.1], dtype = float)
+    y = numpy.array([1.0, 1.0], dtype = float)
+    assert dominance_relationship(x, y) == 0
+    assert dominance_relationship(x, y, eps = 0.2) == -1
+    assert dominance_relationship(x, y, eps = [0.2, 0.0]) == 0
+    assert dominance_relationship(x, y, eps = [0.0, 0.2]) == -1
+
+def test_constraint_dominance_relationship():
+    x = numpy.array([0.0, 0.0], dtype = float)
+    y = numpy.array([1.0, 1.0], dtype = float)
+
+    # both feasible: Pareto dominance
+    assert dominance_relationship(x, y, cvx = 0.0, cvy = -1.0) == -1
+
+    # a feasible vector dominates an infeasible one
+    assert dominance_relationship(x, y, cvx = 0.5, cvy = 0.0) == 1
+    assert dominance_relationship(y, x, cvx = 0.0, cvy = 0.5) == -1
+
+    # of two infeasible vectors, the less violating one dominates
+    assert dominance_relationship(x, y, cvx = 0.5, cvy = 0.25) == 1
+    assert dominance_relationship(x, y, cvx = 0.25, cvy = 0.5) == -1
+    assert dominance_relationship(x, y, cvx = 0.5, cvy = 0.5) == 0
+
+def loop_dominance_relationship_matrix_options(x, sense, eps, cv):
+    nindiv = x.shape[0]
+    dom = numpy.empty((nindiv,nindiv), dtype = int)
+    for i in range(nindiv):
+        for j in range(nindiv):
+            cvi = None if cv is None else cv[i]
+            cvj = None if cv is None else cv[j]
+            dom[i,j] = dominance_relationship(x[i], x[j], sense, eps, cvi, cvj)
+    return dom
+
+@pytest.mark.parametrize("sense", [None, [1, -1, -1]])
+@pytest.mark.parametrize("eps", [None, 0.1, [0.0, 0.2, 0.1]])
+@pytest.mark.parametrize("constrained", [False, True])
+@pytest.mark.parametrize("blksize", [None,7])
+def test_dominance_relationship_matrix_options(sense, eps, constrained, blksize):
+    x = numpy.random.random((60,3)).round(1)
+    cv = numpy.random.random(60).round(1) - 0.5 if constrained else None
+    sense = None if sense is None else numpy.array(sense)
+    dom = numpy.empty((60,60), dtype = int)
+    dominance_relationship_matrix(x, dom, blksize, sense = sense, eps = eps, cv = cv)
+    assert numpy.all(dom == loop_dominance_relationship_matrix_options(x, sense, eps, cv))
+
+@pytest.mark.parametrize("sense", [None, [1, -1, -1]])
+@pytest.mark.parametrize("constrained", [False, True])
+def test_dominated_by_any(sense, constrained):
+    x = numpy.random.random((60,3)).round(1)
+    cv = numpy.random.random(60).round(1) - 0.5 if constrained else None
+    sense = None if sense is None else numpy.array(sense)
+    maximize, _ = relation_options(3, sense)
+    dom = loop_dominance_relationship_matrix_options(x, sense, None, cv)
+    for i in range(60):
+        members = numpy.arange(i % 7, 60, 7)
+        cvi = None if cv is None else cv[i]
+        cvm = None if cv is None else cv[members]
+        assert dominated_by_any(x[i], x[members], maximize, cvi, cvm) == numpy.any(dom[i,members] > 0)
+    assert not dominated_by_any(x[0], x[:0])
+
+def test_dominance_relationship_matrix_options_ValueError():
+    x = numpy.random.random((10,2))
+    dom = numpy.empty((10,10), dtype = int)
+    with pytest.raises(ValueError):
+        dominance_relationship_matrix(x, dom, sense = numpy.array([1, 1, 1]))
+    with pytest.raises(ValueError):
+        dominance_relationship_matrix(x, dom, sense = numpy.array([1, 0]))
+    with pytest.raises(ValueError):
+        dominance_relationship_matrix(x, dom, eps = -0.1)
+    with pytest.raises(ValueError):
+        dominance_relationship_matrix(x, dom, cv = numpy.zeros(9))
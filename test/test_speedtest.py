@@ -1,15 +1,19 @@
 import timeit
 import pytest
 import numpy
+from pynds.workspace import Workspace
 
 # helper functions
 
+# workspaces are reused between sorts, so that timings exclude allocation
+WORKSPACE = Workspace()
+
 def generate_matrices(nobj, nindiv):
     x = numpy.random.random((nindiv,nobj))
-    front = numpy.empty(nindiv, dtype = int)
-    dom = numpy.empty((nindiv,nindiv), dtype = int)
-    rem = numpy.empty(nindiv, dtype = int)
-    mask = numpy.empty(nindiv, dtype = bool)
+    front = WORKSPACE.get("front", nindiv, int)
+    dom = WORKSPACE.get("dom", (nindiv,nindiv), int)
+    rem = WORKSPACE.get("rem", nindiv, int)
+    mask = WORKSPACE.get("mask", nindiv, bool)
     return x, front, dom, rem, mask
 
 @pytest.fixture
@@ -49,3 +53,89 @@ def test_speedtest_ndsort_naive2(objectives, individuals):
             )
     
     print(stats)
+
+def test_speedtest_ndsort_fast(objectives, individuals):
+    stats = numpy.empty((len(objectives),len(individuals)), dtype = float)
+
+    for i,obj in enumerate(objectives):
+        for j,indiv in enumerate(individuals):
+            x, front, dom, rem, mask = generate_matrices(obj, indiv)
+            cnt = numpy.empty(indiv, dtype = int)
+            stats[i,j] = timeit.timeit(
+                'ndsort_fast(x, front, dom, cnt, rem)', 
+                setup = 'from pynds.fast import ndsort_fast',
+                number = 1, 
+                globals = locals()
+            )
+    
+    print(stats)
+
+def test_speedtest_ndsort_ens_bs(objectives, individuals):
+    stats = numpy.empty((len(objectives),len(individuals)), dtype = float)
+
+    for i,obj in enumerate(objectives):
+        for j,indiv in enumerate(individuals):
+            x, front, dom, rem, mask = generate_matrices(obj, indiv)
+            perm = numpy.empty(indiv, dtype = int)
+            head = numpy.empty(indiv, dtype = int)
+            stats[i,j] = timeit.timeit(
+                'ndsort_ens_bs(x, front, perm, head, rem)', 
+                setup = 'from pynds.ens import ndsort_ens_bs',
+                number = 1, 
+                globals = locals()
+            )
+    
+    print(stats)
+
+def test_speedtest_ndsort_biobj():
+    individuals = [10**4,10**5,10**6]
+    stats = numpy.empty(len(individuals), dtype = float)
+
+    # compile the sweep before timing, if it can be compiled
+    from pynds.biobj import ndsort_biobj
+    ndsort_biobj(numpy.random.random((10,2)), numpy.empty(10, dtype = int), numpy.empty(10, dtype = int))
+
+    for j,indiv in enumerate(individuals):
+        x, front = numpy.random.random((indiv,2)), numpy.empty(indiv, dtype = int)
+        perm = numpy.empty(indiv, dtype = int)
+        # best of three sorts, each of a fresh copy of the same points
+        stats[j] = min(timeit.repeat(
+            'ndsort_biobj(x.copy(), front, perm)', 
+            setup = 'from pynds.biobj import ndsort_biobj',
+            repeat = 3,
+            number = 1, 
+            globals = locals()
+        ))
+    
+    print(stats)
+
+def test_speedtest_ndsort_jensen(objectives, individuals):
+    stats = numpy.empty((len(objectives),len(individuals)), dtype = float)
+
+    for i,obj in enumerate(objectives):
+        for j,indiv in enumerate(individuals):
+            x, front, dom, rem, mask = generate_matrices(obj, indiv)
+            stats[i,j] = timeit.timeit(
+                'ndsort_jensen(x, front, rem)', 
+                setup = 'from pynds.jensen import ndsort_jensen',
+                number = 1, 
+                globals = locals()
+            )
+    
+    print(stats)
+
+def test_speedtest_ndsort_bos(objectives, individuals):
+    stats = numpy.empty((len(objectives),len(individuals)), dtype = float)
+
+    for i,obj in enumerate(objectives):
+        for j,indiv in enumerate(individuals):
+            x, front, dom, rem, mask = generate_matrices(obj, indiv)
+            order = numpy.empty((obj,indiv), dtype = int)
+            stats[i,j] = timeit.timeit(
+                'ndsort_bos(x, front, rem, order)', 
+                setup = 'from pynds.bos import ndsort_bos',
+                number = 1, 
+                globals = locals()
+            )
+    
+    print(stats)
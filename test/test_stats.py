@@ -0,0 +1,145 @@
+import time
+import pytest
+import numpy
+import pynds.stats
+from pynds.stats import STATS_PHASES
+from pynds.stats import SortStats
+from pynds.stats import count_relations
+from pynds.stats import phase_start
+from pynds.stats import phase_stop
+from pynds.dispatch import ENGINES
+from pynds.dispatch import argndsort
+from pynds.dispatch import iter_fronts
+from pynds.dispatch import ndsort
+from pynds.batch import ndsort_batch
+
+################################################################################
+################################ Test Fixtures #################################
+################################################################################
+
+@pytest.fixture(params = list(ENGINES))
+def engine(request):
+    yield request.param
+
+@pytest.fixture
+def xmat(engine):
+    # biobj requires two objectives; naive is slow
+    nobj = 2 if engine == "biobj" else 3
+    nindiv = 50 if engine == "naive" else 200
+    yield numpy.random.random((nindiv,nobj)).round(1)
+
+################################################################################
+################################## Unit Tests ##################################
+################################################################################
+
+def test_SortStats_phases():
+    stats = SortStats()
+    with stats:
+        outer = phase_start()
+        inner = phase_start()
+        time.sleep(0.02)
+        phase_stop("presort", inner)
+        phase_stop("peel", outer)
+        count_relations(10, 2)
+    assert pynds.stats.ACTIVE is None
+    # nested phase time is excluded from the enclosing phase
+    assert stats.time["presort"] >= 0.02
+    assert stats.time["peel"] < stats.time["presort"]
+    assert stats.time["total"] >= stats.time["presort"] + stats.time["peel"]
+    assert stats.ncompare == 10
+    assert stats.ncall == 2
+    d = stats.as_dict()
+    assert set(d) == {"ncall","ncompare","nfront","front_sizes"} | {"time_" + p for p in STATS_PHASES}
+    stats.reset()
+    assert stats.ncompare == 0
+    assert all(t == 0.0 for t in stats.time.values())
+
+def test_SortStats_disabled():
+    # hooks do nothing without an active collector
+    assert pynds.stats.ACTIVE is None
+    tstart = phase_start()
+    assert tstart is None
+    phase_stop("peel", tstart)
+    count_relations(10, 2)
+
+def test_SortStats_nested():
+    outer = SortStats()
+    inner = SortStats()
+    with outer:
+        with inner:
+            assert pynds.stats.ACTIVE is inner
+            count_relations(1)
+        assert pynds.stats.ACTIVE is outer
+        count_relations(2)
+    assert pynds.stats.ACTIVE is None
+    assert inner.ncompare == 1
+    assert outer.ncompare == 2
+
+def test_SortStats_exception():
+    stats = SortStats()
+    with pytest.raises(RuntimeError):
+        with stats:
+            phase_start()
+            raise RuntimeError
+    assert pynds.stats.ACTIVE is None
+    assert stats._stack == []
+
+def test_SortStats_record_fronts():
+    stats = SortStats()
+    stats.record_fronts(numpy.array([0,1,0,2,-1,1,0]))
+    assert stats.front_sizes == [3,2,1]
+    assert stats.nfront == 3
+
+def test_ndsort_stats(engine, xmat):
+    stats = SortStats()
+    front, _ = ndsort(xmat.copy(), engine = engine, stats = stats)
+    assert pynds.stats.ACTIVE is None
+    assert stats.front_sizes == numpy.bincount(front).tolist()
+    assert stats.nfront == front.max() + 1
+    assert all(t >= 0.0 for t in stats.time.values())
+    assert sum(stats.time[p] for p in STATS_PHASES if p != "total") <= stats.time["total"] + 1e-6
+    assert stats.time["peel"] > 0.0
+    n = len(xmat)
+    if engine in ("naive2","fast","bitset"):
+        assert stats.ncompare == n * n
+        assert stats.time["matrix"] > 0.0
+    if engine in ("naive","naive1"):
+        assert stats.ncall > 0
+        assert stats.ncompare == stats.ncall
+    if engine in ("ens_ss","ens_bs","jensen"):
+        assert stats.ncompare > 0
+    if engine == "biobj":
+        assert stats.ncompare == 0
+
+def test_ndsort_stats_disabled(xmat):
+    # results do not depend on statistics collection
+    f1, _ = ndsort(xmat.copy())
+    f2, _ = ndsort(xmat.copy(), stats = SortStats())
+    assert numpy.all(f1 == f2)
+
+def test_argndsort_stats(engine, xmat):
+    stats = SortStats()
+    perm, front, _ = argndsort(xmat, engine = engine, stats = stats)
+    assert stats.front_sizes == numpy.bincount(front).tolist()
+    assert stats.time["lexsort"] > 0.0
+
+@pytest.mark.parametrize("kind", ["fast","bitset"])
+def test_iter_fronts_stats(kind):
+    x = numpy.random.random((200,3))
+    stats = SortStats()
+    fronts = [f.copy() for f in iter_fronts(x, engine = kind, stats = stats)]
+    assert pynds.stats.ACTIVE is None
+    assert stats.front_sizes == [len(f) for f in fronts]
+    assert stats.ncompare == 200 * 200
+    assert stats.time["matrix"] > 0.0
+
+def test_ndsort_batch_stats():
+    x = numpy.random.random((4,50,3)).round(1)
+    front = numpy.empty((4,50), dtype = int)
+    stats = SortStats()
+    with stats:
+        ndsort_batch(x, front, numpy.empty((4,50), dtype = int), numpy.empty((4,50,50), dtype = int), numpy.empty((4,50), dtype = int))
+    assert stats.ncompare == 4 * 50 * 50
+    assert stats.time["matrix"] > 0.0
+    assert stats.time["peel"] > 0.0
+    assert stats.time["lexsort"] > 0.0
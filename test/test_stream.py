@@ -0,0 +1,89 @@
+import pytest
+import numpy
+from pynds.stream import ParetoFilter
+from pynds.stream import pareto_filter
+from pynds.archive import nondominated_mask
+from pynds.dispatch import argndsort
+
+################################################################################
+################################ Test Fixtures #################################
+################################################################################
+
+@pytest.fixture(params = [1,2,3,5])
+def nobj(request):
+    yield request.param
+
+@pytest.fixture
+def xmat(nobj):
+    # round to create ties and duplicate rows
+    yield numpy.random.random((1000,nobj)).round(1)
+
+def chunked(x, sizes):
+    # split a matrix into chunks of varying sizes
+    bounds = numpy.cumsum([0] + list(sizes))
+    return [x[bounds[i]:bounds[i+1]] for i in range(len(sizes))]
+
+################################################################################
+################################## Unit Tests ##################################
+################################################################################
+
+@pytest.mark.parametrize("sizes", [[1000],[1]*50 + [950],[100]*10,[0,333,0,667]])
+def test_pareto_filter(sizes, xmat):
+    out = pareto_filter(chunked(xmat, sizes))
+    expected = numpy.flatnonzero(nondominated_mask(xmat))
+    # front members and their stream positions
+    assert numpy.all(numpy.sort(out.index) == expected)
+    assert numpy.all(out.front == xmat[out.index])
+    assert len(out) == len(expected)
+    assert out.nseen == len(xmat)
+
+def test_pareto_filter_update(xmat, nobj):
+    filt = ParetoFilter(nobj)
+    for chunk in chunked(xmat, [100]*10):
+        entered = filt.update(chunk)
+        # entered individuals are non-dominated within their chunk
+        assert numpy.all(entered <= nondominated_mask(chunk))
+        # running front is the first front of everything seen so far
+        seen = xmat[:filt.nseen]
+        assert numpy.all(numpy.sort(filt.index) == numpy.flatnonzero(nondominated_mask(seen)))
+
+def test_pareto_filter_sense_cv(xmat, nobj):
+    sense = numpy.where(numpy.arange(nobj) % 2 == 0, -1, 1)
+    cv = numpy.random.randint(-2, 3, size = len(xmat)) * 0.5
+    # chunks given without violations are feasible
+    cv[:300] = 0
+    filt = ParetoFilter(nobj, sense = sense)
+    filt.update(xmat[:300])
+    for chunk, cvchunk in zip(chunked(xmat[300:], [100]*7), chunked(cv[300:], [100]*7)):
+        filt.update(chunk, cvchunk)
+    perm, front, used = argndsort(xmat, engine = "naive2", sense = sense, cv = cv)
+    assert numpy.all(numpy.sort(filt.index) == numpy.flatnonzero(front == 0))
+    assert numpy.all(filt.cv == cv[filt.index])
+
+def test_pareto_filter_infeasible(nobj):
+    # the least violating individuals are kept until a feasible one arrives
+    x = numpy.random.random((30,nobj))
+    filt = ParetoFilter(nobj)
+    filt.update(x[:10], numpy.full(10, 2.0))
+    filt.update(x[10:20], numpy.r_[numpy.full(5, 1.0), numpy.full(5, 3.0)])
+    assert numpy.all(numpy.sort(filt.index) == numpy.arange(10, 15))
+    filt.update(x[20:])
+    assert numpy.all(filt.index >= 20)
+    assert numpy.all(numpy.sort(filt.index) == 20 + numpy.flatnonzero(nondominated_mask(x[20:])))
+
+def test_pareto_filter_duplicates(nobj):
+    x = numpy.zeros((10,nobj))
+    out = pareto_filter(chunked(x, [3,3,4]))
+    assert len(out) == 10
+
+def test_pareto_filter_ValueError(nobj):
+    with pytest.raises(ValueError):
+        ParetoFilter(0)
+    with pytest.raises(ValueError):
+        ParetoFilter(nobj, blksize = 0)
+    with pytest.raises(ValueError):
+        ParetoFilter(nobj).update(numpy.zeros((5,nobj+1)))
+    with pytest.raises(ValueError):
+        ParetoFilter(nobj).update(numpy.zeros((5,nobj)), numpy.zeros(4))
+    with pytest.raises(ValueError):
+        pareto_filter(iter([]))
@@ -0,0 +1,69 @@
+import pytest
+import numpy
+from pynds.workspace import Workspace
+from pynds.workspace import workspace_empty
+from pynds.dispatch import ENGINES
+from pynds.dispatch import ndsort
+
+################################################################################
+################################ Test Fixtures #################################
+################################################################################
+
+@pytest.fixture(params = sorted(ENGINES))
+def engine(request):
+    yield request.param
+
+@pytest.fixture(params = [2,3])
+def nobj(request):
+    yield request.param
+
+################################################################################
+################################## Unit Tests ##################################
+################################################################################
+
+def test_Workspace_get():
+    ws = Workspace()
+    a = ws.get("dom", (10,10), int)
+    assert a.shape == (10,10)
+    assert a.dtype == numpy.dtype(int)
+    assert a.flags["C_CONTIGUOUS"]
+    nbytes = ws.nbytes
+    # smaller and differently typed requests reuse the buffer
+    b = ws.get("dom", (5,5), bool)
+    assert b.shape == (5,5)
+    assert numpy.shares_memory(a, b)
+    assert ws.nbytes == nbytes
+    # larger requests grow the buffer
+    c = ws.get("dom", 200, int)
+    assert c.shape == (200,)
+    assert ws.nbytes > nbytes
+    # different names do not share memory
+    d = ws.get("rem", 200, int)
+    assert not numpy.shares_memory(c, d)
+    ws.clear()
+    assert ws.nbytes == 0
+
+def test_workspace_empty():
+    a = workspace_empty(None, "rem", 7, int)
+    assert a.shape == (7,)
+    ws = Workspace()
+    b = workspace_empty(ws, "rem", 7, int)
+    assert numpy.shares_memory(b, ws.buffers["rem"])
+
+def test_ndsort_workspace(engine, nobj):
+    if engine == "biobj" and nobj != 2:
+        pytest.skip("biobj requires two objectives")
+    ws = Workspace()
+    for nindiv in [50,30,50]:
+        xmat = numpy.random.random((nindiv,nobj)).round(1)
+        x1 = xmat.copy()
+        front1, _ = ndsort(x1, engine = engine, workspace = ws)
+        x2 = xmat.copy()
+        front2, _ = ndsort(x2, engine = engine)
+        assert numpy.all(front1 == front2)
+        assert numpy.all(x1 == x2)
+    # repeated sorts at the same or smaller sizes allocate nothing
+    buffers = dict(ws.buffers)
+    ndsort(numpy.random.random((40,nobj)), engine = engine, workspace = ws)
+    assert all(ws.buffers[k] is v for k,v in buffers.items())
+    assert len(ws.buffers) == len(buffers)